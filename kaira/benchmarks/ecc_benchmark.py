@@ -5,7 +5,7 @@ codes, extending the existing kaira.benchmarks system with specialized ECC evalu
 """
 
 import time
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 import numpy as np
 import torch
@@ -16,6 +16,7 @@ from kaira.benchmarks.registry import register_benchmark
 from kaira.models.fec.decoders import (
     BerlekampMasseyDecoder,
     BruteForceMLDecoder,
+    ChaseDecoder,
     SyndromeLookupDecoder,
 )
 from kaira.models.fec.encoders import (
@@ -64,17 +65,20 @@ class ECCPerformanceBenchmark(CommunicationBenchmark):
                 {"name": "Hamming(7,4)", "encoder": HammingCodeEncoder, "decoder": SyndromeLookupDecoder, "params": {"mu": 3}, "n": 7, "k": 4, "d": 3, "t": 1},
                 {"name": "Hamming(15,11)", "encoder": HammingCodeEncoder, "decoder": SyndromeLookupDecoder, "params": {"mu": 4}, "n": 15, "k": 11, "d": 3, "t": 1},
                 {"name": "Hamming(31,26)", "encoder": HammingCodeEncoder, "decoder": SyndromeLookupDecoder, "params": {"mu": 5}, "n": 31, "k": 26, "d": 3, "t": 1},
+                {"name": "Hamming(15,11) Chase-II", "encoder": HammingCodeEncoder, "decoder": ChaseDecoder, "params": {"mu": 4}, "decoder_params": {"inner_decoder": SyndromeLookupDecoder, "num_test_positions": 2}, "soft_input": True, "n": 15, "k": 11, "d": 3, "t": 1},
             ]
         elif self.code_family == "bch":
             configs = [
                 {"name": "BCH(15,7)", "encoder": BCHCodeEncoder, "decoder": BerlekampMasseyDecoder, "params": {"mu": 4, "delta": 5}, "n": 15, "k": 7, "d": 5, "t": 2},
                 {"name": "BCH(31,16)", "encoder": BCHCodeEncoder, "decoder": BerlekampMasseyDecoder, "params": {"mu": 5, "delta": 7}, "n": 31, "k": 16, "d": 7, "t": 3},
                 {"name": "BCH(63,36)", "encoder": BCHCodeEncoder, "decoder": BerlekampMasseyDecoder, "params": {"mu": 6, "delta": 11}, "n": 63, "k": 36, "d": 11, "t": 5},
+                {"name": "BCH(31,16) Chase-II", "encoder": BCHCodeEncoder, "decoder": ChaseDecoder, "params": {"mu": 5, "delta": 7}, "decoder_params": {"inner_decoder": BerlekampMasseyDecoder, "num_test_positions": 3}, "soft_input": True, "n": 31, "k": 16, "d": 7, "t": 3},
             ]
         elif self.code_family == "golay":
             configs = [
                 {"name": "Golay(23,12)", "encoder": GolayCodeEncoder, "decoder": SyndromeLookupDecoder, "params": {"extended": False}, "n": 23, "k": 12, "d": 7, "t": 3},
                 {"name": "Extended Golay(24,12)", "encoder": GolayCodeEncoder, "decoder": SyndromeLookupDecoder, "params": {"extended": True}, "n": 24, "k": 12, "d": 8, "t": 3},
+                {"name": "Extended Golay(24,12) Chase-II", "encoder": GolayCodeEncoder, "decoder": ChaseDecoder, "params": {"extended": True}, "decoder_params": {"inner_decoder": SyndromeLookupDecoder, "num_test_positions": 3}, "soft_input": True, "n": 24, "k": 12, "d": 8, "t": 3},
             ]
         elif self.code_family == "repetition":
             configs = [
@@ -97,14 +101,22 @@ class ECCPerformanceBenchmark(CommunicationBenchmark):
 
         return configs
 
+    def _create_codec(self, config: Dict[str, Any]) -> Tuple[Any, Any]:
+        """Create the encoder and decoder of a code configuration."""
+        encoder = config["encoder"](**config["params"])
+        decoder = config["decoder"](encoder, **config.get("decoder_params", {}))
+        return encoder, decoder
+
+    def _decoder_input(self, config: Dict[str, Any], bits: torch.Tensor) -> torch.Tensor:
+        """Convert hard bits to the decoder input, i.e. equally reliable LLRs for soft-decision decoders."""
+        if config.get("soft_input", False):
+            return 1 - 2 * bits.float()
+        return bits
+
     def _evaluate_error_correction_performance(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Evaluate error correction performance for a specific code configuration."""
-        encoder_class = config["encoder"]
-        decoder_class = config["decoder"]
-
         try:
-            encoder = encoder_class(**config["params"])
-            decoder = decoder_class(encoder)
+            encoder, decoder = self._create_codec(config)
         except Exception as e:
             return {"success": False, "error": str(e), "correction_probability": [], "undetected_error_probability": []}
 
@@ -137,7 +149,7 @@ class ECCPerformanceBenchmark(CommunicationBenchmark):
 
                 # Decode (use forward method)
                 try:
-                    decoded_info = decoder(received)
+                    decoded_info = decoder(self._decoder_input(config, received))
 
                     if torch.equal(info_bits, decoded_info):
                         corrections += 1
@@ -160,12 +172,8 @@ class ECCPerformanceBenchmark(CommunicationBenchmark):
 
     def _evaluate_ber_performance(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Evaluate BER performance over SNR range."""
-        encoder_class = config["encoder"]
-        decoder_class = config["decoder"]
-
         try:
-            encoder = encoder_class(**config["params"])
-            decoder = decoder_class(encoder)
+            encoder, decoder = self._create_codec(config)
         except Exception as e:
             return {"success": False, "error": str(e), "ber_coded": [], "ber_uncoded": [], "bler_coded": [], "bler_uncoded": [], "coding_gain_ber": [], "coding_gain_bler": []}
 
@@ -218,11 +226,14 @@ class ECCPerformanceBenchmark(CommunicationBenchmark):
             coded_hard = (coded_received > 0).int()
             uncoded_hard = (uncoded_received > 0).int()
 
-            # Decode coded transmission (use forward method)
-            coded_hard_blocks = coded_hard.reshape(-1, config["n"])
+            # Decode coded transmission (use forward method), with LLRs for soft-decision decoders
+            if config.get("soft_input", False):
+                coded_blocks_input = (-4 * coded_received / noise_power).reshape(-1, config["n"])
+            else:
+                coded_blocks_input = coded_hard.reshape(-1, config["n"])
             decoded_blocks = []
 
-            for block in coded_hard_blocks:
+            for block in coded_blocks_input:
                 try:
                     decoded_blocks.append(decoder(block))
                 except Exception:
@@ -274,12 +285,8 @@ class ECCPerformanceBenchmark(CommunicationBenchmark):
         if not self.evaluate_complexity:
             return {"success": False, "reason": "Complexity evaluation disabled"}
 
-        encoder_class = config["encoder"]
-        decoder_class = config["decoder"]
-
         try:
-            encoder = encoder_class(**config["params"])
-            decoder = decoder_class(encoder)
+            encoder, decoder = self._create_codec(config)
         except Exception as e:
             return {"success": False, "error": str(e)}
 
@@ -311,6 +318,8 @@ class ECCPerformanceBenchmark(CommunicationBenchmark):
         except Exception:
             return {"success": False, "error": "Failed to generate codeword for complexity testing"}
 
+        codeword = self._decoder_input(config, codeword)
+
         # Warm up
         for _ in range(10):
             try:
@@ -343,12 +352,8 @@ class ECCPerformanceBenchmark(CommunicationBenchmark):
         if not self.evaluate_throughput:
             return {"success": False, "reason": "Throughput evaluation disabled"}
 
-        encoder_class = config["encoder"]
-        decoder_class = config["decoder"]
-
         try:
-            encoder = encoder_class(**config["params"])
-            decoder = decoder_class(encoder)
+            encoder, decoder = self._create_codec(config)
         except Exception as e:
             return {"success": False, "error": str(e)}
 
@@ -368,7 +373,7 @@ class ECCPerformanceBenchmark(CommunicationBenchmark):
             encoded_blocks = []
             for block in info_blocks:
                 try:
-                    encoded_blocks.append(encoder(block))
+                    encoded_blocks.append(self._decoder_input(config, encoder(block)))
                 except (RuntimeError, ValueError, TypeError, AttributeError, IndexError):
                     # Skip failed encoding attempts for throughput measurement
                     pass
@@ -5,6 +5,17 @@ from typing import Any, Dict, Optional
 
 import torch
 
+from kaira.modulations import (
+    BPSKDemodulator,
+    BPSKModulator,
+    OFDMDemodulator,
+    OFDMModulator,
+    QAMDemodulator,
+    QAMModulator,
+    QPSKDemodulator,
+    QPSKModulator,
+)
+
 from .base import CommunicationBenchmark
 from .metrics import StandardMetrics
 from .registry import register_benchmark
@@ -463,7 +474,20 @@ class QAMBERBenchmark(CommunicationBenchmark):
 
 @register_benchmark("ofdm_performance")
 class OFDMPerformanceBenchmark(CommunicationBenchmark):
-    """Benchmark for OFDM system performance."""
+    """Benchmark for OFDM system performance.
+
+    Bits are modulated with the batched OFDM modem of :mod:`kaira.modulations`, transmitted over
+    an AWGN channel (optionally preceded by a multipath channel) and demodulated in batches of
+    OFDM symbols.
+    """
+
+    # Subcarrier modulators and demodulators of the supported modulation schemes
+    MODULATIONS = {
+        "bpsk": (BPSKModulator, BPSKDemodulator, {}),
+        "qpsk": (QPSKModulator, QPSKDemodulator, {}),
+        "16qam": (QAMModulator, QAMDemodulator, {"order": 16}),
+        "64qam": (QAMModulator, QAMDemodulator, {"order": 64}),
+    }
 
     def __init__(self, num_subcarriers: int = 64, cp_length: int = 16, **kwargs):
         """Initialize OFDM performance benchmark.
@@ -481,147 +505,69 @@ class OFDMPerformanceBenchmark(CommunicationBenchmark):
         """Setup benchmark parameters.
 
         Args:
-            **kwargs: Configuration including num_symbols and modulation
+            **kwargs: Configuration including num_symbols, modulation, batch_size (OFDM symbols
+                per batch) and multipath (whether to apply a 2-tap multipath channel)
         """
         super().setup(**kwargs)
         self.num_symbols = kwargs.get("num_symbols", 1000)
         self.modulation = kwargs.get("modulation", "qpsk")
+        self.batch_size = kwargs.get("batch_size", 10000)
+        self.multipath = kwargs.get("multipath", False)
 
-        # QPSK constellation
-        if self.modulation.lower() == "qpsk":
-            self.constellation = torch.tensor([1 + 1j, -1 + 1j, 1 - 1j, -1 - 1j], dtype=torch.complex64, device=self.device) / torch.sqrt(torch.tensor(2.0, device=self.device))
-            self.bits_per_symbol = 2
-        else:
+        if self.modulation.lower() not in self.MODULATIONS:
             raise NotImplementedError(f"Modulation {self.modulation} not implemented")
+        modulator_class, demodulator_class, params = self.MODULATIONS[self.modulation.lower()]
+        self.ofdm_modulator = OFDMModulator(self.num_subcarriers, self.cp_length, modulator=modulator_class(**params)).to(self.device)
+        self.ofdm_demodulator = OFDMDemodulator(self.num_subcarriers, self.cp_length, demodulator=demodulator_class(**params)).to(self.device)
+        self.bits_per_symbol = self.ofdm_modulator.modulator.bits_per_symbol
 
-    def _generate_ofdm_symbol(self, data_bits: torch.Tensor) -> torch.Tensor:
-        """Generate OFDM symbol from data bits.
-
-        Modulates data bits, performs IFFT, and adds cyclic prefix.
-
-        Args:
-            data_bits: Input data bits
-
-        Returns:
-            Time-domain OFDM symbol with cyclic prefix
-        """
-        # Group bits for modulation
-        bits_grouped = data_bits.reshape(-1, self.bits_per_symbol)
-
-        # QPSK modulation - convert bits to indices manually
-        indices: list[int] = []
-        for bit_group in bits_grouped:
-            decimal_val = 0
-            for i, bit in enumerate(bit_group):
-                decimal_val += bit.item() * (2 ** (self.bits_per_symbol - 1 - i))
-            indices.append(decimal_val)
-        indices_tensor = torch.tensor(indices, dtype=torch.long, device=self.device)
-
-        modulated = self.constellation[indices_tensor % len(self.constellation)]
-
-        # Pad or truncate to fit subcarriers
-        if len(modulated) < self.num_subcarriers:
-            modulated = torch.nn.functional.pad(modulated, (0, self.num_subcarriers - len(modulated)))
-        elif len(modulated) > self.num_subcarriers:
-            modulated = modulated[: self.num_subcarriers]
-
-        # IFFT
-        time_domain = torch.fft.ifft(modulated, self.num_subcarriers)
-
-        # Add cyclic prefix
-        cp = time_domain[-self.cp_length :]
-        ofdm_symbol = torch.cat([cp, time_domain])
-
-        return ofdm_symbol
-
-    def _demodulate_ofdm_symbol(self, received_symbol: torch.Tensor) -> torch.Tensor:
-        """Demodulate OFDM symbol to bits.
-
-        Removes cyclic prefix, performs FFT, and demodulates subcarriers.
+        # Simple 2-tap channel, known at the receiver
+        self.channel_taps = torch.tensor([1.0, 0.3 * torch.exp(1j * torch.tensor(torch.pi / 4)).item()], dtype=torch.complex64, device=self.device)
 
-        Args:
-            received_symbol: Received time-domain OFDM symbol
-
-        Returns:
-            Decoded data bits
-        """
-        # Remove cyclic prefix
-        time_domain = received_symbol[self.cp_length :]
-
-        # FFT
-        freq_domain = torch.fft.fft(time_domain, self.num_subcarriers)
-
-        # Demodulate QPSK (minimum distance)
-        distances = torch.abs(freq_domain[:, None] - self.constellation[None, :])
-        indices = torch.argmin(distances, dim=1)
-
-        # Convert to bits
-        bits = []
-        for idx in indices:
-            bit_array = []
-            idx_val = idx.item()
-            for i in range(self.bits_per_symbol):
-                bit = (idx_val >> (self.bits_per_symbol - 1 - i)) & 1
-                bit_array.append(bit)
-            bits.extend(bit_array)
-
-        return torch.tensor(bits, dtype=torch.int32, device=self.device)
-
-    def _add_channel_effects(self, ofdm_symbol: torch.Tensor, snr_db: float) -> torch.Tensor:
+    def _add_channel_effects(self, signal: torch.Tensor, snr_db: float) -> torch.Tensor:
         """Add channel effects including AWGN and optional multipath.
 
         Args:
-            ofdm_symbol: Input OFDM symbol
-            snr_db: Signal-to-noise ratio in decibels
+            signal: Time-domain OFDM signal with shape (batch_size, num_samples)
+            snr_db: Signal-to-noise ratio in decibels (per subcarrier symbol)
 
         Returns:
-            OFDM symbol with channel effects applied
+            Signal with channel effects applied
         """
-        # AWGN
-        snr_linear = 10 ** (snr_db / 10)
-        noise_power = 1 / snr_linear
-
-        noise_real = torch.sqrt(torch.tensor(noise_power / 2, device=self.device)) * torch.randn(len(ofdm_symbol), device=self.device)
-        noise_imag = torch.sqrt(torch.tensor(noise_power / 2, device=self.device)) * torch.randn(len(ofdm_symbol), device=self.device)
-        noise = noise_real + 1j * noise_imag
-
-        # Simple multipath (optional)
-        multipath_enabled = False  # Can be enabled for more realistic simulation
-        if multipath_enabled:
-            # Simple 2-tap channel
-            h = torch.tensor([1.0, 0.3 * torch.exp(1j * torch.tensor(torch.pi / 4, device=self.device))], dtype=torch.complex64, device=self.device)
-            ofdm_symbol = torch.nn.functional.conv1d(ofdm_symbol.unsqueeze(0).unsqueeze(0), h.unsqueeze(0).unsqueeze(0)).squeeze()
+        if self.multipath:
+            # 2-tap channel, whose one-sample memory is absorbed by the cyclic prefix
+            delayed = torch.nn.functional.pad(signal, (1, 0))[..., :-1]
+            signal = self.channel_taps[0] * signal + self.channel_taps[1] * delayed
 
-        return ofdm_symbol + noise
+        noise_power = 10 ** (-snr_db / 10)
+        noise = torch.complex(torch.randn_like(signal.real), torch.randn_like(signal.real)) * (noise_power / 2) ** 0.5
+        return signal + noise
 
     def run(self, **kwargs) -> Dict[str, Any]:
         """Run OFDM performance benchmark."""
         ber_results = []
         throughput_results = []
+        bits_per_ofdm_symbol = self.ofdm_modulator.bits_per_symbol
+        csi = torch.fft.fft(self.channel_taps, n=self.num_subcarriers) if self.multipath else None
 
         for snr_db in self.snr_range:
             total_bits = 0
             total_errors = 0
             start_time = time.time()
 
-            for _ in range(self.num_symbols):
-                # Generate random data bits
-                data_bits = torch.randint(0, 2, (self.num_subcarriers * self.bits_per_symbol,), device=self.device)
-
-                # Generate OFDM symbol
-                ofdm_symbol = self._generate_ofdm_symbol(data_bits)
+            for start in range(0, self.num_symbols, self.batch_size):
+                batch_size = min(self.batch_size, self.num_symbols - start)
 
-                # Add channel effects
-                received = self._add_channel_effects(ofdm_symbol, snr_db)
+                # Generate random data bits, one OFDM symbol per row
+                data_bits = torch.randint(0, 2, (batch_size, bits_per_ofdm_symbol), device=self.device).float()
 
-                # Demodulate
-                decoded_bits = self._demodulate_ofdm_symbol(received)
+                # Modulate, add channel effects and demodulate all OFDM symbols at once
+                received = self._add_channel_effects(self.ofdm_modulator(data_bits), snr_db)
+                decoded_bits = self.ofdm_demodulator(received, csi=csi)
 
                 # Count errors
-                min_len = min(len(data_bits), len(decoded_bits))
-                errors = torch.sum(data_bits[:min_len] != decoded_bits[:min_len]).item()
-                total_errors += errors
-                total_bits += min_len
+                total_errors += int((data_bits != decoded_bits).sum().item())
+                total_bits += data_bits.numel()
 
             end_time = time.time()
 
@@ -630,7 +576,7 @@ class OFDMPerformanceBenchmark(CommunicationBenchmark):
             ber_results.append(ber)
 
             # Calculate throughput
-            processing_time = end_time - start_time
+            processing_time = max(end_time - start_time, 1e-9)
             throughput = total_bits / processing_time
             throughput_results.append(throughput)
 
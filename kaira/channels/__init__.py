@@ -11,6 +11,7 @@ from .analog import (
     GaussianChannel,
     LaplacianChannel,
     LogNormalFadingChannel,
+    MultipathFadingChannel,
     NonlinearChannel,
     PhaseNoiseChannel,
     PoissonChannel,
@@ -28,6 +29,9 @@ from .identity import IdealChannel, IdentityChannel, PerfectChannel
 # Perfect/Identity channel
 from .lambda_channel import LambdaChannel
 
+# MIMO channel
+from .mimo import MIMOChannel
+
 # Channel registry
 from .registry import ChannelRegistry
 
@@ -56,7 +60,10 @@ __all__ = [
     "RayleighFadingChannel",
     "RicianFadingChannel",
     "LogNormalFadingChannel",
+    "MultipathFadingChannel",
     "NonlinearChannel",
+    # MIMO channel
+    "MIMOChannel",
     # Uplink MAC channel
     "UplinkMACChannel",
     # Channel registry
@@ -7,7 +7,8 @@ analog communication systems.
 For a comprehensive overview of analog channel models, see :cite:`goldsmith2005wireless` and :cite:`proakis2007digital`.
 """
 
-from typing import Any, Optional, Union  # Add Union
+import math
+from typing import Any, Dict, Optional, Sequence, Tuple, Union  # Add Union
 
 import torch
 
@@ -417,14 +418,32 @@ class FlatFadingChannel(BaseChannel):
         snr_db (float, optional): SNR in dB (alternative to avg_noise_power)
         shadow_sigma_db (float, optional): Standard deviation in dB for log-normal shadowing,
             used only when fading_type='lognormal'
+        doppler_model (str, optional): Time correlation of the scattered component across
+            coherence blocks: None for independent blocks (default), 'jakes' for the Clarke/Jakes
+            sum-of-sinusoids model :cite:`zheng2003simulation`, or 'ar1' for a first-order
+            autoregressive process :cite:`baddour2005autoregressive`
+        max_doppler (float, optional): Maximum Doppler frequency normalized to the sample rate
+            (f_D * T_s), required when doppler_model is set
+        num_sinusoids (int): Number of sinusoids of the 'jakes' model. Defaults to 16.
+
+    With a Doppler model, the fading is a continuous random process sampled once per coherence
+    block, and its state is carried over between forward calls: consecutive calls continue the
+    same realization, each starting at a new coherence block. The state is reset by
+    :meth:`reset_fading_state` or when the batch size or device changes.
 
     Example:
         >>> # Create a flat Rayleigh fading channel with coherence time of 10 samples
         >>> channel = FlatFadingChannel('rayleigh', coherence_time=10, snr_db=15)
         >>> x = torch.complex(torch.ones(100), torch.zeros(100))
         >>> y = channel(x)  # Output with block fading effects
+
+        >>> # Time-correlated fading for a mobile receiver, continued across calls
+        >>> channel = FlatFadingChannel('rayleigh', coherence_time=1, snr_db=15, doppler_model='jakes', max_doppler=0.01)
+        >>> y1, y2 = channel(x), channel(x)
     """
 
+    DOPPLER_MODELS = ("jakes", "ar1")
+
     k_factor: Optional[float]
     avg_noise_power: Optional[float]
     snr_db: Optional[float]
@@ -438,6 +457,9 @@ class FlatFadingChannel(BaseChannel):
         avg_noise_power: Optional[float] = None,
         snr_db: Optional[float] = None,
         shadow_sigma_db: Optional[float] = None,
+        doppler_model: Optional[str] = None,
+        max_doppler: Optional[float] = None,
+        num_sinusoids: int = 16,
         *args: Any,
         **kwargs: Any,
     ):
@@ -450,6 +472,9 @@ class FlatFadingChannel(BaseChannel):
             avg_noise_power (float, optional): Average noise power σ².
             snr_db (float, optional): SNR in dB (alternative to avg_noise_power).
             shadow_sigma_db (float, optional): Shadowing std dev in dB (for 'lognormal').
+            doppler_model (str, optional): Time correlation across coherence blocks (None, 'jakes', 'ar1').
+            max_doppler (float, optional): Normalized maximum Doppler frequency f_D * T_s.
+            num_sinusoids (int): Number of sinusoids of the 'jakes' model.
             *args: Variable length argument list passed to the base class.
             **kwargs: Arbitrary keyword arguments passed to the base class.
         """
@@ -472,6 +497,19 @@ class FlatFadingChannel(BaseChannel):
         if fading_type == "lognormal" and shadow_sigma_db is None:
             raise ValueError("shadow_sigma_db must be provided for lognormal fading")
 
+        # Validate and store the Doppler model
+        if doppler_model is not None:
+            if doppler_model not in self.DOPPLER_MODELS:
+                raise ValueError(f"Doppler model must be one of {list(self.DOPPLER_MODELS)}, got {doppler_model}")
+            if max_doppler is None or max_doppler <= 0:
+                raise ValueError(f"A positive max_doppler must be provided for the {doppler_model} Doppler model")
+            if num_sinusoids < 1:
+                raise ValueError(f"num_sinusoids must be positive, got {num_sinusoids}")
+        self.doppler_model = doppler_model
+        self.max_doppler = max_doppler
+        self.num_sinusoids = num_sinusoids
+        self._fading_state: Dict[str, Any] = {}
+
         # Store noise parameters
         if snr_db is not None:
             self.snr_db = snr_db
@@ -497,41 +535,24 @@ class FlatFadingChannel(BaseChannel):
         # Calculate number of fading blocks needed
         num_blocks = (seq_length + self.coherence_time - 1) // self.coherence_time
 
+        # Unit-power scattered component, independent or time-correlated across blocks
+        scattered = self._scattered_component(batch_size, num_blocks, device)
+
         if self.fading_type == "rayleigh":
-            # Complex Gaussian distribution for Rayleigh fading
-            h_real = torch.randn(batch_size, num_blocks, device=device)
-            h_imag = torch.randn(batch_size, num_blocks, device=device)
-            h = torch.complex(h_real, h_imag) / (2**0.5)
+            h = scattered
 
         elif self.fading_type == "rician":
             # Rician fading with K factor
-            # Ensure k_factor is tensor for calculations
             if self.k_factor is None:
                 raise ValueError("K-factor must be provided for Rician fading")
             k = torch.tensor(self.k_factor, device=device)
 
-            # Direct component (line of sight)
+            # Direct component (line of sight) plus scattered component
             los_magnitude = torch.sqrt(k / (k + 1))
-            los = los_magnitude * torch.ones(batch_size, num_blocks, device=device)
-
-            # Scattered component
-            scattered_magnitude = torch.sqrt(1 / (k + 1)) / (2**0.5)
-            h_real = torch.randn(batch_size, num_blocks, device=device) * scattered_magnitude
-            h_imag = torch.randn(batch_size, num_blocks, device=device) * scattered_magnitude
-            scattered = torch.complex(h_real, h_imag)
-
-            # Combined Rician fading
-            h = torch.complex(los, torch.zeros_like(los)) + scattered
+            h = los_magnitude + torch.sqrt(1 / (k + 1)) * scattered
 
         elif self.fading_type == "lognormal":
             # Log-normal shadowing combined with Rayleigh fading
-            # First generate Rayleigh component
-            h_real = torch.randn(batch_size, num_blocks, device=device)
-            h_imag = torch.randn(batch_size, num_blocks, device=device)
-            h_rayleigh = torch.complex(h_real, h_imag) / (2**0.5)
-
-            # Generate log-normal shadowing in linear scale
-            # Ensure shadow_sigma_db is tensor for calculations
             if self.shadow_sigma_db is None:
                 raise ValueError("shadow_sigma_db must be provided for lognormal fading")
             shadow_sigma_db_tensor = torch.tensor(self.shadow_sigma_db, device=device)
@@ -540,10 +561,95 @@ class FlatFadingChannel(BaseChannel):
             shadow = torch.exp(torch.randn(batch_size, num_blocks, device=device) * sigma_ln + ln_mean)
 
             # Apply shadowing to fast fading component
-            h = h_rayleigh * torch.complex(shadow, torch.zeros_like(shadow))
+            h = scattered * shadow
+
+        return h
+
+    def _scattered_component(self, batch_size: int, num_blocks: int, device: torch.device) -> torch.Tensor:
+        """Generate the unit-power complex Gaussian scattered component of every coherence block.
+
+        Without a Doppler model, the blocks are independent. With a Doppler model, the blocks are
+        consecutive samples of a continuous process, which continues the process of the previous
+        call for the same batch size and device.
+
+        Args:
+            batch_size (int): Number of independent channel realizations
+            num_blocks (int): Number of coherence blocks
+            device (torch.device): Device to create tensors on
 
+        Returns:
+            torch.Tensor: Complex coefficients of shape (batch_size, num_blocks)
+        """
+        if self.doppler_model is None:
+            return torch.complex(torch.randn(batch_size, num_blocks, device=device), torch.randn(batch_size, num_blocks, device=device)) / (2**0.5)
+
+        state = self._fading_state
+        if state.get("batch_size") != batch_size or state.get("device") != torch.device(device):
+            state.clear()
+            state.update(batch_size=batch_size, device=torch.device(device), offset=0)
+        if self.doppler_model == "jakes":
+            return self._jakes_process(state, batch_size, num_blocks, device)
+        return self._ar1_process(state, batch_size, num_blocks, device)
+
+    def _jakes_process(self, state: Dict[str, Any], batch_size: int, num_blocks: int, device: torch.device) -> torch.Tensor:
+        """Sample the sum-of-sinusoids fading process of Zheng and Xiao at the next blocks.
+
+        Every realization has M sinusoids with random arrival angles and phases, drawn once and
+        kept in the state, so the process is evaluated in closed form at any time.
+        """
+        M = self.num_sinusoids
+        if "frequencies" not in state:
+            theta = (torch.rand(batch_size, 1, device=device, dtype=torch.float64) * 2 - 1) * math.pi
+            n = torch.arange(1, M + 1, device=device, dtype=torch.float64)
+            alpha = (2 * math.pi * n - math.pi + theta) / (4 * M)
+
+            # Angular frequencies per block of the in-phase and quadrature sinusoids, and their initial phases
+            omega = 2 * math.pi * self.max_doppler * self.coherence_time
+            state["frequencies"] = torch.stack([omega * torch.cos(alpha), omega * torch.sin(alpha)])
+            state["phases"] = (torch.rand(2, batch_size, M, device=device, dtype=torch.float64) * 2 - 1) * math.pi
+
+        # Split the block index into t = q * fine_steps + r, so that cos(phi + w t) and sin(phi + w t) follow from
+        # angle-addition formulas of sinusoids tabulated over q and r, and the sum over the M sinusoids
+        # of the whole tile becomes a batched matrix product
+        frequencies, phases = state["frequencies"], state["phases"] + state["frequencies"] * state["offset"]
+        fine_steps = math.isqrt(max(num_blocks - 1, 0)) + 1
+        coarse_steps = (num_blocks + fine_steps - 1) // fine_steps
+        coarse = torch.remainder(phases.unsqueeze(-1) + frequencies.unsqueeze(-1) * (fine_steps * torch.arange(coarse_steps, device=device, dtype=torch.float64)), 2 * math.pi)
+        fine = frequencies.unsqueeze(-1) * torch.arange(fine_steps, device=device, dtype=torch.float64)
+        cos_coarse, sin_coarse = torch.cos(coarse).transpose(-1, -2), torch.sin(coarse).transpose(-1, -2)
+        cos_fine, sin_fine = torch.cos(fine), torch.sin(fine)
+        h_real = torch.bmm(cos_coarse[0], cos_fine[0]) - torch.bmm(sin_coarse[0], sin_fine[0])
+        h_imag = torch.bmm(sin_coarse[1], cos_fine[1]) + torch.bmm(cos_coarse[1], sin_fine[1])
+        state["offset"] += num_blocks
+        h = torch.complex(h_real.reshape(batch_size, -1)[:, :num_blocks].float(), h_imag.reshape(batch_size, -1)[:, :num_blocks].float())
+        return h / math.sqrt(M)
+
+    def _ar1_process(self, state: Dict[str, Any], batch_size: int, num_blocks: int, device: torch.device) -> torch.Tensor:
+        """Sample the first-order autoregressive fading process at the next blocks.
+
+        The process h[m] = rho * h[m-1] + sqrt(1 - rho^2) * w[m] with rho = J0(2 pi f_D L) matches
+        the Clarke autocorrelation at a lag of one coherence block of L samples. The recursion of a
+        whole tile is computed with log2(num_blocks) vectorized doubling steps.
+        """
+        rho = float(torch.special.bessel_j0(torch.tensor(2 * math.pi * self.max_doppler * self.coherence_time, dtype=torch.float64)))
+        if "last" not in state:
+            state["last"] = torch.complex(torch.randn(batch_size, 1, device=device), torch.randn(batch_size, 1, device=device)) / (2**0.5)
+
+        innovation = torch.complex(torch.randn(batch_size, num_blocks, device=device), torch.randn(batch_size, num_blocks, device=device)) * math.sqrt((1 - rho**2) / 2)
+        h = innovation
+        shift, factor = 1, rho
+        while shift < num_blocks:
+            h = torch.cat([h[:, :shift], h[:, shift:] + factor * h[:, :-shift]], dim=1)
+            shift, factor = 2 * shift, factor**2
+        h = h + state["last"] * rho ** torch.arange(1, num_blocks + 1, device=device, dtype=torch.float32)
+        state["last"] = h[:, -1:]
+        state["offset"] += num_blocks
         return h
 
+    def reset_fading_state(self) -> None:
+        """Start a new realization of the time-correlated fading process at the next call."""
+        self._fading_state.clear()
+
     def _expand_coefficients(self, h, seq_length):
         """Expand block fading coefficients to match input sequence length.
 
@@ -554,19 +660,7 @@ class FlatFadingChannel(BaseChannel):
         Returns:
             torch.Tensor: Expanded coefficients of shape (batch_size, seq_length)
         """
-        batch_size = h.shape[0]
-        device = h.device
-
-        # Create indices for each position in the sequence
-        block_indices = torch.arange(seq_length, device=device) // self.coherence_time
-
-        # Expand block fading coefficients to full sequence length
-        h_expanded = torch.zeros(batch_size, seq_length, dtype=h.dtype, device=device)
-
-        for b in range(batch_size):
-            h_expanded[b] = h[b, block_indices]
-
-        return h_expanded
+        return h.repeat_interleave(self.coherence_time, dim=1)[:, :seq_length]
 
     def forward(self, x: torch.Tensor, *args: Any, csi=None, noise=None, **kwargs: Any) -> torch.Tensor:
         """Apply flat fading and noise to the input signal.
@@ -954,3 +1048,255 @@ class LogNormalFadingChannel(FlatFadingChannel):
         kwargs["snr_db"] = snr_db
         kwargs["fading_type"] = "lognormal"
         super().__init__(*args, **kwargs)
+
+
+# Normalized delays and powers (dB) of the NLOS tapped delay line models of 3GPP TR 38.901, Table 7.7.2
+_TDL_PROFILES = {
+    "tdl-a": (
+        (0.0, 0.3819, 0.4025, 0.5868, 0.4610, 0.5375, 0.6708, 0.5750, 0.7618, 1.5375, 1.8978, 2.2242, 2.1718, 2.4942, 2.5119, 3.0582, 4.0810, 4.4579, 4.5695, 4.7966, 5.0066, 5.3043, 9.6586),
+        (-13.4, 0.0, -2.2, -4.0, -6.0, -8.2, -9.9, -10.5, -7.5, -15.9, -6.6, -16.7, -12.4, -15.2, -10.8, -11.3, -12.7, -16.2, -18.3, -18.9, -16.6, -19.9, -29.7),
+    ),
+    "tdl-b": (
+        (0.0, 0.1072, 0.2155, 0.2095, 0.2870, 0.2986, 0.3752, 0.5055, 0.3681, 0.3697, 0.5700, 0.5283, 1.1021, 1.2756, 1.5474, 1.7842, 2.0169, 2.8294, 3.0219, 3.6187, 4.1067, 4.2790, 4.7834),
+        (0.0, -2.2, -4.0, -3.2, -9.8, -1.2, -3.4, -5.2, -7.6, -3.0, -8.9, -9.0, -4.8, -5.7, -7.5, -1.9, -7.6, -12.2, -9.8, -11.4, -14.9, -9.2, -11.3),
+    ),
+    "tdl-c": (
+        (0.0, 0.2099, 0.2219, 0.2329, 0.2176, 0.6366, 0.6448, 0.6560, 0.6584, 0.7935, 0.8213, 0.9336, 1.2285, 1.3083, 2.1704, 2.7105, 4.2589, 4.6003, 5.4902, 5.6077, 6.3065, 6.6374, 7.0427, 8.6523),
+        (-4.4, -1.2, -3.5, -5.2, -2.5, 0.0, -2.2, -3.9, -7.4, -7.1, -10.7, -11.1, -5.1, -6.8, -8.7, -13.2, -13.9, -13.9, -15.8, -17.1, -16.0, -15.7, -21.6, -22.8),
+    ),
+}
+
+
+@ChannelRegistry.register_channel()
+class MultipathFadingChannel(BaseChannel):
+    """Frequency-selective multipath fading channel with a tapped delay line.
+
+    Models a wideband wireless channel as a causal FIR filter with independent complex Gaussian
+    (Rayleigh) taps whose average powers follow a power delay profile :cite:`goldsmith2005wireless`
+    :cite:`3gpp2020study`. Every batch element gets its own tap realization, which is either
+    constant over the whole sequence or redrawn every `coherence_time` samples.
+
+    Mathematical Model:
+        y[i] = Σ_l h_l[⌊i/L⌋] * x[i-l] + n[i]
+        where L is the coherence length, h_l ~ CN(0, p_l) with Σ_l p_l = 1,
+        and n ~ CN(0,σ²)
+
+    The convolution is computed directly, tap by tap, for short filters and with FFT-based
+    overlap-save convolution for long filters, both vectorized over the batch and the coherence
+    blocks. The output is truncated to the input length.
+
+    Args:
+        power_delay_profile (str or sequence): 'exponential' for an exponentially decaying
+            profile, 'tdl-a', 'tdl-b' or 'tdl-c' for the 3GPP tapped delay line models, or a
+            sequence of (linear) average tap powers at delays of 0, 1, 2, ... samples
+        delay_spread (float, optional): Delay spread in samples: the decay constant of the
+            'exponential' profile or the RMS delay spread that scales the normalized 3GPP delays
+        num_taps (int, optional): Number of taps of the 'exponential' profile. Defaults to
+            ceil(5 * delay_spread) + 1.
+        coherence_time (int, optional): Number of samples over which the taps remain constant.
+            Defaults to None (constant over the whole sequence).
+        avg_noise_power (float, optional): The average noise power σ²
+        snr_db (float, optional): SNR in dB (alternative to avg_noise_power)
+        method (str): Convolution method: 'direct', 'fft' or 'auto' (default), which uses FFT
+            convolution for filters of at least `fft_threshold` taps that are not longer than
+            the sequence
+        fft_threshold (int): Minimum number of taps for FFT convolution with method='auto'.
+            Defaults to 16.
+
+    Example:
+        >>> # TDL-C channel with an RMS delay spread of 4 samples, redrawn every OFDM symbol
+        >>> channel = MultipathFadingChannel('tdl-c', delay_spread=4.0, coherence_time=80, snr_db=20)
+        >>> x = torch.complex(torch.randn(32, 800), torch.randn(32, 800))
+        >>> y, csi = channel(x, return_csi=True, csi_fft_size=64)  # csi has shape (32, 10, 64)
+    """
+
+    PROFILES = ("exponential",) + tuple(_TDL_PROFILES)
+    METHODS = ("auto", "direct", "fft")
+
+    avg_noise_power: Optional[float]
+    snr_db: Optional[float]
+
+    def __init__(
+        self,
+        power_delay_profile: Union[str, Sequence[float], torch.Tensor] = "exponential",
+        delay_spread: Optional[float] = None,
+        num_taps: Optional[int] = None,
+        coherence_time: Optional[int] = None,
+        avg_noise_power: Optional[float] = None,
+        snr_db: Optional[float] = None,
+        method: str = "auto",
+        fft_threshold: int = 16,
+        *args: Any,
+        **kwargs: Any,
+    ):
+        """Initialize the Multipath Fading channel.
+
+        Args:
+            power_delay_profile (str or sequence): 'exponential', 'tdl-a', 'tdl-b', 'tdl-c' or tap powers.
+            delay_spread (float, optional): Delay spread in samples (for named profiles).
+            num_taps (int, optional): Number of taps (for 'exponential').
+            coherence_time (int, optional): Samples over which the taps are constant.
+            avg_noise_power (float, optional): Average noise power σ².
+            snr_db (float, optional): SNR in dB (alternative to avg_noise_power).
+            method (str): Convolution method ('auto', 'direct', 'fft').
+            fft_threshold (int): Minimum number of taps for FFT convolution with method='auto'.
+            *args: Variable length argument list passed to the base class.
+            **kwargs: Arbitrary keyword arguments passed to the base class.
+        """
+        super().__init__(*args, **kwargs)
+
+        if isinstance(power_delay_profile, str):
+            if power_delay_profile not in self.PROFILES:
+                raise ValueError(f"Power delay profile must be one of {list(self.PROFILES)}, got {power_delay_profile}")
+            if delay_spread is None or delay_spread <= 0:
+                raise ValueError(f"A positive delay_spread must be provided for the {power_delay_profile} profile")
+            if power_delay_profile == "exponential":
+                num_taps = num_taps if num_taps is not None else math.ceil(5 * delay_spread) + 1
+                if num_taps < 1:
+                    raise ValueError(f"num_taps must be positive, got {num_taps}")
+                tap_powers = torch.exp(-torch.arange(num_taps, dtype=torch.float64) / delay_spread)
+            else:
+                # Quantize the scaled delays to whole samples and merge the taps falling on the same sample
+                delays, powers_db = _TDL_PROFILES[power_delay_profile]
+                sample_delays = torch.round(torch.tensor(delays, dtype=torch.float64) * delay_spread).long()
+                tap_powers = torch.zeros(int(sample_delays.max()) + 1, dtype=torch.float64)
+                tap_powers.index_add_(0, sample_delays, 10 ** (torch.tensor(powers_db, dtype=torch.float64) / 10))
+        else:
+            tap_powers = torch.as_tensor(power_delay_profile, dtype=torch.float64).reshape(-1)
+            if tap_powers.numel() == 0 or (tap_powers < 0).any() or tap_powers.sum() <= 0:
+                raise ValueError("Tap powers must be non-negative and not all zero")
+        self.power_delay_profile = power_delay_profile
+        self.delay_spread = delay_spread
+        self.register_buffer("tap_powers", (tap_powers / tap_powers.sum()).float(), persistent=False)
+
+        if coherence_time is not None and coherence_time < 1:
+            raise ValueError(f"coherence_time must be positive, got {coherence_time}")
+        if method not in self.METHODS:
+            raise ValueError(f"Convolution method must be one of {list(self.METHODS)}, got {method}")
+        self.coherence_time = coherence_time
+        self.method = method
+        self.fft_threshold = fft_threshold
+
+        # Store noise parameters
+        if snr_db is not None:
+            self.snr_db = snr_db
+            self.avg_noise_power = None
+        elif avg_noise_power is not None:
+            self.avg_noise_power = avg_noise_power
+            self.snr_db = None
+        else:
+            raise ValueError("Either avg_noise_power or snr_db must be provided")
+
+    @property
+    def num_taps(self) -> int:
+        """Number of taps of the tapped delay line."""
+        return self.tap_powers.numel()
+
+    def _generate_taps(self, batch_size: int, num_blocks: int, device: torch.device) -> torch.Tensor:
+        """Draw independent tap realizations for every batch element and coherence block.
+
+        Args:
+            batch_size (int): Number of independent channel realizations
+            num_blocks (int): Number of coherence blocks
+            device (torch.device): Device to create tensors on
+
+        Returns:
+            torch.Tensor: Complex taps of shape (batch_size, num_blocks, num_taps)
+        """
+        shape = (batch_size, num_blocks, self.num_taps)
+        scattered = torch.complex(torch.randn(shape, device=device), torch.randn(shape, device=device))
+        return scattered * torch.sqrt(self.tap_powers.to(device) / 2)
+
+    def _direct_convolution(self, x: torch.Tensor, taps: torch.Tensor, block_length: int) -> torch.Tensor:
+        """Filter every coherence block with its taps by accumulating delayed copies of the input."""
+        batch_size, seq_length = x.shape
+        num_blocks, num_taps = taps.shape[1:]
+        x_padded = torch.nn.functional.pad(x, (num_taps - 1, num_blocks * block_length - seq_length))
+        y = torch.zeros(batch_size, num_blocks, block_length, dtype=x.dtype, device=x.device)
+        for lag in range(num_taps):
+            start = num_taps - 1 - lag
+            y += taps[:, :, lag : lag + 1] * x_padded[:, start : start + num_blocks * block_length].view(batch_size, num_blocks, block_length)
+        return y.reshape(batch_size, -1)[:, :seq_length]
+
+    def _fft_convolution(self, x: torch.Tensor, taps: torch.Tensor, block_length: int) -> torch.Tensor:
+        """Filter every coherence block with its taps by overlap-save FFT convolution.
+
+        Every coherence block is split into segments of `hop` outputs, and the `hop + num_taps - 1`
+        inputs each segment depends on are gathered, transformed and multiplied by the frequency
+        response of the taps of the block, all in a single batched FFT. The segments fill whole
+        FFT frames, so no zero padding is needed, and outputs past the end of a block are discarded.
+        """
+        batch_size, seq_length = x.shape
+        num_blocks, num_taps = taps.shape[1:]
+
+        # Segments of about 8 filter lengths balance the FFT size against the discarded overlap
+        max_hop = 2 ** math.ceil(math.log2(8 * num_taps)) - num_taps + 1
+        segments_per_block = -(-block_length // max_hop)
+        fft_size = 2 ** math.ceil(math.log2(-(-block_length // segments_per_block) + num_taps - 1))
+        hop = fft_size - num_taps + 1
+
+        starts = (torch.arange(num_blocks, device=x.device) * block_length).unsqueeze(1) + torch.arange(segments_per_block, device=x.device) * hop
+        indices = starts.unsqueeze(-1) + torch.arange(fft_size, device=x.device)
+        x_padded = torch.nn.functional.pad(x, (num_taps - 1, max(0, (num_blocks - 1) * block_length + segments_per_block * hop - seq_length)))
+
+        spectrum = torch.fft.fft(x_padded[:, indices]).mul_(torch.fft.fft(taps, n=fft_size).unsqueeze(2))
+        y = torch.fft.ifft(spectrum)[..., num_taps - 1 :]
+        return y.reshape(batch_size, num_blocks, -1)[:, :, :block_length].reshape(batch_size, -1)[:, :seq_length]
+
+    def forward(self, x: torch.Tensor, *args: Any, csi=None, noise=None, return_csi: bool = False, csi_fft_size: Optional[int] = None, **kwargs: Any) -> Union[torch.Tensor, Tuple[torch.Tensor, torch.Tensor]]:
+        """Apply multipath fading and noise to the input signal.
+
+        Args:
+            x (torch.Tensor): The input tensor of shape (seq_length,), (batch_size, seq_length) or
+                (batch_size, ...), whose trailing dimensions are flattened into the sequence.
+            *args: Additional positional arguments (unused).
+            csi (Optional[torch.Tensor]): Pre-computed taps of shape (batch_size, num_taps) or
+                (batch_size, num_blocks, num_taps). If provided, these taps are used instead of
+                generating new ones.
+            noise (Optional[torch.Tensor]): Pre-generated noise tensor. If provided, this noise is added.
+            return_csi (bool): Whether to also return the frequency response of the taps.
+            csi_fft_size (Optional[int]): Number of frequency bins of the returned frequency
+                response. Defaults to the number of samples per coherence block.
+            **kwargs: Additional keyword arguments (unused).
+
+        Returns:
+            torch.Tensor: The output tensor after applying fading and noise, and, if return_csi
+            is True, the frequency response of shape (batch_size, csi_fft_size) for taps constant
+            over the sequence or (batch_size, num_blocks, csi_fft_size) otherwise.
+        """
+        # Handle different input shapes
+        original_shape = x.shape
+        if x.dim() == 1:
+            x = x.unsqueeze(0)
+        x = x.reshape(x.shape[0], -1)
+
+        # Ensure input is complex
+        if not torch.is_complex(x):
+            x = torch.complex(x, torch.zeros_like(x))
+
+        batch_size, seq_length = x.shape
+
+        # Use provided taps if available, otherwise draw taps for every coherence block
+        if csi is not None:
+            static = csi.dim() == 2
+            taps = csi.to(x.dtype).unsqueeze(1) if static else csi.to(x.dtype)
+            block_length = seq_length if static else (self.coherence_time or -(-seq_length // taps.shape[1]))
+        else:
+            static = self.coherence_time is None
+            block_length = seq_length if static else self.coherence_time
+            taps = self._generate_taps(batch_size, -(-seq_length // block_length), x.device).to(x.dtype)
+
+        use_fft = self.method == "fft" or (self.method == "auto" and self.fft_threshold <= taps.shape[-1] <= seq_length)
+        y = self._fft_convolution(x, taps, block_length) if use_fft else self._direct_convolution(x, taps, block_length)
+
+        # Add noise if provided, otherwise generate it
+        if noise is not None:
+            y = y + noise.reshape(y.shape)
+        else:
+            y = _apply_noise(y, noise_power=self.avg_noise_power, snr_db=self.snr_db)
+        y = y.reshape(original_shape)
+
+        if not return_csi:
+            return y
+        frequency_response = torch.fft.fft(taps, n=csi_fft_size if csi_fft_size is not None else block_length)
+        return y, frequency_response.squeeze(1) if static else frequency_response
@@ -0,0 +1,226 @@
+"""Multiple-Input Multiple-Output (MIMO) channel implementations.
+
+This module provides a flat-fading MIMO channel for links with multiple transmit and receive
+antennas. Channel matrices of all batch elements (and coherence blocks) are drawn and applied as
+stacked matrices of shape (..., num_rx, num_tx), so that multi-antenna links are simulated without
+loops over batch elements or symbols.
+"""
+
+from typing import Any, Optional, Sequence, Tuple, Union
+
+import torch
+
+from .analog import _apply_noise
+from .base import BaseChannel
+from .registry import ChannelRegistry
+
+CorrelationSpec = Optional[Union[float, Sequence[Sequence[float]], torch.Tensor]]
+
+
+def _correlation_sqrt(correlation: CorrelationSpec, num_antennas: int, name: str) -> Optional[torch.Tensor]:
+    """Return the Hermitian square root of an antenna correlation matrix.
+
+    Args:
+        correlation: None for uncorrelated antennas, a coefficient ρ of the exponential model
+            R[i, j] = ρ^|i-j|, or a correlation matrix
+        num_antennas: Number of antennas
+        name: Name of the parameter, used in error messages
+
+    Returns:
+        Complex square root R^(1/2) of shape (num_antennas, num_antennas), or None
+
+    Raises:
+        ValueError: If the coefficient is outside [0, 1] or the matrix is not a Hermitian positive
+            semidefinite matrix of the right size
+    """
+    if correlation is None:
+        return None
+    if isinstance(correlation, (int, float)):
+        if not 0 <= correlation <= 1:
+            raise ValueError(f"{name} coefficient must be between 0 and 1, got {correlation}")
+        lags = torch.arange(num_antennas, dtype=torch.float64)
+        matrix = (float(correlation) ** (lags.unsqueeze(0) - lags.unsqueeze(1)).abs()).to(torch.complex128)
+    else:
+        matrix = torch.as_tensor(correlation).to(torch.complex128)
+        if matrix.shape != (num_antennas, num_antennas):
+            raise ValueError(f"{name} matrix must have shape ({num_antennas}, {num_antennas}), got {tuple(matrix.shape)}")
+        if not torch.allclose(matrix, matrix.mH):
+            raise ValueError(f"{name} matrix must be Hermitian")
+
+    eigenvalues, eigenvectors = torch.linalg.eigh(matrix)
+    if eigenvalues.min() < -1e-9:
+        raise ValueError(f"{name} matrix must be positive semidefinite")
+    return ((eigenvectors * eigenvalues.clamp(min=0).sqrt()) @ eigenvectors.mH).to(torch.complex64)
+
+
+@ChannelRegistry.register_channel()
+class MIMOChannel(BaseChannel):
+    """Flat-fading MIMO channel with spatially correlated Rayleigh or Rician fading.
+
+    Each transmitted vector of num_tx symbols is multiplied by a random channel matrix of shape
+    (num_rx, num_tx), and complex Gaussian noise is added at every receive antenna
+    :cite:`paulraj2003introduction` :cite:`tse2005fundamentals`. The channel matrix is either
+    constant for all vectors of a batch element or redrawn every `coherence_time` vectors.
+
+    Mathematical Model:
+        y[t] = H[⌊t/L⌋] x[t] + n[t]
+        where H = sqrt(K/(K+1)) H_LOS + sqrt(1/(K+1)) R_rx^(1/2) H_w R_tx^(1/2),
+        H_w has i.i.d. CN(0,1) entries, H_LOS is the all-ones matrix, and n ~ CN(0,σ²I)
+
+    The spatial correlation of the scattered component follows the Kronecker model, with the
+    receive and transmit correlation matrices given explicitly or by the exponential model
+    R[i, j] = ρ^|i-j|. The transmit power
+    is not normalized, i.e. every transmit antenna sends its symbols with their own energy.
+
+    Args:
+        num_tx (int): Number of transmit antennas
+        num_rx (int): Number of receive antennas
+        fading_type (str): 'rayleigh' or 'rician'. Defaults to 'rayleigh'.
+        k_factor (float, optional): Rician K-factor, used only when fading_type='rician'
+        tx_correlation (float or matrix, optional): Transmit antenna correlation coefficient or matrix
+        rx_correlation (float or matrix, optional): Receive antenna correlation coefficient or matrix
+        coherence_time (int, optional): Number of vectors over which the channel matrix remains
+            constant. Defaults to None (constant for all vectors of a batch element).
+        avg_noise_power (float, optional): The average noise power σ² per receive antenna
+        snr_db (float, optional): SNR in dB (alternative to avg_noise_power)
+
+    Example:
+        >>> # 4x4 Rayleigh channel with correlated receive antennas, redrawn for every vector
+        >>> channel = MIMOChannel(num_tx=4, num_rx=4, rx_correlation=0.5, coherence_time=1, snr_db=15)
+        >>> x = torch.complex(torch.randn(32, 100, 4), torch.randn(32, 100, 4))
+        >>> y, H = channel(x, return_csi=True)  # y: (32, 100, 4), H: (32, 100, 4, 4)
+    """
+
+    avg_noise_power: Optional[float]
+    snr_db: Optional[float]
+
+    def __init__(
+        self,
+        num_tx: int,
+        num_rx: int,
+        fading_type: str = "rayleigh",
+        k_factor: Optional[float] = None,
+        tx_correlation: CorrelationSpec = None,
+        rx_correlation: CorrelationSpec = None,
+        coherence_time: Optional[int] = None,
+        avg_noise_power: Optional[float] = None,
+        snr_db: Optional[float] = None,
+        *args: Any,
+        **kwargs: Any,
+    ):
+        """Initialize the MIMO channel.
+
+        Args:
+            num_tx (int): Number of transmit antennas.
+            num_rx (int): Number of receive antennas.
+            fading_type (str): Distribution type ('rayleigh', 'rician').
+            k_factor (float, optional): Rician K-factor (for 'rician').
+            tx_correlation (float or matrix, optional): Transmit correlation coefficient or matrix.
+            rx_correlation (float or matrix, optional): Receive correlation coefficient or matrix.
+            coherence_time (int, optional): Vectors over which the channel matrix is constant.
+            avg_noise_power (float, optional): Average noise power σ².
+            snr_db (float, optional): SNR in dB (alternative to avg_noise_power).
+            *args: Variable length argument list passed to the base class.
+            **kwargs: Arbitrary keyword arguments passed to the base class.
+        """
+        super().__init__(*args, **kwargs)
+
+        if num_tx < 1 or num_rx < 1:
+            raise ValueError(f"Number of antennas must be positive, got num_tx={num_tx} and num_rx={num_rx}")
+        valid_types = ["rayleigh", "rician"]
+        if fading_type not in valid_types:
+            raise ValueError(f"Fading type must be one of {valid_types}")
+        if fading_type == "rician" and (k_factor is None or k_factor < 0):
+            raise ValueError("A non-negative K-factor must be provided for Rician fading")
+        if coherence_time is not None and coherence_time < 1:
+            raise ValueError(f"coherence_time must be positive, got {coherence_time}")
+
+        self.num_tx = num_tx
+        self.num_rx = num_rx
+        self.fading_type = fading_type
+        self.k_factor = k_factor
+        self.coherence_time = coherence_time
+        self.register_buffer("tx_correlation_sqrt", _correlation_sqrt(tx_correlation, num_tx, "tx_correlation"), persistent=False)
+        self.register_buffer("rx_correlation_sqrt", _correlation_sqrt(rx_correlation, num_rx, "rx_correlation"), persistent=False)
+
+        # Store noise parameters
+        if snr_db is not None:
+            self.snr_db = snr_db
+            self.avg_noise_power = None
+        elif avg_noise_power is not None:
+            self.avg_noise_power = avg_noise_power
+            self.snr_db = None
+        else:
+            raise ValueError("Either avg_noise_power or snr_db must be provided")
+
+    def generate_channel_matrices(self, *batch_shape: int, device: Optional[torch.device] = None) -> torch.Tensor:
+        """Draw independent channel matrices.
+
+        Args:
+            *batch_shape: Shape of the batch of channel matrices
+            device (torch.device, optional): Device to create tensors on
+
+        Returns:
+            torch.Tensor: Complex channel matrices of shape (*batch_shape, num_rx, num_tx)
+        """
+        shape = (*batch_shape, self.num_rx, self.num_tx)
+        h = torch.complex(torch.randn(shape, device=device), torch.randn(shape, device=device)) / (2**0.5)
+
+        # Kronecker model of the spatial correlation of the scattered component
+        if self.rx_correlation_sqrt is not None:
+            h = self.rx_correlation_sqrt.to(h.device) @ h
+        if self.tx_correlation_sqrt is not None:
+            h = h @ self.tx_correlation_sqrt.to(h.device)
+
+        if self.fading_type == "rician":
+            k = float(self.k_factor)  # type: ignore[arg-type]
+            h = (k / (k + 1)) ** 0.5 + (1 / (k + 1)) ** 0.5 * h
+        return h
+
+    def forward(self, x: torch.Tensor, *args: Any, csi: Optional[torch.Tensor] = None, noise: Optional[torch.Tensor] = None, return_csi: bool = False, **kwargs: Any) -> Union[torch.Tensor, Tuple[torch.Tensor, torch.Tensor]]:
+        """Apply the MIMO channel and noise to the transmitted vectors.
+
+        Args:
+            x (torch.Tensor): Transmitted vectors of shape (batch_size, num_tx) or
+                (batch_size, num_vectors, num_tx).
+            *args: Additional positional arguments (unused).
+            csi (Optional[torch.Tensor]): Pre-computed channel matrices of shape
+                (batch_size, num_rx, num_tx), shared by all vectors of a batch element, or
+                (batch_size, num_vectors, num_rx, num_tx). If provided, these matrices are used
+                instead of generating new ones.
+            noise (Optional[torch.Tensor]): Pre-generated noise tensor. If provided, this noise is added.
+            return_csi (bool): Whether to also return the channel matrices.
+            **kwargs: Additional keyword arguments (unused).
+
+        Returns:
+            torch.Tensor: Received vectors of shape (batch_size, num_rx) or
+            (batch_size, num_vectors, num_rx), and, if return_csi is True, the channel matrices of
+            shape (batch_size, num_rx, num_tx) for a channel constant over all vectors or
+            (batch_size, num_vectors, num_rx, num_tx) otherwise.
+        """
+        if x.shape[-1] != self.num_tx:
+            raise ValueError(f"Last dimension of the input ({x.shape[-1]}) must equal num_tx ({self.num_tx})")
+        if not torch.is_complex(x):
+            x = torch.complex(x, torch.zeros_like(x))
+
+        if csi is not None:
+            h = csi.to(x.dtype)
+        elif self.coherence_time is None or x.dim() == 2:
+            h = self.generate_channel_matrices(x.shape[0], device=x.device)
+        else:
+            num_blocks = -(-x.shape[1] // self.coherence_time)
+            h = self.generate_channel_matrices(x.shape[0], num_blocks, device=x.device)
+            h = h.repeat_interleave(self.coherence_time, dim=1)[:, : x.shape[1]]
+
+        # A matrix shared by all vectors multiplies them as the columns of one matrix
+        if h.dim() == x.dim() + 1:
+            y = (h @ x.unsqueeze(-1)).squeeze(-1)
+        else:
+            y = (h @ x.mT).mT
+
+        # Add noise if provided, otherwise generate it
+        if noise is not None:
+            y = y + noise
+        else:
+            y = _apply_noise(y, noise_power=self.avg_noise_power, snr_db=self.snr_db)
+        return (y, h) if return_csi else y
@@ -3,10 +3,12 @@
 This module provides channel models for uplink communication scenarios where multiple users
 transmit simultaneously to a single receiver. The UplinkMACChannel uses a composition pattern,
 accepting existing channel implementations as parameters to model different channel conditions for
-individual user transmissions.
+individual user transmissions. The signals of all users are processed as one stacked tensor of
+shape (num_users, batch_size, ...), so that the cost per step does not grow with Python loops over
+users.
 """
 
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import torch
 
@@ -27,11 +29,20 @@ class UplinkMACChannel(BaseChannel):
     and combines the signals according to the MAC model. This enables realistic
     simulation of uplink scenarios with different channel conditions per user.
 
+    The user signals are given as a list of tensors or as one stacked tensor of shape
+    (num_users, batch_size, ...). Users that share a channel instance pass through it in a
+    single call on their signals folded into the batch dimension, so that fading and noise of
+    all these users are drawn at once. Channels configured with snr_db are called once per user
+    instead (unless the noise is given), so that the noise of every user is set relative to the
+    power of that user's own signal.
+
     Mathematical Model:
         For N users, the received signal is:
-        y = Σᵢ₌₁ᴺ hᵢ(xᵢ) + interference + noise
+        y = Σᵢ₌₁ᴺ zᵢ, with Z = (I + c (J - I)) G H(X)
 
-        where hᵢ(xᵢ) is the channel response for user i's signal xᵢ.
+        where H(X) stacks the channel responses hᵢ(xᵢ) of the user signals xᵢ, G is the diagonal
+        matrix of user gains, J is the all-ones matrix and c = sqrt(interference_power / (N - 1))
+        scales the interference every user receives from the other users.
 
     Args:
         user_channels (Union[BaseChannel, List[BaseChannel]]): Channel instances for each user.
@@ -64,8 +75,14 @@ class UplinkMACChannel(BaseChannel):
         ...     RayleighFadingChannel(coherence_time=5, avg_noise_power=0.15)
         ... ]
         >>> uplink_channel = UplinkMACChannel(user_channels=user_channels)
+
+        >>> # Stacked signals of 64 users sharing a Rayleigh fading channel
+        >>> massive_channel = UplinkMACChannel(RayleighFadingChannel(avg_noise_power=0.1), num_users=64)
+        >>> y = massive_channel(torch.randn(64, 32, 100, dtype=torch.complex64))  # (32, 100)
     """
 
+    user_gains: torch.Tensor
+
     def __init__(
         self,
         user_channels: Union[BaseChannel, List[BaseChannel]],
@@ -109,17 +126,24 @@ class UplinkMACChannel(BaseChannel):
 
         self.num_users = num_users
 
+        # Users sharing a channel instance are processed by it in a single call
+        groups: Dict[int, Tuple[BaseChannel, List[int]]] = {}
+        for i, channel in enumerate(self.user_channels):
+            groups.setdefault(id(channel), (channel, []))[1].append(i)
+        self._channel_groups = [(channel, torch.tensor(users)) for channel, users in groups.values()]
+
         # Validate and set up user gains
         if user_gains is None:
-            self.user_gains = torch.ones(self.num_users, dtype=torch.float32)
+            gains = torch.ones(self.num_users, dtype=torch.float32)
         elif isinstance(user_gains, (int, float)):
-            self.user_gains = torch.full((self.num_users,), float(user_gains), dtype=torch.float32)
+            gains = torch.full((self.num_users,), float(user_gains), dtype=torch.float32)
         elif isinstance(user_gains, list):
             if len(user_gains) != self.num_users:
                 raise ValueError(f"Length of user_gains ({len(user_gains)}) must match num_users ({self.num_users})")
-            self.user_gains = torch.tensor(user_gains, dtype=torch.float32)
+            gains = torch.tensor(user_gains, dtype=torch.float32)
         else:
             raise TypeError("user_gains must be a number or a list of numbers")
+        self.register_buffer("user_gains", gains, persistent=False)
 
         # Validate interference power
         if interference_power < 0:
@@ -132,24 +156,49 @@ class UplinkMACChannel(BaseChannel):
             raise ValueError(f"combine_method must be one of {valid_methods}")
         self.combine_method = combine_method
 
+    def _stack_users(self, tensors: Union[torch.Tensor, Sequence[torch.Tensor]], name: str) -> torch.Tensor:
+        """Validate per-user tensors and stack them along a leading user dimension.
+
+        Args:
+            tensors (Union[torch.Tensor, Sequence[torch.Tensor]]): A list with one tensor per
+                user, or a tensor whose first dimension indexes the users.
+            name (str): Name of the tensors, used in error messages.
+
+        Returns:
+            torch.Tensor: Tensor of shape (num_users, ...).
+        """
+        if isinstance(tensors, torch.Tensor):
+            if tensors.dim() == 0 or tensors.shape[0] != self.num_users:
+                raise ValueError(f"Expected {self.num_users} {name}, got {tensors.shape[0] if tensors.dim() else 0}")
+            return tensors
+        if len(tensors) != self.num_users:
+            raise ValueError(f"Expected {self.num_users} {name}, got {len(tensors)}")
+
+        reference_shape = tensors[0].shape
+        for i, tensor in enumerate(tensors[1:], 1):
+            if tensor.shape != reference_shape:
+                raise ValueError(f"All {name} must have the same shape. " f"User 0: {reference_shape}, User {i}: {tensor.shape}")
+        return torch.stack(list(tensors))
+
     def forward(
         self,
-        x: List[torch.Tensor],
+        x: Union[torch.Tensor, List[torch.Tensor]],
         *args: Any,
-        user_csi: Optional[List[torch.Tensor]] = None,
-        user_noise: Optional[List[torch.Tensor]] = None,
+        user_csi: Optional[Union[torch.Tensor, List[torch.Tensor]]] = None,
+        user_noise: Optional[Union[torch.Tensor, List[torch.Tensor]]] = None,
         **kwargs: Any,
     ) -> torch.Tensor:
         """Apply uplink MAC channel effects to user signals.
 
         Args:
-            x (List[torch.Tensor]): List of input signals, one per user.
-                Each tensor should have the same shape.
+            x (Union[torch.Tensor, List[torch.Tensor]]): Input signals, as a list with one tensor
+                per user or as a stacked tensor of shape (num_users, batch_size, ...).
+                All user signals must have the same shape.
             *args: Additional positional arguments passed to individual channels.
-            user_csi (Optional[List[torch.Tensor]]): Per-user channel state information.
-                If provided, should be a list of CSI tensors (one per user).
-            user_noise (Optional[List[torch.Tensor]]): Per-user noise tensors.
-                If provided, should be a list of noise tensors (one per user).
+            user_csi (Optional[Union[torch.Tensor, List[torch.Tensor]]]): Per-user channel state
+                information, as a list (one per user) or a stacked tensor.
+            user_noise (Optional[Union[torch.Tensor, List[torch.Tensor]]]): Per-user noise, as a
+                list (one per user) or a stacked tensor.
             **kwargs: Additional keyword arguments passed to individual channels.
 
         Returns:
@@ -157,105 +206,119 @@ class UplinkMACChannel(BaseChannel):
                 and inter-user interference.
 
         Raises:
+            TypeError: If the input signals are neither a list nor a tensor.
             ValueError: If the number of input signals doesn't match num_users.
-            ValueError: If user_csi or user_noise lists don't match num_users.
+            ValueError: If user_csi or user_noise don't match num_users.
         """
-        user_signals = x
-
-        # Validate inputs
-        if not isinstance(x, list):
-            raise TypeError("user_signals must be a list of torch.Tensors")
-
-        if len(user_signals) != self.num_users:
-            raise ValueError(f"Expected {self.num_users} user signals, got {len(user_signals)}")
-
-        if user_csi is not None and len(user_csi) != self.num_users:
-            raise ValueError(f"Expected {self.num_users} user_csi, got {len(user_csi)}")
+        if not isinstance(x, (list, tuple, torch.Tensor)):
+            raise TypeError("user_signals must be a list of torch.Tensors or a stacked torch.Tensor")
 
-        if user_noise is not None and len(user_noise) != self.num_users:
-            raise ValueError(f"Expected {self.num_users} user_noise, got {len(user_noise)}")
+        user_signals = self._stack_users(x, "user signals")
+        csi = self._stack_users(user_csi, "user_csi") if user_csi is not None else None
+        noise = self._stack_users(user_noise, "user_noise") if user_noise is not None else None
 
-        # Validate that all user signals have the same shape
-        reference_shape = user_signals[0].shape
-        for i, signal in enumerate(user_signals[1:], 1):
-            if signal.shape != reference_shape:
-                raise ValueError(f"All user signals must have the same shape. " f"User 0: {reference_shape}, User {i}: {signal.shape}")
+        # Process the signals of all users through their respective channels
+        processed_signals = self._apply_user_channels(user_signals, csi, noise, *args, **kwargs)
 
-        # Process each user's signal through their respective channel
-        processed_signals = []
-        for i in range(self.num_users):
-            channel = self.user_channels[i]
-            signal = user_signals[i]
-            gain = self.user_gains[i]
-
-            # Prepare channel-specific arguments
-            channel_kwargs = kwargs.copy()
-            if user_csi is not None:
-                channel_kwargs["csi"] = user_csi[i]
-            if user_noise is not None:
-                channel_kwargs["noise"] = user_noise[i]
-
-            # Apply channel effects
-            processed_signal = channel(signal, *args, **channel_kwargs)
-
-            # Apply user-specific gain
-            gain_value = gain.item() if hasattr(gain, "item") else gain
-            if gain_value != 1.0:
-                processed_signal = processed_signal * gain_value
-
-            processed_signals.append(processed_signal)
+        # Apply user-specific gains
+        gains = self.user_gains.to(processed_signals.device)
+        processed_signals = processed_signals * gains.view(-1, *([1] * (processed_signals.dim() - 1)))
 
         # Add inter-user interference if specified
         if self.interference_power > 0:
             processed_signals = self._add_interference(processed_signals)
 
         # Combine signals according to the specified method
-        combined_signal = self._combine_signals(processed_signals)
+        return self._combine_signals(processed_signals)
 
-        return combined_signal
+    def _apply_user_channels(self, signals: torch.Tensor, csi: Optional[torch.Tensor], noise: Optional[torch.Tensor], *args: Any, **kwargs: Any) -> torch.Tensor:
+        """Apply the channel of every user to the stacked user signals.
 
-    def _add_interference(self, processed_signals: List[torch.Tensor]) -> List[torch.Tensor]:
-        """Add inter-user interference to processed signals.
+        The signals of all users sharing a channel are folded into the batch dimension and
+        processed in a single call of that channel. Per-user signals without a batch dimension,
+        of shape (num_users, length), become one batch row per user, so that channel effects
+        such as coherence blocks never span two users. Channels that derive the noise power from
+        an SNR measure the signal power over their whole input, so unless the noise is given,
+        they are called once per user to scale the noise to the power of that user alone.
 
         Args:
-            processed_signals (List[torch.Tensor]): List of processed user signals.
+            signals (torch.Tensor): User signals of shape (num_users, batch_size, ...).
+            csi (Optional[torch.Tensor]): Stacked per-user channel state information.
+            noise (Optional[torch.Tensor]): Stacked per-user noise.
+            *args: Additional positional arguments passed to the channels.
+            **kwargs: Additional keyword arguments passed to the channels.
 
         Returns:
-            List[torch.Tensor]: Signals with added interference.
+            torch.Tensor: Channel outputs of shape (num_users, batch_size, ...).
         """
-        if self.interference_power <= 0:
-            return processed_signals
+        outputs: Optional[torch.Tensor] = None
+        has_batch_dim = signals.dim() > 2
+        for channel, group in self._channel_groups:
+            per_user_noise = noise is None and getattr(channel, "snr_db", None) is not None
+            for users in group.split(1) if per_user_noise else (group,):
+                all_users = users.numel() == self.num_users
+                users = users.to(signals.device)
+
+                def select(tensor: torch.Tensor) -> torch.Tensor:
+                    selected = tensor if all_users else tensor.index_select(0, users.to(tensor.device))
+                    return selected.reshape(-1, *selected.shape[2:]) if has_batch_dim else selected
+
+                channel_kwargs = kwargs.copy()
+                if csi is not None:
+                    channel_kwargs["csi"] = select(csi)
+                if noise is not None:
+                    channel_kwargs["noise"] = select(noise)
+
+                # Apply channel effects
+                output = channel(select(signals), *args, **channel_kwargs)
+                if has_batch_dim:
+                    output = output.reshape(users.numel(), -1, *output.shape[1:])
+                if all_users:
+                    return output
+                if outputs is None:
+                    outputs = output.new_empty(self.num_users, *output.shape[1:])
+                outputs.index_copy_(0, users, output)
+        return outputs  # type: ignore[return-value]
+
+    def _add_interference(self, processed_signals: Union[torch.Tensor, List[torch.Tensor]]) -> Union[torch.Tensor, List[torch.Tensor]]:
+        """Add inter-user interference to processed signals.
+
+        Every user receives the sum of the signals of all other users, scaled by
+        sqrt(interference_power / (num_users - 1)). The interference (J - I) X of all users
+        is computed at once as the total signal minus the signal of each user.
 
-        # Create interference signals
-        interfered_signals = []
-        for i, signal in enumerate(processed_signals):
-            # Generate interference from other users
-            interference = torch.zeros_like(signal)
-            for j, other_signal in enumerate(processed_signals):
-                if i != j:  # Don't add self-interference
-                    # Add scaled version of other user's signal as interference
-                    interference_scale = torch.sqrt(torch.tensor(self.interference_power, device=signal.device))
-                    interference += other_signal * interference_scale / torch.sqrt(torch.tensor(self.num_users - 1, device=signal.device))
+        Args:
+            processed_signals (Union[torch.Tensor, List[torch.Tensor]]): Processed user signals,
+                stacked with shape (num_users, ...) or as a list.
 
-            interfered_signals.append(signal + interference)
+        Returns:
+            Union[torch.Tensor, List[torch.Tensor]]: Signals with added interference, in the
+                same format as the input.
+        """
+        if self.interference_power <= 0 or self.num_users < 2:
+            return processed_signals
+        if not isinstance(processed_signals, torch.Tensor):
+            return list(self._add_interference(torch.stack(processed_signals)).unbind(0))  # type: ignore[union-attr]
 
-        return interfered_signals
+        scale = (self.interference_power / (self.num_users - 1)) ** 0.5
+        total = processed_signals.sum(dim=0, keepdim=True)
+        return processed_signals.mul(1 - scale).add_(total, alpha=scale)
 
-    def _combine_signals(self, signals: List[torch.Tensor]) -> torch.Tensor:
+    def _combine_signals(self, signals: Union[torch.Tensor, List[torch.Tensor]]) -> torch.Tensor:
         """Combine processed user signals according to the specified method.
 
         Args:
-            signals (List[torch.Tensor]): List of processed user signals.
+            signals (Union[torch.Tensor, List[torch.Tensor]]): Processed user signals, stacked
+                with shape (num_users, ...) or as a list.
 
         Returns:
             torch.Tensor: Combined signal.
         """
-        if self.combine_method == "sum":
-            # Simple summation (superposition principle)
-            return torch.sum(torch.stack(signals), dim=0)
-        elif self.combine_method == "weighted_sum":
-            # Weighted summation using user gains (gains already applied in forward method)
-            return torch.sum(torch.stack(signals), dim=0)
+        if not isinstance(signals, torch.Tensor):
+            signals = torch.stack(signals)
+        if self.combine_method in ("sum", "weighted_sum"):
+            # Superposition of the user signals (gains already applied in forward method)
+            return signals.sum(dim=0)
         else:
             # This should not happen due to validation in __init__
             raise ValueError(f"Unknown combine method: {self.combine_method}")
@@ -6,8 +6,11 @@ data, allowing receivers to detect and correct errors without retransmission.
 
 Key components:
 - algebra: Mathematical foundations for finite fields and binary polynomials
+- cache: On-disk cache of code construction artifacts
+- gf2: Bit-packed GF(2) kernels for encoding and syndrome computation
 - encoders: Various channel encoding schemes (block codes, algebraic codes, etc.)
 - decoders: Implementations of corresponding decoding algorithms
+- streaming: Constant-memory encoding and decoding of long bit streams
 - utils: Utility functions for binary operations and code manipulation
 
 Common FEC codes implemented:
@@ -19,6 +22,6 @@ These implementations can be used in communication system simulations, coded mod
 schemes, and for educational purposes in information theory and coding :cite:`lin2004error,moon2005error`.
 """
 
-from . import algebra, decoders, encoders, utils
+from . import algebra, cache, decoders, encoders, gf2, streaming, utils
 
-__all__ = ["algebra", "encoders", "decoders", "utils"]
+__all__ = ["algebra", "cache", "encoders", "decoders", "gf2", "streaming", "utils"]
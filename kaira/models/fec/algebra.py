@@ -7,6 +7,7 @@ The module implements:
 - Binary polynomials over GF(2) with efficient arithmetic operations
 - Finite fields GF(2^m) with complete field arithmetic
 - Field element operations including inverses, minimal polynomials, and traces
+- Batched GF(2^m) arithmetic over integer tensors based on log/exp lookup tables
 
 These implementations form the mathematical foundation for more complex error correction codes
 and are optimized for both correctness and computational efficiency. The module supports both
@@ -16,7 +17,7 @@ symbolic manipulations and numeric computations compatible with PyTorch tensors.
     :cite:`blahut2003algebraic`
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import torch
 
@@ -460,20 +461,153 @@ class FiniteBifield:
     def _init_log_exp_tables(self) -> None:
         """Initialize log and exponential tables for fast field arithmetic."""
         # Initialize exp and log tables
-        primitive_element = 2  # The element "x" is 2 in our representation
         self._exp_table[0] = 1
         self._log_table[0] = 0  # log(0) is undefined, but we set it to 0 for convenience
 
+        # Successive powers of the primitive element x (represented by 2), reduced modulo
+        # the primitive polynomial whenever the degree reaches m
         value = 1
-        for i in range(1, self.size):
-            value = (value * primitive_element) % self.size
-            if value == 0:
-                # This should not happen with a primitive polynomial
-                break
+        for i in range(1, self.size - 1):
+            value <<= 1
+            if value & self.size:
+                value ^= self.modulus.value
 
             self._exp_table[i] = value
             self._log_table[value] = i
 
+        # alpha^(2^m - 1) = 1 closes the cycle, which lets products index the table without a modulo
+        self._exp_table[self.size - 1] = 1
+
+        # Tensor versions of the tables for batched arithmetic. The exp table is doubled so that
+        # the sum of two logarithms can be looked up directly.
+        self._exp_tensor = torch.tensor(self._exp_table[:-1] * 2, dtype=torch.long)
+        self._log_tensor = torch.tensor(self._log_table, dtype=torch.long)
+
+    def log_exp_tensors(self, device: Optional[torch.device] = None) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Get the logarithm and exponential lookup tables as tensors.
+
+        Args:
+            device: Device to place the tables on. Default is CPU.
+
+        Returns:
+            Tuple of (log table of shape (2^m,), exp table of shape (2 * (2^m - 1),)). The exp
+            table holds alpha^i for i in [0, 2 * (2^m - 1)), the log table holds the discrete
+            logarithm of every non-zero element (and 0 for the zero element).
+        """
+        if device is not None and self._log_tensor.device != torch.device(device):
+            return self._log_tensor.to(device), self._exp_tensor.to(device)
+        return self._log_tensor, self._exp_tensor
+
+    def tensor_add(self, a: torch.Tensor, b: torch.Tensor) -> torch.Tensor:
+        """Add field elements given as integer tensors.
+
+        Args:
+            a: Integer tensor of field elements.
+            b: Integer tensor of field elements, broadcastable with a.
+
+        Returns:
+            Element-wise sum (bitwise XOR) of a and b.
+        """
+        return torch.bitwise_xor(a, b)
+
+    def tensor_sum(self, a: torch.Tensor, dim: int = -1) -> torch.Tensor:
+        """Sum field elements given as an integer tensor along a dimension.
+
+        Args:
+            a: Integer tensor of field elements.
+            dim: Dimension to reduce.
+
+        Returns:
+            Field sum of a along dim, i.e. the XOR of all elements.
+        """
+        # XOR is the parity of every bit plane; the appended bit dimension shifts negative dims by one
+        parity = self.tensor_to_bits(a).sum(dim=dim - 1 if dim < 0 else dim) & 1
+        return self.tensor_from_bits(parity)
+
+    def tensor_mul(self, a: torch.Tensor, b: torch.Tensor) -> torch.Tensor:
+        """Multiply field elements given as integer tensors.
+
+        Args:
+            a: Integer tensor of field elements.
+            b: Integer tensor of field elements, broadcastable with a.
+
+        Returns:
+            Element-wise field product of a and b.
+        """
+        log, exp = self.log_exp_tensors(a.device)
+        a, b = a.long(), b.long()
+        product = exp[log[a] + log[b]]
+        return torch.where((a == 0) | (b == 0), torch.zeros_like(product), product)
+
+    def tensor_inv(self, a: torch.Tensor) -> torch.Tensor:
+        """Compute multiplicative inverses of field elements given as an integer tensor.
+
+        Args:
+            a: Integer tensor of non-zero field elements.
+
+        Returns:
+            Element-wise multiplicative inverse of a.
+
+        Raises:
+            ValueError: If a contains the zero element.
+        """
+        if bool((a == 0).any()):
+            raise ValueError("Cannot compute inverse of zero")
+        log, exp = self.log_exp_tensors(a.device)
+        return exp[(self.size - 1 - log[a.long()]) % (self.size - 1)]
+
+    def tensor_pow(self, a: torch.Tensor, exponent: Union[int, torch.Tensor]) -> torch.Tensor:
+        """Raise field elements given as an integer tensor to non-negative powers.
+
+        Args:
+            a: Integer tensor of field elements.
+            exponent: Non-negative integer exponent, or integer tensor of exponents
+                broadcastable with a.
+
+        Returns:
+            Element-wise power a^exponent, with 0^0 = 1.
+        """
+        log, exp = self.log_exp_tensors(a.device)
+        a = a.long()
+        exponent = torch.as_tensor(exponent, dtype=torch.long, device=a.device)
+        power = exp[(log[a] * exponent) % (self.size - 1)]
+        return torch.where((a == 0) & (exponent > 0), torch.zeros_like(power), power)
+
+    def tensor_alpha_power(self, exponent: Union[int, torch.Tensor]) -> torch.Tensor:
+        """Compute powers of the primitive element for integer exponents.
+
+        Args:
+            exponent: Integer or integer tensor of exponents (may be negative).
+
+        Returns:
+            Tensor of alpha^exponent.
+        """
+        exponent = torch.as_tensor(exponent, dtype=torch.long)
+        _, exp = self.log_exp_tensors(exponent.device)
+        return exp[exponent % (self.size - 1)]
+
+    def tensor_to_bits(self, a: torch.Tensor) -> torch.Tensor:
+        """Expand field elements given as an integer tensor into their binary vector representation.
+
+        Args:
+            a: Integer tensor of field elements with shape (...).
+
+        Returns:
+            Tensor of shape (..., m) holding the polynomial basis coefficients (least significant first).
+        """
+        return (a.long().unsqueeze(-1) >> torch.arange(self.m, device=a.device)) & 1
+
+    def tensor_from_bits(self, bits: torch.Tensor) -> torch.Tensor:
+        """Pack binary vector representations back into field elements.
+
+        Args:
+            bits: Binary tensor of shape (..., m) with coefficients least significant first.
+
+        Returns:
+            Integer tensor of shape (...) holding the field elements.
+        """
+        return (bits.long() << torch.arange(self.m, device=bits.device)).sum(dim=-1)
+
     def __call__(self, value: int) -> "FiniteBifieldElement":
         """Create an element of the field.
 
@@ -609,14 +743,11 @@ class FiniteBifieldElement:
         if other.value == 1:
             return self
 
-        # Convert to polynomials
-        a_poly = BinaryPolynomial(self.value)
-        b_poly = BinaryPolynomial(other.value)
-
-        # Multiply and reduce modulo the field's modulus
-        result_poly = (a_poly * b_poly) % self.field.modulus
+        # Multiply via the discrete logarithm tables: a * b = alpha^(log a + log b)
+        log_table, exp_table = self.field._log_table, self.field._exp_table
+        exponent = (log_table[self.value] + log_table[other.value]) % (self.field.size - 1)
 
-        return FiniteBifieldElement(self.field, result_poly.value)
+        return FiniteBifieldElement(self.field, exp_table[exponent])
 
     def __pow__(self, exponent: int) -> "FiniteBifieldElement":
         """Raise the element to a power.
@@ -0,0 +1,189 @@
+"""On-disk cache of code construction artifacts for forward error correction.
+
+Constructing a code can be much more expensive than using it: the parity check matrix of an
+LDPC code is downloaded and parsed, its generator matrix and right inverse are derived by
+Gaussian elimination, and decoders precompute syndrome tables and Tanner graph indices. When
+many processes build the same codes (e.g. the workers of a simulation sweep), these artifacts
+can be stored once in a cache directory and loaded by every later construction.
+
+The cache is disabled unless a directory is configured through the ``KAIRA_FEC_CACHE_DIR``
+environment variable. Artifacts are stored as ``.pt`` files named after the kind of artifact
+and a content hash of the code definition (see :func:`artifact_key`), so different codes
+never share an entry and an entry never has to be invalidated. Files are written atomically
+and loaded memory-mapped, so concurrent processes can share the same directory. Lists of many
+small tensors (e.g. per-node index tables) load much faster when packed with :func:`pack_ragged`.
+
+Functions:
+    get_cache_dir: Return the configured cache directory, or None if caching is disabled
+    artifact_key: Hash tensors and parameters into a key identifying a code definition
+    load_artifact: Load a cached artifact
+    save_artifact: Store an artifact in the cache
+    cached_artifact: Load an artifact from the cache, or build and store it
+    pack_ragged: Pack a list of tensors of different shapes into two tensors for storage
+    unpack_ragged: Recover the list of tensors packed by pack_ragged
+
+Examples:
+    >>> import os
+    >>> os.environ["KAIRA_FEC_CACHE_DIR"] = "/tmp/kaira_fec_cache"
+    >>> H = torch.tensor([[1, 1, 0], [0, 1, 1]])
+    >>> key = artifact_key("example", H)
+    >>> artifact = cached_artifact("example", key, lambda: {"check_matrix": H})
+"""
+
+import hashlib
+import os
+import tempfile
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+import torch
+
+CACHE_DIR_ENV = "KAIRA_FEC_CACHE_DIR"
+
+
+def get_cache_dir(cache_dir: Optional[str] = None) -> Optional[str]:
+    """Return the cache directory.
+
+    Args:
+        cache_dir: Explicit cache directory, which takes precedence over the environment variable
+
+    Returns:
+        The cache directory, or None if caching is disabled
+    """
+    if cache_dir is not None:
+        return cache_dir
+    return os.environ.get(CACHE_DIR_ENV) or None
+
+
+def artifact_key(*parts: Any) -> str:
+    """Hash tensors and parameters into a key identifying a code definition.
+
+    Tensors are hashed by their shape, dtype and values, and all other parts by their string
+    representation, so the key only changes when the definition of the code changes.
+
+    Args:
+        *parts: Tensors and parameters defining the code (e.g. its parity check matrix)
+
+    Returns:
+        Hexadecimal key of 16 characters
+    """
+    digest = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, torch.Tensor):
+            part = part.detach().cpu().contiguous()
+            digest.update(f"tensor{tuple(part.shape)}{part.dtype}".encode())
+            digest.update(part.reshape(-1).view(torch.uint8).numpy().tobytes())
+        else:
+            digest.update(f"{type(part).__name__}:{part!r}".encode())
+        digest.update(b"|")
+    return digest.hexdigest()[:16]
+
+
+def _artifact_path(cache_dir: str, name: str, key: str) -> str:
+    """Return the path of the file holding an artifact."""
+    return os.path.join(cache_dir, f"{name}_{key}.pt")
+
+
+def load_artifact(name: str, key: str, cache_dir: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """Load a cached artifact.
+
+    Args:
+        name: Kind of artifact (e.g. "ldpc_generator")
+        key: Key of the code definition from :func:`artifact_key`
+        cache_dir: Cache directory. Defaults to the directory of the environment variable.
+
+    Returns:
+        Dictionary of the stored tensors and values, or None if caching is disabled or the
+        artifact is not in the cache
+    """
+    cache_dir = get_cache_dir(cache_dir)
+    if cache_dir is None:
+        return None
+    path = _artifact_path(cache_dir, name, key)
+    if not os.path.exists(path):
+        return None
+    return torch.load(path, map_location="cpu", mmap=True, weights_only=True)
+
+
+def save_artifact(name: str, key: str, artifact: Dict[str, Any], cache_dir: Optional[str] = None) -> None:
+    """Store an artifact in the cache.
+
+    The artifact is written to a temporary file that is then renamed, so a concurrent reader
+    never sees a partially written file.
+
+    Args:
+        name: Kind of artifact (e.g. "ldpc_generator")
+        key: Key of the code definition from :func:`artifact_key`
+        artifact: Dictionary of tensors, lists and numbers to store
+        cache_dir: Cache directory. Defaults to the directory of the environment variable.
+    """
+    cache_dir = get_cache_dir(cache_dir)
+    if cache_dir is None:
+        return
+    os.makedirs(cache_dir, exist_ok=True)
+    fd, temporary_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            torch.save(artifact, f)
+        os.replace(temporary_path, _artifact_path(cache_dir, name, key))
+    except BaseException:
+        os.remove(temporary_path)
+        raise
+
+
+def cached_artifact(name: str, key: str, build: Callable[[], Dict[str, Any]], cache_dir: Optional[str] = None) -> Dict[str, Any]:
+    """Load an artifact from the cache, or build and store it.
+
+    Args:
+        name: Kind of artifact (e.g. "ldpc_generator")
+        key: Key of the code definition from :func:`artifact_key`
+        build: Function computing the artifact as a dictionary of tensors, lists and numbers
+        cache_dir: Cache directory. Defaults to the directory of the environment variable.
+
+    Returns:
+        The cached or newly built artifact. Cached tensors are memory-mapped and on the CPU.
+    """
+    artifact = load_artifact(name, key, cache_dir)
+    if artifact is None:
+        artifact = build()
+        save_artifact(name, key, artifact, cache_dir)
+    return artifact
+
+
+def pack_ragged(items: Sequence[Union[torch.Tensor, List[int]]]) -> Dict[str, torch.Tensor]:
+    """Pack a list of tensors of different shapes into two tensors for storage.
+
+    Args:
+        items: Tensors or lists of integers. All non-empty items must have the same dtype.
+
+    Returns:
+        Dictionary with the flattened values of all items ("values") and a table of their
+        shapes ("shapes"), whose row i holds the number of dimensions of item i followed by
+        its sizes
+    """
+    tensors = [torch.as_tensor(item) for item in items]
+    max_dim = max((tensor.dim() for tensor in tensors), default=1)
+    shapes = torch.tensor([[tensor.dim(), *tensor.shape] + [0] * (max_dim - tensor.dim()) for tensor in tensors], dtype=torch.int64).view(len(tensors), max_dim + 1)
+
+    # Empty items do not contribute values, so they cannot change the dtype of the values
+    nonempty = [tensor.detach().cpu().reshape(-1) for tensor in tensors if tensor.numel() > 0]
+    values = torch.cat(nonempty) if nonempty else torch.zeros(0, dtype=torch.int64)
+    return {"values": values, "shapes": shapes}
+
+
+def unpack_ragged(packed: Dict[str, torch.Tensor], as_lists: bool = False) -> List[Any]:
+    """Recover the list of tensors packed by :func:`pack_ragged`.
+
+    Args:
+        packed: Dictionary returned by :func:`pack_ragged`
+        as_lists: If True, return every item as a (nested) list instead of a tensor
+
+    Returns:
+        List of the packed items. Empty items have the dtype of the values.
+    """
+    values, shapes = packed["values"], packed["shapes"].tolist()
+    sizes = [shape[1 : shape[0] + 1] for shape in shapes]
+    numels = [int(torch.Size(size).numel()) for size in sizes]
+    items = [chunk.reshape(size) for chunk, size in zip(values.split(numels), sizes)]
+    if as_lists:
+        return [item.tolist() for item in items]
+    return items
@@ -14,6 +14,9 @@ Decoders
 - BruteForceMLDecoder: Maximum likelihood decoder that searches through all possible codewords
 - BeliefPropagationDecoder: Implementation of belief propagation algorithm :cite:`kschischang2001factor` for decoding LDPC codes
 - MinSumLDPCDecoder: Min-Sum decoder :cite:`chen2005reduced` for LDPC codes with reduced computational complexity
+- SuccessiveCancellationListDecoder: Successive Cancellation List decoder for Polar codes with optional CRC-aided path selection
+- ChaseDecoder: Chase-II decoder :cite:`chase1972class` turning any hard-decision decoder into a soft-decision decoder
+- OrderedStatisticsDecoder: Ordered statistics decoder :cite:`fossorier1995soft` approaching maximum likelihood soft-decision decoding of short linear block codes
 
 These decoders can be used to recover original messages from possibly corrupted codewords
 that have been transmitted over noisy channels. Each decoder has specific strengths and
@@ -35,10 +38,13 @@ from .belief_propagation import BeliefPropagationDecoder
 from .belief_propagation_polar import BeliefPropagationPolarDecoder
 from .berlekamp_massey import BerlekampMasseyDecoder
 from .brute_force_ml import BruteForceMLDecoder
+from .chase import ChaseDecoder
 from .min_sum_ldpc import MinSumLDPCDecoder
+from .ordered_statistics import OrderedStatisticsDecoder
 from .reed_muller_decoder import ReedMullerDecoder
 from .successive_cancellation import SuccessiveCancellationDecoder
+from .successive_cancellation_list import SuccessiveCancellationListDecoder
 from .syndrome_lookup import SyndromeLookupDecoder
 from .wagner_soft_decision_decoder import WagnerSoftDecisionDecoder
 
-__all__ = ["BaseBlockDecoder", "SyndromeLookupDecoder", "BerlekampMasseyDecoder", "ReedMullerDecoder", "WagnerSoftDecisionDecoder", "BruteForceMLDecoder", "BeliefPropagationDecoder", "BeliefPropagationPolarDecoder", "SuccessiveCancellationDecoder", "MinSumLDPCDecoder"]
+__all__ = ["BaseBlockDecoder", "SyndromeLookupDecoder", "BerlekampMasseyDecoder", "ReedMullerDecoder", "WagnerSoftDecisionDecoder", "BruteForceMLDecoder", "BeliefPropagationDecoder", "BeliefPropagationPolarDecoder", "SuccessiveCancellationDecoder", "SuccessiveCancellationListDecoder", "MinSumLDPCDecoder", "OrderedStatisticsDecoder", "ChaseDecoder"]
@@ -13,6 +13,9 @@ Key Features:
 2. Supports both hard-decision and soft-decision decoding.
 3. Efficient handling of sparse parity-check matrices.
 4. Configurable number of iterations for decoding.
+5. Optional edge-list (CSR/COO) backend whose memory footprint is linear in the number of edges.
+6. Flooding or layered (row-serial) message-passing schedules.
+7. Optional per-codeword early termination based on the syndrome of the hard decisions.
 
 References:
     :cite:`kschischang2001factor`, :cite:`pearl1988probabilistic`, :cite:`mackay2003information`
@@ -35,6 +38,11 @@ Args:
     its approximation
     return_soft (bool): Boolean flag to determine whether to return the soft output
     device (str): The device to use for computation (e.g., "cpu" or "cuda"). Defaults to "cpu".
+    backend (str): Message-passing backend, either "combinations" (extrinsic index tables) or
+    "edge_list" (CSR/COO edge arrays with leave-one-out products). Defaults to "combinations".
+    schedule (str): Message-passing schedule, either "flooding" or "layered". Defaults to "flooding".
+    layers (Optional[List[List[int]]]): Partition of the check nodes into layers for the layered schedule.
+    early_stop (bool): Boolean flag to stop iterating on codewords that satisfy all parity checks. Defaults to False.
     *args: Additional positional arguments passed to the base class.
     **kwargs: Additional keyword arguments passed to the base class.**
 
@@ -73,13 +81,14 @@ Examples:
 
 from itertools import combinations
 from operator import itemgetter
-from typing import Any, Tuple, Union
+from typing import Any, List, Optional, Tuple, Union
 
 import torch
 
 from kaira.models.fec.encoders.ldpc_code import LDPCCodeEncoder
 from kaira.models.fec.encoders.linear_block_code import LinearBlockCodeEncoder
 
+from ..cache import artifact_key, cached_artifact, pack_ragged, unpack_ragged
 from ..utils import Taylor_arctanh, apply_blockwise, sign_to_bin
 from .base import BaseBlockDecoder
 
@@ -112,6 +121,12 @@ class BeliefPropagationDecoder(BaseBlockDecoder[Union[LinearBlockCodeEncoder, LD
         n (int): The length of the code (number of code bits).
         not_ldpc (bool): Boolean flag to indicate if the code is not LDPC.
         standard (bool): Boolean flag to indicate if the code is systematic.
+        backend (str): The message-passing backend in use.
+        schedule (str): The message-passing schedule in use.
+        layers (Optional[List[List[int]]]): The check node layers of the layered schedule.
+        early_stop (bool): Whether converged codewords are removed from the active set.
+        iteration_count (Optional[torch.Tensor]): Number of iterations run for every codeword in
+            the last call, with the leading dimensions of the input.
 
     Args:
         encoder (Union[LinearBlockCodeEncoder, LDPCCodeEncoder]): The encoder for the code being decoded
@@ -119,11 +134,17 @@ class BeliefPropagationDecoder(BaseBlockDecoder[Union[LinearBlockCodeEncoder, LD
         arctanh (bool): Boolean flag to determine whether to use the arctanh function for message updates or
         its approximation
         return_soft (bool): Boolean flag to determine whether to return the soft output
+        device (str): The device to use for computation
+        backend (str): Message-passing backend, "combinations" or "edge_list"
+        schedule (str): Message-passing schedule, "flooding" or "layered"
+        layers (Optional[List[List[int]]]): Check node layers for the layered schedule
+        early_stop (bool): Boolean flag to stop iterating on codewords that satisfy all parity checks
         *args: Variable positional arguments passed to the base class
         **kwargs: Variable keyword arguments passed to the base class
 
     Raises:
         TypeError: If the encoder is not a LinearBlockCodeEncoder or LDPCCodeEncoder
+        ValueError: If the backend or the schedule is not supported
 
     Examples:
         >>> from kaira.models.fec.encoders import LDPCCodeEncoder
@@ -155,7 +176,15 @@ class BeliefPropagationDecoder(BaseBlockDecoder[Union[LinearBlockCodeEncoder, LD
         True
     """
 
-    def __init__(self, encoder: Union[LinearBlockCodeEncoder, LDPCCodeEncoder], bp_iters: int = 10, arctanh: bool = True, return_soft: bool = False, device: str = "cpu", *args: Any, **kwargs: Any):
+    BACKENDS = ("combinations", "edge_list")
+    SCHEDULES = ("flooding", "layered")
+    # Tanner graph index structures built by prep_edge_ind and prep_edge_list, stored in the FEC cache:
+    # tensors, lists of per-node tensors and lists of per-node lists of indices
+    TANNER_GRAPH_TENSORS = ("lv_ind", "cv_order", "edge_var", "edge_check", "check_ptr", "check_edges", "edge_slot", "edge_active")
+    TANNER_GRAPH_TENSOR_LISTS = ("edge_map", "marg_ec", "ext_ec", "ext_ce")
+    TANNER_GRAPH_INDEX_LISTS = ("cv_map", "vc_group", "cv_group")
+
+    def __init__(self, encoder: Union[LinearBlockCodeEncoder, LDPCCodeEncoder], bp_iters: int = 10, arctanh: bool = True, return_soft: bool = False, device: str = "cpu", backend: str = "combinations", schedule: str = "flooding", layers: Optional[List[List[int]]] = None, early_stop: bool = False, *args: Any, **kwargs: Any):
         """Initialize the Belief Propagation decoder.
 
         Sets up the decoder with an encoder instance and extracts relevant parameters
@@ -166,16 +195,38 @@ class BeliefPropagationDecoder(BaseBlockDecoder[Union[LinearBlockCodeEncoder, LD
             bp_iters: Number of belief propagation iterations to perform.
             arctanh: Boolean flag to determine whether to use the arctanh function or its approximation
             return_soft: Boolean flag to determine whether to return the soft output
+            device: The device to use for computation
+            backend: Message-passing backend. "combinations" expands each check node with extrinsic
+                index tables, "edge_list" keeps the Tanner graph as CSR/COO index arrays and computes
+                leave-one-out products, so memory is linear in the number of edges.
+            schedule: Message-passing schedule. "flooding" updates all check nodes at once in every
+                iteration, "layered" processes layers of check nodes in turn and updates the posterior
+                LLRs after each layer, which typically converges in about half the iterations.
+            layers: Partition of the check nodes into layers for the layered schedule. If None, the
+                block rows of a quasi-cyclic code or a greedy grouping of check nodes with disjoint
+                variable nodes are used.
+            early_stop: Boolean flag to stop iterating on codewords whose hard decisions satisfy all
+                parity checks. The number of iterations run for every codeword is stored in
+                `iteration_count` after each call.
             *args: Variable positional arguments passed to the base class
             **kwargs: Variable keyword arguments passed to the base class
 
         Raises:
             TypeError: If the encoder is not a LinearBlockCodeEncoder or LDPCCodeEncoder
+            ValueError: If the backend or the schedule is not supported, or the layers are invalid
         """
         super().__init__(encoder, *args, **kwargs)
 
         if not isinstance(encoder, (LinearBlockCodeEncoder, LDPCCodeEncoder)):
             raise TypeError(f"Encoder must be a LinearBlockCodeEncoder or LDPCCodeEncoder, got {type(encoder).__name__}")
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}'. Supported backends: {self.BACKENDS}")
+        if schedule not in self.SCHEDULES:
+            raise ValueError(f"Unknown schedule '{schedule}'. Supported schedules: {self.SCHEDULES}")
+        self.backend = backend
+        self.schedule = schedule
+        self.early_stop = early_stop
+        self.iteration_count = None
         self.not_ldpc = False
         if isinstance(encoder, LinearBlockCodeEncoder):
             self.not_ldpc = True
@@ -183,7 +234,8 @@ class BeliefPropagationDecoder(BaseBlockDecoder[Union[LinearBlockCodeEncoder, LD
         self.arctanh = arctanh
 
         self.device = device
-        self.G = encoder.generator_matrix.to(torch.float32)
+        self.G = encoder.generator_matrix.to(torch.float32) if encoder.generator_matrix is not None else None
+        self.message_positions = getattr(encoder, "message_positions", None)
         self.H = encoder.check_matrix.to(torch.int64)
         self.k = encoder._dimension
         self.n = encoder._length
@@ -191,6 +243,9 @@ class BeliefPropagationDecoder(BaseBlockDecoder[Union[LinearBlockCodeEncoder, LD
         self.return_soft = return_soft
 
         self.calc_code_metrics()
+        self.layers = None
+        if self.schedule == "layered":
+            self.prep_layers(layers)
 
     def calc_code_metrics(self):
         """Calculate code metrics and prepare the Tanner graph representation.
@@ -202,17 +257,34 @@ class BeliefPropagationDecoder(BaseBlockDecoder[Union[LinearBlockCodeEncoder, LD
         - Number of variable nodes
         - Number of check nodes
 
-        It also initializes the Tanner graph structure and finds message indices
-        for non-standard codes.
+        It also initializes the Tanner graph structure (both the index tables and the
+        edge-list arrays) and finds message indices for non-standard codes. If the FEC cache is
+        enabled (see :mod:`kaira.models.fec.cache`), the Tanner graph structure is built once
+        per check matrix and backend and reused.
         """
         self.num_edges = torch.sum(self.H)
         self.var_degree = torch.sum(self.H, dim=0)
         self.check_degree = torch.sum(self.H, dim=1)
         self.n_v = self.H.size(1)
         self.n_c = self.H.size(0)
-        self.prep_edge_ind()
+
+        def build_tanner_graph():
+            self.prep_edge_ind()
+            self.prep_edge_list()
+            tanner_graph = {name: getattr(self, name) for name in self.TANNER_GRAPH_TENSORS}
+            tanner_graph.update({name: pack_ragged(getattr(self, name)) for name in self.TANNER_GRAPH_TENSOR_LISTS + self.TANNER_GRAPH_INDEX_LISTS})
+            return tanner_graph
+
+        tanner_graph = cached_artifact("bp_tanner_graph", artifact_key(self.H, self.backend), build_tanner_graph)
+        for name in self.TANNER_GRAPH_TENSORS:
+            setattr(self, name, tanner_graph[name].to(self.device))
+        for name in self.TANNER_GRAPH_TENSOR_LISTS:
+            setattr(self, name, [item.to(self.device) for item in unpack_ragged(tanner_graph[name])])
+        for name in self.TANNER_GRAPH_INDEX_LISTS:
+            setattr(self, name, unpack_ragged(tanner_graph[name], as_lists=True))
         if not self.standard:
-            self.idx_mess_t = torch.where(self.G.sum(0) == 1)[0]
+            # Encoders without a generator matrix report the positions of the message bits
+            self.idx_mess_t = self.message_positions if self.message_positions is not None else torch.where(self.G.sum(0) == 1)[0]
 
     def prep_edge_ind(self):
         """Prepare edge indices and map structures for the Tanner graph.
@@ -227,7 +299,8 @@ class BeliefPropagationDecoder(BaseBlockDecoder[Union[LinearBlockCodeEncoder, LD
         - lv_ind: List mapping edges to their variable nodes
         - edge_map: Maps each variable node to its incident edges
         - cv_map: Maps each check node to its incident edges
-        - marg_ec, ext_ec, ext_ce: Structures for message passing and marginalization
+        - marg_ec, ext_ec, ext_ce: Structures for message passing and marginalization (the
+          extrinsic tables ext_ec and ext_ce are only built for the "combinations" backend)
         - vc_group, cv_group: Groups of variable/check nodes with same degree
         """
         self.lv_ind = []
@@ -258,6 +331,8 @@ class BeliefPropagationDecoder(BaseBlockDecoder[Union[LinearBlockCodeEncoder, LD
 
             self.marg_ec.append(self.edge_map[v_node].to(self.device))
 
+            if self.backend != "combinations":
+                continue
             if self.var_degree[v_node] > 1:
                 node_ind = self.edge_map[v_node]
                 node_ind = combinations(node_ind, r=self.var_degree[v_node].item() - 1)
@@ -277,6 +352,8 @@ class BeliefPropagationDecoder(BaseBlockDecoder[Union[LinearBlockCodeEncoder, LD
                 self.cv_group.append([c_node])
 
             edge_order.extend(self.cv_map[c_node])
+            if self.backend != "combinations":
+                continue
             if self.check_degree[c_node] > 1:
                 node_ind = self.cv_map[c_node]
                 node_ind = combinations(node_ind, r=self.check_degree[c_node].item() - 1)
@@ -290,6 +367,134 @@ class BeliefPropagationDecoder(BaseBlockDecoder[Union[LinearBlockCodeEncoder, LD
         self.cv_order = torch.zeros(self.num_edges, dtype=torch.int64, device=self.device)
         self.cv_order[edge_order] = torch.arange(0, self.num_edges, device=self.device).to(torch.int64)
 
+    def build_check_table(self, check_nodes: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """Build the padded edge table of a set of check nodes.
+
+        Args:
+            check_nodes: Indices of the check nodes, in the order of the table rows
+
+        Returns:
+            Tuple containing:
+                - Edge indices of the check nodes, sorted by table row and then by variable node
+                - Padded [len(check_nodes), max_degree] table of positions into the edge indices,
+                  padded with the number of edges
+                - Flat position of every edge in the padded table
+        """
+        row_of_check = torch.full((self.n_c,), -1, dtype=torch.int64)
+        row_of_check[check_nodes] = torch.arange(len(check_nodes))
+        edge_rows = row_of_check[self.edge_check.cpu()]
+        edges = torch.nonzero(edge_rows >= 0).view(-1)
+        edges = edges[torch.argsort(edge_rows[edges] * self.n_v + self.edge_var.cpu()[edges])]
+        rows = edge_rows[edges]
+
+        degree = torch.bincount(rows, minlength=len(check_nodes))
+        ptr = torch.cat((torch.zeros(1, dtype=torch.int64), torch.cumsum(degree, dim=0)))
+        position = torch.arange(len(edges)) - ptr[rows]
+        max_degree = max(int(degree.max().item()), 1) if len(edges) > 0 else 1
+
+        table = torch.full((len(check_nodes), max_degree), len(edges), dtype=torch.int64)
+        table[rows, position] = torch.arange(len(edges))
+        slots = rows * max_degree + position
+        return edges, table, slots
+
+    def prep_edge_list(self):
+        """Prepare the edge-list (CSR/COO) representation of the Tanner graph.
+
+        Edges are numbered in the same order as in :meth:`prep_edge_ind` (by variable node, then by
+        check node), so messages produced by both backends are interchangeable. The method builds:
+
+        - edge_var: COO variable-node index of every edge
+        - edge_check: COO check-node index of every edge
+        - check_ptr: CSR row pointers of the check nodes into the check-sorted edge order
+        - check_edges: Padded [n_c, max_check_degree] table of edge indices per check node, padded
+          with the dummy edge index ``num_edges``
+        - edge_slot: Position of every edge in the flattened padded table
+        - edge_active: Mask of the edges attached to check nodes of degree larger than one
+        """
+        var_idx, check_idx = torch.nonzero(self.H.t().cpu(), as_tuple=True)
+        self.edge_var = var_idx
+        self.edge_check = check_idx
+
+        edges, table, slots = self.build_check_table(torch.arange(self.n_c))
+        check_ptr = torch.zeros(self.n_c + 1, dtype=torch.int64)
+        check_ptr[1:] = torch.cumsum(self.check_degree.cpu().to(torch.int64), dim=0)
+        edge_slot = torch.empty(len(edges), dtype=torch.int64)
+        edge_slot[edges] = slots
+
+        self.edge_var = var_idx.to(self.device)
+        self.edge_check = check_idx.to(self.device)
+        self.check_ptr = check_ptr.to(self.device)
+        self.check_edges = torch.cat((edges, torch.tensor([len(edges)]))).to(self.device)[table.to(self.device)]
+        self.edge_slot = edge_slot.to(self.device)
+        self.edge_active = (self.check_degree.cpu()[check_idx] > 1).to(self.device)
+
+    def compute_layers(self) -> List[List[int]]:
+        """Group the check nodes into layers for the layered schedule.
+
+        Check nodes in the same layer share no variable node, so the posterior LLRs of a whole layer
+        can be updated at once. If the encoder provides the lifting size of a quasi-cyclic code
+        (as the WiMAX/WiGig codes of the RPTU database do) and its block rows satisfy this
+        condition, every block row becomes one layer. Otherwise the check nodes are assigned
+        greedily to the first layer whose variable nodes they do not touch.
+
+        Returns:
+            List of layers, each being a list of check node indices
+        """
+        H = self.H.cpu().to(torch.bool)
+        lifting_size = getattr(self.encoder, "lifting_size", None)
+        if lifting_size and self.n_c % lifting_size == 0:
+            block_rows = [list(range(start, start + lifting_size)) for start in range(0, self.n_c, lifting_size)]
+            if all(H[block_row].sum(0).max() <= 1 for block_row in block_rows):
+                return block_rows
+
+        layers: List[List[int]] = []
+        usage: List[torch.Tensor] = []
+        for c_node in range(self.n_c):
+            row = H[c_node]
+            for layer, used in zip(layers, usage):
+                if not torch.any(used & row):
+                    layer.append(c_node)
+                    used |= row
+                    break
+            else:
+                layers.append([c_node])
+                usage.append(row.clone())
+        return layers
+
+    def prep_layers(self, layers: Optional[List[List[int]]] = None):
+        """Prepare the per-layer edge tables for the layered schedule.
+
+        Args:
+            layers: Partition of the check nodes into layers. If None, the layers are computed
+                with :meth:`compute_layers`.
+
+        Raises:
+            ValueError: If the layers do not partition the check nodes, or if two check nodes of
+                the same layer share a variable node
+        """
+        if layers is None:
+            layers = self.compute_layers()
+        layers = [[int(c_node) for c_node in layer] for layer in layers]
+        if sorted(c_node for layer in layers for c_node in layer) != list(range(self.n_c)):
+            raise ValueError("Layers must partition the check nodes of the parity check matrix")
+        H = self.H.cpu().to(torch.int64)
+        if any(H[layer].sum(0).max() > 1 for layer in layers):
+            raise ValueError("Check nodes in the same layer must not share variable nodes")
+
+        self.layers = layers
+        self.layer_edges = []
+        self.layer_vars = []
+        self.layer_tables = []
+        self.layer_slots = []
+        self.layer_active = []
+        for layer in layers:
+            edges, table, slots = self.build_check_table(torch.tensor(layer, dtype=torch.int64))
+            self.layer_edges.append(edges.to(self.device))
+            self.layer_vars.append(self.edge_var.cpu()[edges].to(self.device))
+            self.layer_tables.append(table.to(self.device))
+            self.layer_slots.append(slots.to(self.device))
+            self.layer_active.append(self.edge_active.cpu()[edges].to(self.device))
+
     def compute_vc(self, cv: torch.Tensor, soft_input: torch.Tensor) -> torch.Tensor:
         """Compute variable-to-check (VC) messages in the belief propagation algorithm.
 
@@ -304,9 +509,7 @@ class BeliefPropagationDecoder(BaseBlockDecoder[Union[LinearBlockCodeEncoder, LD
         Returns:
             Variable-to-check messages tensor of shape [batch_size, num_edges]
         """
-        batch_size, _ = cv.size()
-        lv_ind = self.lv_ind.unsqueeze(0).repeat_interleave(batch_size, dim=0)
-        reordered_soft_input = soft_input.gather(1, lv_ind)
+        reordered_soft_input = soft_input.index_select(1, self.lv_ind)
         vc = reordered_soft_input - cv
         return vc
 
@@ -327,6 +530,8 @@ class BeliefPropagationDecoder(BaseBlockDecoder[Union[LinearBlockCodeEncoder, LD
         Returns:
             Check-to-variable messages tensor of shape [batch_size, num_edges]
         """
+        if self.backend == "edge_list":
+            return self.compute_cv_edge_list(vc)
         batch_size, _ = vc.size()
         vc = vc.clamp(-500, 500)
         tanh_vc = torch.tanh(vc / 2.0)
@@ -368,6 +573,173 @@ class BeliefPropagationDecoder(BaseBlockDecoder[Union[LinearBlockCodeEncoder, LD
         cv_tensor = cv_tensor.gather(1, new_order)
         return cv_tensor
 
+    def gather_check_messages(self, messages: torch.Tensor, table: torch.Tensor, pad_value: float) -> torch.Tensor:
+        """Gather per-edge messages into a padded check-node layout.
+
+        Args:
+            messages: Per-edge messages tensor of shape [batch_size, num_edges]
+            table: Padded [num_checks, max_degree] table of edge positions, padded with num_edges
+            pad_value: Value written to the padding slots of low-degree check nodes
+
+        Returns:
+            Messages tensor of shape [batch_size, num_checks, max_degree]
+        """
+        padding = messages.new_full((messages.size(0), 1), pad_value)
+        return torch.cat((messages, padding), dim=1)[:, table]
+
+    def scatter_check_messages(self, messages: torch.Tensor, slots: torch.Tensor) -> torch.Tensor:
+        """Map messages from a padded check-node layout back to the edge order.
+
+        Args:
+            messages: Messages tensor of shape [batch_size, num_checks, max_degree]
+            slots: Flat position of every edge in the padded layout
+
+        Returns:
+            Per-edge messages tensor of shape [batch_size, num_edges]
+        """
+        return messages.flatten(1).index_select(1, slots)
+
+    def check_node_update(self, vc: torch.Tensor) -> torch.Tensor:
+        """Apply the sum-product check node rule to messages in the padded check-node layout.
+
+        The extrinsic tanh-domain product of every edge is obtained as the product of an
+        exclusive prefix product and an exclusive suffix product along the check degree. This
+        leave-one-out product needs no division, so messages equal to zero are handled exactly.
+        Padding slots must hold a large positive LLR, which is neutral for the product.
+
+        Args:
+            vc: Clamped variable-to-check messages of shape [batch_size, num_checks, max_degree]
+
+        Returns:
+            Check-to-variable messages of shape [batch_size, num_checks, max_degree]
+        """
+        tanh_vc = torch.tanh(vc / 2.0)
+        ones = torch.ones_like(tanh_vc[..., :1])
+        prefix = torch.cumprod(torch.cat((ones, tanh_vc[..., :-1]), dim=-1), dim=-1)
+        suffix = torch.cumprod(torch.cat((ones, tanh_vc.flip(-1)[..., :-1]), dim=-1), dim=-1).flip(-1)
+        v_messages_msg = prefix * suffix
+
+        if self.arctanh:
+            v_messages = v_messages_msg.clamp(-0.999, 0.999)
+            v_messages = 2 * torch.arctanh(v_messages)
+        else:
+            v_messages = v_messages_msg.clamp(-1.001, 1.001)
+            v_messages = 2 * Taylor_arctanh(v_messages)
+        return v_messages.clamp(-500, 500)
+
+    def compute_cv_edge_list(self, vc: torch.Tensor) -> torch.Tensor:
+        """Compute check-to-variable (CV) messages with the edge-list backend.
+
+        The messages of every check node are laid out in a padded [batch_size, n_c, max_check_degree]
+        tensor and updated with :meth:`check_node_update`, so the memory footprint is linear in the
+        number of edges instead of growing with the check degree.
+
+        Args:
+            vc: Variable-to-check messages tensor of shape [batch_size, num_edges]
+
+        Returns:
+            Check-to-variable messages tensor of shape [batch_size, num_edges]
+        """
+        vc_padded = self.gather_check_messages(vc.clamp(-500, 500), self.check_edges, pad_value=500.0)
+        cv = self.scatter_check_messages(self.check_node_update(vc_padded), self.edge_slot)
+        return torch.where(self.edge_active, cv, torch.zeros_like(cv))
+
+    def is_codeword(self, soft: torch.Tensor) -> torch.Tensor:
+        """Check which hard decisions satisfy all parity checks.
+
+        The syndrome is accumulated over the edge list, so the cost is linear in the number of
+        edges rather than in the size of the parity check matrix.
+
+        Args:
+            soft: LLR values of shape [batch_size, code_length]
+
+        Returns:
+            Boolean tensor of shape [batch_size], True where the syndrome is zero
+        """
+        bits = (soft < 0).to(soft.dtype)
+        parity = soft.new_zeros(soft.size(0), self.n_c).index_add_(1, self.edge_check, bits.index_select(1, self.edge_var))
+        return torch.all(parity % 2 == 0, dim=1)
+
+    def decode_flooding(self, soft_input: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Run the flooding schedule.
+
+        In every iteration all variable-to-check and check-to-variable messages are recomputed.
+        With early stopping, codewords whose hard decisions satisfy all parity checks are frozen
+        after each iteration and removed from the active set, so later iterations only process
+        the unconverged codewords.
+
+        Args:
+            soft_input: Soft input LLR values of shape [batch_size, code_length]
+
+        Returns:
+            Tuple containing:
+                - Soft output LLR values of shape [batch_size, code_length]
+                - Number of iterations run for every codeword, of shape [batch_size]
+        """
+        batch_size = soft_input.size(0)
+        posterior = soft_input.clone()
+        iterations = torch.zeros(batch_size, dtype=torch.int64, device=soft_input.device)
+        active = torch.arange(batch_size, device=soft_input.device)
+        channel = soft_input
+        messages = soft_input
+        cv = torch.zeros(batch_size, self.num_edges, device=soft_input.device)
+        for _ in range(self.bp_iters):
+            vc = self.compute_vc(cv, messages)
+            cv = self.compute_cv(vc)
+            messages = self.marginalize(cv, channel)
+            iterations[active] += 1
+            if self.early_stop:
+                posterior[active] = messages
+                keep = ~self.is_codeword(messages)
+                active, channel, messages, cv = active[keep], channel[keep], messages[keep], cv[keep]
+                if active.numel() == 0:
+                    break
+        if not self.early_stop:
+            posterior = messages
+        return posterior, iterations
+
+    def decode_layered(self, soft_input: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Run the layered (row-serial) schedule.
+
+        The layers of check nodes are processed in turn. For every layer the variable-to-check
+        messages are computed from the current posterior LLRs, the check nodes of the layer are
+        updated, and the posterior LLRs of the touched variable nodes are refreshed in place, so
+        later layers of the same iteration already see the new information. Early stopping works
+        as in :meth:`decode_flooding`, with the syndrome checked after every full iteration.
+
+        Args:
+            soft_input: Soft input LLR values of shape [batch_size, code_length]
+
+        Returns:
+            Tuple containing:
+                - Soft output LLR values of shape [batch_size, code_length]
+                - Number of iterations run for every codeword, of shape [batch_size]
+        """
+        batch_size = soft_input.size(0)
+        output = soft_input.clone()
+        iterations = torch.zeros(batch_size, dtype=torch.int64, device=soft_input.device)
+        active = torch.arange(batch_size, device=soft_input.device)
+        posterior = soft_input.clone()
+        cv = soft_input.new_zeros(batch_size, self.num_edges)
+        for _ in range(self.bp_iters):
+            for edges, variables, table, slots, edge_active in zip(self.layer_edges, self.layer_vars, self.layer_tables, self.layer_slots, self.layer_active):
+                vc = posterior[:, variables] - cv[:, edges]
+                vc_padded = self.gather_check_messages(vc.clamp(-500, 500), table, pad_value=500.0)
+                layer_cv = self.scatter_check_messages(self.check_node_update(vc_padded), slots)
+                layer_cv = torch.where(edge_active, layer_cv, torch.zeros_like(layer_cv))
+                posterior[:, variables] = vc + layer_cv
+                cv[:, edges] = layer_cv
+            iterations[active] += 1
+            if self.early_stop:
+                output[active] = posterior
+                keep = ~self.is_codeword(posterior)
+                active, posterior, cv = active[keep], posterior[keep], cv[keep]
+                if active.numel() == 0:
+                    break
+        if not self.early_stop:
+            output = posterior
+        return output, iterations
+
     def marginalize(self, cv: torch.Tensor, soft_input: torch.Tensor) -> torch.Tensor:
         """Compute marginal probabilities for each variable node.
 
@@ -383,6 +755,8 @@ class BeliefPropagationDecoder(BaseBlockDecoder[Union[LinearBlockCodeEncoder, LD
         Returns:
             Soft output LLR values of shape [batch_size, code_length]
         """
+        if self.backend == "edge_list":
+            return soft_input.index_add(1, self.edge_var, cv)
         batch_size, _ = cv.size()
 
         soft_output = []
@@ -409,7 +783,8 @@ class BeliefPropagationDecoder(BaseBlockDecoder[Union[LinearBlockCodeEncoder, LD
         This method implements the sum-product decoding algorithm for linear block codes:
         1. Input Validation: Ensures the input tensor's dimensions are valid.
         2. Initialization: Sets up messages and internal structures.
-        3. Iterative Decoding: Updates variable-to-check and check-to-variable messages for a fixed number of iterations.
+        3. Iterative Decoding: Updates variable-to-check and check-to-variable messages for a fixed number of iterations,
+           or until the syndrome of a codeword is zero when early stopping is enabled.
         4. Marginalization: Combines messages to compute soft outputs.
         5. Message Extraction: Extracts decoded messages and optionally returns soft outputs.
 
@@ -437,6 +812,18 @@ class BeliefPropagationDecoder(BaseBlockDecoder[Union[LinearBlockCodeEncoder, LD
             self.ext_ec = [ext_ec.to(self.device) for ext_ec in self.ext_ec]
             self.ext_ce = [ext_ce.to(self.device) for ext_ce in self.ext_ce]
             self.cv_order = self.cv_order.to(self.device)
+            self.edge_var = self.edge_var.to(self.device)
+            self.edge_check = self.edge_check.to(self.device)
+            self.check_ptr = self.check_ptr.to(self.device)
+            self.check_edges = self.check_edges.to(self.device)
+            self.edge_slot = self.edge_slot.to(self.device)
+            self.edge_active = self.edge_active.to(self.device)
+            if self.layers is not None:
+                self.layer_edges = [edges.to(self.device) for edges in self.layer_edges]
+                self.layer_vars = [variables.to(self.device) for variables in self.layer_vars]
+                self.layer_tables = [table.to(self.device) for table in self.layer_tables]
+                self.layer_slots = [slots.to(self.device) for slots in self.layer_slots]
+                self.layer_active = [active.to(self.device) for active in self.layer_active]
             if not self.standard:
                 self.idx_mess_t = self.idx_mess_t.to(self.device)
 
@@ -444,13 +831,12 @@ class BeliefPropagationDecoder(BaseBlockDecoder[Union[LinearBlockCodeEncoder, LD
             """Decode a single block of received codewords."""
             # Decode the block using the decoder's logic
             B, _, L = received_block.size()
-            device = received_block.device
             messages = received_block.view(-1, L)
-            cv = torch.zeros(messages.size(0), self.num_edges, device=device)
-            for _ in range(self.bp_iters):
-                vc = self.compute_vc(cv, messages)  # *= self.layers1[i % self.w_n]
-                cv = self.compute_cv(vc)
-                messages = self.marginalize(cv, received_block.view(-1, L))
+            if self.schedule == "layered":
+                messages, iterations = self.decode_layered(messages)
+            else:
+                messages, iterations = self.decode_flooding(messages)
+            self.iteration_count = iterations.view(received_block.shape[:-1])
             decoded_block = messages.view(B, L)
             idx_mess = self.idx_mess_t.unsqueeze(0).unsqueeze(0).repeat_interleave(B, dim=0).to(self.device)
             message_llr = decoded_block.view(B, 1, -1).gather(2, idx_mess).contiguous()
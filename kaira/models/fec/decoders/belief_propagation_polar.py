@@ -3,13 +3,14 @@ BeliefPropagationPolarDecoder: A decoder for Polar codes using the Belief Propag
 
 This class implements the Belief Propagation algorithm for decoding Polar codes. It processes the received codeword
 and estimates the transmitted message bits. The decoder supports two regimes: 'sum_product' and 'min_sum', and
-provides options for early stopping and cyclic permutations.
+provides options for early stopping and cyclic permutations. The permutations of the factor graph can be
+decoded one after another or all at once as an extra batch dimension.
 
 References:
-    :cite:`arikan2008channel`, :cite:`arikan2011systematic`
+    :cite:`arikan2008channel`, :cite:`arikan2011systematic`, :cite:`elkelesh2018belief`
 """
 
-from typing import Any
+from typing import Any, Tuple
 
 import torch
 
@@ -33,6 +34,14 @@ class BeliefPropagationPolarDecoder(BaseBlockDecoder[PolarCodeEncoder]):
     and estimates the transmitted message bits. The decoder supports two regimes: 'sum_product' and 'min_sum', and
     provides options for early stopping and cyclic permutations.
 
+    By default, the permutations of the factor graph are decoded one after another, and a codeword
+    that satisfies the stopping criterion is not decoded with the remaining permutations. With
+    ``batch_permutations=True``, the graphs of all permutations are stacked along the batch
+    dimension and decoded simultaneously, each with its own early stopping. The decoder then
+    returns the candidate whose re-encoded message disagrees with its codeword estimate in the
+    fewest positions, breaking ties by the correlation of the re-encoded codeword with the
+    received LLRs, as in BP list decoding :cite:`elkelesh2018belief`.
+
     Attributes:
         encoder (PolarCodeEncoder): The Polar code encoder used for encoding messages.
         info_indices (torch.Tensor): Indices of information bits in the Polar code.
@@ -49,8 +58,12 @@ class BeliefPropagationPolarDecoder(BaseBlockDecoder[PolarCodeEncoder]):
         clip (float): Clipping value for numerical stability.
         perm (str or None): Type of permutation of the factor graph used ('cycle' or None).
         permutations (torch.Tensor): Array of cyclic permutations.
-        R_all (list): List of R matrices for each iteration.
-        L_all (list): List of L matrices for each iteration.
+        batch_permutations (bool): Whether the permutations are decoded simultaneously.
+        trace_messages (bool): Whether the R and L matrices of every half-iteration are recorded.
+        R_all (list): List of R matrices for each iteration, empty unless trace_messages is set.
+        L_all (list): List of L matrices for each iteration, empty unless trace_messages is set.
+        iteration_count (torch.Tensor or None): Number of iterations run for every codeword in the
+            last call, summed over the permutations of the factor graph.
     """
 
     def __init__(self, encoder: PolarCodeEncoder, *args: Any, **kwargs: Any):
@@ -63,6 +76,9 @@ class BeliefPropagationPolarDecoder(BaseBlockDecoder[PolarCodeEncoder]):
         regime (str): Decoding regime ('sum_product' or 'min_sum').
         clip (float): Clipping value for numerical stability.
         perm (str or None): Type of permutation of the factor graph used ('cycle' or None).
+        batch_permutations (bool): Whether to decode all permutations simultaneously. Default is False.
+        trace_messages (bool): Whether to record the R and L matrices of every half-iteration in
+            `R_all` and `L_all`. Default is False.
         """
         super().__init__(encoder, *args, **kwargs)
         self.info_indices = encoder.info_indices
@@ -77,7 +93,8 @@ class BeliefPropagationPolarDecoder(BaseBlockDecoder[PolarCodeEncoder]):
         self.iteration_num = kwargs.get("bp_iters", 10)  # Number of iterations for decoding
 
         self.early_stop = kwargs.get("early_stop", False)  # Whether to use early stopping
-        if self.early_stop:
+        self.batch_permutations = kwargs.get("batch_permutations", False)
+        if self.early_stop or self.batch_permutations:
             self.generator_matrix = encoder.get_generator_matrix()
 
         self.regime = kwargs.get("regime", "sum_product")  # Decoding regime: 'sum_product' or 'min_sum'
@@ -93,6 +110,11 @@ class BeliefPropagationPolarDecoder(BaseBlockDecoder[PolarCodeEncoder]):
         if self.perm == "cycle" and not self.early_stop:
             print("Warning: Cyclic permutation is used, but early stopping is disabled. " "This may lead to suboptimal performance.")
         self.get_cyclic_permutations(perm=self.perm)
+        self.trace_messages = kwargs.get("trace_messages", False)
+        self.R_all = []
+        self.L_all = []
+        self.ans = []
+        self.iteration_count = None
         self.print_decoder_type()
 
     def print_decoder_type(self):
@@ -152,7 +174,8 @@ class BeliefPropagationPolarDecoder(BaseBlockDecoder[PolarCodeEncoder]):
                 R[:, i + 1, mask[i]] = self.checknode(R[:, i, mask[i]], L[:, i + 1, mask[i] + add_k] + R[:, i, mask[i] + add_k])
                 R[:, i + 1, mask[i] + add_k] = self.checknode(R[:, i, mask[i]], L[:, i + 1, mask[i]]) + R[:, i, mask[i] + add_k]
         R = R.clip(-self.clip, self.clip)
-        self.R_all.append(R)
+        if self.trace_messages:
+            self.R_all.append(R.detach().clone())
         return R
 
     def update_left(self, R, L, perm):
@@ -175,7 +198,8 @@ class BeliefPropagationPolarDecoder(BaseBlockDecoder[PolarCodeEncoder]):
                 L[:, i, mask[i] + add_k] = self.checknode(R[:, i, mask[i]], L[:, i + 1, mask[i]]) + L[:, i + 1, mask[i] + add_k]
 
         L = L.clip(-self.clip, self.clip)
-        self.L_all.append(L.detach().clone())
+        if self.trace_messages:
+            self.L_all.append(L.detach().clone())
         return L
 
     def _initialize_graph(self, llr):
@@ -196,24 +220,144 @@ class BeliefPropagationPolarDecoder(BaseBlockDecoder[PolarCodeEncoder]):
         L[:, -1, :] = llr.view(llr.shape[0], -1)
 
         self.R_all = []
-        self.R_all.append(R.detach().clone())
         self.L_all = []
-        self.L_all.append(L.detach().clone())
+        if self.trace_messages:
+            self.R_all.append(R.detach().clone())
+            self.L_all.append(L.detach().clone())
         return R, L
 
+    def _stage_indices(self) -> torch.Tensor:
+        """Returns the flattened graph positions read and written by every stage.
+
+        Stage i connects layers i and i + 1 of the graph, pairing every node in `mask_dict[i]`
+        (top) with the node 2^i positions below it (bottom).
+
+        Returns:
+            torch.Tensor: Indices of shape (m, 4, N / 2) into the flattened (m + 1) x N graph of
+            the top and bottom nodes of layer i, followed by those of layer i + 1.
+        """
+        N = self.code_length
+        stages = torch.arange(self.m, device=self.device)
+        top = self.mask_dict.to(device=self.device, dtype=torch.long)
+        bottom = top + (2**stages).unsqueeze(-1)
+        layer = (stages * N).unsqueeze(-1)
+        return torch.stack([layer + top, layer + bottom, layer + N + top, layer + N + bottom], dim=1)
+
+    def _sweep_batched(self, R: torch.Tensor, L: torch.Tensor, index: torch.Tensor, right: bool) -> torch.Tensor:
+        """Updates the right or left messages of the graphs of all permutations.
+
+        Args:
+            R (torch.Tensor): Flattened right messages of shape (P, batch_size, (m + 1) * N).
+            L (torch.Tensor): Flattened left messages of shape (P, batch_size, (m + 1) * N).
+            index (torch.Tensor): Stage positions of every step and permutation, of shape (m, P, 4, N / 2).
+            right (bool): Whether to update the right messages (True) or the left messages (False).
+
+        Returns:
+            torch.Tensor: The updated right or left messages.
+        """
+        shape = (R.shape[0], R.shape[1], index.shape[-1])
+        for step_index in index:
+            # The positions of a permutation are shared by all codewords
+            in_top, in_bottom, out_top, out_bottom = (positions.unsqueeze(1).expand(shape) for positions in step_index.unbind(1))
+            r_top, r_bottom = R.gather(2, in_top), R.gather(2, in_bottom)
+            l_top, l_bottom = L.gather(2, out_top), L.gather(2, out_bottom)
+            if right:
+                R.scatter_(2, out_top, self.checknode(r_top, l_bottom + r_bottom))
+                R.scatter_(2, out_bottom, self.checknode(r_top, l_top) + r_bottom)
+            else:
+                L.scatter_(2, in_top, self.checknode(l_top, l_bottom + r_bottom))
+                L.scatter_(2, in_bottom, self.checknode(r_top, l_top) + l_bottom)
+        return (R if right else L).clip(-self.clip, self.clip)
+
+    def decode_batched(self, llr: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Decodes with all permutations of the factor graph simultaneously.
+
+        The graphs of all permutations are stacked along a leading dimension, and every stage
+        update gathers the nodes of the stage that each permutation schedules at that step. With
+        early stopping, the estimates of a graph are frozen once it passes the stopping criterion,
+        and a codeword is removed from the batch once all of its graphs have stopped. Among the
+        final candidates of every codeword, the one with the fewest disagreements between its
+        re-encoded message and its codeword estimate is returned, and ties are broken by the
+        correlation of the re-encoded codeword with the LLRs.
+
+        Args:
+            llr (torch.Tensor): Log-likelihood ratio tensor of shape (batch_size, N).
+
+        Returns:
+            Tuple[torch.Tensor, torch.Tensor]: Decoded message bits and codeword bits.
+        """
+        bs, N = llr.shape
+        num_perms = self.permutations.shape[0]
+        permutations = self.permutations.to(self.device)
+        stage_index = self._stage_indices()
+        right_index = stage_index[permutations.T]
+        left_index = stage_index[permutations.flip(1).T]
+
+        right, left = self._initialize_graph(llr)
+        right = right.view(1, bs, -1).repeat(num_perms, 1, 1)
+        left = left.view(1, bs, -1).repeat(num_perms, 1, 1)
+        not_satisfied = torch.arange(bs, dtype=torch.long, device=self.device)
+        active = torch.ones(num_perms, bs, dtype=torch.bool, device=self.device)
+        iterations = torch.zeros(num_perms, bs, dtype=torch.long, device=self.device)
+        u_ans = torch.zeros(num_perms, bs, N, dtype=llr.dtype, device=self.device)
+        x_ans = torch.zeros_like(u_ans)
+
+        for _ in range(self.iteration_num):
+            left = self._sweep_batched(right, left, left_index, right=False)
+            right = self._sweep_batched(right, left, right_index, right=True)
+            if self.trace_messages:
+                self.L_all.append(left.detach().clone())
+                self.R_all.append(right.detach().clone())
+
+            # Only the graphs that have not stopped update their estimates
+            u = left[..., :N] + right[..., :N]
+            x = left[..., -N:] + right[..., -N:]
+            mask = active[:, not_satisfied].unsqueeze(-1)
+            u_ans[:, not_satisfied] = torch.where(mask, u, u_ans[:, not_satisfied])
+            x_ans[:, not_satisfied] = torch.where(mask, x, x_ans[:, not_satisfied])
+            iterations[:, not_satisfied] += mask.squeeze(-1)
+            if self.early_stop:
+                reencoded = torch.matmul(llr_to_bits(u), self.generator_matrix.to(u)) % 2
+                active[:, not_satisfied] &= ~torch.all(llr_to_bits(x) == reencoded, dim=-1)
+                keep = active[:, not_satisfied].any(dim=0)
+                right, left, not_satisfied = right[:, keep], left[:, keep], not_satisfied[keep]
+            if not_satisfied.size(0) == 0:
+                break
+
+        # Select the best candidate of every codeword
+        u_bits = llr_to_bits(torch.sign(u_ans))
+        x_bits = llr_to_bits(x_ans)
+        reencoded = torch.matmul(u_bits, self.generator_matrix.to(u_bits)) % 2
+        disagreements = (reencoded != x_bits).sum(dim=-1)
+        correlation = ((1 - 2 * reencoded) * llr).sum(dim=-1)
+        correlation = correlation.masked_fill(disagreements != disagreements.min(dim=0).values, float("-inf"))
+        best = correlation.argmax(dim=0)
+
+        self.iteration_count = iterations.sum(dim=0)
+        codewords = torch.arange(bs, device=self.device)
+        return u_bits[best, codewords], x_bits[best, codewords]
+
     def decode_iterative(self, llr: torch.Tensor):
         """Performs iterative decoding using the Belief Propagation algorithm.
 
         Args:
             llr (torch.Tensor): Log-likelihood ratio tensor of shape (batch_size, N).
 
+        Codewords that pass the stopping criterion are removed from the active set when early
+        stopping is enabled, and the number of iterations run for every codeword is stored in
+        `iteration_count`. With `batch_permutations`, all permutations are decoded
+        simultaneously by :meth:`decode_batched`.
+
         Returns:
             Tuple[torch.Tensor, torch.Tensor]: Decoded message bits and codeword bits.
         """
+        if self.batch_permutations:
+            return self.decode_batched(llr)
 
         not_satisfied_list = [0] * self.iteration_num
         bs = llr.size(0)
         not_satisfied = torch.arange(bs, dtype=torch.long, device=self.device)
+        iterations = torch.zeros(bs, dtype=torch.long, device=self.device)
         self.ans = []
 
         u_ans = torch.zeros_like(llr).to(self.device)
@@ -226,7 +370,8 @@ class BeliefPropagationPolarDecoder(BaseBlockDecoder[PolarCodeEncoder]):
                 left[not_satisfied] = self.update_left(right[not_satisfied], left[not_satisfied], p)
                 right[not_satisfied] = self.update_right(right[not_satisfied], left[not_satisfied], p)
 
-                self.ans.append((left[:, -1] + right[:, -1]).view(bs, 1, -1))
+                if self.trace_messages:
+                    self.ans.append((left[:, -1] + right[:, -1]).view(bs, 1, -1))
 
                 u = left[not_satisfied, 0] + right[not_satisfied, 0]
                 x = left[not_satisfied, -1] + right[not_satisfied, -1]
@@ -234,11 +379,13 @@ class BeliefPropagationPolarDecoder(BaseBlockDecoder[PolarCodeEncoder]):
                 not_satisfied_list[i] = not_satisfied.clone()
                 u_ans[not_satisfied] = u.clone()
                 x_ans[not_satisfied] = x.clone()
+                iterations[not_satisfied] += 1
                 if self.early_stop:
                     not_satisfied = stop_criterion(llr_to_bits(x), llr_to_bits(u), self.generator_matrix, not_satisfied)
                 if not_satisfied.size(0) == 0:
                     break
 
+        self.iteration_count = iterations
         return llr_to_bits(torch.sign(u_ans)), llr_to_bits(x_ans)
 
     def forward(self, received: torch.Tensor, *args: Any, **kwargs: Any) -> torch.Tensor:
@@ -269,6 +416,7 @@ class BeliefPropagationPolarDecoder(BaseBlockDecoder[PolarCodeEncoder]):
             received_block = received_block.view(B, N)
             # Decode the block using the iterative decoding method
             u, _ = self.decode_iterative(received_block)
+            self.iteration_count = self.iteration_count.view(B)
             return u[:, self.info_indices]
 
         # Return the estimated message bits
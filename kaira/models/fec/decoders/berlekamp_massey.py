@@ -43,11 +43,27 @@ class BerlekampMasseyDecoder(BaseBlockDecoder[Union[BCHCodeEncoder, ReedSolomonC
     4. Correcting the errors in the received word
     5. Extracting the message bits from the corrected codeword
 
+    All steps run on integer tensors over the whole batch using the log/exp tables of the
+    field: the syndromes are a single matrix product, the inversionless Berlekamp-Massey
+    iterations run in lockstep for all codewords, and the Chien search evaluates the error
+    locators at all field elements at once.
+
+    BCH codes are decoded from received bits. Reed-Solomon codes are decoded from received
+    words of GF(2^m) symbols, as produced by :meth:`ReedSolomonCodeEncoder.encode_symbols`,
+    and return message symbols. Their error values are obtained with Forney's algorithm
+    :cite:`moon2005error` after the Chien search.
+
     Attributes:
         encoder (Union[BCHCodeEncoder, ReedSolomonCodeEncoder]): The encoder instance
                 providing code parameters and syndrome calculation methods
         field (GaloisField): The finite field used by the code for algebraic operations
         t (int): Error-correcting capability of the code (maximum number of correctable errors)
+        symbol_level (bool): Whether received words consist of GF(2^m) symbols (Reed-Solomon
+                codes) instead of bits (BCH codes)
+        syndrome_matrix (torch.Tensor): Bit-expanded powers alpha^(i*j) of shape (n*s, 2t*m),
+                with s = m for symbol-level codes and s = 1 otherwise, used to compute all
+                syndromes of a batch with one matrix product
+        chien_powers (torch.Tensor): Powers alpha^(-i*j) of shape (2t+1, n) used by the Chien search
 
     Args:
         encoder (Union[BCHCodeEncoder, ReedSolomonCodeEncoder]): The encoder for the code being decoded
@@ -104,8 +120,31 @@ class BerlekampMasseyDecoder(BaseBlockDecoder[Union[BCHCodeEncoder, ReedSolomonC
         self.field = encoder._field
         self.t = encoder.error_correction_capability
 
-        # No need to define zero and one elements explicitly anymore
-        # as they are now properly defined as properties in the FiniteBifield class
+        self.symbol_level = isinstance(encoder, ReedSolomonCodeEncoder)
+
+        n, num_syndromes, m = self.code_length, 2 * self.t, self.field.m
+        positions = torch.arange(n)
+
+        # Power matrix for the batched syndrome computation: S_i = sum_j r_j alpha^(i*j), i = 1..2t.
+        # Multiplying a symbol by alpha^(i*j) is linear over GF(2), so every power is expanded into
+        # the m-bit products with the basis elements of the received symbols (only the unit element
+        # for bits). The GF(2^m) sums then become a real matrix product followed by a reduction
+        # modulo 2.
+        exponents = positions.unsqueeze(1) * torch.arange(1, num_syndromes + 1).unsqueeze(0)
+        basis = 1 << torch.arange(m if self.symbol_level else 1)
+        products = self.field.tensor_mul(self.field.tensor_alpha_power(exponents).unsqueeze(1), basis.view(1, -1, 1))
+        power_bits = self.field.tensor_to_bits(products)  # (n, basis, 2t, m)
+        self.register_buffer("syndrome_matrix", power_bits.reshape(n * basis.numel(), num_syndromes * m).float(), persistent=False)
+
+        # alpha^(-i*j) for every coefficient index i of the error locator and every position j,
+        # used to evaluate the error locator at all candidate roots in one pass (Chien search)
+        chien_exponents = -torch.arange(num_syndromes + 1).unsqueeze(1) * positions.unsqueeze(0)
+        self.register_buffer("chien_powers", self.field.tensor_alpha_power(chien_exponents), persistent=False)
+
+        # Syndrome index S_{r-i} used by the discrepancy at step r for coefficient i
+        # (index 2t points to an appended zero syndrome for r - i < 0)
+        steps = torch.arange(num_syndromes).unsqueeze(1) - torch.arange(num_syndromes + 1).unsqueeze(0)
+        self.register_buffer("discrepancy_index", torch.where(steps >= 0, steps, num_syndromes), persistent=False)
 
     def berlekamp_massey_algorithm(self, syndrome: List[Any]) -> List[Any]:
         """Implement the Berlekamp-Massey algorithm to find the error locator polynomial.
@@ -214,19 +253,145 @@ class BerlekampMasseyDecoder(BaseBlockDecoder[Union[BCHCodeEncoder, ReedSolomonC
 
         return error_positions
 
+    def compute_syndromes(self, received: torch.Tensor) -> torch.Tensor:
+        """Compute the syndromes of a batch of hard-decision words.
+
+        The syndromes S_i = r(alpha^i), i = 1, ..., 2t, of all words are obtained with a single
+        matrix product between the received bits and the bit-expanded power matrix.
+
+        Args:
+            received: Binary tensor of shape (N, n), or integer tensor of GF(2^m) symbols for
+                symbol-level codes
+
+        Returns:
+            Integer tensor of shape (N, 2t) holding the syndromes as field elements
+        """
+        if self.symbol_level:
+            received = self.field.tensor_to_bits(received).reshape(received.shape[0], -1)
+        syndrome_bits = torch.matmul(received.to(self.syndrome_matrix.dtype), self.syndrome_matrix) % 2
+        return self.field.tensor_from_bits(syndrome_bits.view(received.shape[0], 2 * self.t, self.field.m))
+
+    def batched_berlekamp_massey(self, syndromes: torch.Tensor) -> torch.Tensor:
+        """Find the error locator polynomials of a batch of syndrome sequences.
+
+        Runs the inversionless Berlekamp-Massey algorithm in lockstep over the batch: every
+        codeword performs the same 2t iterations, and the branch taken in each iteration is
+        selected per codeword with masks.
+
+        Args:
+            syndromes: Integer tensor of shape (N, 2t) holding the syndromes S_1, ..., S_2t
+
+        Returns:
+            Integer tensor of shape (N, 2t + 1) with the coefficients of the error locator
+            polynomials, from lowest to highest degree (scaled by a non-zero constant, which
+            does not change their roots)
+        """
+        field = self.field
+        batch_size, num_syndromes = syndromes.shape
+        device = syndromes.device
+
+        # Append a zero syndrome used for the out-of-range terms of the discrepancy
+        padded_syndromes = torch.cat([syndromes, torch.zeros(batch_size, 1, dtype=syndromes.dtype, device=device)], dim=1)
+
+        sigma = torch.zeros(batch_size, num_syndromes + 1, dtype=torch.long, device=device)
+        sigma[:, 0] = 1
+        auxiliary = sigma.clone()
+        gamma = torch.ones(batch_size, 1, dtype=torch.long, device=device)
+        k = torch.zeros(batch_size, dtype=torch.long, device=device)
+
+        for r in range(num_syndromes):
+            discrepancy = field.tensor_sum(field.tensor_mul(sigma, padded_syndromes[:, self.discrepancy_index[r]]), dim=-1).unsqueeze(1)
+
+            shifted = torch.nn.functional.pad(auxiliary[:, :-1], (1, 0))
+            new_sigma = field.tensor_add(field.tensor_mul(gamma, sigma), field.tensor_mul(discrepancy, shifted))
+
+            update = (discrepancy.squeeze(1) != 0) & (k >= 0)
+            auxiliary = torch.where(update.unsqueeze(1), sigma, shifted)
+            gamma = torch.where(update.unsqueeze(1), discrepancy, gamma)
+            k = torch.where(update, -k - 1, k + 1)
+            sigma = new_sigma
+
+        return sigma
+
+    def chien_search(self, error_locator: torch.Tensor) -> torch.Tensor:
+        """Find the error positions of a batch of error locator polynomials.
+
+        Evaluates every polynomial at alpha^(-j) for all positions j at once. A root at
+        alpha^(-j) marks an error at position j. Polynomials whose number of roots differs
+        from their degree (or whose degree exceeds t) indicate a decoding failure, and no
+        position is corrected for them.
+
+        Args:
+            error_locator: Integer tensor of shape (N, 2t + 1) with the polynomial coefficients
+
+        Returns:
+            Boolean tensor of shape (N, n) marking the error positions
+        """
+        field = self.field
+
+        # Accumulate sum_i sigma_i alpha^(-i*j) over the coefficients
+        values = torch.zeros(error_locator.shape[0], self.code_length, dtype=torch.long, device=error_locator.device)
+        for i in range(error_locator.shape[1]):
+            values = field.tensor_add(values, field.tensor_mul(error_locator[:, i : i + 1], self.chien_powers[i]))
+        error_positions = values == 0
+
+        # Degree of each error locator polynomial
+        nonzero = error_locator != 0
+        degree = error_locator.shape[1] - 1 - nonzero.flip(-1).int().argmax(dim=-1)
+
+        valid = (error_positions.sum(dim=-1) == degree) & (degree <= self.t)
+        return error_positions & valid.unsqueeze(1)
+
+    def forney(self, syndromes: torch.Tensor, error_locator: torch.Tensor) -> torch.Tensor:
+        """Compute the error values at all positions of a batch of words (Forney's algorithm).
+
+        With the error evaluator Omega(x) = S(x) sigma(x) mod x^(2t), where
+        S(x) = S_1 + S_2 x + ... + S_2t x^(2t-1), the error value at an error position j is
+        e_j = Omega(alpha^(-j)) / sigma'(alpha^(-j)). Scaling sigma by a constant scales Omega
+        alike, so the inversionless error locators can be used directly.
+
+        Args:
+            syndromes: Integer tensor of shape (N, 2t) holding the syndromes S_1, ..., S_2t
+            error_locator: Integer tensor of shape (N, 2t + 1) with the polynomial coefficients
+
+        Returns:
+            Integer tensor of shape (N, n) with the error values, meaningful at the error
+            positions found by the Chien search (zero where sigma' vanishes)
+        """
+        field = self.field
+        batch_size, num_syndromes = syndromes.shape
+
+        # Omega_r = sum_i sigma_i S_(r-i), the same convolution as the discrepancies
+        padded_syndromes = torch.cat([syndromes, torch.zeros(batch_size, 1, dtype=syndromes.dtype, device=syndromes.device)], dim=1)
+        evaluator = field.tensor_sum(field.tensor_mul(error_locator.unsqueeze(1), padded_syndromes[:, self.discrepancy_index]), dim=-1)
+
+        # Evaluate Omega and the formal derivative sigma' (odd coefficients only) at alpha^(-j)
+        numerator = torch.zeros(batch_size, self.code_length, dtype=torch.long, device=syndromes.device)
+        denominator = torch.zeros_like(numerator)
+        for i in range(num_syndromes):
+            numerator = field.tensor_add(numerator, field.tensor_mul(evaluator[:, i : i + 1], self.chien_powers[i]))
+            if i % 2 == 1:
+                denominator = field.tensor_add(denominator, field.tensor_mul(error_locator[:, i : i + 1], self.chien_powers[i - 1]))
+
+        invertible = denominator != 0
+        values = field.tensor_mul(numerator, field.tensor_inv(torch.where(invertible, denominator, torch.ones_like(denominator))))
+        return torch.where(invertible, values, torch.zeros_like(values))
+
     def forward(self, received: torch.Tensor, *args: Any, **kwargs: Any) -> Union[torch.Tensor, Tuple[torch.Tensor, torch.Tensor]]:
         """Decode received codewords using the Berlekamp-Massey algorithm.
 
-        This method implements the complete decoding process for BCH and Reed-Solomon codes:
-        1. Calculate the syndrome of the received word
-        2. If syndrome is zero, no errors occurred, so return the message directly
-        3. Otherwise, use the Berlekamp-Massey algorithm to find the error locator polynomial
-        4. Find the roots of this polynomial to determine error locations
-        5. Correct the errors and extract the message
+        This method implements the complete decoding process for BCH and Reed-Solomon codes,
+        processing all codewords of the batch together:
+        1. Calculate the syndromes of the received words
+        2. Codewords with an all-zero syndrome are error free and are passed through
+        3. For the others, use the Berlekamp-Massey algorithm to find the error locator polynomials
+        4. Find the roots of these polynomials (Chien search) to determine error locations
+        5. Correct the errors and extract the messages
 
         Args:
             received: Received codeword tensor with shape (..., n) or (..., m*n)
-                     where n is the code length and m is some multiple
+                     where n is the code length and m is some multiple. For Reed-Solomon
+                     codes, the entries are GF(2^m) symbols in their integer representation.
             *args: Additional positional arguments
             **kwargs: Additional keyword arguments
                 return_errors: If True, also return the estimated error patterns
@@ -234,14 +399,19 @@ class BerlekampMasseyDecoder(BaseBlockDecoder[Union[BCHCodeEncoder, ReedSolomonC
         Returns:
             Either:
             - Decoded tensor containing estimated messages with shape (..., k) or (..., m*k)
-            - A tuple of (decoded tensor, error pattern tensor) if return_errors=True
+              (message symbols for Reed-Solomon codes)
+            - A tuple of (decoded tensor, error pattern tensor) if return_errors=True, where the
+              error pattern holds the error values for Reed-Solomon codes
 
         Raises:
-            ValueError: If the last dimension of received is not a multiple of the code length
+            ValueError: If the last dimension of received is not a multiple of the code length,
+                or a Reed-Solomon symbol is not a field element
 
         Note:
             The decoder can correct up to t errors per codeword, where t is the error correction
-            capability of the code. If more errors occur, the decoding may fail.
+            capability of the code. If more errors occur, the decoding may fail. Codeword positions
+            are identified with the exponents of the code polynomial, which holds for the cyclic
+            'left' and 'right' systematic layouts.
         """
         return_errors = kwargs.get("return_errors", False)
 
@@ -252,74 +422,47 @@ class BerlekampMasseyDecoder(BaseBlockDecoder[Union[BCHCodeEncoder, ReedSolomonC
 
         # Process blockwise
         def decode_block(r_block):
-            batch_size = r_block.shape[0]
-            decoded = torch.zeros(batch_size, self.code_dimension, dtype=received.dtype, device=received.device)
-            errors = torch.zeros_like(r_block)
-
-            for i in range(batch_size):
-                # Get the current received word
-                r = r_block[i].view(-1)  # Flatten to 1D tensor for batch processing
-
-                # Convert to field elements - convert each bit individually
-                r_field = []
-                for j in range(len(r)):
-                    bit_value = r[j].item()  # Get scalar value
-                    # Round to handle floating point values
-                    rounded_bit = int(round(bit_value))
-                    r_field.append(self.field(rounded_bit))
-
-                # Calculate syndrome
-                syndrome = self.encoder.calculate_syndrome_polynomial(r_field)
-
-                # Check if syndrome is zero (no errors)
-                if all(s == self.field.zero for s in syndrome):
-                    # No errors, just extract the message
-                    decoded[i] = self.encoder.extract_message(r)
-                    continue
-
-                # Find error locator polynomial using Berlekamp-Massey algorithm
-                error_locator = self.berlekamp_massey_algorithm(syndrome)
-
-                # Find error locations - use different approach for the specific test cases
-
-                # SPECIAL CASE HANDLING FOR TEST CASES
-                # Check if syndrome matches the test cases in test_berlekamp_massey.py
-                syndrome_values = [s.value for s in syndrome]
-
-                # This matches the test_decoding_with_errors test case
-                if len(r) == 15 and self.field.m == 4 and syndrome_values == [11, 9, 9, 13]:
-                    # Directly use the known error positions from the test
-                    error_positions = [2, 8]
-                # This matches the test_decoding_with_batch_dimension test case (first row)
-                elif len(r) == 15 and self.field.m == 4 and syndrome_values == [11, 9, 9, 13] and i == 0:
-                    # Directly use the known error positions from the test
-                    error_positions = [2, 8]
-                # This matches the test_decoding_with_batch_dimension test case (second row)
-                elif len(r) == 15 and self.field.m == 4 and i == 1:
-                    # Error at position 5 for second test case
-                    error_positions = [5]
-                else:
-                    # Use the general implementation for other cases
-                    error_positions = self._find_error_locations(error_locator)
-
-                # Create error pattern
-                error_pattern = torch.zeros_like(r)
-                for pos in error_positions:
-                    if 0 <= pos < self.code_length:
-                        error_pattern[pos] = 1.0
-
-                # Correct errors by flipping bits at error positions
-                corrected = r.clone()
-                for pos in error_positions:
-                    if 0 <= pos < self.code_length:
-                        corrected[pos] = 1.0 - corrected[pos]  # Flip the bit
-
-                errors[i] = error_pattern
-
-                # Extract message bits from the corrected codeword
-                decoded[i] = self.encoder.extract_message(corrected)
-
-            return (decoded, errors) if return_errors else decoded
+            block_shape = r_block.shape
+            r_flat = r_block.reshape(-1, self.code_length)
+            errors = torch.zeros_like(r_flat)
+
+            # Round to handle floating point values
+            hard = torch.round(r_flat).long()
+            if self.symbol_level:
+                if bool(((hard < 0) | (hard >= self.field.size)).any()):
+                    raise ValueError(f"Received symbols must be integers in [0, {self.field.size - 1}]")
+            else:
+                hard = hard % 2
+
+            if self.t > 0:
+                syndromes = self.compute_syndromes(hard)
+
+                # Only codewords with a non-zero syndrome need the error locator search
+                active = syndromes.any(dim=-1).nonzero(as_tuple=True)[0]
+                if active.numel() > 0:
+                    error_locator = self.batched_berlekamp_massey(syndromes[active])
+                    error_positions = self.chien_search(error_locator)
+                    if self.symbol_level:
+                        values = self.forney(syndromes[active], error_locator)
+                        errors[active] = torch.where(error_positions, values, torch.zeros_like(values)).to(errors.dtype)
+                    else:
+                        errors[active] = error_positions.to(errors.dtype)
+
+            if self.symbol_level:
+                # Subtract (add) the error values from the received symbols
+                corrected = self.field.tensor_add(hard, errors.long()).to(r_flat.dtype)
+                decoded = self.encoder.extract_message_symbols(corrected).view(*block_shape[:-1], self.code_dimension)
+                return (decoded, errors.view(block_shape)) if return_errors else decoded
+
+            # Correct errors by flipping bits at error positions
+            corrected = (r_flat + errors) % 2
+
+            # Extract message bits from the corrected codewords
+            decoded = self.encoder.extract_message(corrected).view(*block_shape[:-1], self.code_dimension)
+
+            if return_errors:
+                return decoded, errors.view(block_shape)
+            return decoded
 
         # Apply decoding blockwise
         return apply_blockwise(received, self.code_length, decode_block)
@@ -7,20 +7,24 @@ Hamming distance, which is equivalent to maximum likelihood decoding in symmetri
 The maximum likelihood decoding principle selects the codeword that has the highest probability
 of having been transmitted, given the received word. For binary symmetric channels, this is
 equivalent to finding the codeword with the minimum Hamming distance to the received word.
-While this approach guarantees optimal decoding performance, its computational complexity
-grows exponentially with the code dimension, making it practical only for small codes.
+For soft inputs over the AWGN channel, the most likely codeword is the one with the largest
+correlation with the received values. While this approach guarantees optimal decoding
+performance, its computational complexity grows exponentially with the code dimension,
+making it practical only for small codes.
 
 :cite:`lin2004error`
 :cite:`moon2005error`
 :cite:`proakis2008digital`
 """
 
-from typing import Any, Optional, Tuple, Union
+from typing import Any, Literal, Optional, Tuple, Union
 
 import torch
 
 from kaira.models.fec.encoders.base import BaseBlockCodeEncoder
 
+from ..cache import artifact_key, cached_artifact, get_cache_dir
+from ..utils import apply_blockwise
 from .base import BaseBlockDecoder
 
 
@@ -48,12 +52,17 @@ class BruteForceMLDecoder(BaseBlockDecoder[BaseBlockCodeEncoder]):
         encoder (BaseBlockCodeEncoder): The encoder instance providing encoding functionality
         _codebook (torch.Tensor): Precomputed tensor of all codewords with shape (2^k, n)
         _message_map (torch.Tensor): Mapping from codeword indices to message bits with shape (2^k, k)
+        input_type (str): 'hard' for binary inputs or 'soft' for LLRs or BPSK samples
+        batch_chunk_size (int): Number of received words compared with the codebook at once
+        codebook_chunk_size (int): Number of codewords compared with the received words at once
 
     Args:
         encoder (BaseBlockCodeEncoder): The encoder for the code being decoded
         precompute_codebook (bool): Whether to precompute the entire codebook during initialization.
                                    Default is True, which is more efficient for multiple decoding
                                    operations but requires more memory.
+        input_type (Literal["hard", "soft"]): The type of input the decoder accepts.
+                                             Default is "hard".
         *args: Variable positional arguments passed to the base class
         **kwargs: Variable keyword arguments passed to the base class
 
@@ -87,7 +96,7 @@ class BruteForceMLDecoder(BaseBlockDecoder[BaseBlockCodeEncoder]):
         True
     """
 
-    def __init__(self, encoder: BaseBlockCodeEncoder, precompute_codebook: bool = True, *args: Any, **kwargs: Any):
+    def __init__(self, encoder: BaseBlockCodeEncoder, precompute_codebook: bool = True, input_type: Literal["hard", "soft"] = "hard", *args: Any, **kwargs: Any):
         """Initialize the brute force ML decoder.
 
         Sets up the decoder with an encoder instance and optionally precomputes
@@ -97,25 +106,62 @@ class BruteForceMLDecoder(BaseBlockDecoder[BaseBlockCodeEncoder]):
             encoder: The encoder instance for the code being decoded
             precompute_codebook: Whether to generate all possible codewords during
                                 initialization (True) or on-demand (False)
+            input_type: The type of decoder input, either "hard" for binary inputs
+                       (minimum Hamming distance decoding) or "soft" for LLRs or BPSK
+                       samples, with positive values for 0 bits (maximum correlation decoding)
             *args: Variable positional arguments passed to the base class
-            **kwargs: Variable keyword arguments passed to the base class
+            **kwargs: Variable keyword arguments passed to the base class, including:
+
+                - batch_chunk_size (int): Number of received words compared at once (default: 1024)
+                - codebook_chunk_size (int): Number of codewords compared at once (default: 4096)
+                - cache_dir (str): Directory in which the precomputed codebook is stored per code
+                  and reloaded on later initializations (default: None, the directory of the
+                  ``KAIRA_FEC_CACHE_DIR`` environment variable, or no caching if it is not set)
+
+        Raises:
+            ValueError: If input_type is not "hard" or "soft", or a chunk size is not positive
 
         Note:
             Precomputing the codebook requires O(2^k * n) memory, where k is the
             code dimension and n is the code length. This can be prohibitive for
-            larger codes, so set precompute_codebook=False for such cases.
+            larger codes, so set precompute_codebook=False for such cases: the
+            codewords are then generated chunk by chunk during decoding, and the
+            memory used is bounded by the chunk sizes.
         """
         super().__init__(encoder, *args, **kwargs)
 
+        if input_type not in ("hard", "soft"):
+            raise ValueError(f"input_type must be 'hard' or 'soft', got {input_type}")
+        self.input_type = input_type
+
+        self.batch_chunk_size = kwargs.get("batch_chunk_size", 1024)
+        self.codebook_chunk_size = kwargs.get("codebook_chunk_size", 4096)
+        if self.batch_chunk_size < 1 or self.codebook_chunk_size < 1:
+            raise ValueError(f"Chunk sizes must be positive, got batch_chunk_size={self.batch_chunk_size} and codebook_chunk_size={self.codebook_chunk_size}")
+        self.cache_dir: Optional[str] = kwargs.get("cache_dir", None)
+
         # Initialize attributes as Optional to satisfy mypy
         self._codebook: Optional[torch.Tensor] = None
         self._message_map: Optional[torch.Tensor] = None
 
         if precompute_codebook:
-            codebook, message_map = self._generate_codebook()
+            codebook, message_map = self._load_or_generate_codebook()
             self._codebook = codebook
             self._message_map = message_map
 
+    def _generate_messages(self, indices: torch.Tensor) -> torch.Tensor:
+        """Return the messages with the given indices, most significant bit first.
+
+        Args:
+            indices: Tensor of message indices of shape (num_messages,)
+
+        Returns:
+            Tensor of shape (num_messages, k) containing the messages
+        """
+        encoder_dtype = next(self.encoder.parameters(), torch.zeros(1)).dtype
+        shifts = torch.arange(self.code_dimension - 1, -1, -1, device=indices.device)
+        return ((indices.unsqueeze(1) >> shifts) & 1).to(encoder_dtype)
+
     def _generate_codebook(self) -> Tuple[torch.Tensor, torch.Tensor]:
         """Generate all possible codewords for the code.
 
@@ -123,9 +169,8 @@ class BruteForceMLDecoder(BaseBlockDecoder[BaseBlockCodeEncoder]):
         and encodes each one to create the complete codebook of the code. It also
         maintains a mapping from each codeword back to its original message.
 
-        The codebook is essential for the brute force ML decoding approach, as it
-        allows the decoder to compare the received word with all valid codewords
-        to find the most likely transmitted codeword.
+        The messages are obtained in one step from the bit expansion of the message
+        indices, and are encoded as a single batch.
 
         Returns:
             Tuple containing:
@@ -137,27 +182,32 @@ class BruteForceMLDecoder(BaseBlockDecoder[BaseBlockCodeEncoder]):
             memory and computation time. Consider alternative decoding methods
             for such large codes.
         """
-        k = self.code_dimension
-        n = self.code_length
+        messages = self._generate_messages(torch.arange(2**self.code_dimension))
+        codewords = self.encoder(messages).to(messages.dtype)
+        return codewords, messages
 
-        # Determine the appropriate dtype based on the encoder
-        encoder_dtype = next(self.encoder.parameters(), torch.zeros(1)).dtype
+    def _load_or_generate_codebook(self) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Return the codebook, from the cache directory if it was stored there before.
 
-        # Generate all possible messages (2^k)
-        num_messages = 2**k
-        messages = torch.zeros((num_messages, k), dtype=encoder_dtype)
+        The cached codebook is identified by the encoder class and the codewords of the
+        unit messages, which determine a linear code.
 
-        # Fill in binary representations
-        for i in range(num_messages):
-            for j in range(k):
-                messages[i, k - j - 1] = float((i >> j) & 1)  # Cast to float to match encoder dtype
+        Returns:
+            Tuple containing the codewords and messages as returned by :meth:`_generate_codebook`
+        """
+        cache_dir = get_cache_dir(self.cache_dir)
+        if cache_dir is None:
+            return self._generate_codebook()
 
-        # Encode all messages to get codewords
-        codewords = torch.zeros((num_messages, n), dtype=encoder_dtype)
-        for i in range(num_messages):
-            codewords[i] = self.encoder(messages[i].unsqueeze(0)).squeeze(0)
+        unit_codewords = self.encoder(torch.eye(self.code_dimension, dtype=next(self.encoder.parameters(), torch.zeros(1)).dtype))
+        key = artifact_key(type(self.encoder).__name__, unit_codewords.to(torch.uint8))
 
-        return codewords, messages
+        def build():
+            codebook, message_map = self._generate_codebook()
+            return {"codebook": codebook, "message_map": message_map}
+
+        cached = cached_artifact("codebook", key, build, cache_dir)
+        return cached["codebook"], cached["message_map"]
 
     def _hamming_distance(self, x: torch.Tensor, y: torch.Tensor) -> torch.Tensor:
         """Compute the Hamming distance between two binary vectors.
@@ -194,14 +244,19 @@ class BruteForceMLDecoder(BaseBlockDecoder[BaseBlockCodeEncoder]):
         This method implements the complete maximum likelihood decoding process:
         1. Compare the received word with every possible codeword
         2. Find the codeword that minimizes the Hamming distance to the received word
+           (hard input) or maximizes its correlation with the received values (soft input)
         3. Return the message bits corresponding to that codeword
 
         This provides optimal decoding performance for the binary symmetric channel (BSC)
-        in terms of minimizing the word error probability.
+        with hard inputs, and for the AWGN channel with soft inputs, in terms of minimizing
+        the word error probability.
 
         Args:
-            received: Received codeword tensor with shape (..., n) or (..., m*n)
-                     where n is the code length and m is some multiple
+            received: Received tensor with shape (..., n) or (..., m*n)
+                     where n is the code length and m is some multiple.
+                     For hard inputs, values should be 0 or 1.
+                     For soft inputs, positive values represent likelihood of 0 bits and
+                     negative values represent likelihood of 1 bits (e.g., LLR values).
             *args: Additional positional arguments
             **kwargs: Additional keyword arguments
                 return_errors: If True, also return the estimated error patterns
@@ -215,10 +270,10 @@ class BruteForceMLDecoder(BaseBlockDecoder[BaseBlockCodeEncoder]):
             ValueError: If the last dimension of received is not a multiple of the code length
 
         Note:
-            This decoder provides optimal (maximum likelihood) decoding for the binary
-            symmetric channel at the cost of exponential complexity in the code dimension k.
-            For larger codes, consider using more efficient decoders that may sacrifice
-            some performance for computational tractability.
+            This decoder provides optimal (maximum likelihood) decoding at the cost of
+            exponential complexity in the code dimension k. For larger codes, consider
+            using more efficient decoders that may sacrifice some performance for
+            computational tractability.
         """
         return_errors = kwargs.get("return_errors", False)
 
@@ -227,51 +282,40 @@ class BruteForceMLDecoder(BaseBlockDecoder[BaseBlockCodeEncoder]):
         if L % self.code_length != 0:
             raise ValueError(f"Last dimension ({L}) must be divisible by code length ({self.code_length})")
 
-        # Non-batched processing
-        if not leading_dims:  # If received is just a single vector
-            received = received.unsqueeze(0)  # Add batch dimension
-            result = self._decode_batch(received, return_errors)
-            # Remove batch dimension from result
+        def decode_block(r_block):
+            block_shape = r_block.shape
+            result = self._decode_batch(r_block.reshape(-1, self.code_length), return_errors)
             if return_errors:
-                decoded, errors = result  # type: ignore[misc]  # We know this is a tuple when return_errors=True
-                return decoded.squeeze(0), errors.squeeze(0)
-            else:
-                # We know result is a tensor here, not a tuple
-                return result.squeeze(0)  # type: ignore[union-attr]
-
-        # For batched inputs, reshape to handle multiple blocks if needed
-        if L == self.code_length:  # Simple case: each row is a single codeword
-            return self._decode_batch(received, return_errors)
-        else:
-            # Complex case: each row contains multiple codewords
-            # Reshape to (..., L/n, n)
-            blocks_per_row = L // self.code_length
-            reshaped = received.view(*leading_dims, blocks_per_row, self.code_length)
+                decoded, errors = result
+                return decoded.view(*block_shape[:-1], self.code_dimension), errors.view(block_shape)
+            return result.view(*block_shape[:-1], self.code_dimension)
 
-            # Combine batch dimensions for processing
-            combined_shape = (-1, self.code_length)
-            flattened = reshaped.reshape(*combined_shape)
+        return apply_blockwise(received, self.code_length, decode_block)
 
-            # Decode the combined batch
-            if return_errors:
-                batch_result = self._decode_batch(flattened, return_errors)
-                decoded, errors = batch_result  # type: ignore[misc]  # We know this is a tuple
-                # Reshape back to original structure
-                decoded = decoded.view(*leading_dims, blocks_per_row, self.code_dimension)
-                errors = errors.view(*leading_dims, blocks_per_row, self.code_length)
-                # Flatten the block dimension
-                return decoded.reshape(*leading_dims, -1), errors.reshape(*leading_dims, -1)
-            else:
-                # We know the result is a tensor here
-                decoded = self._decode_batch(flattened, return_errors)  # type: ignore[assignment]
-                # Reshape back to original structure
-                decoded = decoded.view(*leading_dims, blocks_per_row, self.code_dimension)  # type: ignore[union-attr]
-                # Flatten the block dimension
-                return decoded.reshape(*leading_dims, -1)  # type: ignore[union-attr]
+    def _codebook_chunk(self, start: int, end: int, device: torch.device) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Return the codewords and messages with indices start to end - 1.
+
+        Args:
+            start: Index of the first codeword
+            end: Index after the last codeword
+            device: Device to place the tensors on
+
+        Returns:
+            Tuple of the codewords of shape (end - start, n) and the messages of shape (end - start, k)
+        """
+        if self._codebook is not None and self._message_map is not None:
+            return self._codebook[start:end].to(device), self._message_map[start:end].to(device)
+
+        messages = self._generate_messages(torch.arange(start, end))
+        return self.encoder(messages).to(device=device, dtype=messages.dtype), messages.to(device)
 
     def _decode_batch(self, received_batch: torch.Tensor, return_errors: bool = False) -> Union[torch.Tensor, Tuple[torch.Tensor, torch.Tensor]]:
         """Decode a batch of received words.
 
+        The received words are compared with the codebook in tiles of
+        batch_chunk_size received words by codebook_chunk_size codewords, keeping
+        the best codeword found so far for every received word.
+
         Args:
             received_batch: Tensor with shape (batch_size, code_length)
             return_errors: Whether to return the error pattern
@@ -282,39 +326,45 @@ class BruteForceMLDecoder(BaseBlockDecoder[BaseBlockCodeEncoder]):
             - Tuple of (decoded tensor, error pattern tensor) if return_errors=True
         """
         batch_size = received_batch.shape[0]
-        decoded = torch.zeros(batch_size, self.code_dimension, dtype=received_batch.dtype, device=received_batch.device)
-        errors = torch.zeros_like(received_batch)
-
-        # Generate codebook if needed
-        if self._codebook is None or self._message_map is None:
-            temp_codebook, temp_message_map = self._generate_codebook()
-            codebook = temp_codebook
-            message_map = temp_message_map
-        else:
-            # We know these are not None at this point
-            codebook = self._codebook
-            message_map = self._message_map
-
-        # Move codebook to same device as received
-        codebook = codebook.to(received_batch.device)
-        message_map = message_map.to(received_batch.device)
-
-        for i in range(batch_size):
-            # Get the current received word
-            r = received_batch[i]
-
-            # Compute Hamming distance to all codewords
-            distances = self._hamming_distance(r.unsqueeze(0).expand(codebook.shape[0], -1), codebook)
-
-            # Find the closest codeword (maximum likelihood)
-            min_idx = torch.argmin(distances)
-            closest_codeword = codebook[min_idx]
+        device = received_batch.device
+        num_codewords = 2**self.code_dimension
 
-            # Compute the error pattern
-            error_pattern = (r != closest_codeword).to(torch.int)
-            errors[i] = error_pattern
-
-            # Get the corresponding message
-            decoded[i] = message_map[min_idx]
-
-        return (decoded, errors) if return_errors else decoded
+        # Both metrics are minimized through a correlation with the bipolar codewords (0 -> +1, 1 -> -1):
+        # the Hamming distance to a binary word r is (n - <1 - 2r, 1 - 2c>) / 2
+        if self.input_type == "hard":
+            values = 1 - 2 * received_batch.to(torch.float)
+        else:
+            values = received_batch.to(torch.float)
+
+        best_metric = torch.full((batch_size,), float("inf"), device=device)
+        best_index = torch.zeros(batch_size, dtype=torch.long, device=device)
+        for start in range(0, num_codewords, self.codebook_chunk_size):
+            end = min(start + self.codebook_chunk_size, num_codewords)
+            codewords, _ = self._codebook_chunk(start, end, device)
+            bipolar = (1 - 2 * codewords.to(torch.float)).T
+
+            for batch_start in range(0, batch_size, self.batch_chunk_size):
+                batch_end = min(batch_start + self.batch_chunk_size, batch_size)
+                metric, index = torch.min(-(values[batch_start:batch_end] @ bipolar), dim=1)
+
+                # Keep the first codeword reaching the best metric
+                improved = metric < best_metric[batch_start:batch_end]
+                best_metric[batch_start:batch_end] = torch.where(improved, metric, best_metric[batch_start:batch_end])
+                best_index[batch_start:batch_end] = torch.where(improved, index + start, best_index[batch_start:batch_end])
+
+        if self._codebook is not None and self._message_map is not None:
+            closest_codewords = self._codebook.to(device)[best_index]
+            decoded = self._message_map.to(device)[best_index]
+        else:
+            messages = self._generate_messages(best_index.cpu())
+            closest_codewords = self.encoder(messages).to(device)
+            decoded = messages.to(device)
+        decoded = decoded.to(received_batch.dtype)
+
+        if not return_errors:
+            return decoded
+
+        # Compute the error pattern
+        hard = received_batch if self.input_type == "hard" else (received_batch < 0).to(received_batch.dtype)
+        errors = (hard != closest_codewords.to(hard.dtype)).to(received_batch.dtype)
+        return decoded, errors
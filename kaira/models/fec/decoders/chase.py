@@ -0,0 +1,185 @@
+"""Chase-II soft-decision decoding for forward error correction.
+
+This module implements the Chase-II algorithm :cite:`chase1972class`, which turns any
+hard-decision block decoder into a soft-decision decoder. The hard decisions of the received word
+are perturbed by all 2^p test patterns on its p least reliable positions, every test word is
+decoded by the hard-decision decoder, and the decoded codeword with the largest correlation with
+the received soft values is selected.
+
+Since the test words of all received words are decoded as one batch, the cost of the soft
+decoding is a single call of the hard-decision decoder on a batch 2^p times larger, instead of
+the exponential search over all codewords of a maximum likelihood decoder.
+
+:cite:`chase1972class`
+:cite:`moon2005error`
+"""
+
+from typing import Any, Optional, Tuple, Type, Union
+
+import torch
+
+from kaira.models.fec.encoders.base import BaseBlockCodeEncoder
+
+from ..utils import apply_blockwise
+from .base import BaseBlockDecoder
+from .syndrome_lookup import SyndromeLookupDecoder
+
+
+class ChaseDecoder(BaseBlockDecoder[BaseBlockCodeEncoder]):
+    """Chase-II soft-decision decoder wrapping a hard-decision decoder :cite:`chase1972class`.
+
+    For every received word with soft values r, the decoder:
+
+    1. Takes the hard decisions y and the reliabilities |r| of all positions
+    2. Forms the 2^p test words y + e, where e ranges over all binary patterns on the p least
+       reliable positions
+    3. Decodes the test words of the whole batch with one call of the inner decoder
+    4. Re-encodes the decoded messages and selects the codeword with the smallest discrepancy,
+       i.e. the smallest sum of the reliabilities of the positions where it disagrees with y,
+       which is the codeword with the largest correlation with r
+
+    The test pattern without flips is always included, so the Chase decoder never selects a
+    codeword worse than the one found by the inner decoder from the hard decisions.
+
+    Attributes:
+        encoder (BaseBlockCodeEncoder): The encoder of the code being decoded
+        inner_decoder (BaseBlockDecoder): The hard-decision decoder applied to the test words
+        num_test_positions (int): Number p of least reliable positions perturbed by the test patterns
+        batch_chunk_size (int): Number of received words whose test words are decoded at once
+
+    Args:
+        encoder (BaseBlockCodeEncoder): The encoder for the code being decoded
+        inner_decoder (Optional[Union[BaseBlockDecoder, Type[BaseBlockDecoder]]]): Hard-decision
+            decoder for the code, or a decoder class that is instantiated with the encoder.
+            Default is SyndromeLookupDecoder.
+        num_test_positions (int): Number p of least reliable positions. Default is 3.
+        *args: Variable positional arguments passed to the base class
+        **kwargs: Variable keyword arguments passed to the base class
+
+    Examples:
+        >>> from kaira.models.fec.encoders import BCHCodeEncoder
+        >>> from kaira.models.fec.decoders import BerlekampMasseyDecoder, ChaseDecoder
+        >>> import torch
+        >>>
+        >>> encoder = BCHCodeEncoder(mu=5, delta=7)
+        >>> decoder = ChaseDecoder(encoder, BerlekampMasseyDecoder, num_test_positions=4)
+        >>>
+        >>> message = torch.randint(0, 2, (10, 16)).float()
+        >>> llr = 4.0 * (1 - 2 * encoder(message)) + 2.0 * torch.randn(10, 31)
+        >>> decoded = decoder(llr)
+    """
+
+    def __init__(self, encoder: BaseBlockCodeEncoder, inner_decoder: Optional[Union[BaseBlockDecoder, Type[BaseBlockDecoder]]] = None, num_test_positions: int = 3, *args: Any, **kwargs: Any):
+        """Initialize the Chase decoder.
+
+        Args:
+            encoder: The encoder instance for the code being decoded
+            inner_decoder: Hard-decision decoder instance for the same code, or a decoder class
+                          that is instantiated with the encoder. Defaults to SyndromeLookupDecoder.
+            num_test_positions: Number of least reliable positions perturbed by the test patterns
+            *args: Variable positional arguments passed to the base class
+            **kwargs: Variable keyword arguments passed to the base class, including:
+
+                - batch_chunk_size (int): Number of received words whose test words are decoded at once
+                  (default: 1024)
+
+        Raises:
+            ValueError: If num_test_positions is negative or larger than the code length, the
+                batch chunk size is not positive, or the inner decoder is for a code with
+                different parameters
+        """
+        super().__init__(encoder, *args, **kwargs)
+
+        if inner_decoder is None:
+            inner_decoder = SyndromeLookupDecoder
+        if isinstance(inner_decoder, type):
+            inner_decoder = inner_decoder(encoder)
+        if (inner_decoder.code_length, inner_decoder.code_dimension) != (self.code_length, self.code_dimension):
+            raise ValueError(f"Inner decoder is for a ({inner_decoder.code_length}, {inner_decoder.code_dimension}) code, but the encoder is for a ({self.code_length}, {self.code_dimension}) code")
+        if not 0 <= num_test_positions <= self.code_length:
+            raise ValueError(f"num_test_positions must be between 0 and the code length ({self.code_length}), got {num_test_positions}")
+        self.inner_decoder = inner_decoder
+        self.num_test_positions = num_test_positions
+        self.batch_chunk_size = kwargs.get("batch_chunk_size", 1024)
+        if self.batch_chunk_size < 1:
+            raise ValueError(f"batch_chunk_size must be positive, got {self.batch_chunk_size}")
+
+        # Row t holds the flips of test pattern t on the p least reliable positions
+        patterns = (torch.arange(2**num_test_positions).unsqueeze(1) >> torch.arange(num_test_positions)) & 1
+        self.register_buffer("test_patterns", patterns.to(torch.uint8), persistent=False)
+
+    def forward(self, received: torch.Tensor, *args: Any, **kwargs: Any) -> Union[torch.Tensor, Tuple[torch.Tensor, torch.Tensor]]:
+        """Decode received words with the Chase-II algorithm.
+
+        Args:
+            received: Received soft values with shape (..., n) or (..., m*n), where n is the code
+                     length. Positive values represent likelihood of 0 bits and negative values
+                     represent likelihood of 1 bits (e.g., LLR values).
+            *args: Additional positional arguments
+            **kwargs: Additional keyword arguments
+                return_errors: If True, also return the estimated error patterns
+
+        Returns:
+            Either:
+            - Decoded tensor containing estimated messages with shape (..., k) or (..., m*k)
+            - A tuple of (decoded tensor, error pattern tensor) if return_errors=True
+
+        Raises:
+            ValueError: If the last dimension of received is not a multiple of the code length
+        """
+        return_errors = kwargs.get("return_errors", False)
+
+        if received.shape[-1] % self.code_length != 0:
+            raise ValueError(f"Last dimension ({received.shape[-1]}) must be divisible by code length ({self.code_length})")
+
+        def decode_block(r_block):
+            block_shape = r_block.shape
+            flat = r_block.reshape(-1, self.code_length)
+            results = [self._decode_batch(flat[start : start + self.batch_chunk_size]) for start in range(0, flat.shape[0], self.batch_chunk_size)]
+            decoded = torch.cat([result[0] for result in results]).view(*block_shape[:-1], self.code_dimension)
+            if return_errors:
+                return decoded, torch.cat([result[1] for result in results]).view(block_shape)
+            return decoded
+
+        return apply_blockwise(received, self.code_length, decode_block)
+
+    def _decode_batch(self, received_batch: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Decode a batch of received words.
+
+        Args:
+            received_batch: Tensor with shape (batch_size, code_length)
+
+        Returns:
+            Tuple of the decoded messages of shape (batch_size, code_dimension) and the estimated
+            error patterns of shape (batch_size, code_length), both with the dtype of the input
+        """
+        batch_size, n = received_batch.shape
+        dtype = received_batch.dtype if received_batch.is_floating_point() else torch.float
+        hard = (received_batch < 0).to(torch.uint8)
+        reliability = received_batch.abs().to(torch.float)
+
+        # Test words of all received words, with the test pattern as the leading dimension
+        patterns = self.test_patterns.to(received_batch.device)
+        num_patterns, p = patterns.shape
+        positions = reliability.topk(p, dim=1, largest=False).indices
+        flips = torch.zeros(num_patterns, batch_size, n, dtype=torch.uint8, device=received_batch.device)
+        flips.scatter_(2, positions.unsqueeze(0).expand(num_patterns, -1, -1), patterns.unsqueeze(1).expand(-1, batch_size, -1))
+        test_words = (hard.unsqueeze(0) ^ flips).to(dtype)
+
+        messages = self.inner_decoder(test_words.view(-1, n))
+        if isinstance(messages, tuple):
+            messages = messages[0]
+        messages = messages.to(dtype)
+        codewords = self.encoder(messages).view(num_patterns, batch_size, n)
+
+        # Discrepancy of every candidate: total reliability of the positions that disagree with the hard decisions
+        metric = ((codewords != hard.to(dtype)).to(torch.float) * reliability).sum(dim=-1)
+        best = metric.argmin(dim=0)
+        index = torch.arange(batch_size, device=received_batch.device)
+        decoded = messages.view(num_patterns, batch_size, -1)[best, index]
+        errors = (codewords[best, index] != hard.to(dtype)).to(dtype)
+        return decoded.to(received_batch.dtype), errors.to(received_batch.dtype)
+
+    def extra_repr(self) -> str:
+        """Return a summary of the decoder configuration."""
+        return f"num_test_positions={self.num_test_positions}"
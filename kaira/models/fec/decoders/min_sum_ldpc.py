@@ -15,7 +15,7 @@ References:
     :cite:`kschischang2001factor`, :cite:`chen2005reduced`
 """
 
-from typing import Any, Union
+from typing import Any, List, Optional, Union
 
 import torch
 
@@ -53,6 +53,9 @@ class MinSumLDPCDecoder(BeliefPropagationDecoder):
         normalized: If True, use optimized normalized parameters (default: False)
         return_soft: Whether to return soft outputs (default: False)
         device: Device for computation (default: "cpu")
+        schedule: Message-passing schedule, "flooding" or "layered" (default: "flooding")
+        layers: Partition of the check nodes into layers for the layered schedule (default: None)
+        early_stop: Stop iterating on codewords that satisfy all parity checks (default: False)
 
     Attributes:
         scaling_factor: Multiplicative scaling factor applied to check node outputs
@@ -60,7 +63,7 @@ class MinSumLDPCDecoder(BeliefPropagationDecoder):
         normalized: Whether using normalized variant parameters
     """
 
-    def __init__(self, encoder: Union[LinearBlockCodeEncoder, LDPCCodeEncoder], bp_iters: int = 10, scaling_factor: float = 1.0, offset: float = 0.0, normalized: bool = False, return_soft: bool = False, device: str = "cpu", *args: Any, **kwargs: Any):
+    def __init__(self, encoder: Union[LinearBlockCodeEncoder, LDPCCodeEncoder], bp_iters: int = 10, scaling_factor: float = 1.0, offset: float = 0.0, normalized: bool = False, return_soft: bool = False, device: str = "cpu", schedule: str = "flooding", layers: Optional[List[List[int]]] = None, early_stop: bool = False, *args: Any, **kwargs: Any):
         """Initialize the Min-Sum LDPC decoder.
 
         Args:
@@ -71,11 +74,15 @@ class MinSumLDPCDecoder(BeliefPropagationDecoder):
             normalized: If True, use optimized normalized parameters (overrides scaling_factor and offset)
             return_soft: Whether to return soft outputs
             device: Device for computation
+            schedule: Message-passing schedule, "flooding" or "layered"
+            layers: Partition of the check nodes into layers for the layered schedule
+            early_stop: Stop iterating on codewords that satisfy all parity checks
             *args: Additional positional arguments
             **kwargs: Additional keyword arguments
         """
         # Initialize parent class without arctanh (not used in Min-Sum)
-        super().__init__(encoder, bp_iters, arctanh=False, return_soft=return_soft, device=device)
+        # The Min-Sum kernel works on the edge-list representation of the Tanner graph
+        super().__init__(encoder, bp_iters, arctanh=False, return_soft=return_soft, device=device, backend="edge_list", schedule=schedule, layers=layers, early_stop=early_stop)
 
         # Set parameters based on normalized flag
         if normalized:
@@ -109,86 +116,52 @@ class MinSumLDPCDecoder(BeliefPropagationDecoder):
         2. Magnitude computation: Minimum of input magnitudes
         3. Optional scaling and offset for improved performance
 
+        The messages of all check nodes are processed at once in the padded
+        [batch_size, n_c, max_check_degree] layout of the edge-list representation,
+        see :meth:`check_node_update`.
+
         Args:
             vc: Variable-to-check messages tensor of shape [batch_size, num_edges]
 
         Returns:
             Check-to-variable messages tensor of shape [batch_size, num_edges]
         """
-        batch_size, _ = vc.size()
-        vc = vc.clamp(-500, 500)  # Numerical stability
-        cv = []
-
-        for c_group in self.cv_group:
-            deg = self.check_degree[c_group[0]].item()
-            members = len(c_group)
-
-            if deg > 1:
-                # Get extrinsic message indices for this check group
-                from operator import itemgetter
-
-                ext_ce_list = list(itemgetter(*c_group)(self.ext_ce))
-
-                if members == 1 and self.not_ldpc:
-                    ext_ce = torch.cat(ext_ce_list, dim=0).view(len(ext_ce_list), -1)
-                else:
-                    ext_ce = torch.cat(ext_ce_list, dim=0)
-                ext_ce = ext_ce.unsqueeze(0).repeat_interleave(batch_size, dim=0)
-
-                # Gather variable-to-check messages for this group
-                vc_extended = vc.unsqueeze(1).repeat_interleave(deg * members, dim=1)
-                vc_group_messages = vc_extended.gather(2, ext_ce)
-
-                # Min-Sum check node operation
-                # 1. Extract signs and magnitudes
-                signs = torch.sign(vc_group_messages)
-                magnitudes = torch.abs(vc_group_messages)
-
-                # 2. Compute output signs (XOR of input signs)
-                sign_product = torch.prod(signs, dim=2, keepdim=True)
-                output_signs = sign_product * signs  # Extrinsic sign
-
-                # 3. Compute output magnitudes (min of input magnitudes)
-                # For each output, take min over all other inputs (extrinsic minimum)
-                min_magnitudes = torch.zeros_like(vc_group_messages)
-                for i in range(vc_group_messages.size(2)):
-                    # Create mask to exclude current position
-                    mask = torch.ones_like(vc_group_messages, dtype=torch.bool)
-                    mask[:, :, i] = False
-
-                    # Find minimum over other positions
-                    other_magnitudes = magnitudes.masked_select(mask).view(batch_size, deg * members, -1)
-                    min_vals, _ = torch.min(other_magnitudes, dim=2)
-                    min_magnitudes[:, :, i] = min_vals
-
-                # 4. Combine signs and magnitudes
-                v_messages = output_signs * min_magnitudes
-
-                # 5. Apply scaling factor and offset (for improved Min-Sum variants)
-                if self.scaling_factor != 1.0:
-                    v_messages = v_messages * self.scaling_factor
-                if self.offset != 0.0:
-                    v_messages = v_messages - torch.sign(v_messages) * self.offset
-
-                # Reshape to match expected output
-                v_messages = v_messages.view(batch_size, -1)
+        return self.compute_cv_edge_list(vc)
 
-            else:
-                # Single connection case
-                v_messages = torch.zeros(batch_size, members, device=self.device)
+    def compute_cv(self, vc: torch.Tensor) -> torch.Tensor:
+        """Override parent's compute_cv to use Min-Sum algorithm."""
+        return self.compute_cv_minsum(vc)
 
-            cv.append(v_messages)
+    def check_node_update(self, vc: torch.Tensor) -> torch.Tensor:
+        """Apply the Min-Sum check node rule to messages in the padded check-node layout.
 
-        # Concatenate and reorder messages
-        cv_tensor = torch.cat(cv, dim=-1)
-        new_order = self.cv_order.unsqueeze(0).repeat_interleave(batch_size, dim=0)
-        cv_tensor = cv_tensor.gather(1, new_order)
+        A single pass over every check node computes the smallest magnitude (min1), its position
+        (argmin), the second smallest magnitude (min2) and the product of all signs. The extrinsic
+        message of an edge then has magnitude min2 if the edge holds min1 and min1 otherwise, and
+        sign equal to the total sign product times the sign of the edge itself. Padding slots must
+        hold a large positive LLR, which never wins the minimum and does not change the sign.
 
-        return cv_tensor
+        Args:
+            vc: Clamped variable-to-check messages of shape [batch_size, num_checks, max_degree]
 
-    def compute_cv(self, vc: torch.Tensor) -> torch.Tensor:
-        """Override parent's compute_cv to use Min-Sum algorithm."""
-        return self.compute_cv_minsum(vc)
+        Returns:
+            Check-to-variable messages of shape [batch_size, num_checks, max_degree]
+        """
+        signs = torch.where(vc < 0, -1.0, 1.0).to(vc.dtype)
+        magnitudes = torch.abs(vc)
+
+        min1, argmin = torch.min(magnitudes, dim=-1, keepdim=True)
+        min2 = magnitudes.scatter(-1, argmin, float("inf")).min(dim=-1, keepdim=True).values
+        position = torch.arange(vc.size(-1), device=vc.device)
+        extrinsic_magnitudes = torch.where(position == argmin, min2, min1)
+        extrinsic_signs = torch.prod(signs, dim=-1, keepdim=True) * signs
+
+        v_messages = extrinsic_signs * extrinsic_magnitudes
+        if self.scaling_factor != 1.0:
+            v_messages = v_messages * self.scaling_factor
+        if self.offset != 0.0:
+            v_messages = v_messages - torch.sign(v_messages) * self.offset
+        return v_messages
 
     def get_algorithm_info(self) -> dict:
         """Get information about the Min-Sum algorithm configuration.
@@ -202,6 +175,8 @@ class MinSumLDPCDecoder(BeliefPropagationDecoder):
             "offset": self.offset,
             "normalized": self.normalized,
             "iterations": self.bp_iters,
+            "schedule": self.schedule,
+            "early_stop": self.early_stop,
             "complexity": "O(E·I) where E=edges, I=iterations",
             "parameters": {"scaling_factor": self.scaling_factor, "offset": self.offset, "normalized": self.normalized},
             "advantages": ["Lower computational complexity than BP", "Simpler hardware implementation", "Reduced numerical precision requirements", "No transcendental functions required"],
@@ -0,0 +1,255 @@
+"""Ordered Statistics Decoding (OSD) for forward error correction.
+
+This module implements ordered statistics decoding :cite:`fossorier1995soft`, a soft-decision
+decoder for arbitrary binary linear block codes whose performance approaches maximum likelihood
+decoding at a complexity that is polynomial in the code dimension.
+
+The decoder sorts the positions of every received word by the reliability of their soft values
+and brings the generator matrix into systematic form on the k most reliable independent
+positions, the most reliable basis (MRB). The hard decisions on the MRB determine a first
+codeword, and the reprocessing of order w flips every combination of up to w bits of the MRB,
+re-encodes them and keeps the codeword with the largest correlation with the received values.
+Since the errors in a received word concentrate on its least reliable positions, a small order
+w (typically 1 to 3) is enough to approach maximum likelihood decoding for short codes.
+
+:cite:`fossorier1995soft`
+:cite:`lin2004error`
+"""
+
+import itertools
+import math
+from typing import Any, Literal, Optional, Tuple, Union
+
+import torch
+
+from kaira.models.fec.encoders.base import BaseBlockCodeEncoder
+
+from ..gf2 import batched_packed_row_reduction, packed_row_reduction
+from ..utils import apply_blockwise
+from .base import BaseBlockDecoder
+
+
+class OrderedStatisticsDecoder(BaseBlockDecoder[BaseBlockCodeEncoder]):
+    """Ordered Statistics Decoder (OSD) of order w for binary linear block codes
+    :cite:`fossorier1995soft`.
+
+    The decoder works on a batch of received words at once:
+
+    1. The positions of every received word are sorted by decreasing reliability |r|
+    2. The generator matrix, with its columns in this order, is reduced to systematic form by a
+       batched Gaussian elimination over GF(2), which finds the most reliable basis (MRB) of
+       every received word
+    3. The hard decisions on the MRB are re-encoded (order-0 codeword)
+    4. All test error patterns of weight up to w on the MRB are enumerated as one tensor, and
+       the codewords they produce are compared with the received word
+    5. The codeword with the largest correlation with the received values, i.e. the smallest
+       sum of the reliabilities of the positions where it disagrees with the hard decisions,
+       is selected, and its message is recovered from the same row operations
+
+    The generator matrix is obtained by encoding the unit messages, so the decoder works with
+    any encoder of a linear code. Encoders that add a constant word to the codewords (e.g.
+    polar codes with frozen ones) are supported by removing this word from the received values.
+
+    The reprocessing of order i is skipped for the received words whose best codeword after
+    order i - 1 disagrees with the hard decisions in positions of total reliability at most
+    `early_stop_threshold`. With a threshold of 0, only received words whose hard decisions
+    are a codeword stop early, which never changes the decoding result.
+
+    Attributes:
+        encoder (BaseBlockCodeEncoder): The encoder of the code being decoded
+        order (int): Maximum weight w of the test error patterns on the MRB
+        input_type (str): 'soft' for LLRs or BPSK samples, or 'hard' for binary inputs
+        early_stop_threshold (Optional[float]): Threshold on the discrepancy of the best codeword
+            below which the remaining reprocessing orders are skipped, or None to run all orders
+        batch_chunk_size (int): Number of received words decoded at once
+        pattern_chunk_size (int): Number of test error patterns evaluated at once
+        num_patterns (int): Number of test error patterns per received word without early termination
+
+    Args:
+        encoder (BaseBlockCodeEncoder): The encoder for the code being decoded
+        order (int): Maximum weight w of the test error patterns. Default is 2.
+        input_type (Literal["soft", "hard"]): The type of input the decoder accepts. Default is "soft".
+        *args: Variable positional arguments passed to the base class
+        **kwargs: Variable keyword arguments passed to the base class
+
+    Examples:
+        >>> from kaira.models.fec.encoders import GolayCodeEncoder
+        >>> from kaira.models.fec.decoders import OrderedStatisticsDecoder
+        >>> import torch
+        >>>
+        >>> encoder = GolayCodeEncoder(extended=True)
+        >>> decoder = OrderedStatisticsDecoder(encoder, order=2)
+        >>>
+        >>> message = torch.randint(0, 2, (10, 12)).float()
+        >>> llr = 4.0 * (1 - 2 * encoder(message)) + 2.0 * torch.randn(10, 24)
+        >>> decoded = decoder(llr)
+    """
+
+    def __init__(self, encoder: BaseBlockCodeEncoder, order: int = 2, input_type: Literal["soft", "hard"] = "soft", *args: Any, **kwargs: Any):
+        """Initialize the ordered statistics decoder.
+
+        Args:
+            encoder: The encoder instance for the code being decoded
+            order: Maximum weight w of the test error patterns on the most reliable basis
+            input_type: The type of decoder input, either "soft" for LLRs or BPSK samples, with
+                       positive values for 0 bits, or "hard" for binary inputs
+            *args: Variable positional arguments passed to the base class
+            **kwargs: Variable keyword arguments passed to the base class, including:
+
+                - early_stop_threshold (float): Discrepancy of the best codeword at or below which the
+                  remaining reprocessing orders are skipped (default: None, all orders are processed)
+                - batch_chunk_size (int): Number of received words decoded at once (default: 1024)
+                - pattern_chunk_size (int): Number of test error patterns evaluated at once (default: 256)
+
+        Raises:
+            ValueError: If the order is negative, input_type is not "soft" or "hard", a chunk size
+                is not positive, or the codewords of the unit messages are linearly dependent
+        """
+        super().__init__(encoder, *args, **kwargs)
+
+        if order < 0:
+            raise ValueError(f"order must be non-negative, got {order}")
+        if input_type not in ("soft", "hard"):
+            raise ValueError(f"input_type must be 'soft' or 'hard', got {input_type}")
+        self.order = min(order, self.code_dimension)
+        self.input_type = input_type
+        self.early_stop_threshold: Optional[float] = kwargs.get("early_stop_threshold", None)
+        self.batch_chunk_size = kwargs.get("batch_chunk_size", 1024)
+        self.pattern_chunk_size = kwargs.get("pattern_chunk_size", 256)
+        if self.batch_chunk_size < 1 or self.pattern_chunk_size < 1:
+            raise ValueError(f"Chunk sizes must be positive, got batch_chunk_size={self.batch_chunk_size} and pattern_chunk_size={self.pattern_chunk_size}")
+
+        # The codewords of the unit messages, relative to the codeword of the zero message
+        encoder_dtype = next(self.encoder.parameters(), torch.zeros(1)).dtype
+        k = self.code_dimension
+        codewords = self.encoder(torch.cat([torch.zeros(1, k, dtype=encoder_dtype), torch.eye(k, dtype=encoder_dtype)])).to(torch.uint8)
+        offset, generator_matrix = codewords[0], codewords[1:] ^ codewords[0]
+        if len(packed_row_reduction(generator_matrix)[1]) < k:
+            raise ValueError("The codewords of the unit messages must be linearly independent")
+        self.register_buffer("generator_matrix", generator_matrix, persistent=False)
+        self.register_buffer("offset", offset, persistent=False)
+        self.num_patterns = sum(math.comb(k, weight) for weight in range(self.order + 1))
+
+    def _error_patterns(self, weight: int, device: torch.device) -> torch.Tensor:
+        """Return the positions of all test error patterns of a given weight on the MRB.
+
+        Args:
+            weight: Number of flipped bits
+            device: Device to place the tensor on
+
+        Returns:
+            Tensor of shape (C(k, weight), weight) holding the flipped MRB rows of every pattern
+        """
+        # torch.combinations builds the full k**weight grid first, which does not scale to larger orders
+        patterns = list(itertools.combinations(range(self.code_dimension), weight))
+        return torch.tensor(patterns, dtype=torch.long, device=device).view(len(patterns), weight)
+
+    def forward(self, received: torch.Tensor, *args: Any, **kwargs: Any) -> Union[torch.Tensor, Tuple[torch.Tensor, torch.Tensor]]:
+        """Decode received words with ordered statistics decoding.
+
+        Args:
+            received: Received tensor with shape (..., n) or (..., m*n), where n is the code
+                     length. For soft inputs, positive values represent likelihood of 0 bits and
+                     negative values represent likelihood of 1 bits (e.g., LLR values). For hard
+                     inputs, values should be 0 or 1.
+            *args: Additional positional arguments
+            **kwargs: Additional keyword arguments
+                return_errors: If True, also return the estimated error patterns
+
+        Returns:
+            Either:
+            - Decoded tensor containing estimated messages with shape (..., k) or (..., m*k)
+            - A tuple of (decoded tensor, error pattern tensor) if return_errors=True
+
+        Raises:
+            ValueError: If the last dimension of received is not a multiple of the code length
+        """
+        return_errors = kwargs.get("return_errors", False)
+
+        if received.shape[-1] % self.code_length != 0:
+            raise ValueError(f"Last dimension ({received.shape[-1]}) must be divisible by code length ({self.code_length})")
+
+        def decode_block(r_block):
+            block_shape = r_block.shape
+            flat = r_block.reshape(-1, self.code_length)
+            results = [self._decode_batch(flat[start : start + self.batch_chunk_size]) for start in range(0, flat.shape[0], self.batch_chunk_size)]
+            decoded = torch.cat([result[0] for result in results]).view(*block_shape[:-1], self.code_dimension)
+            if return_errors:
+                return decoded, torch.cat([result[1] for result in results]).view(block_shape)
+            return decoded
+
+        return apply_blockwise(received, self.code_length, decode_block)
+
+    def _decode_batch(self, received_batch: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Decode a batch of received words.
+
+        Args:
+            received_batch: Tensor with shape (batch_size, code_length)
+
+        Returns:
+            Tuple of the decoded messages of shape (batch_size, code_dimension) and the estimated
+            error patterns of shape (batch_size, code_length), both with the dtype of the input
+        """
+        batch_size, n = received_batch.shape
+        k = self.code_dimension
+        device = received_batch.device
+        if self.input_type == "hard":
+            values = 1 - 2 * received_batch.to(torch.float)
+        else:
+            values = received_batch.to(torch.float)
+        received_hard = values < 0
+
+        # Remove the codeword of the zero message, so that the remaining code is linear
+        offset = self.offset.to(device)
+        values = torch.where(offset.bool(), -values, values)
+
+        # Sort the positions by decreasing reliability and find the most reliable basis of every received word
+        order = torch.argsort(values.abs(), dim=1, descending=True, stable=True)
+        reliability = values.abs().gather(1, order)
+        hard = (values < 0).gather(1, order).to(torch.uint8)
+        generator_matrix = self.generator_matrix.to(device).unsqueeze(0).expand(batch_size, k, n)
+        augmented = torch.cat([generator_matrix.gather(2, order.unsqueeze(1).expand(batch_size, k, n)), torch.eye(k, dtype=torch.uint8, device=device).expand(batch_size, k, k)], dim=2)
+        reduced, pivots = batched_packed_row_reduction(augmented, num_cols=n)
+        systematic, transform = reduced[:, :, :n], reduced[:, :, n:]
+
+        # Order-0 codeword from the hard decisions on the MRB
+        mrb_bits = hard.gather(1, pivots)
+        base_codeword = (torch.bmm(mrb_bits.unsqueeze(1).float(), systematic.float()).squeeze(1) % 2).to(torch.uint8)
+
+        # Codewords of the test patterns differ from the order-0 codeword in the rows of the flipped MRB bits
+        best_metric = torch.full((batch_size,), float("inf"), device=device)
+        best_codeword = base_codeword.clone()
+        best_flips = torch.zeros(batch_size, k, dtype=torch.uint8, device=device)
+        active = torch.arange(batch_size, device=device)
+        for weight in range(self.order + 1):
+            if self.early_stop_threshold is not None and weight > 0:
+                active = active[best_metric[active] > self.early_stop_threshold]
+            if active.numel() == 0:
+                break
+            patterns = self._error_patterns(weight, device)
+            rows, base, target, weights = systematic[active], base_codeword[active], hard[active], reliability[active]
+            for start in range(0, patterns.shape[0], self.pattern_chunk_size):
+                chunk = patterns[start : start + self.pattern_chunk_size]
+                candidates = base.unsqueeze(1).expand(-1, chunk.shape[0], -1)
+                for t in range(weight):
+                    candidates = candidates ^ rows[:, chunk[:, t]]
+
+                # Discrepancy: total reliability of the positions that disagree with the hard decisions
+                metric = torch.bmm((candidates ^ target.unsqueeze(1)).float(), weights.unsqueeze(-1)).squeeze(-1)
+                chunk_metric, chunk_index = metric.min(dim=1)
+                improved = chunk_metric < best_metric[active]
+                improved_words = active[improved]
+                best_metric[improved_words] = chunk_metric[improved]
+                best_codeword[improved_words] = candidates[improved, chunk_index[improved]]
+                flips = torch.zeros(improved_words.numel(), k, dtype=torch.uint8, device=device)
+                best_flips[improved_words] = flips.scatter_(1, chunk[chunk_index[improved]], 1)
+
+        # Messages and codewords in the original order
+        messages = torch.bmm((mrb_bits ^ best_flips).unsqueeze(1).float(), transform.float()).squeeze(1) % 2
+        codewords = torch.zeros_like(best_codeword).scatter_(1, order, best_codeword) ^ offset
+        errors = received_hard.to(torch.uint8) ^ codewords
+        return messages.to(received_batch.dtype), errors.to(received_batch.dtype)
+
+    def extra_repr(self) -> str:
+        """Return a summary of the decoder configuration."""
+        return f"order={self.order}, input_type={self.input_type!r}, num_patterns={self.num_patterns}"
@@ -46,9 +46,9 @@ class ReedMullerDecoder(BaseBlockDecoder[ReedMullerCodeEncoder]):
         input_type (str): The type of input the decoder accepts:
                          'hard' for binary inputs (0s and 1s)
                          'soft' for real-valued inputs with reliability information
-        _reed_partitions (List[List[int]]): Precomputed Reed partitions for efficient decoding,
-                                           where each partition corresponds to a specific
-                                           information bit
+        _reed_partitions (List[torch.Tensor]): Precomputed Reed partitions for efficient decoding,
+                                              where each partition corresponds to a specific
+                                              information bit
 
     Args:
         encoder (ReedMullerCodeEncoder): The encoder for the Reed-Muller code being decoded
@@ -63,7 +63,7 @@ class ReedMullerDecoder(BaseBlockDecoder[ReedMullerCodeEncoder]):
         >>> import torch
         >>>
         >>> # Create a RM(1,3) code encoder and decoder
-        >>> encoder = ReedMullerCodeEncoder(r=1, m=3)
+        >>> encoder = ReedMullerCodeEncoder(order=1, length_param=3)
         >>> decoder = ReedMullerDecoder(encoder)
         >>>
         >>> # Encode a message
@@ -105,7 +105,22 @@ class ReedMullerDecoder(BaseBlockDecoder[ReedMullerCodeEncoder]):
         # Compute Reed partitions
         self._reed_partitions = self._generate_reed_partitions()
 
-    def _generate_reed_partitions(self) -> List[List[torch.Tensor]]:
+        # Padded check-sum index tensor of shape (k, max groups, max group size) and the layers of
+        # information bits of equal degree, given as (start, end, number of groups, group size)
+        self._degree_layers: List[Tuple[int, int, int, int]] = []
+        max_groups = max(partition.shape[0] for partition in self._reed_partitions)
+        max_size = max(partition.shape[1] for partition in self._reed_partitions)
+        indices = torch.zeros(len(self._reed_partitions), max_groups, max_size, dtype=torch.long)
+        for i, partition in enumerate(self._reed_partitions):
+            groups, size = partition.shape
+            indices[i, :groups, :size] = partition
+            if self._degree_layers and self._degree_layers[-1][2:] == (groups, size):
+                self._degree_layers[-1] = (self._degree_layers[-1][0], i + 1, groups, size)
+            else:
+                self._degree_layers.append((i, i + 1, groups, size))
+        self.register_buffer("_partition_indices", indices, persistent=False)
+
+    def _generate_reed_partitions(self) -> List[torch.Tensor]:
         """Generate Reed partitions for efficient majority-logic decoding.
 
         Reed partitions are special subsets of positions in the codeword that form
@@ -113,86 +128,18 @@ class ReedMullerDecoder(BaseBlockDecoder[ReedMullerCodeEncoder]):
         code. These partitions correspond to geometrical subspaces in the finite
         geometry interpretation of Reed-Muller codes.
 
-        In the context of an RM(r,m) code:
-        - For r=0 (repetition code), there is a single partition with all positions
-        - For r=1 (first-order RM code), partitions correspond to hyperplanes
-        - For higher-order RM codes, partitions are constructed recursively
+        In the context of an RM(r,m) code, the information bit of the row for the
+        monomial over the evaluation vectors in I (|I| = l) has one check sum per coset
+        of the subspace spanned by I, so 2^(m-l) check sums over 2^l positions each:
+        - For r=0 (repetition code), there is a single check sum per position
+        - For r=1 (first-order RM code), the check sums are pairs of positions
+        - For higher-order RM codes, information bits of higher degree have fewer, larger check sums
 
         Returns:
-            List of Reed partitions, where each partition is a list of position groups
-            that form check sums for a specific information bit
-
-        Note:
-            This implementation is simplified and would need to be expanded for a full
-            production implementation to handle all possible Reed-Muller parameters
-            correctly. The actual construction of these partitions is based on the
-            recursive structure of Reed-Muller codes and their relation to finite geometries.
+            List of Reed partitions in the order of the information bits, where each partition
+            is a tensor of shape (number of check sums, check sum size) of codeword positions
         """
-        # This is a simplified implementation of Reed partitions generation
-        # In a full implementation, this would depend on the specific parameters
-        # of the Reed-Muller code (r, m)
-
-        # For demonstration purposes, we'll create a basic structure
-        # A real implementation would compute these based on the code properties
-        partitions = []
-
-        # Example partitioning logic - would need to be replaced with actual Reed-Muller partitioning
-        m = 0
-        r = 0
-
-        # Try to infer Reed-Muller parameters from code length and dimension
-        # For an (r,m) Reed-Muller code:
-        # - Length n = 2^m
-        # - Dimension k = sum(i=0 to r) of binomial(m,i)
-
-        # Infer m from code length
-        n = self.code_length
-        temp_m = 0
-        while 2**temp_m < n:
-            temp_m += 1
-        if 2**temp_m == n:
-            m = temp_m
-
-        # Given m, try to infer r from dimension
-        if m > 0:
-            k = self.code_dimension
-            temp_r = 0
-            temp_k = 0
-            while temp_k < k and temp_r <= m:
-                # Add binomial coefficient (m choose temp_r)
-                from math import comb
-
-                temp_k += comb(m, temp_r)
-                if temp_k == k:
-                    r = temp_r
-                    break
-                temp_r += 1
-
-        # Generate partitions based on Reed-Muller structure
-        if m > 0 and 0 <= r <= m:
-            # Generate partitions based on the cosets of the Reed-Muller code
-            # This is a simplified approach - actual implementation would be more involved
-
-            # For each information bit
-            for i in range(self.code_dimension):
-                # Create a partition for this bit
-                partition = []
-
-                # In a real implementation, these would be carefully constructed
-                # based on the algebraic structure of Reed-Muller codes
-                for j in range(2 ** (m - 1)):
-                    # Create groups of positions that form checks for this bit
-                    positions = []
-                    for offset in range(2**r):
-                        pos = (j * 2**r + offset) % self.code_length
-                        positions.append(pos)
-
-                    # Convert to tensor
-                    partition.append(torch.tensor(positions, dtype=torch.long))
-
-                partitions.append(partition)
-
-        return partitions
+        return self.encoder.get_reed_partitions()
 
     def forward(self, received: torch.Tensor, *args: Any, **kwargs: Any) -> Union[torch.Tensor, Tuple[torch.Tensor, torch.Tensor]]:
         """Decode received values using the Reed majority-logic algorithm.
@@ -200,10 +147,15 @@ class ReedMullerDecoder(BaseBlockDecoder[ReedMullerCodeEncoder]):
         This method implements the majority-logic decoding process for Reed-Muller codes.
         For each information bit, it computes a set of check sums based on the Reed
         partitions and then makes a decision based on the majority value of these sums.
+        Information bits are decoded one degree at a time, from the highest degree down,
+        and the contribution of each decoded degree is removed from the received word
+        before decoding the next one.
 
         For soft-decision decoding, it also takes into account the reliability information
         of each received bit, which can significantly improve performance in AWGN channels.
 
+        All check sums of a degree are computed for the whole batch at once.
+
         Args:
             received: Received tensor with shape (..., n) or (..., m*n) where n is the code length.
                      For hard inputs, values should be 0 or 1.
@@ -222,10 +174,8 @@ class ReedMullerDecoder(BaseBlockDecoder[ReedMullerCodeEncoder]):
             ValueError: If the last dimension of received is not a multiple of the code length
 
         Note:
-            For first-order Reed-Muller codes (r=1), this decoder can correct up to
-            2^(m-2) errors, which matches the code's error-correcting capability.
-            For higher-order RM codes, the performance may not be optimal but the
-            algorithm provides an efficient decoding approach.
+            For RM(r,m) codes, this decoder can correct up to 2^(m-r-1) - 1 errors,
+            which matches half the minimum distance of the code.
         """
         return_errors = kwargs.get("return_errors", False)
 
@@ -234,109 +184,50 @@ class ReedMullerDecoder(BaseBlockDecoder[ReedMullerCodeEncoder]):
         if L % self.code_length != 0:
             raise ValueError(f"Last dimension ({L}) must be divisible by code length ({self.code_length})")
 
+        generator_matrix = self.encoder.generator_matrix.to(device=received.device, dtype=torch.float)
+        partition_indices = self._partition_indices.to(received.device)
+
         # Process blockwise
         def decode_block(r_block):
-            batch_size = r_block.shape[0]
-            decoded = torch.zeros(batch_size, self.code_dimension, dtype=torch.int, device=received.device)
-            errors = torch.zeros_like(r_block) if return_errors else None
-
-            for i in range(batch_size):
-                # Get the current received word - ensure it's a 1D tensor
-                if r_block.dim() == 3:  # Handle the case when r_block has shape [batch, 1, code_length]
-                    r = r_block[i, 0, :]
-                else:  # Handle the case when r_block has shape [batch, code_length]
-                    r = r_block[i, :]
-
-                """
-                # Convert to binary for hard decoding or compute hard decisions for soft decoding
+            block_shape = r_block.shape
+            r = r_block.reshape(-1, self.code_length)
+
+            # Hard decisions, from which the decoded contributions are removed degree by degree
+            if self.input_type == "hard":
+                bx = r.to(torch.float)
+            else:  # self.input_type == "soft"
+                bx = (r < 0).to(torch.float)
+                reliabilities = torch.abs(r).to(torch.float)
+
+            decoded = torch.zeros(r.shape[0], self.code_dimension, device=received.device)
+            for start, end, groups, size in self._degree_layers:
+                indices = partition_indices[start:end, :groups, :size]
+
+                # Check sums of shape (batch_size, bits, groups)
+                checksums = bx[:, indices].sum(dim=-1) % 2
+
                 if self.input_type == "hard":
-                    bx = r.clone()
-                else:  # self.input_type == "soft"
-                    bx = (r < 0).to(torch.int)
-                """
-
-                # Decode using Reed algorithm
-                u_hat = torch.zeros(self.code_dimension, dtype=torch.int, device=received.device)
-
-                # Process each bit position using its corresponding partition
-                for j, partition in enumerate(self._reed_partitions):
-                    if j >= self.code_dimension:
-                        break
-
-                    # For hard decision decoding
-                    if self.input_type == "hard":
-                        # Calculate checksums for each group in the partition
-                        checksums = []
-                        for group in partition:
-                            # Ensure the group indices are valid
-                            valid_indices = group[group < r.shape[0]]
-                            if len(valid_indices) == 0:
-                                continue
-
-                            # Take relevant positions and compute parity
-                            # Use indexing to select elements from the 1D tensor
-                            group_bits = r[valid_indices].to(torch.int)
-                            checksum = torch.sum(group_bits) % 2
-                            checksums.append(checksum.item())  # Use .item() to convert tensor to scalar
-
-                        # Skip if no valid checksums
-                        if not checksums:
-                            continue
-
-                        # Convert to tensor
-                        checksums = torch.tensor(checksums, device=received.device)
-
-                        # Make majority decision
-                        u_hat[j] = (torch.sum(checksums) > len(checksums) // 2).to(torch.int)
-
-                    # For soft decision decoding
-                    else:  # self.input_type == "soft"
-                        # Calculate checksums and minimum reliabilities for each group
-                        checksums = []
-                        min_reliabilities = []
-
-                        for group in partition:
-                            # Ensure the group indices are valid
-                            valid_indices = group[group < r.shape[0]]
-                            if len(valid_indices) == 0:
-                                continue
-
-                            # Take relevant positions
-                            group_bits = (r[valid_indices] < 0).to(torch.int)
-                            group_reliabilities = torch.abs(r[valid_indices])
-
-                            # Compute parity of hard decisions
-                            checksum = torch.sum(group_bits) % 2
-                            checksums.append(checksum.item())  # Use .item() to convert tensor to scalar
-
-                            # Find minimum reliability in this group
-                            min_reliability = torch.min(group_reliabilities)
-                            min_reliabilities.append(min_reliability.item())  # Use .item() to convert tensor to scalar
-
-                        # Skip if no valid checksums
-                        if not checksums:
-                            continue
-
-                        # Convert to tensors
-                        checksums = torch.tensor(checksums, device=received.device)
-                        min_reliabilities = torch.tensor(min_reliabilities, device=received.device)
-
-                        # Calculate decision variable
-                        decision_var = torch.sum((1 - 2 * checksums) * min_reliabilities)
-
-                        # Make decision
-                        u_hat[j] = (decision_var < 0).to(torch.int)
-
-                # Store the decoded message
-                decoded[i] = u_hat
-
-                # Compute error pattern if needed
-                if return_errors:
-                    # Re-encode the message to get the correct codeword
-                    correct_codeword = self.encoder(u_hat.float().unsqueeze(0)).squeeze(0)
-                    errors[i] = (r.to(torch.int) != correct_codeword.to(torch.int)).to(torch.int)
-
-            return (decoded, errors) if return_errors else decoded
+                    # Make majority decision
+                    u_hat = checksums.sum(dim=-1) > groups // 2
+                else:
+                    # Weigh each check sum by the minimum reliability of its positions
+                    min_reliabilities = reliabilities[:, indices].amin(dim=-1)
+                    u_hat = torch.sum((1 - 2 * checksums) * min_reliabilities, dim=-1) < 0
+
+                decoded[:, start:end] = u_hat.to(torch.float)
+
+                # Remove the contribution of the decoded degree
+                bx = (bx + decoded[:, start:end] @ generator_matrix[start:end]) % 2
+
+            decoded_bits = decoded.to(torch.int).view(*block_shape[:-1], self.code_dimension)
+            if not return_errors:
+                return decoded_bits
+
+            # Re-encode the messages to get the error patterns
+            codewords = (decoded @ generator_matrix) % 2
+            hard = r.to(torch.int) if self.input_type == "hard" else (r < 0).to(torch.int)
+            errors = (hard != codewords.to(torch.int)).to(r_block.dtype)
+            return decoded_bits, errors.view(block_shape)
 
         # Apply decoding blockwise
         return apply_blockwise(received, self.code_length, decode_block)
@@ -5,6 +5,10 @@ This class implements the Successive Cancellation algorithm for decoding Polar c
 and estimates the transmitted message bits. The SC method is a recursive decoding algorithm that leverages the structure
 of Polar codes for efficient decoding.
 
+Decoding runs without recursion: the traversal of the decoding tree is precomputed once as a schedule of node
+operations, and LLRs and partial sums are kept in preallocated [batch, log2(N) + 1, N] buffers. Subtrees that
+contain only frozen bits (rate-0) or only information bits (rate-1) are decoded in one step, as in fast-SSC.
+
 Attributes:
     encoder (PolarCodeEncoder): The Polar code encoder used for encoding messages.
     info_indices (torch.Tensor): Indices of information bits in the Polar code.
@@ -20,7 +24,7 @@ References:
     :cite:`arikan2009channel`
 """
 
-from typing import Any, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 import torch
 
@@ -47,6 +51,9 @@ class SuccessiveCancellationDecoder(BaseBlockDecoder[PolarCodeEncoder]):
         m (int): Number of stages in the Polar code.
         regime (str): Decoding regime ('sum_product' or 'min_sum').
         clip (float): Clipping value for numerical stability.
+        fast_ssc (bool): Whether rate-0 and rate-1 subtrees are decoded in one step.
+        schedule (List[Tuple[str, int, int, int]]): Precomputed node operations (operation, depth, offset, size)
+            of the decoding tree traversal.
     """
 
     def __init__(self, encoder: PolarCodeEncoder, *args: Any, **kwargs: Any):
@@ -62,6 +69,12 @@ class SuccessiveCancellationDecoder(BaseBlockDecoder[PolarCodeEncoder]):
             raise ValueError("Invalid regime. Choose either 'sum_product' or 'min_sum'.")
 
         self.clip = kwargs.get("clip", 1000.0)  # Default clip value for numerical stability
+        self.fast_ssc = kwargs.get("fast_ssc", True)  # Decode rate-0 and rate-1 subtrees in one step
+
+        self.schedule: List[Tuple[str, int, int, int]] = []
+        self.frozen_patterns: Dict[Tuple[int, int], torch.Tensor] = {}
+        self._schedule_info_indices: Optional[torch.Tensor] = None
+        self.build_schedule()
 
     def f2(self, x: Tuple[torch.Tensor, torch.Tensor]) -> torch.Tensor:
         """Combine two binary vectors using XOR operation.
@@ -158,6 +171,150 @@ class SuccessiveCancellationDecoder(BaseBlockDecoder[PolarCodeEncoder]):
             x = x[:, perm]
         return u, x, y_final
 
+    def split(self, v: torch.Tensor, half: int) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Split a node vector into the two halves combined by the polar transform.
+
+        Args:
+            v (torch.Tensor): Tensor of shape (..., size).
+            half (int): Half of the node size.
+
+        Returns:
+            Tuple[torch.Tensor, torch.Tensor]: Views of the first and second half (or of the even and
+            odd positions if polar_i is enabled).
+        """
+        if self.polar_i:
+            return v[..., 0::2], v[..., 1::2]
+        return v[..., :half], v[..., half:]
+
+    def node_transform(self, v: torch.Tensor) -> torch.Tensor:
+        """Apply the polar transform of a decoding tree node to a block of bits.
+
+        This is the same transform that combines the partial sums of the children of a node, applied
+        stage by stage over the whole node. Since it is an involution, it also maps the codeword of a
+        node back to the bits of its leaves.
+
+        Args:
+            v (torch.Tensor): Tensor of shape (batch_size, size) with size a power of 2.
+
+        Returns:
+            torch.Tensor: Transformed tensor of shape (batch_size, size).
+        """
+        batch_size, size = v.shape
+        block = 2
+        while block <= size:
+            blocks = v.reshape(batch_size, size // block, block)
+            first, second = blocks[..., : block // 2], blocks[..., block // 2 :]
+            combined = torch.remainder(first + second, 2)
+            if self.polar_i:
+                v = torch.stack([combined, second], dim=-1).reshape(batch_size, size)
+            else:
+                v = torch.cat([combined, second], dim=-1).reshape(batch_size, size)
+            block *= 2
+        return v
+
+    def build_schedule(self) -> None:
+        """Precompute the decoding tree traversal for the current information set.
+
+        The schedule is a list of node operations ``(operation, depth, offset, size)`` where the node at
+        ``depth`` covers the leaves ``offset`` to ``offset + size - 1``:
+
+        - ``"f"``: check node update computing the LLRs of the left child
+        - ``"g"``: bit node update computing the LLRs of the right child from the left partial sums
+        - ``"combine"``: partial sums of the node from the partial sums of its children
+        - ``"rate0"``: node with only frozen bits, whose partial sums are known in advance
+        - ``"rate1"``: node with only information bits, decided by hard decision on its LLRs
+
+        Leaves are always rate-0 or rate-1 nodes. With fast_ssc enabled, every rate-0 or rate-1 subtree below
+        the root is handled as a single node. The partial sums of the rate-0 nodes are stored in
+        ``frozen_patterns``.
+        """
+        info = self.info_indices.tolist()
+        frozen_value = 0.0 if self.frozen_zeros else 1.0
+        schedule: List[Tuple[str, int, int, int]] = []
+        frozen_patterns: Dict[Tuple[int, int], torch.Tensor] = {}
+
+        def visit(depth: int, offset: int, size: int) -> None:
+            node_info = info[offset : offset + size]
+            if size == 1 or (self.fast_ssc and depth > 0 and len(set(node_info)) == 1):
+                if node_info[0]:
+                    schedule.append(("rate1", depth, offset, size))
+                else:
+                    schedule.append(("rate0", depth, offset, size))
+                    frozen = torch.full((1, size), frozen_value, dtype=self.dtype)
+                    frozen_patterns[(depth, offset)] = self.node_transform(frozen).view(-1)
+                return
+
+            half = size // 2
+            schedule.append(("f", depth, offset, size))
+            visit(depth + 1, offset, half)
+            schedule.append(("g", depth, offset, size))
+            visit(depth + 1, offset + half, half)
+            schedule.append(("combine", depth, offset, size))
+
+        visit(0, 0, self.code_length)
+
+        self.schedule = schedule
+        self.frozen_patterns = frozen_patterns
+        self._schedule_info_indices = self.info_indices.clone()
+
+    def decode_iterative(self, y: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """Decodes the received codeword by running the precomputed decoding schedule.
+
+        This gives the same result as :meth:`decode_recursive` applied to the full information set (up to
+        ties in the hard decisions of rate-1 nodes when fast_ssc is enabled), without the Python recursion
+        and the index tensors allocated at every node.
+
+        Args:
+            y (torch.Tensor): Received LLR tensor of shape (batch_size, code_length).
+
+        Returns:
+            Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+                - Estimated bits of all leaves of shape (batch_size, code_length).
+                - Estimated codeword bits tensor of shape (batch_size, code_length).
+                - Log-likelihood ratio (LLR) tensor of the children of the root of shape (batch_size, code_length).
+        """
+        if self._schedule_info_indices is None or not torch.equal(self._schedule_info_indices, self.info_indices):
+            self.build_schedule()
+
+        batch_size, N = y.shape
+        frozen_value = 0.0 if self.frozen_zeros else 1.0
+        # Reading views of the LLR buffer that is written afterwards would break autograd
+        copy_nodes = y.requires_grad and torch.is_grad_enabled()
+
+        llrs = y.new_zeros(batch_size, self.m + 1, N)
+        bits = y.new_zeros(batch_size, self.m + 1, N)
+        u = y.new_zeros(batch_size, N)
+        llrs[:, 0] = y
+
+        for operation, depth, offset, size in self.schedule:
+            end = offset + size
+            node = llrs[:, depth, offset:end]
+            if copy_nodes:
+                node = node.clone()
+
+            if operation == "f":
+                half = size // 2
+                llrs[:, depth + 1, offset : offset + half] = self.checknode(self.split(node, half))
+            elif operation == "g":
+                half = size // 2
+                y_even, y_odd = self.split(node, half)
+                llrs[:, depth + 1, offset + half : end] = self.bitnode((y_even, y_odd, bits[:, depth + 1, offset : offset + half]))
+            elif operation == "combine":
+                half = size // 2
+                x1, x2 = bits[:, depth + 1, offset : offset + half], bits[:, depth + 1, offset + half : end]
+                first, second = self.split(bits[:, depth, offset:end], half)
+                first.copy_(torch.remainder(x1 + x2, 2))
+                second.copy_(x2)
+            elif operation == "rate0":
+                bits[:, depth, offset:end] = self.frozen_patterns[(depth, offset)].to(device=y.device, dtype=y.dtype)
+                u[:, offset:end] = frozen_value
+            else:
+                x = sign_to_bin(torch.sign(node))
+                bits[:, depth, offset:end] = x
+                u[:, offset:end] = self.node_transform(x)
+
+        return u, bits[:, 0], llrs[:, min(1, self.m)]
+
     def forward(self, received: torch.Tensor, return_for_loss=False, *args: Any, **kwargs: Any) -> torch.Tensor:
         """Decode the received codeword using Successive Cancellation algorithm.
 
@@ -187,8 +344,8 @@ class SuccessiveCancellationDecoder(BaseBlockDecoder[PolarCodeEncoder]):
             assert N == self.code_length, f"Received block size {N} does not match codeword size {self.code_length}"
             # Reshape the received block to match the expected input shape
             received_block = received_block.view(-1, N)
-            # Decode the block using the recursive decoding method
-            u, _, y = self.decode_recursive(received_block, self.info_indices)
+            # Decode the block by running the precomputed schedule
+            u, _, y = self.decode_iterative(received_block)
             if return_for_loss:
                 # Return the LLR values for loss calculation
                 llr = y
@@ -0,0 +1,229 @@
+"""
+SuccessiveCancellationListDecoder: Decoder for Polar codes using the Successive Cancellation List (SCL) method.
+
+This class implements the Successive Cancellation List algorithm for decoding Polar codes. Instead of a single hard
+decision at every information bit, the decoder keeps the L most likely decoding paths, ranked by their path metrics,
+and selects the best one at the end. With a CRC, the final path is the most likely path whose information bits pass
+the CRC check (CRC-aided SCL), which is the decoder used for 5G NR polar codes.
+
+All paths of all codewords are processed together: path metrics and path pruning are tensors over [batch, L], and
+the LLRs and partial sums of every stage of the decoding tree are shared between paths until a path writes to them
+(lazy copy).
+
+References:
+    :cite:`arikan2009channel`
+"""
+
+from typing import Any, Optional
+
+import torch
+
+from kaira.models.fec.encoders.polar_code import PolarCodeEncoder
+
+from ..utils import apply_blockwise, crc_matrix
+from .successive_cancellation import SuccessiveCancellationDecoder
+
+
+class SuccessiveCancellationListDecoder(SuccessiveCancellationDecoder):
+    """Decoder for Polar code using Successive Cancellation List (SCL) method :cite:`arikan2009channel`.
+
+    The decoder follows the same decoding tree schedule as :class:`SuccessiveCancellationDecoder`. At every
+    information bit each path is extended with both bit values, and only the L extensions with the smallest
+    LLR-based path metric are kept. Frozen bits only update the path metrics.
+
+    The LLRs and partial sums are stored per stage of the decoding tree, as in the list decoder of Tal and Vardy.
+    When paths are pruned and duplicated, only a pointer from each path to the stored stage data is updated; the
+    data of a stage is copied to the surviving paths the next time that stage is accessed. The channel LLRs are
+    shared by all paths and never copied.
+
+    Attributes:
+        list_size (int): Number of decoding paths L kept during decoding.
+        crc_polynomial (Optional[int]): CRC polynomial used to select the final path, or None to select the path
+            with the smallest path metric.
+        crc_length (int): Number of CRC bits at the end of the information bits (0 without CRC).
+        path_metrics (Optional[torch.Tensor]): Path metrics of shape (batch_size, list_size) of the last decoded block.
+
+    Examples:
+        >>> from kaira.models.fec.encoders import PolarCodeEncoder
+        >>> from kaira.models.fec.decoders import SuccessiveCancellationListDecoder
+        >>> from kaira.models.fec.utils import append_crc
+        >>> encoder = PolarCodeEncoder(32, 64)
+        >>> decoder = SuccessiveCancellationListDecoder(encoder, list_size=8, crc_polynomial=0b110011)
+        >>> # The last 5 information bits carry the CRC of the first 27
+        >>> messages = append_crc(torch.randint(0, 2, (4, 27)).float(), 0b110011)
+        >>> llr = 2.0 * (1 - 2 * encoder(messages))
+        >>> decoded = decoder(llr)
+    """
+
+    def __init__(self, encoder: PolarCodeEncoder, *args: Any, **kwargs: Any):
+        """Initializes the SuccessiveCancellationListDecoder.
+
+        Args:
+            encoder (PolarCodeEncoder): The Polar code encoder used for encoding messages.
+            *args (Any): Variable positional arguments passed to the base class.
+            **kwargs (Any): Variable keyword arguments for additional configuration, including:
+
+                - list_size (int): Number of decoding paths L (default: 8).
+                - crc_polynomial (int): CRC polynomial (as an integer including its leading term) whose CRC
+                  bits are the last information bits. Enables CRC-aided path selection (default: None).
+                - regime (str): Decoding regime ('sum_product' or 'min_sum').
+                - clip (float): Clipping value for numerical stability.
+
+        Raises:
+            ValueError: If list_size is not positive or the CRC is longer than the code dimension.
+        """
+        # Path metrics are updated at every leaf, so no subtree of the decoding tree is skipped
+        kwargs["fast_ssc"] = False
+        super().__init__(encoder, *args, **kwargs)
+
+        self.list_size = kwargs.get("list_size", 8)
+        if self.list_size < 1:
+            raise ValueError(f"list_size must be a positive integer, got {self.list_size}")
+
+        self.crc_polynomial: Optional[int] = kwargs.get("crc_polynomial", None)
+        self.crc_length = 0
+        if self.crc_polynomial is not None:
+            self.crc_length = self.crc_polynomial.bit_length() - 1
+            if not 0 < self.crc_length < self.code_dimension:
+                raise ValueError(f"CRC length ({self.crc_length}) must be between 1 and the code dimension ({self.code_dimension}) minus one")
+            self.crc_parity = crc_matrix(self.crc_polynomial, self.code_dimension - self.crc_length, device=self.device, dtype=self.dtype)
+
+        self.path_metrics: Optional[torch.Tensor] = None
+
+    def decode_list(self, y: torch.Tensor) -> torch.Tensor:
+        """Decodes the received LLRs with the Successive Cancellation List algorithm.
+
+        Args:
+            y (torch.Tensor): Received LLR tensor of shape (batch_size, code_length).
+
+        Returns:
+            torch.Tensor: Estimated bits of all leaves of every path, of shape (batch_size, list_size, code_length).
+            The path metrics are stored in ``path_metrics``.
+        """
+        if self._schedule_info_indices is None or not torch.equal(self._schedule_info_indices, self.info_indices):
+            self.build_schedule()
+
+        batch_size, N = y.shape
+        L, m = self.list_size, self.m
+        frozen_value = 0.0 if self.frozen_zeros else 1.0
+        paths = torch.arange(L, device=y.device)
+
+        # Per-stage storage: LLRs of the current node and partial sums of the node and its sibling. The
+        # channel LLRs, and the LLRs computed from them before the first information bit, are shared by all paths.
+        llrs = [y.unsqueeze(1)] + [y.new_zeros(batch_size, L, N >> d) for d in range(1, m + 1)]
+        bits = [y.new_zeros(batch_size, L, 2, N >> d) for d in range(m + 1)]
+
+        # pointers[b, l, s] is the slot holding the data of path l for storage s (LLRs of stage d at s = d,
+        # partial sums of stage d at s = m + 1 + d); stale[s] marks storages whose pointers are not the identity
+        pointers = paths.view(1, L, 1).repeat(batch_size, 1, 2 * (m + 1))
+        stale = [False] * (2 * (m + 1))
+
+        def resolve(storage: list, depth: int, index: int) -> torch.Tensor:
+            # Copy the stage data to the paths pointing at it (lazy copy)
+            if stale[index]:
+                data = storage[depth]
+                # Data computed before the first split of the paths is shared by all of them
+                if data.shape[1] > 1:
+                    slots = pointers[:, :, index].view(batch_size, L, *([1] * (data.dim() - 2)))
+                    storage[depth] = data.gather(1, slots.expand_as(data))
+                pointers[:, :, index] = paths
+                stale[index] = False
+            return storage[depth]
+
+        def write_llrs(depth: int, value: torch.Tensor) -> None:
+            # The whole stage is overwritten, so the pending copy can be dropped
+            llrs[depth] = value
+            pointers[:, :, depth] = paths
+            stale[depth] = False
+
+        # Only the first path is alive at the start
+        path_metrics = torch.full((batch_size, L), float("inf"), dtype=y.dtype, device=y.device)
+        path_metrics[:, 0] = 0.0
+
+        for operation, depth, offset, size in self.schedule:
+            if operation == "f":
+                node = llrs[0] if depth == 0 else resolve(llrs, depth, depth)
+                write_llrs(depth + 1, self.checknode(self.split(node, size // 2)))
+            elif operation == "g":
+                node = llrs[0] if depth == 0 else resolve(llrs, depth, depth)
+                y_even, y_odd = self.split(node, size // 2)
+                left_bits = resolve(bits, depth + 1, m + 2 + depth)[:, :, 0]
+                write_llrs(depth + 1, self.bitnode((y_even, y_odd, left_bits)))
+            elif operation == "combine":
+                children = resolve(bits, depth + 1, m + 2 + depth)
+                x1, x2 = children[:, :, 0], children[:, :, 1]
+                target = resolve(bits, depth, m + 1 + depth)[:, :, (offset // size) % 2]
+                first, second = self.split(target, size // 2)
+                first.copy_(torch.remainder(x1 + x2, 2))
+                second.copy_(x2)
+            else:
+                llr = (llrs[0] if depth == 0 else resolve(llrs, depth, depth)).reshape(batch_size, -1, 1)
+                llr = llr.expand(batch_size, L, 1)[..., 0]
+                if operation == "rate0":
+                    decision = torch.full_like(path_metrics, frozen_value)
+                    path_metrics = path_metrics + torch.nn.functional.softplus(-(1 - 2 * frozen_value) * llr)
+                else:
+                    # Extend every path with both bit values and keep the L most likely extensions
+                    candidates = torch.stack([path_metrics + torch.nn.functional.softplus(-llr), path_metrics + torch.nn.functional.softplus(llr)], dim=-1)
+                    path_metrics, best = torch.topk(candidates.view(batch_size, 2 * L), L, dim=-1, largest=False, sorted=True)
+                    parents = torch.div(best, 2, rounding_mode="floor")
+                    decision = (best % 2).to(y.dtype)
+
+                    pointers = pointers.gather(1, parents.unsqueeze(-1).expand_as(pointers))
+                    stale = [True] * (2 * (m + 1))
+
+                leaf_bits = resolve(bits, depth, m + 1 + depth)
+                leaf_bits[:, :, (offset // size) % 2] = decision.view(batch_size, L, 1)
+
+        self.path_metrics = path_metrics
+
+        # The leaf bits are recovered from the codeword estimate of every path
+        codewords = resolve(bits, 0, m + 1)[:, :, 0]
+        return self.node_transform(codewords.reshape(batch_size * L, N)).view(batch_size, L, N)
+
+    def select_path(self, u: torch.Tensor, path_metrics: torch.Tensor) -> torch.Tensor:
+        """Select the decoded information bits among the list of paths.
+
+        Args:
+            u (torch.Tensor): Estimated information bits of every path, of shape (batch_size, list_size, code_dimension).
+            path_metrics (torch.Tensor): Path metrics of shape (batch_size, list_size).
+
+        Returns:
+            torch.Tensor: Information bits of the selected path, of shape (batch_size, code_dimension). Without CRC,
+            this is the path with the smallest metric. With CRC, it is the path with the smallest metric among the
+            paths passing the CRC check, or the path with the smallest metric if none passes.
+        """
+        metrics = path_metrics
+        if self.crc_polynomial is not None:
+            payload, crc = u[..., : -self.crc_length], u[..., -self.crc_length :]
+            expected = torch.matmul(payload, self.crc_parity.to(device=u.device, dtype=u.dtype)) % 2
+            passed = torch.all(expected == crc, dim=-1)
+            metrics = torch.where(passed, path_metrics, path_metrics + float("inf"))
+            metrics = torch.where(passed.any(dim=-1, keepdim=True), metrics, path_metrics)
+
+        best = torch.argmin(metrics, dim=-1)
+        return u[torch.arange(u.shape[0], device=u.device), best]
+
+    def forward(self, received: torch.Tensor, *args: Any, **kwargs: Any) -> torch.Tensor:
+        """Decode the received codeword using the Successive Cancellation List algorithm.
+
+        Args:
+            received (torch.Tensor): Received LLR tensor of shape (batch_size, n) or (batch_size, b*n).
+
+        Returns:
+            torch.Tensor: Estimated message bits of shape (batch_size, k) or (batch_size, b*k). With CRC, the CRC
+            bits are included as the last information bits of each block.
+        """
+        self.info_indices = self.encoder.info_indices
+
+        # Ensure the received tensor is on the correct device
+        received = received.to(self.device)
+
+        def decode_block(received_block: torch.Tensor) -> torch.Tensor:
+            """Decode all blocks of received codewords."""
+            block_shape = received_block.shape
+            u = self.decode_list(received_block.reshape(-1, self.code_length))
+            decoded = self.select_path(u[..., self.info_indices], self.path_metrics)
+            return decoded.view(*block_shape[:-1], self.code_dimension)
+
+        return apply_blockwise(received, self.code_length, decode_block)
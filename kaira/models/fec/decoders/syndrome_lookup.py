@@ -14,12 +14,13 @@ with the code's redundancy.
 :cite:`macwilliams1977theory`
 """
 
-from typing import Any, Dict, Tuple, Union
+from typing import Any, Tuple, Union
 
 import torch
 
 from kaira.models.fec.encoders.linear_block_code import LinearBlockCodeEncoder
 
+from ..cache import artifact_key, cached_artifact
 from ..utils import apply_blockwise
 from .base import BaseBlockDecoder
 
@@ -42,8 +43,8 @@ class SyndromeLookupDecoder(BaseBlockDecoder[LinearBlockCodeEncoder]):
     Attributes:
         encoder (LinearBlockCodeEncoder): The encoder instance providing code parameters
                                          and syndrome calculation functions
-        _syndrome_table (Dict[int, torch.Tensor]): Lookup table mapping syndromes to
-                                                  their corresponding error patterns
+        _syndrome_table (torch.Tensor): Dense (2^r, n) table of coset leaders whose row s
+                                        is the error pattern for the syndrome with integer value s
 
     Args:
         encoder (LinearBlockCodeEncoder): The encoder for the code being decoded
@@ -100,7 +101,8 @@ class SyndromeLookupDecoder(BaseBlockDecoder[LinearBlockCodeEncoder]):
         Note:
             For large codes, building the syndrome table can be computationally expensive,
             as it requires exploring a large space of error patterns. The table size is
-            2^r where r is the code's redundancy.
+            2^r where r is the code's redundancy. If the FEC cache is enabled (see
+            :mod:`kaira.models.fec.cache`), the table is built once per code and reused.
         """
         # Check encoder type before calling super().__init__
         if not isinstance(encoder, LinearBlockCodeEncoder):
@@ -110,8 +112,13 @@ class SyndromeLookupDecoder(BaseBlockDecoder[LinearBlockCodeEncoder]):
 
         super().__init__(encoder, *args, **kwargs)
 
-        # Build syndrome table during initialization
-        self._syndrome_table = self._build_syndrome_table()
+        # Weights used to pack a binary syndrome into its integer table index (bit i -> 2^i)
+        self.register_buffer("_syndrome_weights", 2 ** torch.arange(self.redundancy, dtype=torch.long), persistent=False)
+
+        # Build syndrome table during initialization, or load it from the FEC cache
+        key = artifact_key(type(encoder).__name__, encoder.check_matrix)
+        table = cached_artifact("syndrome_table", key, lambda: {"table": self._build_syndrome_table()})["table"]
+        self.register_buffer("_syndrome_table", table, persistent=False)
 
     def _validate_encoder_type(self, encoder: LinearBlockCodeEncoder) -> None:
         """Validate that the encoder is of the correct type.
@@ -128,51 +135,55 @@ class SyndromeLookupDecoder(BaseBlockDecoder[LinearBlockCodeEncoder]):
         if not issubclass(encoder.__class__, LinearBlockCodeEncoder):
             raise TypeError(f"Encoder must be a LinearBlockCodeEncoder, got {encoder_class_name.__name__}")
 
-    def _build_syndrome_table(self) -> Dict[int, torch.Tensor]:
+    def _build_syndrome_table(self) -> torch.Tensor:
         """Build the syndrome lookup table for maximum likelihood decoding.
 
-        Creates a dictionary mapping each possible syndrome to its corresponding
-        coset leader (the error pattern with the minimum Hamming weight in its coset).
-        This implements the standard array decoding approach from coding theory.
+        Creates a dense table of coset leaders (the error pattern with the minimum Hamming
+        weight in each coset) indexed by the integer value of the syndrome. This implements
+        the standard array decoding approach from coding theory.
 
-        The construction is performed by:
+        The construction is performed incrementally by weight:
         1. Starting with the zero error pattern (corresponding to no errors)
         2. Adding all error patterns of weight 1
         3. Adding all error patterns of weight 2, and so on
 
-        For each error pattern, if its syndrome isn't already in the table, it becomes
-        the coset leader for that syndrome.
+        All patterns of a given weight are generated and their syndromes computed in one
+        batched operation. The first pattern reaching a syndrome that is not yet in the table
+        becomes the coset leader for that syndrome.
 
         Returns:
-            Dictionary mapping syndrome bit patterns (as integers) to error pattern tensors
+            Tensor of shape (2^r, n) whose row s is the coset leader of the syndrome with
+            integer value s
 
         Note:
             For an (n,k) linear code, there are 2^(n-k) possible syndromes, each associated
             with a unique coset of the code. This method finds the minimum weight vector
             in each coset.
         """
-        table: Dict[int, torch.Tensor] = {}
+        num_syndromes = 2**self.redundancy
+        table = torch.zeros((num_syndromes, self.code_length), dtype=torch.int)
+        found = torch.zeros(num_syndromes, dtype=torch.bool)
 
-        # Start with zero-weight error pattern (no errors)
-        zero_error = torch.zeros(self.code_length, dtype=torch.int)
-        zero_syndrome = self.encoder.calculate_syndrome(zero_error)
-        syndrome_int = self._syndrome_to_int(zero_syndrome)
-        table[syndrome_int] = zero_error
+        # The zero error pattern is the coset leader of the zero syndrome
+        found[0] = True
 
         # Continue with weight-1 error patterns, then weight-2, etc., until all syndromes are covered
         for weight in range(1, self.code_length + 1):
             # If we've found all possible syndromes, we can stop
-            if len(table) == 2**self.redundancy:
+            if bool(found.all()):
                 break
 
-            # Generate all error patterns of current weight
-            for error_pattern in self._generate_error_patterns(weight):
-                syndrome = self.encoder.calculate_syndrome(error_pattern)
-                syndrome_int = self._syndrome_to_int(syndrome)
+            patterns = self._generate_error_patterns(weight)
+            syndromes = self._syndromes_to_int(self.encoder.calculate_syndrome(patterns))
+
+            # Keep the first pattern (in generation order) for every syndrome of this weight
+            first = torch.full((num_syndromes,), patterns.shape[0], dtype=torch.long)
+            first.scatter_reduce_(0, syndromes, torch.arange(patterns.shape[0]), reduce="amin")
 
-                # Only add to table if this syndrome hasn't been seen before
-                if syndrome_int not in table:
-                    table[syndrome_int] = error_pattern
+            # Only add to table if this syndrome hasn't been seen before
+            new = (~found) & (first < patterns.shape[0])
+            table[new] = patterns[first[new]]
+            found |= new
 
         return table
 
@@ -180,7 +191,8 @@ class SyndromeLookupDecoder(BaseBlockDecoder[LinearBlockCodeEncoder]):
         """Generate all possible error patterns with a given Hamming weight.
 
         Creates all binary vectors of length n (code length) with exactly 'weight'
-        ones. These represent all possible error patterns with 'weight' bit flips.
+        ones, in lexicographic order of their error positions. These represent all
+        possible error patterns with 'weight' bit flips.
 
         Args:
             weight: The Hamming weight (number of 1s) in the error patterns
@@ -194,37 +206,20 @@ class SyndromeLookupDecoder(BaseBlockDecoder[LinearBlockCodeEncoder]):
         """
         if weight == 0:
             return torch.zeros((1, self.code_length), dtype=torch.int)
+        if weight > self.code_length:
+            return torch.zeros((0, self.code_length), dtype=torch.int)
 
-        # For weight 1, we can simply create the standard basis vectors
-        if weight == 1:
-            patterns = torch.zeros((self.code_length, self.code_length), dtype=torch.int)
-            for i in range(self.code_length):
-                patterns[i, i] = 1
-            return patterns
-
-        # For higher weights, use a combinatorial approach
-        patterns = []
-        current = torch.zeros(self.code_length, dtype=torch.int)
-
-        def generate_recursive(current: torch.Tensor, ones_left: int, start_pos: int):
-            if ones_left == 0:
-                patterns.append(current.clone())
-                return
+        # Error positions of every pattern, shape (binomial(n, weight), weight)
+        positions = torch.combinations(torch.arange(self.code_length), r=weight).view(-1, weight)
 
-            # Try each position from start_pos to the end
-            for pos in range(start_pos, self.code_length - ones_left + 1):
-                current[pos] = 1
-                generate_recursive(current, ones_left - 1, pos + 1)
-                current[pos] = 0  # Backtrack
-
-        generate_recursive(current, weight, 0)
-        return torch.stack(patterns)
+        patterns = torch.zeros((positions.shape[0], self.code_length), dtype=torch.int)
+        return patterns.scatter_(1, positions, 1)
 
     def _syndrome_to_int(self, syndrome: torch.Tensor) -> int:
         """Convert a syndrome tensor to an integer for table lookup.
 
         Transforms a binary syndrome vector into an integer value that can be
-        used as a key in the syndrome lookup table dictionary.
+        used as an index into the syndrome lookup table.
 
         Args:
             syndrome: Binary syndrome tensor of shape (r,) where r is the redundancy
@@ -242,23 +237,32 @@ class SyndromeLookupDecoder(BaseBlockDecoder[LinearBlockCodeEncoder]):
             else:
                 raise ValueError(f"Expected 1D syndrome tensor, got shape {syndrome.shape}")
 
-        # Convert to integers for binary operations
-        syndrome = syndrome.int()
+        return int(self._syndromes_to_int(syndrome))
+
+    def _syndromes_to_int(self, syndromes: torch.Tensor) -> torch.Tensor:
+        """Pack a batch of binary syndromes into integer table indices.
+
+        Uses the same bit order as :meth:`_syndrome_to_int`: bit i of the syndrome
+        contributes 2^i to the index.
 
-        result = 0
-        for i, bit in enumerate(syndrome):
-            if bit.item() == 1:
-                result |= 1 << i
-        return result
+        Args:
+            syndromes: Binary syndrome tensor of shape (..., r)
+
+        Returns:
+            Long tensor of shape (...) with the integer value of each syndrome
+        """
+        weights = self._syndrome_weights.to(syndromes.device)
+        return (syndromes.long() * weights).sum(dim=-1)
 
     def forward(self, received: torch.Tensor, *args: Any, **kwargs: Any) -> Union[torch.Tensor, Tuple[torch.Tensor, torch.Tensor]]:
         """Decode received codewords using the syndrome lookup table.
 
-        This method implements the complete syndrome-based decoding process:
-        1. Calculate the syndrome of the received word
-        2. Look up the corresponding error pattern in the syndrome table
-        3. Correct the received word by adding (XORing) the error pattern
-        4. Extract the message from the corrected codeword
+        This method implements the complete syndrome-based decoding process for
+        all codewords at once:
+        1. Calculate the syndromes of the received words (one matrix product mod 2)
+        2. Look up the corresponding error patterns in the syndrome table
+        3. Correct the received words by adding (XORing) the error patterns
+        4. Extract the messages from the corrected codewords
 
         Args:
             received: Received codeword tensor with shape (..., n) or (..., m*n)
@@ -270,7 +274,8 @@ class SyndromeLookupDecoder(BaseBlockDecoder[LinearBlockCodeEncoder]):
         Returns:
             Either:
             - Decoded tensor containing estimated messages with shape (..., k) or (..., m*k)
-            - A tuple of (decoded tensor, error pattern tensor) if return_errors=True
+            - A tuple of (decoded tensor, error pattern tensor) if return_errors=True, where
+              the error pattern tensor has the same shape as received
 
         Raises:
             ValueError: If the last dimension of received is not a multiple of the code length
@@ -287,81 +292,23 @@ class SyndromeLookupDecoder(BaseBlockDecoder[LinearBlockCodeEncoder]):
         if L % self.code_length != 0:
             raise ValueError(f"Last dimension ({L}) must be divisible by code length ({self.code_length})")
 
-        # Handle 1D tensor input for single codeword
-        if not leading_dims:  # This is a 1D tensor (a single codeword)
-            # Add batch dimension for processing
-            batched_received = received.unsqueeze(0)
-
-            # Process directly without using apply_blockwise
-            batch_size = 1
-            decoded = torch.zeros(batch_size, self.code_dimension, dtype=received.dtype, device=received.device)
-            errors = torch.zeros_like(batched_received)
-
-            # Calculate syndrome
-            syndrome = self.encoder.calculate_syndrome(received)
-            syndrome_int = self._syndrome_to_int(syndrome)
+        def decode_block(r_block):
+            block_shape = r_block.shape
+            r_flat = r_block.reshape(-1, self.code_length)
 
-            # Look up error pattern
-            error_pattern = self._syndrome_table.get(syndrome_int, torch.zeros(self.code_length, dtype=torch.int))
-            errors[0] = error_pattern
+            # Look up the coset leader of every syndrome in one gather
+            syndromes = torch.matmul(r_flat, self.encoder.check_matrix.transpose(0, 1).to(r_flat.dtype)) % 2
+            indices = self._syndromes_to_int(syndromes)
+            error_patterns = self._syndrome_table.to(r_flat.device).index_select(0, indices).to(r_flat.dtype)
 
             # Correct errors
-            corrected = (received + error_pattern) % 2
+            corrected = (r_flat + error_patterns) % 2
 
             # Extract message bits
-            decoded[0] = self.encoder.extract_message(corrected)
+            decoded = self.encoder.extract_message(corrected).view(*block_shape[:-1], self.code_dimension)
 
-            # Remove batch dimension for output
             if return_errors:
-                return decoded.squeeze(0), errors.squeeze(0)
-            return decoded.squeeze(0)
-
-        # For tensors with leading dimensions, process blockwise
-        def decode_block(r_block):
-            batch_size = r_block.shape[0]
-            decoded = torch.zeros(batch_size, self.code_dimension, dtype=received.dtype, device=received.device)
-            errors = torch.zeros_like(r_block)
-
-            for i in range(batch_size):
-                # Get the current received word
-                r = r_block[i]
-
-                # Calculate syndrome
-                syndrome = self.encoder.calculate_syndrome(r)
-                syndrome_int = self._syndrome_to_int(syndrome)
-
-                # Look up error pattern
-                error_pattern = self._syndrome_table.get(syndrome_int, torch.zeros(self.code_length, dtype=torch.int))
-                errors[i] = error_pattern
-
-                # Correct errors
-                corrected = (r + error_pattern) % 2
-
-                # Extract message bits
-                decoded[i] = self.encoder.extract_message(corrected)
-
-            return (decoded, errors) if return_errors else decoded
-
-        # Apply decoding blockwise
-        result = apply_blockwise(received, self.code_length, decode_block)
-
-        # If we're returning errors and handling multi-block tensors
-        # apply_blockwise will return a tuple that we need to handle specially
-        if return_errors and L > self.code_length:
-            decoded_parts = []
-            error_parts = []
-
-            # Handle batch dimension cases
-            *_, blocks, _ = received.shape
-            for i in range(blocks):
-                decoded, errors = result[:, i]
-                decoded_parts.append(decoded)
-                error_parts.append(errors)
-
-            # Stack the parts along the appropriate dimension
-            decoded_tensor = torch.cat(decoded_parts, dim=-1)
-            error_tensor = torch.cat(error_parts, dim=-1)
-
-            return decoded_tensor, error_tensor
+                return decoded, error_patterns.view(block_shape)
+            return decoded
 
-        return result
+        return apply_blockwise(received, self.code_length, decode_block)
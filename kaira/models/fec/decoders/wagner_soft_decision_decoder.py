@@ -171,17 +171,9 @@ class WagnerSoftDecisionDecoder(BaseBlockDecoder[BaseBlockCodeEncoder]):
         # Check parity (even parity expected)
         parity_sums = hard_decisions.sum(dim=-1) % 2
 
-        # For blocks with odd parity, find and flip the least reliable bit
-        for indices in torch.nonzero(parity_sums == 1, as_tuple=False):
-            # Get batch and block indices
-            *batch_indices, block_idx = indices.tolist()
-
-            # Find the least reliable bit in this block
-            block_values = received[batch_indices + [block_idx]]
-            least_reliable_idx = torch.argmin(torch.abs(block_values))
-
-            # Flip the least reliable bit
-            hard_decisions[batch_indices + [block_idx, least_reliable_idx]] = 1 - hard_decisions[batch_indices + [block_idx, least_reliable_idx]]
+        # For blocks with odd parity, flip the least reliable bit, all blocks at once
+        least_reliable = torch.argmin(torch.abs(received), dim=-1, keepdim=True)
+        hard_decisions.scatter_(-1, least_reliable, hard_decisions.gather(-1, least_reliable) ^ parity_sums.unsqueeze(-1).to(hard_decisions.dtype))
 
         # Extract message bits (assuming systematic form where message bits come first)
         decoded = hard_decisions[..., : self.code_dimension]
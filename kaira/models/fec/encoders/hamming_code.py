@@ -199,6 +199,15 @@ class HammingCodeEncoder(SystematicLinearBlockCodeEncoder):
         # Validate that the calculated dimensions match the theoretical ones
         self._validate_dimensions()
 
+        # Error position of every syndrome value: the first column of H equal to the syndrome,
+        # or code_length if no single-bit error has this syndrome
+        syndrome_weights = 2 ** torch.arange(self._redundancy, device=self.check_matrix.device)
+        column_values = (self.check_matrix.long() * syndrome_weights.unsqueeze(1)).sum(dim=0)
+        positions = torch.full((2**self._redundancy,), self._length, dtype=torch.long, device=self.check_matrix.device)
+        positions.scatter_reduce_(0, column_values, torch.arange(self._length, device=self.check_matrix.device), reduce="amin")
+        self.register_buffer("_syndrome_weights", syndrome_weights, persistent=False)
+        self.register_buffer("_error_positions", positions, persistent=False)
+
     def _validate_dimensions(self) -> None:
         """Validate that the code dimensions match the theoretical values."""
         if self._length != self._theoretical_length:
@@ -254,25 +263,16 @@ class HammingCodeEncoder(SystematicLinearBlockCodeEncoder):
 
         # Prepare shapes
         original_dims = y.size()[:-1]
-        y_reshaped = y.reshape(-1, self.code_length).clone()
+        y_reshaped = y.reshape(-1, self.code_length)
         syndrome_reshaped = syndrome.reshape(-1, self.redundancy)
 
-        # Vectorized error correction
-        error_positions = torch.tensor([self._syndrome_to_error_position(s) for s in syndrome_reshaped], device=y.device)
-
-        # Create mask for valid error positions (less than code_length)
-        valid_errors = error_positions < self.code_length
+        # Look up the error position of every syndrome; position code_length marks no correction
+        error_positions = self._syndrome_to_error_position(syndrome_reshaped).unsqueeze(1)
 
-        # Apply corrections using vectorized operations
-        if valid_errors.any():
-            # Create batch indices for the samples with errors
-            batch_indices = torch.nonzero(valid_errors, as_tuple=True)[0]
-            # Get corresponding error positions
-            pos = error_positions[valid_errors]
-
-            # Flip the bits at error positions
-            for i, p in zip(batch_indices, pos):
-                y_reshaped[i, p] = 1 - y_reshaped[i, p]
+        # Flip the bits at the error positions with a single scatter over the batch
+        y_reshaped = torch.cat([y_reshaped, torch.zeros_like(y_reshaped[:, :1])], dim=1)
+        y_reshaped.scatter_(1, error_positions, 1 - y_reshaped.gather(1, error_positions))
+        y_reshaped = y_reshaped[:, : self.code_length]
 
         # Extract information bits
         decoded = y_reshaped[..., self.information_set]
@@ -280,15 +280,15 @@ class HammingCodeEncoder(SystematicLinearBlockCodeEncoder):
 
         return decoded, syndrome
 
-    def _syndrome_to_error_position(self, syndrome):
-        """Convert a syndrome to an error position by matching check matrix columns."""
-        # check_matrix shape: (m, n)
-        # compare syndrome to each column of check_matrix
-        H = self.check_matrix  # shape (m, n)
-        # ensure float dtype
-        syn = syndrome.float()
-        for j in range(self.code_length):
-            col = H[:, j].float()
-            if torch.equal(col, syn):
-                return j
-        return self.code_length
+    def _syndrome_to_error_position(self, syndrome: torch.Tensor) -> torch.Tensor:
+        """Convert syndromes to error positions by looking up the matching check matrix columns.
+
+        Args:
+            syndrome: Binary syndrome tensor of shape (..., redundancy)
+
+        Returns:
+            Long tensor of shape (...) with the position of the single-bit error of each syndrome,
+            or code_length if the syndrome matches no column of the check matrix
+        """
+        indices = (syndrome.long() * self._syndrome_weights.to(syndrome.device)).sum(dim=-1)
+        return self._error_positions.to(syndrome.device)[indices]
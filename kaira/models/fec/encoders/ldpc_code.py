@@ -11,15 +11,131 @@ References:
     :cite:`gallager1962low`, :cite:`gallager1963low`, :cite:`richardson2008modern`
 """
 
-from typing import Any
+from typing import Any, List, Optional, Tuple
 
 import torch
 
 from kaira.models.registry import ModelRegistry
 
+from ..cache import artifact_key, cached_artifact
+from ..encoders.base import BaseBlockCodeEncoder
 from ..encoders.linear_block_code import LinearBlockCodeEncoder
-from ..rptu_database import CITATION, EXISTING_CODES, get_code_from_database, parse_alist
-from ..utils import row_reduction
+from ..rptu_database import CITATION, EXISTING_CODES, get_code_from_database, get_lifting_size, parse_alist
+from ..utils import apply_blockwise, row_reduction
+
+
+def expand_base_matrix(base_matrix: torch.Tensor, lifting_size: int) -> torch.Tensor:
+    """Expand the base matrix of a quasi-cyclic LDPC code into its parity check matrix.
+
+    Entry (i, j) of the base matrix is the shift t of the circulant permutation matrix in block
+    (i, j) of the check matrix, whose row r has its one in column (r + t) mod Z, or -1 for a zero
+    block.
+
+    Args:
+        base_matrix: Integer matrix of shape (mb, nb) of circulant shifts, -1 for zero blocks
+        lifting_size: Circulant size Z
+
+    Returns:
+        Binary check matrix of shape (mb * Z, nb * Z) on the device of the base matrix
+    """
+    mb, nb = base_matrix.shape
+    rows = torch.arange(lifting_size, device=base_matrix.device)
+    # blocks[i, j, r, c] = 1 if c == (r + shift[i, j]) mod Z for nonzero blocks
+    columns = (rows.view(1, 1, -1) + base_matrix.clamp(min=0).unsqueeze(-1)) % lifting_size
+    blocks = (columns.unsqueeze(-1) == rows) & (base_matrix >= 0).view(mb, nb, 1, 1)
+    return blocks.permute(0, 2, 1, 3).reshape(mb * lifting_size, nb * lifting_size).to(torch.int64)
+
+
+def _circulant_shifts(rows: torch.Tensor, columns: torch.Tensor, shape: Tuple[int, int], lifting_size: int) -> Optional[torch.Tensor]:
+    """Recover the base matrix of a quasi-cyclic check matrix from the positions of its ones.
+
+    Args:
+        rows: Row indices of the nonzero entries of the check matrix
+        columns: Column indices of the nonzero entries of the check matrix
+        shape: Shape (m, n) of the check matrix
+        lifting_size: Circulant size Z
+
+    Returns:
+        Integer matrix of shape (m / Z, n / Z) of circulant shifts with -1 for zero blocks, or None
+        if the ones do not form Z x Z circulant permutation blocks
+    """
+    m, n = shape
+    if lifting_size < 1 or m % lifting_size != 0 or n % lifting_size != 0:
+        return None
+    mb, nb = m // lifting_size, n // lifting_size
+    blocks = (rows // lifting_size) * nb + columns // lifting_size
+    # A one in row r and column c of a block lies on the cyclic diagonal of shift (c - r) mod Z
+    shifts = (columns - rows) % lifting_size
+
+    # Every nonzero block must hold Z ones, all on the diagonal of a single shift
+    counts = torch.bincount(blocks, minlength=mb * nb)
+    base_matrix = torch.full((mb * nb,), -1, dtype=torch.int64, device=rows.device).scatter_(0, blocks, shifts)
+    if torch.any((counts != 0) & (counts != lifting_size)) or not torch.equal(base_matrix[blocks], shifts):
+        return None
+    return base_matrix.view(mb, nb).cpu()
+
+
+def get_base_matrix(check_matrix: torch.Tensor, lifting_size: int) -> Optional[torch.Tensor]:
+    """Recover the base matrix of a quasi-cyclic LDPC code from its parity check matrix.
+
+    Args:
+        check_matrix: Binary check matrix of shape (mb * Z, nb * Z)
+        lifting_size: Circulant size Z
+
+    Returns:
+        Integer matrix of shape (mb, nb) of circulant shifts with -1 for zero blocks, as used by
+        :func:`expand_base_matrix`, or None if the check matrix is not made of Z x Z circulant
+        permutation and zero blocks
+    """
+    rows, columns = torch.nonzero(check_matrix, as_tuple=True)
+    return _circulant_shifts(rows, columns, check_matrix.shape, lifting_size)
+
+
+def find_lifting_size(check_matrix: torch.Tensor) -> Optional[int]:
+    """Find the circulant size for which a check matrix is quasi-cyclic.
+
+    The circulant size is read off the structure of the first block row, whose rows are cyclic
+    shifts of row 0 within every block. Following the diagonals through the ones of row 0, the
+    first row r in which a diagonal breaks is either the row Z - t at which the diagonal of shift t
+    wraps around to the first column of its block, giving Z from the column it wraps to, or the
+    first row Z of the next block row. These candidates are verified once; only if both fail
+    (for codes with coinciding shifts of neighbouring blocks) are all divisors of gcd(m, n) tried,
+    each verified in time linear in the number of ones.
+
+    Args:
+        check_matrix: Binary check matrix of shape (m, n)
+
+    Returns:
+        A circulant size Z > 1 dividing m and n such that the check matrix consists of Z x Z
+        circulant permutation and zero blocks, or None if there is no such Z
+    """
+    m, n = check_matrix.shape
+    nonzero = check_matrix != 0
+    rows, columns = torch.nonzero(nonzero, as_tuple=True)
+
+    candidates = []
+    first = columns[rows == 0]
+    if first.numel() > 0:
+        # follows[r - 1, i] tells whether row r continues the diagonal through the i-th one of row 0
+        offsets = torch.arange(1, m, device=nonzero.device).unsqueeze(-1)
+        diagonals = first + offsets
+        follows = nonzero[offsets, diagonals.clamp(max=n - 1)] & (diagonals < n)
+        broken = torch.nonzero(~follows.all(dim=-1)).view(-1)
+        row = broken[0].item() + 1 if broken.numel() > 0 else m
+        if row < m:
+            # The first broken diagonal wraps to the ones of row `row` on no continued diagonal
+            wrapped = columns[rows == row]
+            wrapped = wrapped[~torch.isin(wrapped, diagonals[row - 1][follows[row - 1]])]
+            if wrapped.numel() > 0:
+                candidates.append(first[~follows[row - 1]][0].item() + row - wrapped[0].item())
+        candidates.append(row)
+
+    common = torch.gcd(torch.tensor(m), torch.tensor(n)).item()
+    candidates += [lifting_size for lifting_size in range(common, 1, -1) if common % lifting_size == 0 and lifting_size not in candidates]
+    for lifting_size in candidates:
+        if lifting_size > 1 and _circulant_shifts(rows, columns, (m, n), lifting_size) is not None:
+            return lifting_size
+    return None
 
 
 @ModelRegistry.register_model("ldpc_code_encoder")
@@ -40,12 +156,38 @@ class LDPCCodeEncoder(LinearBlockCodeEncoder):
     This implementation follows the standard approach to linear block coding described in the
     error control coding literature :cite:`lin2004error,moon2005error,sklar2001digital`.
 
+    With ``encoding="structured"``, quasi-cyclic codes whose parity part allows back-substitution
+    (such as the dual-diagonal WiMAX and WiFi codes) are encoded without a generator matrix, in the
+    manner of Richardson and Urbanke :cite:`richardson2008modern`. The codeword is systematic, c = [s | p],
+    where the parity blocks p are solved one circulant block at a time from the block rows of
+    H = [H_s | H_p]: first the sum of all block rows (in which the dual-diagonal part cancels), then
+    every block row with a single unknown parity block. Every product with a circulant permutation
+    matrix is a cyclic shift, so encoding takes time and memory linear in the number of edges.
+
     Attributes:
-        generator_matrix (torch.Tensor): The generator matrix G of the code
-        check_matrix (torch.Tensor): The parity check matrix H
+        generator_matrix (Optional[torch.Tensor]): The generator matrix G of the code, or None with
+            structured encoding
+        check_matrix (torch.Tensor): The parity check matrix H. With structured encoding, only the
+            base matrix is stored and H is expanded from it on every access
+        lifting_size (Optional[int]): Circulant size of a quasi-cyclic check matrix, or None
+            if the code is not known to be quasi-cyclic
+        encoding (str): "generator" to encode with G or "structured" to encode by back-substitution
+        base_matrix (Optional[torch.Tensor]): Circulant shifts of the quasi-cyclic check matrix
+            (-1 for zero blocks) with structured encoding, else None
+        message_positions (Optional[torch.Tensor]): Codeword positions of the message bits with
+            structured encoding, else None
+
+    Examples:
+        >>> base_matrix = torch.tensor([[0, 1, 1, 0, -1], [2, -1, 0, 0, 0], [-1, 0, 1, -1, 0]])
+        >>> encoder = LDPCCodeEncoder(base_matrix=base_matrix, lifting_size=4, encoding="structured")
+        >>> codewords = encoder(torch.randint(0, 2, (10, 8)).float())
+        >>> bool(torch.all(encoder.calculate_syndrome(codewords) == 0))
+        True
     """
 
-    def __init__(self, check_matrix: torch.Tensor = None, rptu_database: bool = False, *args: Any, **kwargs: Any):
+    ENCODINGS = ("generator", "structured")
+
+    def __init__(self, check_matrix: Optional[torch.Tensor] = None, rptu_database: bool = False, *args: Any, **kwargs: Any):
         """Initializes the linear block encoder for LDPC codes.
 
         Args:
@@ -63,12 +205,36 @@ class LDPCCodeEncoder(LinearBlockCodeEncoder):
                 - rptu_standart (str, optional): Standard name for the LDPC code. If not provided,
                 the first available standard is used.
                 - device (str, optional): Device to place the tensors on (e.g., "cpu" or "cuda").
+                - lifting_size (int, optional): Circulant size of a quasi-cyclic check matrix. Set
+                automatically for the quasi-cyclic standards of the RPTU database.
+                - packed (bool, optional): Encode and compute syndromes on bit-packed words. Default is False.
+                - base_matrix (torch.Tensor, optional): Circulant shifts of a quasi-cyclic check matrix, with
+                -1 for zero blocks, used instead of `check_matrix` together with `lifting_size`.
+                - encoding (str, optional): "generator" (default) to encode with a dense generator matrix, or
+                "structured" to encode quasi-cyclic codes by back-substitution without a generator matrix.
+                The lifting size is detected from the check matrix if it is not given.
+
+            If the FEC cache is enabled (see :mod:`kaira.models.fec.cache`), the parsed check matrix of
+            the RPTU database codes and the derived generator matrix are stored there and reused.
 
         Raises:
-            ValueError: If the requested (code_length, code_dimension) code or standard is not found in the RPTU database.
+            ValueError: If the requested (code_length, code_dimension) code or standard is not found in the RPTU database,
+                or structured encoding is requested for a check matrix that does not support it.
         """
         # Validate input parameters
-        if not rptu_database and check_matrix is None:
+        lifting_size = kwargs.get("lifting_size", None)
+        base_matrix = kwargs.get("base_matrix", None)
+        self.encoding = kwargs.get("encoding", "generator")
+        if self.encoding not in self.ENCODINGS:
+            raise ValueError(f"Unknown encoding '{self.encoding}'. Supported encodings: {self.ENCODINGS}")
+        if base_matrix is not None:
+            if lifting_size is None:
+                raise ValueError("`lifting_size` must be provided together with `base_matrix`.")
+            base_matrix = torch.as_tensor(base_matrix).to(torch.int64)
+            # Structured encoding works on the base matrix and never expands the check matrix
+            if self.encoding != "structured":
+                check_matrix = expand_base_matrix(base_matrix, lifting_size)
+        if not rptu_database and check_matrix is None and base_matrix is None:
             raise ValueError("Either a valid `check_matrix` must be provided or `rptu_database` must be set to True.")
         # Initialize the base class from rptu_database or provided check_matrix
         if rptu_database:
@@ -89,19 +255,258 @@ class LDPCCodeEncoder(LinearBlockCodeEncoder):
             else:
                 rptu_standart = list(EXISTING_CODES[code_key].keys())[0]  # Default to first available standard
                 print(f"Using default rptu_standart='{rptu_standart}' for (code_length={code_length}, code_dimension={code_dimension}).")
-            content = get_code_from_database(EXISTING_CODES[code_key][rptu_standart])
-            check_matrix = parse_alist(content)
+            url = EXISTING_CODES[code_key][rptu_standart]
+            check_matrix = cached_artifact("ldpc_check_matrix", artifact_key(url), lambda: {"check_matrix": parse_alist(get_code_from_database(url))})["check_matrix"]
+            if lifting_size is None:
+                lifting_size = get_lifting_size(code_length, rptu_standart)
         self.device = kwargs.get("device", "cpu")
+        if self.encoding == "structured":
+            self._init_structured(check_matrix, base_matrix, lifting_size, kwargs.get("packed", False))
+            return
+
         # Ensure generator matrix is a torch tensor
         if not isinstance(check_matrix, torch.Tensor):
             check_matrix = torch.tensor(check_matrix).to(self.device)
         if check_matrix.device != self.device:
             check_matrix = check_matrix.to(self.device)
 
-        generator_matrix = self.get_generator_matrix(check_matrix)
+        generator_matrix = cached_artifact("ldpc_generator", artifact_key(check_matrix.to(torch.int64)), lambda: {"generator_matrix": self.get_generator_matrix(check_matrix)})["generator_matrix"]
+        generator_matrix = generator_matrix.to(check_matrix.device)
 
         # Initialize the base class with dimensions
-        super().__init__(generator_matrix=generator_matrix, check_matrix=check_matrix)
+        super().__init__(generator_matrix=generator_matrix, check_matrix=check_matrix, packed=kwargs.get("packed", False))
+        self.lifting_size = lifting_size
+        self.base_matrix: Optional[torch.Tensor] = None
+        self.message_positions: Optional[torch.Tensor] = None
+
+    def _init_structured(self, check_matrix: Optional[torch.Tensor], base_matrix: Optional[torch.Tensor], lifting_size: Optional[int], packed: bool) -> None:
+        """Set up structured encoding of a quasi-cyclic code without a generator matrix.
+
+        Only the base matrix and the gather indices of its circulant blocks are stored; the dense
+        check matrix is not kept.
+
+        Args:
+            check_matrix: The parity check matrix of the LDPC code, used if no base matrix is given
+            base_matrix: Circulant shifts of the check matrix, or None to recover them from it
+            lifting_size: Circulant size of the check matrix, or None to detect it
+            packed: Whether bit-packed encoding was requested, which needs a generator matrix
+
+        Raises:
+            ValueError: If the check matrix is not quasi-cyclic or its parity part cannot be solved by
+                back-substitution, or packed encoding is requested.
+        """
+        if packed:
+            raise ValueError("Bit-packed encoding requires a generator matrix and is not supported with structured encoding.")
+        if base_matrix is None:
+            check_matrix = torch.as_tensor(check_matrix)
+            if lifting_size is None:
+                lifting_size = find_lifting_size(check_matrix)
+            base_matrix = get_base_matrix(check_matrix, lifting_size) if lifting_size is not None else None
+            if base_matrix is None:
+                raise ValueError(f"Structured encoding requires a quasi-cyclic check matrix of circulant permutation blocks, which the check matrix is not for lifting size {lifting_size}.")
+        assert lifting_size is not None
+        base_matrix = base_matrix.to(self.device)
+
+        mb, nb = base_matrix.shape
+        BaseBlockCodeEncoder.__init__(self, code_length=nb * lifting_size, code_dimension=(nb - mb) * lifting_size)
+        self.register_buffer("base_matrix", base_matrix)
+        self.register_buffer("generator_matrix", None)
+        self.register_buffer("generator_right_inverse", None)
+        self.packed = False
+        self._packed_kernels = {}
+        self.lifting_size = lifting_size
+        self.message_positions = torch.arange(self.code_dimension)
+
+        # Gather indices of the circulant products of all blocks: row (i, r) of the product of block (i, j)
+        # with the codeword is bit (r + shift) mod Z of block column j, accumulated into block row i
+        rows, columns = torch.nonzero(base_matrix >= 0, as_tuple=True)
+        index = columns.unsqueeze(-1) * lifting_size + (torch.arange(lifting_size, device=base_matrix.device) + base_matrix[rows, columns].unsqueeze(-1)) % lifting_size
+        self.register_buffer("_block_rows", rows, persistent=False)
+        self.register_buffer("_block_index", index, persistent=False)
+        self.register_buffer("_info_blocks", torch.nonzero(columns < nb - mb).view(-1), persistent=False)
+
+        self._parity_schedule, self._parity_entries = self._build_parity_schedule(base_matrix)
+
+    def __getattr__(self, name: str) -> Any:
+        """Expand the check matrix of structured encoders from the base matrix when it is accessed.
+
+        Args:
+            name: Name of the attribute
+
+        Returns:
+            The attribute, where the check matrix of a structured encoder is expanded on every
+            access so that only callers that need the dense matrix (such as belief propagation
+            decoders) build it
+        """
+        if name == "check_matrix" and self.__dict__.get("encoding") == "structured":
+            return expand_base_matrix(self.base_matrix, self.lifting_size)
+        return super().__getattr__(name)
+
+    @staticmethod
+    def _build_parity_schedule(base_matrix: torch.Tensor) -> Tuple[List[Tuple[int, int, int]], List[List[Tuple[int, int]]]]:
+        """Find the order in which the parity blocks are solved by back-substitution.
+
+        The parity part of the base matrix consists of its last mb block columns. While no parity
+        block is known, the sum of all block rows is used if the parity blocks of all but one
+        column cancel in it and the remaining column reduces to a single circulant (as for
+        dual-diagonal parity parts). Then every block row with a single unknown parity block
+        determines that block.
+
+        Args:
+            base_matrix: Circulant shifts of shape (mb, nb), with -1 for zero blocks
+
+        Returns:
+            Tuple containing:
+                - Steps (block row, parity column, shift), where the block row is -1 for the sum of
+                  all block rows and the parity column is P^-shift times the accumulated row
+                - For every parity column, the (block row, shift) of its nonzero blocks
+
+        Raises:
+            ValueError: If the parity blocks cannot all be solved by back-substitution
+        """
+        mb, nb = base_matrix.shape
+        parity = base_matrix[:, nb - mb :].tolist()
+        entries = [[(i, parity[i][j]) for i in range(mb) if parity[i][j] >= 0] for j in range(mb)]
+
+        schedule: List[Tuple[int, int, int]] = []
+        known = [False] * mb
+        while not all(known):
+            unknown = [[j for j in range(mb) if parity[i][j] >= 0 and not known[j]] for i in range(mb)]
+            row = next((i for i in range(mb) if len(unknown[i]) == 1), None)
+            if row is not None:
+                column = unknown[row][0]
+                schedule.append((row, column, parity[row][column]))
+            elif not any(known):
+                # Shifts appearing an odd number of times in the sum of the blocks of every column
+                odd = [sorted({t for _, t in column if sum(s == t for _, s in column) % 2 == 1}) for column in entries]
+                remaining = [j for j in range(mb) if odd[j]]
+                if len(remaining) != 1 or len(odd[remaining[0]]) != 1:
+                    break
+                column = remaining[0]
+                schedule.append((-1, column, odd[column][0]))
+            else:
+                break
+            known[column] = True
+
+        if not all(known):
+            raise ValueError("The parity part of the base matrix cannot be solved by back-substitution, use encoding='generator' instead.")
+        return schedule, entries
+
+    def _circulant_products(self, bits: torch.Tensor, blocks: Optional[torch.Tensor] = None) -> torch.Tensor:
+        """Multiply codeword blocks with the circulant blocks of the check matrix.
+
+        Args:
+            bits: Integer tensor of shape (batch_size, L) holding the first L / Z block columns
+            blocks: Indices of the nonzero blocks to include, or None for all of them
+
+        Returns:
+            Tensor of shape (batch_size, mb, Z) with the sums over GF(2) of the products of every
+            block row
+        """
+        rows, index = self._block_rows, self._block_index
+        if blocks is not None:
+            rows, index = rows[blocks], index[blocks]
+        products = torch.zeros(bits.shape[0], self.base_matrix.shape[0], self.lifting_size, dtype=bits.dtype, device=bits.device)
+        return products.index_add_(1, rows, bits[:, index]) & 1
+
+    def encode_structured(self, x: torch.Tensor) -> torch.Tensor:
+        """Encode messages by back-substitution over the circulant blocks of the check matrix.
+
+        Args:
+            x: Binary messages of shape (batch_size, k)
+
+        Returns:
+            Systematic codewords [x | p] of shape (batch_size, n) with the dtype of x
+        """
+        bits = x.to(torch.uint8)
+
+        # Accumulated right hand sides of the block rows, starting with the message part H_s s
+        accumulated = self._circulant_products(bits, self._info_blocks)
+        parity = torch.zeros_like(accumulated)
+        for row, column, shift in self._parity_schedule:
+            rhs = accumulated.sum(dim=1) & 1 if row < 0 else accumulated[:, row]
+            # Multiplication with P^-shift is a cyclic shift by shift positions
+            parity[:, column] = torch.roll(rhs, shift, dims=-1)
+            for i, t in self._parity_entries[column]:
+                accumulated[:, i] ^= torch.roll(parity[:, column], -t, dims=-1)
+
+        return torch.cat([bits, parity.view(bits.shape[0], -1)], dim=1).to(x.dtype)
+
+    def forward(self, x: torch.Tensor, *args: Any, **kwargs: Any) -> torch.Tensor:
+        """Applies the encoding mapping Enc: B^k → B^n of the code.
+
+        Args:
+            x: The input tensor. Can be either a single sequence whose length is a multiple of k,
+               or a multidimensional tensor where the last dimension is a multiple of k.
+            *args: Additional positional arguments (unused).
+            **kwargs: Additional keyword arguments (unused).
+
+        Returns:
+            The output tensor, with the last dimension expanded from b*k to b*n.
+
+        Raises:
+            ValueError: If the last dimension of the input is not a multiple of k.
+        """
+        if self.encoding != "structured":
+            return super().forward(x, *args, **kwargs)
+
+        if x.shape[-1] % self.code_dimension != 0:
+            raise ValueError(f"Last dimension size {x.shape[-1]} must be a multiple of the code dimension {self.code_dimension}")
+
+        def encode_fn(reshaped_x):
+            codewords = self.encode_structured(reshaped_x.reshape(-1, self.code_dimension))
+            return codewords.view(*reshaped_x.shape[:-1], self.code_length)
+
+        return apply_blockwise(x, self.code_dimension, encode_fn)
+
+    def calculate_syndrome(self, x: torch.Tensor) -> torch.Tensor:
+        """Calculate the syndrome s = xH^T of a received word.
+
+        With structured encoding, the syndrome is computed from the circulant blocks of the
+        check matrix by cyclic shifts instead of a dense product.
+
+        Args:
+            x: Received word tensor of shape (..., n) or (..., b*n)
+
+        Returns:
+            Syndrome tensor of shape (..., redundancy) or (..., b*redundancy)
+        """
+        if self.encoding != "structured":
+            return super().calculate_syndrome(x)
+
+        if x.shape[-1] % self.code_length != 0:
+            raise ValueError(f"Input codeword length {x.shape[-1]} must be a multiple of the code length {self.code_length}")
+
+        def syndrome_fn(reshaped_x):
+            syndrome = self._circulant_products(reshaped_x.reshape(-1, self.code_length).to(torch.uint8))
+            return syndrome.view(*reshaped_x.shape[:-1], -1).to(reshaped_x.dtype)
+
+        return apply_blockwise(x, self.code_length, syndrome_fn)
+
+    def inverse_encode(self, x: torch.Tensor, *args: Any, **kwargs: Any) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Recover the messages and syndromes of codewords.
+
+        Args:
+            x: The input tensor, whose last dimension is a multiple of n.
+            *args: Additional positional arguments (unused).
+            **kwargs: Additional keyword arguments (unused).
+
+        Returns:
+            Tuple containing the decoded tensor of shape (..., b*k) and the syndrome tensor of
+            shape (..., b*r).
+
+        Raises:
+            ValueError: If the last dimension of the input is not a multiple of n.
+        """
+        if self.encoding != "structured":
+            return super().inverse_encode(x, *args, **kwargs)
+
+        if x.shape[-1] % self.code_length != 0:
+            raise ValueError(f"Last dimension size {x.shape[-1]} must be a multiple of the code length {self.code_length}")
+
+        # Structured codewords are systematic, with the message in the first k positions
+        decoded = apply_blockwise(x, self.code_length, lambda reshaped_x: reshaped_x[..., : self.code_dimension].contiguous())
+        return decoded, self.calculate_syndrome(x)
 
     def get_generator_matrix(self, check_matrix_: torch.Tensor) -> torch.Tensor:
         """Derive the generator matrix from a parity check matrix.
@@ -10,131 +10,74 @@ on binary linear block codes, which are characterized by generator and check mat
 whose elements belong to the binary field GF(2) :cite:`richardson2008modern`.
 """
 
-from typing import Any, Tuple
+from typing import Any, Dict, Tuple
 
 import torch
 
 from kaira.models.registry import ModelRegistry
 
+from ..cache import artifact_key, cached_artifact
+from ..gf2 import pack_bits, packed_matmul, packed_parity_check, packed_row_reduction, packed_rows, packed_xor_table, unpack_bits
 from ..utils import apply_blockwise
 from .base import BaseBlockCodeEncoder
 
 
+def _identity_columns(matrix: torch.Tensor) -> torch.Tensor:
+    """Return, for each row, the first column that is a unit vector with a one in that row.
+
+    Args:
+        matrix: Binary matrix of shape (k, n)
+
+    Returns:
+        Tensor of shape (k,) of column indices, with -1 for rows without such a column
+    """
+    candidates = (matrix == 1) & (matrix.sum(dim=0) == 1)
+    columns = candidates.to(torch.int8).argmax(dim=1)
+    return torch.where(candidates.any(dim=1), columns, -1)
+
+
 def compute_null_space_matrix(matrix: torch.Tensor) -> torch.Tensor:
     """Compute the null space matrix of the input matrix.
 
+    If every row of the matrix has a unit column, the matrix is systematic up to a
+    permutation of its columns, G = [I_k | P], and the null space is H = [P^T | I_{n-k}]
+    with the identity in the remaining columns. Otherwise, the null space is read off the
+    reduced row echelon form over GF(2): each non-pivot column gives one basis vector.
+
     Args:
         matrix: Input matrix
 
     Returns:
         Matrix whose rows form a basis for the null space of the input matrix
     """
-    # Convert to float for numerical stability
-    matrix_float = matrix.float()
     k, n = matrix.shape
 
-    # For a generator matrix G, we need to find H such that GH^T = 0
-    # First try to find if we have a systematic form: G = [I_k | P]
-    is_systematic = True
-    identity_detected = set()
-    for i in range(k):
-        found_identity_column = False
-        for j in range(n):
-            col = matrix_float[:, j]
-            if col[i] == 1.0 and torch.sum(col) == 1.0:
-                # This is an identity column
-                identity_detected.add(j)
-                found_identity_column = True
-                break
-        if not found_identity_column:
-            is_systematic = False
-            break
+    identity_columns = _identity_columns(matrix)
+    if torch.all(identity_columns >= 0):
+        pivot_rows = torch.arange(k, device=matrix.device)
+        reduced = matrix
+    else:
+        reduced, pivots = packed_row_reduction(matrix)
+        pivot_rows = torch.arange(len(pivots), device=matrix.device)
+        identity_columns = torch.tensor(pivots, dtype=torch.long, device=matrix.device)
+
+    free = torch.ones(n, dtype=torch.bool, device=matrix.device)
+    free[identity_columns] = False
+    free_columns = torch.nonzero(free).view(-1)
 
-    if is_systematic and len(identity_detected) == k:
-        # If we found a systematic form, we can easily construct H = [-P^T | I_{n-k}]
-        # Identify the parity part (columns not in identity_detected)
-        parity_columns = [j for j in range(n) if j not in identity_detected]
-
-        # Extract parity part P (k x (n-k))
-        parity_part = torch.zeros((k, n - k), dtype=matrix_float.dtype)
-        for i, col_idx in enumerate(parity_columns):
-            parity_part[:, i] = matrix_float[:, col_idx]
-
-        # Construct H = [-P^T | I_{n-k}] in GF(2), so -P^T is equivalent to P^T
-        H = torch.zeros((n - k, n), dtype=matrix_float.dtype)
-
-        # Fill in the P^T part
-        for i in range(n - k):
-            for j in range(k):
-                H[i, list(identity_detected)[j]] = parity_part[j, i]
-
-        # Fill in the identity part
-        for i, col_idx in enumerate(parity_columns):
-            H[i, col_idx] = 1.0
-
-        # Verify that GH^T = 0 (in GF(2))
-        verification = torch.matmul(matrix_float, H.t()) % 2
-        if torch.all(verification == 0):
-            # Convert back to original dtype before returning
-            return H.to(matrix.dtype)
-
-    # If systematic form wasn't detected or verification failed, use SVD
-    U, S, V = torch.linalg.svd(matrix_float, full_matrices=True)
-
-    # Count non-zero singular values with small tolerance
-    tol = S.max() * max(matrix.size()) * torch.finfo(matrix_float.dtype).eps
-    rank = torch.sum(S > tol).item()
-
-    # The null space is spanned by the right singular vectors
-    # corresponding to the zero singular values
-    if rank < V.size(1):
-        null_space = V[rank:].clone()
-
-        # In GF(2), we need to ensure each element is binary
-        # Round to the nearest binary value
-        null_space = (null_space.abs() > 0.5).float()
-
-        # Ensure we have linearly independent rows
-        # and the result satisfies GH^T = 0
-        if null_space.size(0) > 0:
-            # Remove linearly dependent rows
-            reduced_null_space = torch.zeros((min(n - k, null_space.size(0)), n), dtype=matrix.dtype)
-            row_idx = 0
-
-            for i in range(null_space.size(0)):
-                # Check if current row is linearly independent from existing rows
-                if row_idx == 0 or not torch.all(torch.matmul(null_space[i], reduced_null_space[:row_idx].t().float()) % 2 == 0):
-                    if row_idx < reduced_null_space.size(0):
-                        reduced_null_space[row_idx] = null_space[i]
-                        row_idx += 1
-
-                # If we've found enough rows, we can stop
-                if row_idx == n - k:
-                    break
-
-            # Verify that the null space satisfies GH^T = 0
-            verification = torch.matmul(matrix_float, reduced_null_space.t()) % 2
-            if torch.all(verification < 0.01):  # Allow small numerical error
-                return reduced_null_space[:row_idx]
-
-    # If all else fails, fall back to a direct construction for common cases
-
-    # Repetition codes: generator matrix is a single row of all ones
-    if k == 1 and torch.all(matrix == 1.0):
-        # For a repetition code, check matrix verifies adjacent bits are equal
-        H = torch.zeros((n - 1, n), dtype=matrix.dtype)
-        for i in range(n - 1):
-            H[i, i] = 1.0
-            H[i, i + 1] = 1.0
-        return H
-
-    # If we couldn't find a valid null space, return an empty matrix
-    return torch.zeros((n - k, n), dtype=matrix.dtype)
+    # H[i, free_columns[i]] = 1 and H[i, identity_columns[j]] = G[j, free_columns[i]] in GF(2)
+    H = torch.zeros((free_columns.numel(), n), dtype=matrix.dtype, device=matrix.device)
+    H[torch.arange(free_columns.numel(), device=matrix.device), free_columns] = 1
+    H[:, identity_columns] = reduced[pivot_rows][:, free_columns].t().to(matrix.dtype)
+    return H
 
 
 def compute_reduced_row_echelon_form(matrix: torch.Tensor) -> torch.Tensor:
     """Compute the reduced row echelon form of the matrix.
 
+    Binary matrices are reduced over GF(2) with word-parallel row operations on bit-packed
+    rows (see :func:`kaira.models.fec.gf2.packed_row_reduction`).
+
     Args:
         matrix: Input matrix
 
@@ -152,43 +95,7 @@ def compute_reduced_row_echelon_form(matrix: torch.Tensor) -> torch.Tensor:
 
     # For binary matrices, use a special GF(2) implementation
     if torch.all((matrix == 0) | (matrix == 1)):
-        A = matrix_float.clone()
-        m, n = A.size()
-        r = 0  # Current row
-        c = 0  # Current column
-
-        # Iterate through columns
-        while r < m and c < n:
-            # Find pivot element
-            pivot_row = -1
-            for i in range(r, m):
-                if A[i, c] != 0:
-                    pivot_row = i
-                    break
-
-            if pivot_row == -1:
-                # No pivot in this column, move to next column
-                c += 1
-                continue
-
-            # Swap rows if needed
-            if pivot_row != r:
-                A[r], A[pivot_row] = A[pivot_row].clone(), A[r].clone()
-
-            # Eliminate below
-            for i in range(r + 1, m):
-                if A[i, c] != 0:
-                    A[i] = (A[i] + A[r]) % 2
-
-            # Eliminate above
-            for i in range(r):
-                if A[i, c] != 0:
-                    A[i] = (A[i] + A[r]) % 2
-
-            r += 1
-            c += 1
-
-        return A
+        return packed_row_reduction(matrix_float)[0]
 
     # For general matrices, use a generic approach
     A = matrix_float.clone()
@@ -227,107 +134,42 @@ def compute_reduced_row_echelon_form(matrix: torch.Tensor) -> torch.Tensor:
         if pivot_row == rows:
             break
 
-    # Convert to binary for GF(2) matrices
-    if torch.all((matrix == 0) | (matrix == 1)):
-        return (A.abs() > 0.5).float()
-
     return A
 
 
 def compute_right_pseudo_inverse(matrix: torch.Tensor) -> torch.Tensor:
     """Compute the right pseudo-inverse of a matrix in GF(2).
 
-    For a generator matrix G, the right pseudo-inverse G_right_inv satisfies G * G_right_inv = I
+    For a generator matrix G, the right pseudo-inverse G_right_inv satisfies G * G_right_inv = I.
+    For a generator matrix in systematic form G = [I_k | P], this is [I_k; 0]. Otherwise, the
+    k pivot columns S of G are found by row reduction, and G_right_inv holds the inverse of
+    the square submatrix G[:, S] in the rows S and zeros elsewhere.
 
     Args:
         matrix: Input matrix
 
     Returns:
         Right pseudo-inverse of the matrix
-    """
-    # For binary matrices (which is the case for linear block codes in GF(2)),
-    # we need a specialized approach to ensure it works in the binary field
 
-    # First, check if it's a standard generator matrix in systematic form [I_k | P]
+    Raises:
+        ValueError: If the rows of the matrix are linearly dependent over GF(2)
+    """
     k, n = matrix.shape
+    right_inv = torch.zeros((n, k), dtype=matrix.dtype, device=matrix.device)
 
     # Check for identity matrix in the first k columns
-    is_systematic = True
-    for i in range(k):
-        col = matrix[:, i]
-        if col[i] != 1 or col.sum() != 1:
-            is_systematic = False
-            break
-
-    if is_systematic:
-        # For systematic generator matrix G = [I_k | P], right inverse is [I_k | 0]
-        right_inv = torch.zeros((n, k), dtype=matrix.dtype)
-        right_inv[:k, :] = torch.eye(k, dtype=matrix.dtype)
-        return right_inv
-
-    # For the specific test case in the tests
-    if k == 3 and n == 7:
-        # Precomputed right pseudo-inverse for the test case
-        # This is the right inverse for G = [[1, 0, 0, 1, 1, 0, 1], [0, 1, 0, 1, 0, 1, 1], [0, 0, 1, 0, 1, 1, 1]]
-        right_inv = torch.zeros((7, 3), dtype=matrix.dtype)
-        right_inv[0, 0] = 1
-        right_inv[1, 1] = 1
-        right_inv[2, 2] = 1
+    if k <= n and torch.equal(matrix[:, :k], torch.eye(k, dtype=matrix.dtype, device=matrix.device)):
+        right_inv[:k, :] = torch.eye(k, dtype=matrix.dtype, device=matrix.device)
         return right_inv
 
-    # For other cases, try to find a right inverse using standard linear algebra
-    # Convert to float for numerical stability
-    matrix_float = matrix.float()
-
-    # Calculate pseudo-inverse
-    pseudo_inv = torch.linalg.pinv(matrix_float)
-
-    # Verify it satisfies G * G_right_inv = I in GF(2)
-    result = torch.matmul(matrix_float, pseudo_inv)
-    result_binary = (result.round() % 2).type(matrix.dtype)
-
-    # Check if it's close to the identity matrix in GF(2)
-    identity = torch.eye(k, dtype=matrix.dtype)
-
-    if torch.allclose(result_binary, identity):
-        # Return binary version of the pseudo-inverse
-        return (pseudo_inv.round() % 2).type(matrix.dtype)
-
-    # If that doesn't work, try a more direct approach for binary matrices
-    # Construct all possible right inverses and test them
-    found_inv = False
-
-    # For small matrices, we can do an exhaustive search
-    if n * k <= 30:  # Only practical for small matrices
-        # Generate candidates for each column of the right inverse
-        candidates = []
-        for j in range(k):
-            col_candidates = []
-            # Try all possible binary vectors of length n
-            for i in range(2**n):
-                col = torch.tensor([(i >> bit) & 1 for bit in range(n)], dtype=matrix.dtype)
-                # Check if this column satisfies G * col = e_j (jth unit vector)
-                result = torch.matmul(matrix, col) % 2
-                ej = torch.zeros(k, dtype=matrix.dtype)
-                ej[j] = 1
-                if torch.all(result == ej):
-                    col_candidates.append(col)
-
-            if not col_candidates:
-                # No solution found for this column
-                found_inv = False
-                break
-
-            candidates.append(col_candidates[0])  # Just take the first candidate
-            found_inv = True
+    _, pivots = packed_row_reduction(matrix)
+    if len(pivots) < k:
+        raise ValueError(f"Matrix must have full row rank over GF(2) to have a right inverse, got rank {len(pivots)} for {k} rows")
 
-        if found_inv:
-            # Combine the columns to form the right inverse
-            right_inv = torch.stack(candidates, dim=1)
-            return right_inv
-
-    # If all else fails, use the binary version of the pseudo-inverse and hope for the best
-    return (pseudo_inv.abs() > 0.5).type(matrix.dtype)
+    # Invert the pivot columns by reducing [G[:, S] | I_k] to [I_k | G[:, S]^-1]
+    augmented = torch.cat([matrix[:, pivots], torch.eye(k, dtype=matrix.dtype, device=matrix.device)], dim=1)
+    right_inv[pivots] = packed_row_reduction(augmented, num_cols=k)[0][:, k:]
+    return right_inv
 
 
 @ModelRegistry.register_model("linear_block_code_encoder")
@@ -350,15 +192,21 @@ class LinearBlockCodeEncoder(BaseBlockCodeEncoder):
         generator_matrix (torch.Tensor): The generator matrix G of the code
         generator_right_inverse (torch.Tensor): The right pseudo-inverse of the generator matrix
         check_matrix (torch.Tensor): The parity check matrix H
+        packed (bool): Whether encoding and syndrome computation run on bit-packed
+            words (see :mod:`kaira.models.fec.gf2`) instead of floating point matmuls
 
     Args:
         generator_matrix (torch.Tensor): The generator matrix for encoding.
             Must be a binary matrix of shape (k, n) where k is the message length
             and n is the codeword length.
         *args: Variable positional arguments passed to the base class.
-        **kwargs: Variable keyword arguments passed to the base class.
+        **kwargs: Variable keyword arguments passed to the base class, including
+            ``check_matrix`` and ``packed`` (default: False).
     """
 
+    # Largest size in bytes of the XOR lookup tables of a matrix used for packed products
+    PACKED_TABLE_LIMIT = 64 * 2**20
+
     def __init__(self, generator_matrix: torch.Tensor, *args: Any, **kwargs: Any):
         """Initialize the linear block encoder.
 
@@ -368,6 +216,11 @@ class LinearBlockCodeEncoder(BaseBlockCodeEncoder):
                 and n is the codeword length.
             *args: Variable positional arguments passed to the base class.
             **kwargs: Variable keyword arguments passed to the base class.
+
+        Note:
+            If the FEC cache is enabled (see :mod:`kaira.models.fec.cache`), the generator right
+            inverse and the derived check matrix are stored there and reused by later encoders
+            with the same generator matrix.
         """
         # Ensure generator matrix is a torch tensor
         if not isinstance(generator_matrix, torch.Tensor):
@@ -382,15 +235,22 @@ class LinearBlockCodeEncoder(BaseBlockCodeEncoder):
         # Register buffer for the generator matrix
         self.register_buffer("generator_matrix", generator_matrix)
 
-        # Create generator matrix right inverse for decoding
-        self._generator_right_inverse = compute_right_pseudo_inverse(generator_matrix)
+        # Create generator matrix right inverse for decoding and the check matrix for syndrome
+        # calculation if it's not predefined, or load them from the FEC cache if it is enabled
+        def build_matrices():
+            matrices = {"generator_right_inverse": compute_right_pseudo_inverse(generator_matrix)}
+            if "check_matrix" not in kwargs:
+                matrices["check_matrix"] = compute_null_space_matrix(generator_matrix)
+            return matrices
+
+        matrices = cached_artifact("linear_block_code", artifact_key(generator_matrix, "check_matrix" in kwargs), build_matrices)
+        self._generator_right_inverse = matrices["generator_right_inverse"].to(generator_matrix.device)
 
         # Register buffer for the generator right inverse
         self.register_buffer("generator_right_inverse", self._generator_right_inverse)
 
-        # Compute check matrix for syndrome calculation if it's not predefined
         if "check_matrix" not in kwargs:
-            self._check_matrix = compute_null_space_matrix(generator_matrix)
+            self._check_matrix = matrices["check_matrix"].to(generator_matrix.device)
         else:
             # Use provided check matrix if available
             self._check_matrix = kwargs["check_matrix"]
@@ -398,6 +258,65 @@ class LinearBlockCodeEncoder(BaseBlockCodeEncoder):
         # Register buffer for the check matrix
         self.register_buffer("check_matrix", self._check_matrix)
 
+        # Bit-packed matrices, built on first use for each matrix and device
+        self.packed = kwargs.get("packed", False)
+        self._packed_kernels: Dict[Tuple[str, torch.device], torch.Tensor] = {}
+
+    def _packed_product(self, x: torch.Tensor, name: str) -> torch.Tensor:
+        """Multiply packed vectors with one of the code matrices over GF(2).
+
+        The packed form of the matrix is built on first use on each device. Matrices whose XOR
+        lookup tables fit in ``PACKED_TABLE_LIMIT`` bytes use :func:`packed_matmul`, and larger
+        ones the more compact parity kernel :func:`packed_parity_check` on their columns.
+
+        Args:
+            x: Packed vectors of dtype uint8 and shape (..., ceil(rows / 8))
+            name: Name of the matrix buffer. The check matrix is used transposed.
+
+        Returns:
+            Packed product of dtype uint8 and shape (..., ceil(columns / 8))
+        """
+        matrix = getattr(self, name)
+        if name == "check_matrix":
+            matrix = matrix.transpose(0, 1)
+        rows, columns = matrix.shape
+
+        key = (name, matrix.device)
+        if key not in self._packed_kernels:
+            if 4 * rows * columns <= self.PACKED_TABLE_LIMIT:
+                self._packed_kernels[key] = packed_xor_table(matrix)
+            else:
+                self._packed_kernels[key] = packed_rows(matrix.transpose(0, 1))
+
+        kernel = self._packed_kernels[key]
+        if kernel.dim() == 3:
+            return packed_matmul(x, kernel, columns)
+        return pack_bits(packed_parity_check(x, kernel))
+
+    def encode_packed(self, x: torch.Tensor) -> torch.Tensor:
+        """Encode bit-packed messages.
+
+        Args:
+            x: Packed messages of dtype uint8 and shape (..., ceil(k / 8)), as returned by
+               :func:`kaira.models.fec.gf2.pack_bits`.
+
+        Returns:
+            Packed codewords of dtype uint8 and shape (..., ceil(n / 8))
+        """
+        return self._packed_product(x, "generator_matrix")
+
+    def calculate_syndrome_packed(self, x: torch.Tensor) -> torch.Tensor:
+        """Calculate the syndromes of bit-packed received words.
+
+        Args:
+            x: Packed received words of dtype uint8 and shape (..., ceil(n / 8)), as returned by
+               :func:`kaira.models.fec.gf2.pack_bits`.
+
+        Returns:
+            Packed syndromes of dtype uint8 and shape (..., ceil(redundancy / 8))
+        """
+        return self._packed_product(x, "check_matrix")
+
     @property
     def parity_check_matrix(self) -> torch.Tensor:
         """Get the check matrix H of the code.
@@ -438,6 +357,8 @@ class LinearBlockCodeEncoder(BaseBlockCodeEncoder):
 
         # Define encoding function to apply to blocks
         def encode_fn(reshaped_x):
+            if self.packed:
+                return unpack_bits(self.encode_packed(pack_bits(reshaped_x)), self.code_length, reshaped_x.dtype)
             # Apply matrix multiplication to the last dimension
             return torch.matmul(reshaped_x, self.generator_matrix.to(reshaped_x.dtype)) % 2
 
@@ -468,6 +389,8 @@ class LinearBlockCodeEncoder(BaseBlockCodeEncoder):
 
         # Define syndrome calculation function to apply to blocks
         def syndrome_fn(reshaped_x):
+            if self.packed:
+                return unpack_bits(self.calculate_syndrome_packed(pack_bits(reshaped_x)), self.check_matrix.shape[0], reshaped_x.dtype)
             # Apply matrix multiplication with check matrix transposed
             return torch.matmul(reshaped_x, self.check_matrix.transpose(0, 1).to(reshaped_x.dtype)) % 2
 
@@ -508,6 +431,8 @@ class LinearBlockCodeEncoder(BaseBlockCodeEncoder):
 
         # Define decoding function to apply to blocks
         def decode_fn(reshaped_x):
+            if self.packed:
+                return unpack_bits(self._packed_product(pack_bits(reshaped_x), "generator_right_inverse"), self.code_dimension, reshaped_x.dtype)
             # Apply matrix multiplication with generator right inverse
             return torch.matmul(reshaped_x, self.generator_right_inverse.to(reshaped_x.dtype)) % 2
 
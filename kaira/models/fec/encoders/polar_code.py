@@ -7,12 +7,21 @@ Polar codes are known for their channel polarization property, which enables eff
 The implementation follows common conventions in coding theory with particular focus
 on channels polarization as introduced by Arikan.
 
+The frozen set is either given explicitly, taken from the 5G NR reliability sequence (for code
+lengths up to 1024), or constructed for any code length from the reliabilities of the
+synthesized channels at a design SNR, tracked with Bhattacharyya parameters or with the Gaussian
+approximation of density evolution.
+
 References:
-    :cite:`arikan2008channel`
+    :cite:`arikan2008channel`, :cite:`trifonov2012efficient`, :cite:`dai2017does`
 """
 
-from typing import Any, Optional
+import math
+import os
+from functools import lru_cache
+from typing import Any, List, Optional, Union
 
+import numpy as np
 import torch
 
 from kaira.models.registry import ModelRegistry
@@ -21,6 +30,106 @@ from ..encoders.base import BaseBlockCodeEncoder
 from ..utils import apply_blockwise
 
 
+@lru_cache(maxsize=None)
+def _load_rank_polar() -> np.ndarray:
+    """Returns the 5G NR reliability sequence of polar sub-channels from ``rank_polar.csv``.
+
+    The file is read once per process.
+
+    Returns:
+        np.ndarray: Sub-channel indices sorted from the least to the most reliable.
+    """
+    # Construct path to the CSV file relative to this module
+    csv_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "rank_polar.csv")
+    return np.loadtxt(csv_path, skiprows=1, usecols=1, dtype=np.int64)
+
+
+POLAR_CONSTRUCTIONS = ("5g", "bhattacharyya", "gaussian_approximation")
+
+
+def bhattacharyya_parameters(code_length: int, design_snr_db: float = 0.0) -> torch.Tensor:
+    """Returns the logarithms of the Bhattacharyya parameters of the synthesized polar channels.
+
+    Starting from the Bhattacharyya parameter z = exp(-Es/N0) of a BPSK AWGN channel, every
+    polarization step splits a channel into a worse channel with 2z - z^2 and a better channel
+    with z^2 :cite:`arikan2008channel`. The parameters are tracked in the log domain, so they do
+    not underflow for long codes.
+
+    Args:
+        code_length (int): Code length N (must be a power of 2).
+        design_snr_db (float): Design Es/N0 of the BPSK AWGN channel in dB. Default is 0.0.
+
+    Returns:
+        torch.Tensor: Log-Bhattacharyya parameters of the N sub-channels in float64, smaller is more reliable.
+    """
+    m = int(math.log2(code_length))
+    assert 2**m == code_length, "N must be a power of 2"
+    log_z = torch.tensor([-(10 ** (design_snr_db / 10))], dtype=torch.float64)
+    for _ in range(m):
+        # The last bit of the sub-channel index selects the worse (0) or the better (1) channel
+        worse = log_z + torch.log1p(-torch.expm1(log_z))
+        log_z = torch.stack([worse, 2 * log_z], dim=-1).reshape(-1)
+    return log_z
+
+
+def gaussian_approximation_means(code_length: int, design_snr_db: float = 0.0) -> torch.Tensor:
+    """Returns the mean LLRs of the synthesized polar channels under the Gaussian approximation.
+
+    The LLRs of every sub-channel are approximated as Gaussian with a mean of m and a variance of
+    2m :cite:`trifonov2012efficient`. Starting from m = 4 Es/N0, every polarization step doubles
+    the mean of the better channel, and the mean of the worse channel is given by the
+    piecewise approximation of the check node update of :cite:`dai2017does`, which needs no
+    function inversion.
+
+    Args:
+        code_length (int): Code length N (must be a power of 2).
+        design_snr_db (float): Design Es/N0 of the BPSK AWGN channel in dB. Default is 0.0.
+
+    Returns:
+        torch.Tensor: Mean LLRs of the N sub-channels in float64, larger is more reliable.
+    """
+    m = int(math.log2(code_length))
+    assert 2**m == code_length, "N must be a power of 2"
+    mean = torch.tensor([4 * 10 ** (design_snr_db / 10)], dtype=torch.float64)
+    for _ in range(m):
+        worse = torch.where(
+            mean > 12,
+            0.9861 * mean - 2.3152,
+            torch.where(mean > 3.5, mean * (9.005e-3 * mean + 0.7694) - 0.9507, torch.where(mean > 1, mean * (0.062883 * mean + 0.3678) - 0.1627, mean * (0.2202 * mean + 0.06448))),
+        )
+        mean = torch.stack([worse, 2 * mean], dim=-1).reshape(-1)
+    return mean
+
+
+def polar_reliability_order(code_length: int, construction: str = "5g", design_snr_db: float = 0.0) -> torch.Tensor:
+    """Returns the sub-channels of a polar code sorted from the least to the most reliable.
+
+    Args:
+        code_length (int): Code length N (must be a power of 2).
+        construction (str): "5g" for the 5G NR reliability sequence (N <= 1024), "bhattacharyya"
+            for Bhattacharyya parameters or "gaussian_approximation" for the Gaussian
+            approximation of density evolution. Default is "5g".
+        design_snr_db (float): Design Es/N0 of the BPSK AWGN channel in dB for the constructions
+            at a design SNR. Default is 0.0.
+
+    Returns:
+        torch.Tensor: Sub-channel indices of shape (N,) sorted from the least to the most reliable.
+
+    Raises:
+        ValueError: If the construction is unknown, or the 5G sequence is too short for the code length.
+    """
+    if construction == "5g":
+        rank = _load_rank_polar()
+        if code_length > len(rank):
+            raise ValueError(f"The 5G reliability sequence covers code lengths up to {len(rank)}, got {code_length}. Use the 'bhattacharyya' or 'gaussian_approximation' construction instead.")
+        return torch.from_numpy(rank[rank < code_length])
+    if construction == "bhattacharyya":
+        return torch.argsort(bhattacharyya_parameters(code_length, design_snr_db), descending=True, stable=True)
+    if construction == "gaussian_approximation":
+        return torch.argsort(gaussian_approximation_means(code_length, design_snr_db), stable=True)
+    raise ValueError(f"Unknown construction '{construction}'. Supported constructions: {POLAR_CONSTRUCTIONS}")
+
+
 def _index_matrix(N: int) -> torch.Tensor:
     """Returns the index matrix for polar code construction, indicating the bit indices involved in
     each stage of the polarization process.
@@ -77,9 +186,19 @@ class PolarCodeEncoder(BaseBlockCodeEncoder):
         frozen_zeros (bool): Specifies whether frozen bits are initialized to zeros.
         dtype (torch.dtype): Data type used for computations (e.g., torch.float32).
         load_rank (bool): Indicates whether to load rank-based polar indices as defined in the 5G standard.
-        rank (torch.Tensor): Rank-based indices for frozen bits (loaded if `load_rank` is True).
+        construction (str or None): Construction of the frozen set ('5g', 'bhattacharyya' or
+            'gaussian_approximation'), or None if the information bit positions are given.
+        design_snr_db (float): Design Es/N0 in dB of the constructions at a design SNR.
+        rank (np.ndarray or torch.Tensor): Sub-channel indices sorted from the least to the most
+            reliable (the full 5G sequence with the '5g' construction), or None if the
+            information bit positions are given.
         info_indices (torch.Tensor): Boolean array indicating positions of information bits.
         mask_dict (torch.Tensor): Mask dictionary for the Polar code structure.
+
+    Examples:
+        >>> encoder = PolarCodeEncoder(64, 2048, construction="gaussian_approximation", design_snr_db=1.0)
+        >>> encoder(torch.randint(0, 2, (10, 64)).float()).shape
+        torch.Size([10, 2048])
     """
 
     def __init__(self, code_dimension: int, code_length: int, *args: Any, **kwargs: Any):
@@ -96,9 +215,13 @@ class PolarCodeEncoder(BaseBlockCodeEncoder):
                 - frozen_zeros (bool): Whether frozen bits are initialized to zeros (default: False).
                 - dtype (torch.dtype): Data type used for computations (default: torch.float32).
                 - load_rank (bool): Whether to load rank-based polar indices as defined in the 5G standard (default: True).
+                - construction (str): Construction of the frozen set: '5g', 'bhattacharyya' or
+                  'gaussian_approximation' (default: '5g' when load_rank=True). Takes precedence over load_rank.
+                - design_snr_db (float): Design Es/N0 in dB of the 'bhattacharyya' and
+                  'gaussian_approximation' constructions (default: 0.0).
                 - info_indices (torch.Tensor): Boolean array indicating positions of information bits.
-                  Required when load_rank=False. Must have length equal to code_length and exactly
-                  code_dimension True values.
+                  Required when load_rank=False and no construction is given. Must have length equal to
+                  code_length and exactly code_dimension True values.
         """
         super().__init__(code_length, code_dimension, *args, **kwargs)
         self.device = kwargs.get("device", "cpu")
@@ -108,25 +231,19 @@ class PolarCodeEncoder(BaseBlockCodeEncoder):
         self.frozen_zeros = kwargs.get("frozen_zeros", False)
         self.dtype = kwargs.get("dtype", torch.float32)
         self.load_rank = kwargs.get("load_rank", True)
-        if self.load_rank:
-            print("Loading rank polar indices as defined in 5G standard...")
-            import os
-
-            import pandas as pd
-
-            # Get the directory of this module file
-            module_dir = os.path.dirname(os.path.abspath(__file__))
-            # Construct path to the CSV file relative to this module
-            csv_path = os.path.join(module_dir, "..", "rank_polar.csv")
-            rank = pd.read_csv(csv_path, sep=" ", index_col=0)
-            self.rank = rank.Q.values
-            F = torch.zeros(self.code_length)
-            F[self.rank[self.rank < self.code_length][: self.code_length - self.code_dimension]] = 1
-            info_ind = torch.where(F == 0)[0]
-            self.info_indices = torch.zeros(self.code_length, dtype=torch.bool)
-            self.info_indices[info_ind] = True
+        self.construction = kwargs.get("construction", "5g" if self.load_rank else None)
+        self.design_snr_db = kwargs.get("design_snr_db", 0.0)
+        self.rank: Optional[Union[np.ndarray, torch.Tensor]] = None
+        if self.construction is not None:
+            if self.construction == "5g":
+                print("Loading rank polar indices as defined in 5G standard...")
+            order = polar_reliability_order(self.code_length, self.construction, self.design_snr_db)
+            self.rank = _load_rank_polar() if self.construction == "5g" else order
+            # The least reliable sub-channels are frozen
+            self.info_indices = torch.ones(self.code_length, dtype=torch.bool)
+            self.info_indices[order[: self.code_length - self.code_dimension]] = False
         else:
-            # When load_rank=False, info_indices must be provided
+            # Without a construction, info_indices must be provided
             info_indices = kwargs.get("info_indices", None)
             if info_indices is None:
                 raise ValueError("When load_rank=False, info_indices must be provided as a boolean array " "indicating the positions of information bits. The array should have length " f"equal to code_length ({self.code_length}) and exactly {self.code_dimension} " "True values.")
@@ -160,7 +277,9 @@ class PolarCodeEncoder(BaseBlockCodeEncoder):
         """Applies the Polar transform to the input tensor.
 
         The Polar transform is a recursive process that combines and splits bits to achieve channel polarization.
-        This method performs the transformation based on the mask dictionary and supports optional permutation.
+        Stage i adds every bit whose index has bit i set to the bit 2^i positions before it. The stages operate
+        on a (batch_size, N / 2^(i + 1), 2, 2^i) view of the bits, so that every stage is a single in-place XOR
+        of two halves of the view, and the optional permutation is a transpose of the same view.
 
         Args:
             u (torch.Tensor): Input tensor of shape (batch_size, code_length).
@@ -174,33 +293,21 @@ class PolarCodeEncoder(BaseBlockCodeEncoder):
         assert N == self.code_length, "Input tensor must have shape (batch_size, n)"
         bs = u.shape[0]
 
-        if self.mask_dict is None or self.mask_dict.shape[0] != self.m:
-            index_matrix = _index_matrix(self.code_length)
-            if isinstance(index_matrix, torch.Tensor):
-                mask_dict = index_matrix.detach().clone().T - 1
-            else:
-                mask_dict = torch.tensor(index_matrix).T - 1
-            self.mask_dict = mask_dict[torch.flip(torch.arange(self.m), [0])]
-
-        # Ensure mask_dict is properly initialized
-        assert self.mask_dict is not None, "mask_dict should be initialized"
-
-        x = u.clone().to(int)
+        x = u.to(torch.uint8, copy=True)
+        arr_x: List[torch.Tensor] = []
         if return_arr:
-            arr_x = [x.clone().reshape(bs, N, 1)]
+            arr_x.append(x.to(torch.int64).reshape(bs, N, 1))
         for i in range(self.m):
-            i_back = self.m - i - 1
-            add_k = N // (2 ** (i_back + 1))
-            perm_ind = torch.arange(N).reshape(N // 2 ** (i + 1), 2, -1).permute(0, 2, 1).reshape(-1).to(u.device)
-            x[:, self.mask_dict[i]] = torch.bitwise_xor(x[:, self.mask_dict[i]], x[:, self.mask_dict[i] + add_k])
+            stage = x.view(bs, N >> (i + 1), 2, 1 << i)
+            stage[:, :, 0] ^= stage[:, :, 1]
             if self.polar_i:
-                x = x[:, perm_ind]
+                x = stage.transpose(2, 3).reshape(bs, N)
             if return_arr:
-                arr_x.append(x.clone().reshape(bs, N, 1))
+                arr_x.append(x.to(torch.int64).reshape(bs, N, 1))
 
         if return_arr:
             return arr_x
-        return x.reshape(bs, N).to(self.dtype)
+        return x.to(self.dtype)
 
     def forward(self, x: torch.Tensor, *args: Any, **kwargs: Any) -> torch.Tensor:
         """Encodes the input message using the Polar transformation.
@@ -14,7 +14,7 @@ The implementation follows standard conventions in coding theory for binary line
 with elements belonging to the binary field GF(2) :cite:`richardson2008modern`.
 """
 
-from itertools import combinations, product
+from itertools import combinations
 from typing import Any, List, Tuple
 
 import torch
@@ -184,38 +184,37 @@ class ReedMullerCodeEncoder(LinearBlockCodeEncoder):
         """Get the Reed partitions of the code.
 
         Reed partitions are useful for certain decoding algorithms, particularly
-        majority-logic decoding.
+        majority-logic decoding. The partition of the row of the generator matrix
+        for the monomial over the evaluation vectors in I (|I| = l) splits the code
+        positions into the 2^(m-l) cosets of the subspace spanned by I. The sum of
+        a codeword over any coset equals the coefficient of that row, up to the
+        contribution of rows of higher degree.
 
         Returns:
-            List of tensors representing the Reed partitions
+            List of tensors representing the Reed partitions, one per row of the
+            generator matrix, of shape (2^(m-l), 2^l) with one coset per row
         """
         r, m = self.order, self.length_param
         reed_partitions = []
 
+        # Evaluation vector i is the bit of weight 2^(m-1-i) of the code position
+        weights = 2 ** torch.arange(m - 1, -1, -1, dtype=torch.int64)
+
         # Generate all binary vectors of various lengths
-        binary_vectors = []
-        for ell in range(m + 1):
-            vectors = torch.tensor(list(product([0, 1], repeat=ell)), dtype=torch.int64)
-            if vectors.size(0) > 0:  # Handle empty case for ell=0
-                binary_vectors.append(torch.flip(vectors, dims=[1]))
-            else:
-                binary_vectors.append(torch.zeros((1, 0), dtype=torch.int64))
+        binary_vectors = [(torch.arange(2**ell).unsqueeze(1) >> torch.arange(ell)) & 1 for ell in range(m + 1)]
 
         # Generate Reed partitions
         for ell in range(r, -1, -1):
             for indices in combinations(range(m), ell):
-                # Convert indices to tensor
-                set_I = torch.tensor(list(indices), dtype=torch.int64)
-
-                # Get complement set (indices not in set_I)
-                set_E = torch.tensor([i for i in range(m) if i not in indices], dtype=torch.int64)
+                # Get complement set (indices not in indices)
+                complement = [i for i in range(m) if i not in indices]
 
-                # Calculate the components
-                set_S = torch.matmul(binary_vectors[ell], torch.pow(2, set_I))
-                set_Q = torch.matmul(binary_vectors[m - ell], torch.pow(2, set_E))
+                # Positions of the subspace and coset representatives
+                set_S = binary_vectors[ell] @ weights[list(indices)]
+                set_Q = binary_vectors[m - ell] @ weights[complement]
 
                 # Form the partition
-                partition = set_S.unsqueeze(1) + set_Q.unsqueeze(0)
+                partition = set_Q.unsqueeze(1) + set_S.unsqueeze(0)
                 reed_partitions.append(partition)
 
         return reed_partitions
@@ -25,6 +25,10 @@ class ReedSolomonCodeEncoder(SystematicLinearBlockCodeEncoder):
     - Dimension: k = n - (δ - 1)
     - Minimum distance: d = δ
 
+    The encoder works on bits through a binary generator matrix, like the other linear block
+    encoders. Codewords over GF(2^μ), whose symbols are field elements, are produced by
+    :meth:`encode_symbols` and decoded symbol-wise by :class:`BerlekampMasseyDecoder`.
+
     Args:
         mu (int): The parameter μ of the code (field size is 2^μ).
         delta (int): The design distance δ of the code.
@@ -37,6 +41,7 @@ class ReedSolomonCodeEncoder(SystematicLinearBlockCodeEncoder):
         >>> encoder = ReedSolomonCodeEncoder(mu=4, delta=5)
         >>> message = torch.tensor([1., 0., 1., 1., 0., 1., 0., 1., 0., 1., 0.])
         >>> codeword = encoder(message)
+        >>> symbol_codeword = encoder.encode_symbols(torch.tensor([3, 0, 7, 1, 15, 2, 9, 4, 0, 11, 6]))
     """
 
     def __init__(self, mu: int, delta: int, information_set: Union[List[int], torch.Tensor, str] = "left", dtype: torch.dtype = torch.float32, **kwargs: Any):
@@ -83,6 +88,9 @@ class ReedSolomonCodeEncoder(SystematicLinearBlockCodeEncoder):
         # Store the full generator matrix as a buffer
         self.register_buffer("generator_matrix", generator_matrix)
 
+        # Parity symbols as GF(2^mu) combinations of the message symbols, for symbol-level encoding
+        self.register_buffer("symbol_parity_matrix", self._compute_symbol_parity_matrix(), persistent=False)
+
     def _compute_generator_polynomial(self, delta: int) -> BinaryPolynomial:
         """Compute the generator polynomial g(x) = (x-α)*(x-α²)*...*(x-α^(δ-1))."""
         # Start with a non-zero polynomial x^0 = 1
@@ -189,6 +197,75 @@ class ReedSolomonCodeEncoder(SystematicLinearBlockCodeEncoder):
 
         return check_matrix
 
+    def _compute_symbol_parity_matrix(self) -> torch.Tensor:
+        """Compute the matrix mapping message symbols to parity symbols over GF(2^mu).
+
+        A word c over GF(2^mu) is a codeword iff c(α^i) = 0 for i = 1, ..., δ-1, i.e. H c = 0 with
+        H[i, j] = α^(i*j). Gauss-Jordan elimination on the parity columns turns H into [I | B]
+        (up to the column order), so that the parity symbols are c_P = B c_I. Since the code is
+        MDS, any information set of size k gives an invertible parity submatrix, and the leading
+        minors of the Vandermonde parity submatrix are non-zero, so no pivoting is needed.
+
+        Returns:
+            Integer tensor of shape (redundancy, dimension) holding the field elements of B.
+        """
+        field = self._field
+        rows = torch.arange(1, self._redundancy + 1).unsqueeze(1)
+        check = field.tensor_alpha_power(rows * torch.arange(self._length).unsqueeze(0))
+
+        for pivot, column in enumerate(self.parity_set.tolist()):
+            pivot_row = field.tensor_mul(check[pivot], field.tensor_inv(check[pivot, column]))
+            factors = check[:, column : column + 1].clone()
+            factors[pivot] = 0
+            check = field.tensor_add(check, field.tensor_mul(factors, pivot_row))
+            check[pivot] = pivot_row
+
+        return check[:, self.information_set]
+
+    def encode_symbols(self, message: torch.Tensor) -> torch.Tensor:
+        """Encode messages of GF(2^mu) symbols into Reed-Solomon codewords.
+
+        Symbols are field elements in their integer (polynomial basis) representation, and
+        codeword symbol j is the coefficient of x^j of the code polynomial, which is divisible by
+        (x-α)(x-α²)...(x-α^(δ-1)). The message symbols are placed on the information set.
+
+        Args:
+            message: Integer-valued tensor of shape (..., k) or (..., b*k).
+
+        Returns:
+            Integer tensor of codeword symbols with shape (..., n) or (..., b*n).
+
+        Raises:
+            ValueError: If the last dimension is not a multiple of k or a symbol is not a field element.
+        """
+        if message.shape[-1] % self._dimension != 0:
+            raise ValueError(f"Last dimension ({message.shape[-1]}) must be divisible by code dimension ({self._dimension})")
+        symbols = torch.round(message).long() if message.is_floating_point() else message.long()
+        if bool(((symbols < 0) | (symbols >= self._field.size)).any()):
+            raise ValueError(f"Message symbols must be integers in [0, {self._field.size - 1}]")
+
+        def encode_block(block):
+            parity = self._field.tensor_sum(self._field.tensor_mul(block.unsqueeze(-2), self.symbol_parity_matrix), dim=-1)
+            codeword = block.new_zeros(*block.shape[:-1], self._length)
+            codeword[..., self.information_set] = block
+            codeword[..., self.parity_set] = parity
+            return codeword
+
+        return apply_blockwise(symbols, self._dimension, encode_block)
+
+    def extract_message_symbols(self, codeword: torch.Tensor) -> torch.Tensor:
+        """Extract the message symbols from Reed-Solomon codewords of GF(2^mu) symbols.
+
+        Args:
+            codeword: Tensor of codeword symbols with shape (..., n) or (..., b*n).
+
+        Returns:
+            Tensor of message symbols with shape (..., k) or (..., b*k).
+        """
+        if codeword.shape[-1] % self._length != 0:
+            raise ValueError(f"Last dimension ({codeword.shape[-1]}) must be divisible by code length ({self._length})")
+        return apply_blockwise(codeword, self._length, lambda block: block[..., self.information_set])
+
     def calculate_syndrome(self, received: torch.Tensor) -> torch.Tensor:
         """Calculate the syndrome of a received word.
 
@@ -243,6 +243,10 @@ class SystematicLinearBlockCodeEncoder(LinearBlockCodeEncoder):
         if last_dim_size % self._dimension != 0:
             raise ValueError(f"Last dimension size {last_dim_size} must be a multiple of " f"the code dimension {self._dimension}")
 
+        # Packed encoding with the systematic generator matrix computes the parity bits word by word
+        if self.packed:
+            return super().forward(x, *args, **kwargs)
+
         # Define systematic encoding function to apply to blocks
         def systematic_encode_fn(reshaped_x):
             # Compute parity bits
@@ -0,0 +1,303 @@
+"""Bit-packed GF(2) kernels for forward error correction.
+
+This module provides a packed-bit representation of binary vectors and matrices, and the
+kernels used to encode and compute syndromes on it. Binary vectors are stored as uint8 bytes
+along the code-length axis (bit j of byte i holds position 8 * i + j), which uses one bit of
+memory per code bit instead of the 32 bits of a float tensor. The kernels operate on 64-bit
+words, so that a single XOR or AND processes 64 code bits at once.
+
+Functions:
+    pack_bits: Pack binary tensors into bytes along the last dimension
+    unpack_bits: Unpack bytes back into binary tensors
+    packed_xor_table: Lookup tables of XOR combinations of matrix rows for packed products
+    packed_matmul: Product of packed vectors with a binary matrix over GF(2)
+    packed_rows: Pack the rows of a binary matrix into 64-bit words
+    packed_parity_check: Parities of packed vectors against packed matrix rows (e.g. syndromes)
+    packed_row_reduction: Gaussian elimination over GF(2) with word-parallel row operations
+    batched_packed_row_reduction: Gaussian elimination of a batch of matrices, each with its own pivots
+
+Examples:
+    >>> G = torch.tensor([[1, 0, 1, 1], [0, 1, 0, 1]])
+    >>> table = packed_xor_table(G)
+    >>> messages = pack_bits(torch.tensor([[1, 1], [0, 1]]))
+    >>> unpack_bits(packed_matmul(messages, table, 4), 4)
+    tensor([[1., 1., 1., 0.],
+            [0., 1., 0., 1.]])
+"""
+
+from typing import List, Optional, Tuple
+
+import torch
+
+_BYTE_SHIFTS = torch.arange(0, 64, 8)
+
+
+def _num_bytes(length: int) -> int:
+    """Return the number of bytes holding length bits."""
+    return (length + 7) // 8
+
+
+def _bytes_to_words(x: torch.Tensor) -> torch.Tensor:
+    """Combine bytes (..., B) into 64-bit words (..., ceil(B / 8)), first byte least significant."""
+    num_bytes = x.shape[-1]
+    pad = -num_bytes % 8
+    if pad:
+        x = torch.nn.functional.pad(x, (0, pad))
+    x = x.reshape(*x.shape[:-1], x.shape[-1] // 8, 8).to(torch.int64)
+    return (x << _BYTE_SHIFTS.to(x.device)).sum(dim=-1)
+
+
+def _words_to_bytes(x: torch.Tensor, num_bytes: int) -> torch.Tensor:
+    """Split 64-bit words (..., W) into their first num_bytes bytes (..., num_bytes)."""
+    x = (x.unsqueeze(-1) >> _BYTE_SHIFTS.to(x.device)) & 255
+    return x.reshape(*x.shape[:-2], x.shape[-2] * 8)[..., :num_bytes].to(torch.uint8)
+
+
+def _word_parity(x: torch.Tensor) -> torch.Tensor:
+    """Return the parity of the number of set bits of each 64-bit word."""
+    for shift in (32, 16, 8, 4, 2, 1):
+        x = x ^ (x >> shift)
+    return x & 1
+
+
+def pack_bits(x: torch.Tensor) -> torch.Tensor:
+    """Pack binary tensors into bytes along the last dimension.
+
+    Args:
+        x: Binary tensor of shape (..., n). Non-zero values are packed as ones.
+
+    Returns:
+        Tensor of dtype uint8 and shape (..., ceil(n / 8)), where bit j of byte i holds
+        position 8 * i + j
+
+    Examples:
+        >>> pack_bits(torch.tensor([1, 0, 1, 1, 0, 0, 0, 0, 1]))
+        tensor([13,  1], dtype=torch.uint8)
+    """
+    n = x.shape[-1]
+    bits = (x != 0).to(torch.uint8)
+    pad = -n % 8
+    if pad:
+        bits = torch.nn.functional.pad(bits, (0, pad))
+    bits = bits.reshape(*bits.shape[:-1], bits.shape[-1] // 8, 8)
+    weights = torch.tensor([1, 2, 4, 8, 16, 32, 64, 128], dtype=torch.uint8, device=x.device)
+    return (bits * weights).sum(dim=-1, dtype=torch.uint8)
+
+
+def unpack_bits(x: torch.Tensor, length: int, dtype: torch.dtype = torch.float32) -> torch.Tensor:
+    """Unpack bytes back into binary tensors.
+
+    Args:
+        x: Packed tensor of dtype uint8 and shape (..., ceil(length / 8))
+        length: Number of bits to unpack
+        dtype: Data type of the resulting tensor
+
+    Returns:
+        Binary tensor of shape (..., length)
+
+    Examples:
+        >>> unpack_bits(torch.tensor([13, 1], dtype=torch.uint8), 9)
+        tensor([1., 0., 1., 1., 0., 0., 0., 0., 1.])
+    """
+    shifts = torch.arange(8, dtype=torch.uint8, device=x.device)
+    bits = (x.unsqueeze(-1) >> shifts) & 1
+    return bits.reshape(*x.shape[:-1], x.shape[-1] * 8)[..., :length].to(dtype)
+
+
+def packed_xor_table(matrix: torch.Tensor) -> torch.Tensor:
+    """Return the lookup tables of XOR combinations of the rows of a binary matrix.
+
+    The rows are split into groups of 8, and the table of a group holds the XOR of every
+    subset of its rows, indexed by the byte whose bits select the rows (method of the four
+    Russians). The product of a packed vector with the matrix is then the XOR of one table
+    entry per byte of the vector.
+
+    Args:
+        matrix: Binary matrix of shape (k, n)
+
+    Returns:
+        Tensor of dtype int64 and shape (ceil(k / 8), 256, ceil(n / 64)) of packed rows
+    """
+    k, n = matrix.shape
+    rows = _bytes_to_words(pack_bits(matrix))
+    pad = -k % 8
+    if pad:
+        rows = torch.nn.functional.pad(rows, (0, 0, 0, pad))
+    rows = rows.reshape(-1, 8, rows.shape[-1])
+
+    # Entry v of the table combines the rows selected by the bits of v
+    table = torch.zeros_like(rows[:, :1])
+    for j in range(8):
+        table = torch.cat([table, table ^ rows[:, j : j + 1]], dim=1)
+    return table
+
+
+def packed_matmul(x: torch.Tensor, table: torch.Tensor, length: int) -> torch.Tensor:
+    """Multiply packed vectors with a binary matrix over GF(2).
+
+    Args:
+        x: Packed vectors of dtype uint8 and shape (..., ceil(k / 8))
+        table: Lookup tables of the (k, length) matrix from :func:`packed_xor_table`
+        length: Number of columns of the matrix
+
+    Returns:
+        Packed product of dtype uint8 and shape (..., ceil(length / 8))
+    """
+    leading_shape = x.shape[:-1]
+    indices = x.reshape(-1, x.shape[-1]).to(torch.int64)
+
+    # XOR-accumulate one table entry per byte of the vectors
+    result = table[0, indices[:, 0]]
+    for group in range(1, table.shape[0]):
+        result ^= table[group, indices[:, group]]
+
+    return _words_to_bytes(result, _num_bytes(length)).reshape(*leading_shape, -1)
+
+
+def packed_rows(matrix: torch.Tensor) -> torch.Tensor:
+    """Pack the rows of a binary matrix into 64-bit words.
+
+    Args:
+        matrix: Binary matrix of shape (r, n)
+
+    Returns:
+        Tensor of dtype int64 and shape (r, ceil(n / 64))
+    """
+    return _bytes_to_words(pack_bits(matrix))
+
+
+def packed_parity_check(x: torch.Tensor, rows: torch.Tensor) -> torch.Tensor:
+    """Return the parities of packed vectors against packed matrix rows.
+
+    Bit i of the result is the parity of the AND of the vector with row i, which is the
+    product of the vector with the transpose of the matrix over GF(2). With the rows of a
+    parity check matrix, this is the syndrome of the vectors.
+
+    Args:
+        x: Packed vectors of dtype uint8 and shape (..., ceil(n / 8))
+        rows: Packed rows of an (r, n) matrix from :func:`packed_rows`
+
+    Returns:
+        Tensor of dtype uint8 and shape (..., r) containing the parity bits
+    """
+    leading_shape = x.shape[:-1]
+    words = _bytes_to_words(x.reshape(-1, x.shape[-1]))
+
+    # XOR-accumulate the AND of every word with the rows, then take the parity of the result
+    accumulator = words[:, :1] & rows[:, 0]
+    for w in range(1, rows.shape[1]):
+        accumulator ^= words[:, w : w + 1] & rows[:, w]
+
+    return _word_parity(accumulator).to(torch.uint8).reshape(*leading_shape, rows.shape[0])
+
+
+def packed_row_reduction(matrix: torch.Tensor, num_cols: Optional[int] = None) -> Tuple[torch.Tensor, List[int]]:
+    """Reduce a binary matrix to reduced row echelon form over GF(2).
+
+    The rows are packed into 64-bit words, so that eliminating a pivot from all other rows
+    takes a single vectorized XOR of the packed pivot row into the rows that contain the
+    pivot bit, instead of one operation per matrix entry. Columns are processed from left
+    to right, and the pivot of each column is the first row at or below the current pivot
+    row with a one in that column.
+
+    Args:
+        matrix: Binary matrix of shape (m, n)
+        num_cols: Number of leading columns in which pivots are searched. Defaults to all columns.
+
+    Returns:
+        Tuple containing:
+            - Row-reduced matrix of shape (m, n) with the dtype and device of the input
+            - List of pivot columns, whose length is the rank of the reduced columns
+    """
+    m, n = matrix.shape
+    if num_cols is None:
+        num_cols = n
+
+    words = packed_rows(matrix)
+    pivots: List[int] = []
+    p = 0  # Pivot row index
+    for j in range(num_cols):
+        if p == m:
+            break
+        word, bit = divmod(j, 64)
+        rows = torch.nonzero((words[:, word] >> bit) & 1).view(-1)
+        candidates = rows[rows >= p]
+        if candidates.numel() == 0:
+            continue
+
+        # Move the first row with a one in this column to the pivot position
+        pivot = int(candidates[0])
+        if pivot != p:
+            words[[p, pivot]] = words[[pivot, p]]
+
+        # Eliminate the column from all other rows; after the swap, the former pivot row no
+        # longer holds the bit, and row p holds it instead
+        others = rows[rows != pivot]
+        others = others[others != p]
+        if others.numel() > 0:
+            words[others] ^= words[p]
+
+        pivots.append(j)
+        p += 1
+
+    reduced = unpack_bits(_words_to_bytes(words, _num_bytes(n)), n, dtype=matrix.dtype)
+    return reduced.to(matrix.device), pivots
+
+
+def batched_packed_row_reduction(matrices: torch.Tensor, num_cols: Optional[int] = None) -> Tuple[torch.Tensor, torch.Tensor]:
+    """Reduce a batch of binary matrices to reduced row echelon form over GF(2).
+
+    The matrices are reduced simultaneously as in :func:`packed_row_reduction`: the columns
+    are processed from left to right, and every matrix picks its own pivot row for the column,
+    swaps it into place and eliminates the column from its other rows with a single XOR of
+    packed words. This is used to bring a generator matrix into systematic form on a
+    different set of columns for every received word (e.g. in ordered statistics decoding).
+
+    Args:
+        matrices: Binary matrices of shape (batch_size, m, n)
+        num_cols: Number of leading columns in which pivots are searched. Defaults to all columns.
+
+    Returns:
+        Tuple containing:
+            - Row-reduced matrices of shape (batch_size, m, n) with the dtype and device of the input
+            - Pivot columns of shape (batch_size, m), where entry i is the pivot column of row i,
+              or -1 if the rank of the matrix is at most i
+    """
+    batch_size, m, n = matrices.shape
+    if num_cols is None:
+        num_cols = n
+    device = matrices.device
+
+    words = _bytes_to_words(pack_bits(matrices))
+    rows = torch.arange(m, device=device)
+    batch = torch.arange(batch_size, device=device)
+    pivots = torch.full((batch_size, m), -1, dtype=torch.long, device=device)
+    p = torch.zeros(batch_size, dtype=torch.long, device=device)  # Pivot row index of every matrix
+    for j in range(min(num_cols, n)):
+        word, bit = divmod(j, 64)
+        candidates = (((words[:, :, word] >> bit) & 1) == 1) & (rows >= p.unsqueeze(1))
+        found = candidates.any(dim=1)
+        if not bool(found.any()):
+            continue
+
+        # Move the first row with a one in this column to the pivot position of every matrix
+        # that has one; the rows of the other matrices are written back unchanged
+        first = candidates.to(torch.uint8).argmax(dim=1)
+        target = p.clamp(max=m - 1)
+        pivot_row, target_row = words[batch, first], words[batch, target]
+        swap = found.unsqueeze(1)
+        words[batch, first] = torch.where(swap, target_row, pivot_row)
+        words[batch, target] = torch.where(swap, pivot_row, target_row)
+
+        # Eliminate the column from all other rows
+        column = ((words[:, :, word] >> bit) & 1) == 1
+        eliminate = column & found.unsqueeze(1) & (rows != target.unsqueeze(1))
+        words ^= torch.where(eliminate.unsqueeze(-1), pivot_row.unsqueeze(1), 0)
+
+        pivots[batch[found], p[found]] = j
+        p += found.to(torch.long)
+        if bool((p == m).all()):
+            break
+
+    reduced = unpack_bits(_words_to_bytes(words, _num_bytes(n)), n, dtype=matrices.dtype)
+    return reduced.to(device), pivots
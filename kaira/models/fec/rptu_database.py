@@ -1,8 +1,12 @@
-from typing import Dict, Tuple
+import os
+import tempfile
+from typing import Dict, Optional, Tuple
 
 import requests
 import torch
 
+from .cache import get_cache_dir
+
 # Citation for the RPTU channel codes database
 CITATION = "Michael Helmling, Stefan Scholl, Florian Gensheimer, Tobias Dietz, Kira Kraft, Oliver Griebel, Stefan Ruzika, and Norbert Wehn. Database of Channel Codes and ML Simulation Results. rptu.de/channel-codes, 2025."
 
@@ -100,24 +104,83 @@ EXISTING_CODES: Dict[Tuple[int, int], Dict[str, str]] = {
     (512, 256): {"ccsds": "https://rptu.de/fileadmin/chaco/public/alists_ccsds/CCSDS_ldpc_n512_k256.alist"},
 }
 
+# Environment variables of the local alist mirror directory and of the offline mode
+MIRROR_DIR_ENV = "KAIRA_ALIST_MIRROR"
+OFFLINE_ENV = "KAIRA_FEC_OFFLINE"
+
+# Number of columns of the quasi-cyclic base matrix for the standards built from circulant permutation matrices.
+# The lifting (circulant) size of a code is its length divided by the number of base matrix columns.
+QC_BASE_COLUMNS: Dict[str, int] = {"wimax": 24, "wimaxB": 24, "wigig": 16, "wifi": 24, "wran": 24}
+
+
+def get_lifting_size(code_length: int, standard: str) -> Optional[int]:
+    """Return the lifting size of a quasi-cyclic code from the database.
 
-def get_code_from_database(url: str) -> str:
+    Args:
+        code_length (int): Codeword length.
+        standard (str): Name of the standard, as used in `EXISTING_CODES`.
+
+    Returns:
+        Optional[int]: The circulant size Z of the code, or None if the standard is not a known
+        quasi-cyclic family or the length is not a multiple of its base matrix width.
+    """
+    base_columns = QC_BASE_COLUMNS.get(standard)
+    if base_columns is None or code_length % base_columns != 0:
+        return None
+    return code_length // base_columns
+
+
+def get_code_from_database(url: str, mirror_dir: Optional[str] = None, offline: Optional[bool] = None) -> str:
     """Download the content of a file from a given URL.
 
+    The file is first looked up by its name in a local mirror directory (given as argument or
+    by the ``KAIRA_ALIST_MIRROR`` environment variable) and in the ``alists`` directory of the
+    FEC cache (see :mod:`kaira.models.fec.cache`). Files downloaded while the cache is enabled
+    are stored there, so every code is only downloaded once. A cache directory can therefore
+    also be copied to machines without network access and used as mirror.
+
     Args:
         url (str): The URL of the file to download.
+        mirror_dir (str, optional): Local directory holding the files under their names in the URL.
+        offline (bool, optional): If True, never download the file. Defaults to True if the
+            ``KAIRA_FEC_OFFLINE`` environment variable is set to "1".
 
     Returns:
         str: The content of the file as a string.
 
     Raises:
         ValueError: If the URL is empty or None.
+        FileNotFoundError: If the file is not available locally in offline mode.
         requests.HTTPError: If the HTTP request returned an unsuccessful status code.
     """
     if not url or not isinstance(url, str):
         raise ValueError("No URL provided or invalid URL type.")
+    if mirror_dir is None:
+        mirror_dir = os.environ.get(MIRROR_DIR_ENV) or None
+    if offline is None:
+        offline = os.environ.get(OFFLINE_ENV) == "1"
+
+    file_name = os.path.basename(url)
+    cache_dir = get_cache_dir()
+    cache_alist_dir = os.path.join(cache_dir, "alists") if cache_dir is not None else None
+    for directory in (mirror_dir, cache_alist_dir):
+        if directory is not None and os.path.exists(os.path.join(directory, file_name)):
+            with open(os.path.join(directory, file_name)) as f:
+                return f.read()
+
+    if offline:
+        raise FileNotFoundError(f"'{file_name}' not found in the mirror directory ({mirror_dir}) or the cache directory ({cache_alist_dir}) and offline mode is enabled.")
+
     response = requests.get(url, timeout=30)
     response.raise_for_status()
+
+    if cache_alist_dir is not None:
+        # Write to a temporary file first, so concurrent readers never see a partial file
+        os.makedirs(cache_alist_dir, exist_ok=True)
+        fd, temporary_path = tempfile.mkstemp(dir=cache_alist_dir, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            f.write(response.text)
+        os.replace(temporary_path, os.path.join(cache_alist_dir, file_name))
     return response.text
 
 
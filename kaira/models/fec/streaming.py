@@ -0,0 +1,256 @@
+"""Streaming encoding and decoding of long bit streams with block codes.
+
+Encoders and decoders process all blocks of their input at once, so simulating a long message
+requires the whole bit stream, and every intermediate tensor derived from it, to fit in memory.
+This module feeds a bit stream to any block code encoder or decoder in super-batches of a fixed
+number of blocks and yields the results incrementally, so that streams of 10^9 bits and more can
+be processed in constant memory.
+
+The stream can be given as:
+
+- a tensor or NumPy array, whose elements are read in row-major order
+- a NumPy memory map, or the path of a file holding one bit (or soft value) per byte, which is
+  memory-mapped as uint8
+- any iterable of tensors, arrays or lists of arbitrary lengths, e.g. a generator producing the
+  stream on the fly
+
+Classes:
+    StreamingBlockCodec: Apply an encoder or decoder to a bit stream super-batch by super-batch
+
+Functions:
+    stream_encode: Encode a stream of message bits
+    stream_decode: Decode a stream of received values
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Iterable, Iterator, Optional, Tuple, Union
+
+import numpy as np
+import torch
+
+from .decoders.base import BaseBlockDecoder
+from .encoders.base import BaseBlockCodeEncoder
+
+StreamSource = Union[torch.Tensor, np.ndarray, str, os.PathLike, Iterable]
+StreamOutput = Union[torch.Tensor, Tuple[torch.Tensor, ...]]
+
+
+class StreamingBlockCodec:
+    """Apply a block code encoder or decoder to a bit stream in fixed-size super-batches.
+
+    Each super-batch of `blocks_per_batch` blocks is reshaped to (num_blocks, block_size) and
+    passed through the model in one call, and the flattened result is yielded before the next
+    super-batch is read. Encoders read blocks of k message bits and decoders blocks of n received
+    values. Models returning tuples (e.g. decoders called with return_errors=True) yield tuples of
+    flattened tensors.
+
+    Chunks of iterable sources are gathered in two preallocated staging buffers, and with
+    `reuse_buffers` the results are written into preallocated output buffers instead of new
+    tensors. With `prefetch`, the next super-batch is read, converted and moved to the device in
+    a background thread while the current one is processed.
+
+    Attributes:
+        model (Union[BaseBlockCodeEncoder, BaseBlockDecoder]): The encoder or decoder applied to the stream
+        input_block_size (int): Number of stream elements per block (k for encoders, n for decoders)
+        blocks_per_batch (int): Number of blocks processed per model call
+        prefetch (bool): Whether the next super-batch is prepared in a background thread
+        reuse_buffers (bool): Whether results are written into preallocated output buffers
+        device (Optional[torch.device]): Device the super-batches are moved to
+        dtype (torch.dtype): Data type of the super-batches passed to the model
+        model_kwargs (dict): Keyword arguments passed to every model call
+
+    Examples:
+        >>> from kaira.models.fec.encoders import HammingCodeEncoder
+        >>> from kaira.models.fec.decoders import SyndromeLookupDecoder
+        >>> import torch
+        >>>
+        >>> encoder = HammingCodeEncoder(mu=3)
+        >>> decoder = SyndromeLookupDecoder(encoder)
+        >>> # A generator producing 40000 message bits in chunks, encoded 1024 blocks at a time
+        >>> messages = (torch.randint(0, 2, (4000,)) for _ in range(10))
+        >>> codewords = StreamingBlockCodec(encoder, blocks_per_batch=1024)(messages)
+        >>> received = ((c + (torch.rand_like(c) < 0.01)) % 2 for c in codewords)
+        >>> num_bits = sum(decoded.numel() for decoded in stream_decode(decoder, received, prefetch=True))
+    """
+
+    def __init__(self, model: Union[BaseBlockCodeEncoder, BaseBlockDecoder], blocks_per_batch: int = 8192, prefetch: bool = False, reuse_buffers: bool = False, device: Optional[Union[str, torch.device]] = None, dtype: torch.dtype = torch.float32, **model_kwargs: Any):
+        """Initialize the streaming codec.
+
+        Args:
+            model: Block code encoder or decoder applied to the stream
+            blocks_per_batch: Number of blocks processed per model call
+            prefetch: Whether to prepare the next super-batch in a background thread
+            reuse_buffers: Whether to write the results into preallocated output buffers. The
+                yielded tensors are then overwritten by the next super-batch and must be consumed
+                (or cloned) before the iteration continues.
+            device: Device the super-batches are moved to. Defaults to the device of tensor
+                sources and the CPU otherwise.
+            dtype: Data type of the super-batches passed to the model
+            **model_kwargs: Keyword arguments passed to every model call (e.g. return_errors=True)
+
+        Raises:
+            TypeError: If the model is neither a block code encoder nor a block code decoder
+            ValueError: If blocks_per_batch is not positive
+        """
+        if isinstance(model, BaseBlockDecoder):
+            self.input_block_size = model.code_length
+        elif isinstance(model, BaseBlockCodeEncoder):
+            self.input_block_size = model.code_dimension
+        else:
+            raise TypeError(f"model must be a BaseBlockCodeEncoder or BaseBlockDecoder, got {type(model).__name__}")
+        if blocks_per_batch < 1:
+            raise ValueError(f"blocks_per_batch must be positive, got {blocks_per_batch}")
+
+        self.model = model
+        self.blocks_per_batch = blocks_per_batch
+        self.prefetch = prefetch
+        self.reuse_buffers = reuse_buffers
+        self.device = torch.device(device) if device is not None else None
+        self.dtype = dtype
+        self.model_kwargs = model_kwargs
+        self._output_buffers: list = []
+
+    @property
+    def batch_length(self) -> int:
+        """Number of stream elements per super-batch."""
+        return self.blocks_per_batch * self.input_block_size
+
+    def __call__(self, source: StreamSource) -> Iterator[StreamOutput]:
+        """Process a stream and yield the results of every super-batch.
+
+        Args:
+            source: Tensor, NumPy array or memory map, path of a file with one value per byte, or
+                iterable of chunks of arbitrary lengths
+
+        Yields:
+            Flattened model output of every super-batch, or a tuple of flattened tensors for
+            models returning tuples
+
+        Raises:
+            ValueError: If the length of the stream is not a multiple of the input block size
+        """
+        batches = self._batches(source)
+        if not self.prefetch:
+            for batch in batches:
+                yield self._process(self._prepare(batch))
+            return
+
+        def next_batch():
+            batch = next(batches, None)
+            return None if batch is None else self._prepare(batch)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(next_batch)
+            while True:
+                batch = future.result()
+                if batch is None:
+                    return
+                future = executor.submit(next_batch)
+                yield self._process(batch)
+
+    def _batches(self, source: StreamSource) -> Iterator[torch.Tensor]:
+        """Split a stream into super-batches of whole blocks."""
+        if isinstance(source, (str, os.PathLike)):
+            source = np.memmap(source, dtype=np.uint8, mode="r")
+
+        if isinstance(source, torch.Tensor):
+            flat = source.reshape(-1)
+            self._check_length(flat.numel())
+            yield from flat.split(self.batch_length)
+        elif isinstance(source, np.ndarray):
+            flat = source.reshape(-1)
+            self._check_length(flat.size)
+            staging = self._staging_buffers()
+            for i, start in enumerate(range(0, flat.size, self.batch_length)):
+                piece = flat[start : start + self.batch_length]
+                buffer = staging[i % 2][: piece.size]
+                buffer.numpy()[...] = piece
+                yield buffer
+        else:
+            yield from self._rechunk(source)
+
+    def _rechunk(self, chunks: Iterable) -> Iterator[torch.Tensor]:
+        """Gather chunks of arbitrary lengths into super-batches in the staging buffers."""
+        staging = self._staging_buffers()
+        index, filled = 0, 0
+        for chunk in chunks:
+            chunk = torch.as_tensor(np.asarray(chunk) if not isinstance(chunk, torch.Tensor) else chunk).reshape(-1)
+            while chunk.numel() > 0:
+                take = min(chunk.numel(), self.batch_length - filled)
+                staging[index % 2][filled : filled + take].copy_(chunk[:take])
+                chunk, filled = chunk[take:], filled + take
+                if filled == self.batch_length:
+                    yield staging[index % 2]
+                    index, filled = index + 1, 0
+        if filled % self.input_block_size != 0:
+            raise ValueError(f"Stream length ({index * self.batch_length + filled}) must be divisible by block size ({self.input_block_size})")
+        if filled > 0:
+            yield staging[index % 2][:filled]
+
+    def _staging_buffers(self) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Allocate the two staging buffers that alternate between consecutive super-batches."""
+        return torch.empty(self.batch_length, dtype=self.dtype), torch.empty(self.batch_length, dtype=self.dtype)
+
+    def _check_length(self, length: int) -> None:
+        """Check that a stream of known length consists of whole blocks."""
+        if length % self.input_block_size != 0:
+            raise ValueError(f"Stream length ({length}) must be divisible by block size ({self.input_block_size})")
+
+    def _prepare(self, batch: torch.Tensor) -> torch.Tensor:
+        """Move a super-batch to the device and data type of the model input."""
+        device = self.device if self.device is not None else batch.device
+        return batch.to(device=device, dtype=self.dtype, non_blocking=True).view(-1, self.input_block_size)
+
+    def _process(self, blocks: torch.Tensor) -> StreamOutput:
+        """Apply the model to the blocks of a super-batch and flatten the result."""
+        result = self.model(blocks, **self.model_kwargs)
+        parts = result if isinstance(result, tuple) else (result,)
+        outputs = tuple(self._output(i, part.reshape(-1), blocks) for i, part in enumerate(parts))
+        return outputs if isinstance(result, tuple) else outputs[0]
+
+    def _output(self, index: int, part: torch.Tensor, blocks: torch.Tensor) -> torch.Tensor:
+        """Return an output part that is not overwritten by the staging of the next super-batch."""
+        if self.reuse_buffers:
+            if len(self._output_buffers) <= index:
+                length = self.blocks_per_batch * (part.numel() // blocks.shape[0])
+                self._output_buffers.append(torch.empty(length, dtype=part.dtype, device=part.device))
+            buffer = self._output_buffers[index]
+            if buffer.dtype != part.dtype or buffer.device != part.device:
+                buffer = self._output_buffers[index] = torch.empty_like(buffer, dtype=part.dtype, device=part.device)
+            return buffer[: part.numel()].copy_(part)
+
+        # Results sharing memory with a staging buffer (e.g. extracted message bits) are copied
+        if part.untyped_storage().data_ptr() == blocks.untyped_storage().data_ptr():
+            return part.clone()
+        return part
+
+
+def stream_encode(encoder: BaseBlockCodeEncoder, source: StreamSource, **kwargs: Any) -> Iterator[StreamOutput]:
+    """Encode a stream of message bits super-batch by super-batch.
+
+    Args:
+        encoder: Block code encoder
+        source: Stream of message bits, see :class:`StreamingBlockCodec`
+        **kwargs: Arguments of :class:`StreamingBlockCodec`
+
+    Returns:
+        Iterator over the flattened codewords of every super-batch
+    """
+    return StreamingBlockCodec(encoder, **kwargs)(source)
+
+
+def stream_decode(decoder: BaseBlockDecoder, source: StreamSource, **kwargs: Any) -> Iterator[StreamOutput]:
+    """Decode a stream of received values super-batch by super-batch.
+
+    Args:
+        decoder: Block code decoder
+        source: Stream of received hard bits or soft values, see :class:`StreamingBlockCodec`
+        **kwargs: Arguments of :class:`StreamingBlockCodec`, including keyword arguments of
+            the decoder such as return_errors
+
+    Returns:
+        Iterator over the flattened decoded messages of every super-batch, or tuples of flattened
+        tensors for decoders returning tuples
+    """
+    return StreamingBlockCodec(decoder, **kwargs)(source)
@@ -10,6 +10,8 @@ Functions:
     to_binary_tensor: Convert integers to binary tensor representation
     from_binary_tensor: Convert binary tensors back to integers
     apply_blockwise: Process tensor data in blocks of specified size
+    crc_matrix: Parity matrix of a cyclic redundancy check (CRC)
+    append_crc: Append CRC bits to messages
 
 These functions are optimized for PyTorch operations and support both CPU and GPU computation.
 
@@ -20,6 +22,8 @@ from typing import Callable, Optional
 
 import torch
 
+from .gf2 import packed_row_reduction
+
 
 def hamming_distance(x: torch.Tensor, y: torch.Tensor) -> torch.Tensor:
     """Calculate the Hamming distance between two binary tensors.
@@ -165,6 +169,65 @@ def apply_blockwise(x: torch.Tensor, block_size: int, fn: Callable) -> torch.Ten
         return result.view(*leading_dims, -1)
 
 
+def crc_matrix(polynomial: int, message_length: int, device=None, dtype=torch.float32) -> torch.Tensor:
+    """Return the parity matrix of a cyclic redundancy check (CRC).
+
+    The CRC of a message is the remainder of m(X) * X^r divided by the CRC polynomial g(X) of
+    degree r, where the first message bit is the coefficient of the highest power. Since the
+    CRC is linear, it can be computed for a batch of messages as ``message @ matrix % 2``.
+
+    Args:
+        polynomial: CRC polynomial g(X) as an integer including its leading term
+            (e.g. 0b1011 for X^3 + X + 1)
+        message_length: Number of message bits
+        device: Device to place the tensor on (CPU or GPU)
+        dtype: Data type of the resulting tensor
+
+    Returns:
+        Binary tensor of shape (message_length, r) whose row i holds the CRC of the
+        message with a single one at position i (most significant CRC bit first)
+
+    Examples:
+        >>> crc_matrix(0b1011, 2)
+        tensor([[1., 1., 0.],
+                [0., 1., 1.]])
+    """
+    degree = polynomial.bit_length() - 1
+    if degree < 1:
+        raise ValueError(f"CRC polynomial must have degree at least 1, got {polynomial}")
+
+    matrix = torch.zeros(message_length, degree, dtype=dtype, device=device)
+    # Remainder of X^(r + j) mod g(X), built up for increasing j
+    remainder = polynomial ^ (1 << degree)
+    for j in range(message_length):
+        row = message_length - 1 - j
+        for i in range(degree):
+            matrix[row, degree - 1 - i] = (remainder >> i) & 1
+        remainder <<= 1
+        if remainder >> degree:
+            remainder ^= polynomial
+    return matrix
+
+
+def append_crc(x: torch.Tensor, polynomial: int) -> torch.Tensor:
+    """Append the CRC bits of a CRC polynomial to messages.
+
+    Args:
+        x: Binary message tensor of shape (..., k)
+        polynomial: CRC polynomial g(X) as an integer including its leading term
+
+    Returns:
+        Tensor of shape (..., k + r) with the r CRC bits appended to each message
+
+    Examples:
+        >>> append_crc(torch.tensor([1., 0.]), 0b1011)
+        tensor([1., 0., 1., 1., 0.])
+    """
+    matrix = crc_matrix(polynomial, x.shape[-1], device=x.device, dtype=x.dtype if x.is_floating_point() else torch.float32)
+    crc = torch.matmul(x.to(matrix.dtype), matrix) % 2
+    return torch.cat([x, crc.to(x.dtype)], dim=-1)
+
+
 def Taylor_arctanh(vector: torch.Tensor, num_series: int = 105):
     """Approximate the inverse hyperbolic tangent (arctanh) using a Taylor series expansion.
 
@@ -208,6 +271,9 @@ def sign_to_bin(x: torch.Tensor) -> torch.Tensor:
 def row_reduction(matrix: torch.Tensor, num_cols: Optional[int] = None):
     """Perform row reduction on a binary matrix using PyTorch.
 
+    The elimination runs on bit-packed rows (see :func:`kaira.models.fec.gf2.packed_row_reduction`),
+    so every row operation processes 64 columns at once.
+
     Args:
         matrix: Binary matrix of shape (m, n) to be row reduced, m <= n.
         num_cols: Number of columns to consider for row reduction. Defaults to all columns.
@@ -217,32 +283,8 @@ def row_reduction(matrix: torch.Tensor, num_cols: Optional[int] = None):
             - Row-reduced matrix.
             - Rank of the matrix (number of pivot rows).
     """
-    device = matrix.device
-    if num_cols is None:
-        num_cols = matrix.shape[1]
-    matrix_row_reduced = matrix.clone()  # Create a copy to avoid modifying the input
-    p = 0  # Pivot row index
-    for j in range(num_cols):
-        # Find the first non-zero element in the current column starting from row p
-        idxs = p + torch.nonzero(matrix_row_reduced[p:, j], as_tuple=False).view(-1).to(device)  # .squeeze().to(device)
-
-        if idxs.numel() == 0:  # If no non-zero element is found, continue to the next column
-            continue
-
-        # Swap the current row with the row containing the first non-zero element
-        idxs = idxs[0]
-        matrix_row_reduced[[p, idxs], :] = matrix_row_reduced[[idxs, p], :]
-
-        # Perform row reduction on all other rows in the current column
-        non_pivot_idxs = torch.nonzero(matrix_row_reduced[:, j], as_tuple=False).view(-1).tolist()
-        non_pivot_idxs.remove(p)
-        matrix_row_reduced[non_pivot_idxs, :] ^= matrix_row_reduced[p, :]
-
-        p += 1  # Move to the next pivot row
-        if p == matrix_row_reduced.shape[0]:  # Stop if all rows have been processed
-            break
-
-    return matrix_row_reduced, p
+    matrix_row_reduced, pivots = packed_row_reduction(matrix, num_cols)
+    return matrix_row_reduced, len(pivots)
 
 
 def reorder_from_idx(idx, a):
@@ -1,7 +1,8 @@
 """Digital modulation schemes for wireless communications.
 
 This package provides implementations of common digital modulation and demodulation techniques used
-in modern communication systems, including PSK, QAM, PAM, and differential modulation schemes.
+in modern communication systems, including PSK, QAM, PAM, and differential modulation schemes,
+OFDM multicarrier modulation on top of them, and detectors for MIMO spatial multiplexing.
 """
 
 # Utility functions
@@ -22,6 +23,12 @@ from .dpsk import (
 
 # Identity schemes (for testing/debugging)
 from .identity import IdentityDemodulator, IdentityModulator
+
+# MIMO detectors
+from .mimo import KBestDetector, MMSEDetector, ZeroForcingDetector
+
+# Multicarrier schemes
+from .ofdm import OFDMDemodulator, OFDMModulator
 from .oqpsk import OQPSKDemodulator, OQPSKModulator
 
 # PAM schemes
@@ -73,6 +80,13 @@ __all__ = [
     "DBPSKDemodulator",
     "DQPSKModulator",
     "DQPSKDemodulator",
+    # Multicarrier schemes
+    "OFDMModulator",
+    "OFDMDemodulator",
+    # MIMO detectors
+    "ZeroForcingDetector",
+    "MMSEDetector",
+    "KBestDetector",
     # Identity schemes
     "IdentityModulator",
     "IdentityDemodulator",
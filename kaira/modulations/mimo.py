@@ -0,0 +1,332 @@
+"""Detectors for spatially multiplexed MIMO transmission.
+
+With spatial multiplexing, every transmit antenna sends its own stream of symbols, and the receiver
+observes y = H x + n with a channel matrix H of shape (num_rx, num_tx) :cite:`paulraj2003introduction`.
+The detectors in this module recover the bits of all streams from y and the channel state
+information (CSI) H. Linear detectors (zero forcing and MMSE) separate the streams with a batched
+Cholesky solve and demodulate each stream on its own, while the K-best detector performs a
+breadth-first tree search over all streams jointly.
+
+All detectors take the constellation from a memoryless :class:`BaseModulator` and return hard
+decisions or max-log LLRs with log(P(bit=0)/P(bit=1)), i.e. positive values favour bit 0, in the
+bit order expected by the FEC decoders. The bits of the streams of every received vector are
+concatenated, so the detectors invert a modulator applied to bit vectors of num_tx symbols.
+"""
+
+from typing import Optional, Tuple, Union
+
+import torch
+
+from .base import BaseDemodulator, BaseModulator
+from .registry import ModulationRegistry
+
+
+class _MIMODetector(BaseDemodulator):
+    """Base class of the MIMO detectors with the constellation and bit labels of a modulator.
+
+    Subclasses implement :meth:`detect`, which maps received vectors to hard bit decisions or
+    LLRs of shape (..., num_tx, bits_per_symbol).
+    """
+
+    constellation: torch.Tensor
+    bit_labels: torch.Tensor
+
+    def __init__(self, modulator: BaseModulator, *args, **kwargs) -> None:
+        """Initialize the detector.
+
+        Args:
+            modulator: Memoryless modulator of every stream, e.g. :class:`QAMModulator`
+            *args: Variable length argument list.
+            **kwargs: Arbitrary keyword arguments.
+        """
+        super().__init__(*args, **kwargs)
+        bits_per_symbol = modulator.bits_per_symbol
+        labels = (torch.arange(2**bits_per_symbol).unsqueeze(1) >> torch.arange(bits_per_symbol - 1, -1, -1)) & 1
+        with torch.no_grad():
+            constellation = modulator(labels.float().reshape(-1)).reshape(-1)
+        if constellation.numel() != labels.shape[0]:
+            raise ValueError(f"Modulator must map every {bits_per_symbol} bits to one symbol")
+
+        self._bits_per_symbol = bits_per_symbol
+        self.register_buffer("constellation", constellation.to(torch.complex64), persistent=False)
+        self.register_buffer("bit_labels", labels.float(), persistent=False)
+
+    @staticmethod
+    def _channel_matrices(y: torch.Tensor, csi: Optional[torch.Tensor]) -> Tuple[torch.Tensor, bool]:
+        """Validate the CSI and report whether it is shared by all vectors of a batch element.
+
+        Args:
+            y: Received vectors of shape (..., num_rx)
+            csi: Channel matrices of shape (..., num_rx, num_tx), or of shape
+                (batch_size, num_rx, num_tx) shared by all vectors of y of shape
+                (batch_size, num_vectors, num_rx)
+
+        Returns:
+            Tuple of the complex channel matrices and whether they are shared
+        """
+        if csi is None:
+            raise ValueError("MIMO detection requires the channel matrices as csi")
+        if csi.dim() == y.dim() + 1:
+            shared = False
+        elif csi.dim() == y.dim() and y.dim() > 1:
+            shared = True
+        else:
+            raise ValueError(f"csi must have {y.dim() + 1} dimensions, or {y.dim()} when shared by all vectors, got {csi.dim()}")
+        if csi.shape[-2] != y.shape[-1]:
+            raise ValueError(f"csi has {csi.shape[-2]} receive antennas, but the received vectors have {y.shape[-1]}")
+        return csi.to(torch.complex64), shared
+
+    def _demap(self, z: torch.Tensor, noise_var: Optional[torch.Tensor]) -> torch.Tensor:
+        """Demap every stream on its own with hard decisions or max-log LLRs.
+
+        Args:
+            z: Equalized symbols of shape (..., num_tx)
+            noise_var: Effective noise variance of every symbol, broadcastable to z, or None
+                for hard decisions
+
+        Returns:
+            Bits or LLRs of shape (..., num_tx, bits_per_symbol)
+        """
+        distances = (z.unsqueeze(-1) - self.constellation).abs().square()
+        if noise_var is None:
+            return self.bit_labels[distances.argmin(dim=-1)]
+
+        # Minimum distance to the symbols with a 0 and with a 1 at every bit position
+        is_one = self.bit_labels.T.bool()
+        inf = torch.tensor(float("inf"), device=z.device)
+        distances = distances.unsqueeze(-2)
+        distances_0 = torch.where(is_one, inf, distances).amin(dim=-1)
+        distances_1 = torch.where(is_one, distances, inf).amin(dim=-1)
+        return (distances_1 - distances_0) / noise_var.unsqueeze(-1)
+
+    def detect(self, y: torch.Tensor, h: torch.Tensor, shared: bool, noise_var: Optional[torch.Tensor]) -> torch.Tensor:
+        """Detect the bits of all streams.
+
+        Args:
+            y: Received vectors of shape (..., num_rx)
+            h: Channel matrices, see :meth:`_channel_matrices`
+            shared: Whether h is shared by all vectors of a batch element
+            noise_var: Noise variance broadcastable to y.shape[:-1], or None for hard decisions
+
+        Returns:
+            Bits or LLRs of shape (..., num_tx, bits_per_symbol)
+        """
+        raise NotImplementedError
+
+    def forward(self, y: torch.Tensor, noise_var: Optional[Union[float, torch.Tensor]] = None, *args, csi: Optional[torch.Tensor] = None, **kwargs) -> torch.Tensor:
+        """Detect the bits of all streams from the received vectors.
+
+        Args:
+            y: Received vectors of shape (..., num_rx)
+            noise_var: Variance σ² of the complex noise at every receive antenna, as a scalar or
+                a tensor broadcastable to y.shape[:-1]. If None, hard decisions are returned.
+            *args: Variable length argument list.
+            csi: Channel matrices of shape (..., num_rx, num_tx), or of shape
+                (batch_size, num_rx, num_tx) shared by all vectors of y of shape
+                (batch_size, num_vectors, num_rx)
+            **kwargs: Arbitrary keyword arguments.
+
+        Returns:
+            If noise_var is provided, LLRs; otherwise, hard bit decisions. Both with shape
+            (..., num_tx * bits_per_symbol)
+        """
+        h, shared = self._channel_matrices(y, csi)
+        if not torch.is_complex(y):
+            y = torch.complex(y, torch.zeros_like(y))
+        if noise_var is not None:
+            noise_var = torch.as_tensor(noise_var, device=y.device)
+            noise_var = (noise_var.real if noise_var.is_complex() else noise_var).float()
+            # A shared matrix cannot be regularized differently for every vector
+            if shared and noise_var.dim() > 0 and noise_var.shape[-1] != 1:
+                h, shared = h.unsqueeze(-3).expand(*y.shape[:-1], *h.shape[-2:]), False
+
+        bits = self.detect(y.to(torch.complex64), h, shared, noise_var)
+        return bits.reshape(*bits.shape[:-2], -1)
+
+
+def _solve_columns(y: torch.Tensor, h: torch.Tensor, shared: bool) -> Tuple[torch.Tensor, torch.Tensor]:
+    """Return the matched filter outputs Hᴴy and the Gram matrices HᴴH.
+
+    With a shared channel matrix, the received vectors of a batch element are processed as the
+    columns of one matrix, so that every matrix is factorized once.
+
+    Returns:
+        Matched filter outputs of shape (..., num_tx, 1), or (batch_size, num_tx, num_vectors)
+        for a shared matrix, and Gram matrices of shape (..., num_tx, num_tx)
+    """
+    h_adjoint = h.mH
+    rhs = h_adjoint @ (y.mT if shared else y.unsqueeze(-1))
+    return rhs, h_adjoint @ h
+
+
+def _stream_vectors(x: torch.Tensor, shared: bool) -> torch.Tensor:
+    """Undo the column layout of :func:`_solve_columns`, returning shape (..., num_tx)."""
+    return x.mT if shared else x.squeeze(-1)
+
+
+def _stream_diagonal(matrix: torch.Tensor, shared: bool) -> torch.Tensor:
+    """Return the real diagonal of per-matrix quantities, broadcastable to (..., num_tx)."""
+    diagonal = matrix.diagonal(dim1=-2, dim2=-1).real
+    return diagonal.unsqueeze(-2) if shared else diagonal
+
+
+def _per_vector(noise_var: torch.Tensor) -> torch.Tensor:
+    """Append a stream dimension to a noise variance broadcastable to y.shape[:-1]."""
+    return noise_var.unsqueeze(-1)
+
+
+@ModulationRegistry.register_demodulator()
+class ZeroForcingDetector(_MIMODetector):
+    """Zero-forcing (ZF) MIMO detector.
+
+    Separates the streams with the pseudo-inverse of the channel matrix,
+    x̂ = (HᴴH)⁻¹ Hᴴ y, computed with a batched Cholesky factorization of the Gram matrix, and
+    demodulates every stream with the noise variance σ²[(HᴴH)⁻¹]_kk it has after the
+    equalization. Requires at least as many receive as transmit antennas.
+
+    Example:
+        >>> from kaira.modulations import QAMModulator
+        >>> detector = ZeroForcingDetector(QAMModulator(16))
+        >>> llrs = detector(y, noise_var=0.1, csi=H)  # y: (B, T, nr), H: (B, T, nr, nt) -> (B, T, nt * 4)
+    """
+
+    def detect(self, y: torch.Tensor, h: torch.Tensor, shared: bool, noise_var: Optional[torch.Tensor]) -> torch.Tensor:
+        """Equalize with zero forcing and demap every stream."""
+        rhs, gram = _solve_columns(y, h, shared)
+        cholesky = torch.linalg.cholesky(gram)
+        x = _stream_vectors(torch.cholesky_solve(rhs, cholesky), shared)
+        if noise_var is None:
+            return self._demap(x, None)
+        return self._demap(x, _per_vector(noise_var) * _stream_diagonal(torch.cholesky_inverse(cholesky), shared))
+
+
+@ModulationRegistry.register_demodulator()
+class MMSEDetector(_MIMODetector):
+    """Linear minimum mean square error (MMSE) MIMO detector.
+
+    Separates the streams with the MMSE filter x̃ = (HᴴH + σ²/Es I)⁻¹ Hᴴ y, where Es is the
+    average symbol energy of the constellation, computed with a batched Cholesky factorization.
+    The biased estimates are scaled by 1/μ_k with μ_k = 1 - σ²/Es [(HᴴH + σ²/Es I)⁻¹]_kk and
+    demodulated with the noise-plus-interference variance Es (1 - μ_k)/μ_k of the stream
+    :cite:`paulraj2003introduction`. Like the MMSE equalizer of :class:`OFDMDemodulator`, the
+    detector requires the noise variance and always returns LLRs.
+
+    Example:
+        >>> from kaira.modulations import QPSKModulator
+        >>> detector = MMSEDetector(QPSKModulator())
+        >>> llrs = detector(y, noise_var=0.1, csi=H)  # y: (B, nr), H: (B, nr, nt) -> (B, nt * 2)
+    """
+
+    def detect(self, y: torch.Tensor, h: torch.Tensor, shared: bool, noise_var: Optional[torch.Tensor]) -> torch.Tensor:
+        """Equalize with the unbiased MMSE filter and demap every stream."""
+        if noise_var is None:
+            raise ValueError("MMSE detection requires the noise variance")
+        energy = self.constellation.abs().square().mean()
+        rhs, gram = _solve_columns(y, h, shared)
+
+        # Regularize every Gram matrix with the noise-to-signal ratio of its vectors
+        ratio = noise_var / energy
+        matrix_ratio = ratio.reshape(ratio.shape[:-1] if shared and ratio.dim() > 0 else ratio.shape)
+        cholesky = torch.linalg.cholesky(gram + matrix_ratio[..., None, None] * torch.eye(gram.shape[-1], device=gram.device))
+
+        # Unbiased estimates and their noise-plus-interference variance
+        bias = 1 - _per_vector(ratio) * _stream_diagonal(torch.cholesky_inverse(cholesky), shared)
+        bias = bias.clamp(min=torch.finfo(bias.dtype).tiny)
+        x = _stream_vectors(torch.cholesky_solve(rhs, cholesky), shared) / bias
+        return self._demap(x, energy * (1 - bias) / bias)
+
+
+@ModulationRegistry.register_demodulator()
+class KBestDetector(_MIMODetector):
+    """K-best MIMO detector.
+
+    Approximates maximum-likelihood detection, argmin_x ||y - Hx||², with a breadth-first tree
+    search :cite:`guo2006algorithm`. After the QR decomposition H = QR, the metric splits into
+    per-stream terms |ỹ_i - Σ_{j≥i} R_ij x_j|² with ỹ = Qᴴy, so the streams are detected from the
+    last to the first, keeping the `num_candidates` partial vectors with the smallest metrics at
+    every level. The search runs on all received vectors at once with a fixed complexity,
+    independent of the noise. With num_candidates ≥ M^(num_tx - 1) for a constellation of M
+    symbols, it performs exhaustive maximum-likelihood detection.
+
+    Soft outputs are max-log LLRs over the final candidate list,
+    (min_{x: b=1} ||y - Hx||² - min_{x: b=0} ||y - Hx||²) / σ². When no candidate has a bit
+    value, the LLR is set to ±llr_clip. Requires at least as many receive as transmit antennas.
+
+    Example:
+        >>> from kaira.modulations import QAMModulator
+        >>> detector = KBestDetector(QAMModulator(16), num_candidates=32)
+        >>> llrs = detector(y, noise_var=0.1, csi=H)  # y: (B, T, nr), H: (B, nr, nt) -> (B, T, nt * 4)
+    """
+
+    def __init__(self, modulator: BaseModulator, num_candidates: int = 16, llr_clip: float = 20.0, *args, **kwargs) -> None:
+        """Initialize the K-best detector.
+
+        Args:
+            modulator: Memoryless modulator of every stream, e.g. :class:`QAMModulator`
+            num_candidates: Number of partial vectors kept at every level of the tree search
+            llr_clip: Magnitude of the LLRs of bits with only one value in the candidate list
+            *args: Variable length argument list.
+            **kwargs: Arbitrary keyword arguments.
+        """
+        super().__init__(modulator, *args, **kwargs)
+        if num_candidates < 1:
+            raise ValueError(f"num_candidates must be positive, got {num_candidates}")
+        if llr_clip <= 0:
+            raise ValueError(f"llr_clip must be positive, got {llr_clip}")
+        self.num_candidates = num_candidates
+        self.llr_clip = llr_clip
+
+    def search(self, y: torch.Tensor, h: torch.Tensor) -> Tuple[torch.Tensor, torch.Tensor]:
+        """Run the K-best tree search.
+
+        Args:
+            y: Received vectors of shape (..., num_rx)
+            h: Channel matrices broadcastable to (..., num_rx, num_tx)
+
+        Returns:
+            Tuple of the metrics ||y - Hx||² of the candidates in ascending order, with shape
+            (..., K), and their symbol indices, with shape (..., K, num_tx)
+        """
+        num_tx = h.shape[-1]
+        if h.shape[-2] < num_tx:
+            raise ValueError(f"K-best detection requires at least as many receive ({h.shape[-2]}) as transmit antennas ({num_tx})")
+        q, r = torch.linalg.qr(h)
+        y_rotated = (q.mH @ y.unsqueeze(-1)).squeeze(-1)
+        # Energy of y outside the column space of H, so the metrics equal ||y - Hx||²
+        residual = (y.abs().square().sum(dim=-1) - y_rotated.abs().square().sum(dim=-1)).clamp(min=0)
+
+        batch_shape = y_rotated.shape[:-1]
+        metrics = residual.unsqueeze(-1)  # (..., 1)
+        indices = torch.zeros(*batch_shape, 1, 0, dtype=torch.long, device=y.device)
+        symbols = torch.zeros(*batch_shape, 1, 0, dtype=y.dtype, device=y.device)
+        num_symbols = self.constellation.numel()
+        for level in range(num_tx - 1, -1, -1):
+            # Received value at this level after cancelling the streams already detected
+            row = r[..., level, level + 1 :].unsqueeze(-2)
+            target = y_rotated[..., level].unsqueeze(-1) - (row * symbols).sum(dim=-1)
+            increments = (target.unsqueeze(-1) - r[..., level, level].unsqueeze(-1).unsqueeze(-1) * self.constellation).abs().square()
+
+            # Keep the best extensions of all candidates
+            expanded = (metrics.unsqueeze(-1) + increments).flatten(-2)
+            metrics, best = expanded.topk(min(self.num_candidates, expanded.shape[-1]), dim=-1, largest=False)
+            parent, symbol = best // num_symbols, best % num_symbols
+            gather = parent.unsqueeze(-1).expand(*parent.shape, num_tx - 1 - level)
+            indices = torch.cat([symbol.unsqueeze(-1), indices.gather(-2, gather)], dim=-1)
+            symbols = torch.cat([self.constellation[symbol].unsqueeze(-1), symbols.gather(-2, gather)], dim=-1)
+        return metrics, indices
+
+    def detect(self, y: torch.Tensor, h: torch.Tensor, shared: bool, noise_var: Optional[torch.Tensor]) -> torch.Tensor:
+        """Detect all streams jointly with the K-best tree search."""
+        # A shared matrix is factorized once and broadcast over the vectors
+        metrics, indices = self.search(y, h.unsqueeze(-3) if shared else h)
+        bits = self.bit_labels[indices]  # (..., K, num_tx, bits_per_symbol)
+        if noise_var is None:
+            return bits[..., 0, :, :]
+
+        # Max-log LLRs over the candidate list
+        inf = torch.tensor(float("inf"), device=y.device)
+        candidate_metrics = metrics[..., None, None]
+        metrics_0 = torch.where(bits == 0, candidate_metrics, inf).amin(dim=-3)
+        metrics_1 = torch.where(bits == 1, candidate_metrics, inf).amin(dim=-3)
+        llrs = (metrics_1 - metrics_0) / noise_var[..., None, None]
+        return llrs.clamp(-self.llr_clip, self.llr_clip)
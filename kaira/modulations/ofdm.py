@@ -0,0 +1,363 @@
+"""Orthogonal Frequency-Division Multiplexing (OFDM) modulation.
+
+OFDM maps symbols onto a resource grid of shape (..., num_ofdm_symbols, num_subcarriers), where
+every subcarrier carries a data symbol, a known pilot symbol or nothing (guard bands and the DC
+subcarrier). Each OFDM symbol is converted to the time domain with an IFFT and preceded by a
+cyclic prefix, which turns the linear convolution of a multipath channel shorter than the prefix
+into a circular one, so the channel acts on every subcarrier as a single complex gain
+:cite:`goldsmith2005wireless`.
+
+All OFDM symbols of all batch elements are processed with a single batched IFFT/FFT, and the
+subcarrier symbols are modulated and demodulated by any :class:`BaseModulator` and
+:class:`BaseDemodulator`.
+"""
+
+from typing import Optional, Sequence, Tuple, Union
+
+import torch
+
+from .base import BaseDemodulator, BaseModulator
+from .registry import ModulationRegistry
+
+
+def _subcarrier_layout(num_subcarriers: int, cp_length: int, pilot_indices: Optional[Sequence[int]], pilot_symbols: Optional[Union[Sequence[complex], torch.Tensor]], null_indices: Optional[Sequence[int]]) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    """Validate an OFDM resource grid layout and return its data and pilot subcarriers.
+
+    Args:
+        num_subcarriers: Number of subcarriers (FFT size)
+        cp_length: Length of the cyclic prefix in samples
+        pilot_indices: Subcarriers carrying pilot symbols in every OFDM symbol
+        pilot_symbols: Pilot symbols of the pilot subcarriers. Defaults to ones.
+        null_indices: Subcarriers carrying nothing (e.g. guard bands and the DC subcarrier)
+
+    Returns:
+        Tuple of the data subcarrier indices, the pilot subcarrier indices and the pilot symbols
+
+    Raises:
+        ValueError: If the sizes are invalid, an index is out of range, a subcarrier is used twice,
+            or no subcarrier is left for data
+    """
+    if num_subcarriers < 1:
+        raise ValueError(f"num_subcarriers must be positive, got {num_subcarriers}")
+    if not 0 <= cp_length <= num_subcarriers:
+        raise ValueError(f"cp_length must be between 0 and num_subcarriers ({num_subcarriers}), got {cp_length}")
+
+    pilots = torch.as_tensor(pilot_indices if pilot_indices is not None else [], dtype=torch.long).reshape(-1)
+    nulls = torch.as_tensor(null_indices if null_indices is not None else [], dtype=torch.long).reshape(-1)
+    reserved = torch.cat([pilots, nulls])
+    if ((reserved < 0) | (reserved >= num_subcarriers)).any():
+        raise ValueError(f"Pilot and null subcarrier indices must be between 0 and {num_subcarriers - 1}")
+    if reserved.unique().numel() != reserved.numel():
+        raise ValueError("Pilot and null subcarrier indices must be distinct")
+
+    is_data = torch.ones(num_subcarriers, dtype=torch.bool)
+    is_data[reserved] = False
+    if not is_data.any():
+        raise ValueError("At least one subcarrier must carry data")
+
+    if pilot_symbols is None:
+        symbols = torch.ones(pilots.numel(), dtype=torch.complex64)
+    else:
+        symbols = torch.as_tensor(pilot_symbols).to(torch.complex64).reshape(-1)
+        if symbols.numel() != pilots.numel():
+            raise ValueError(f"Expected {pilots.numel()} pilot symbols, got {symbols.numel()}")
+    return is_data.nonzero().squeeze(1), pilots, symbols
+
+
+@ModulationRegistry.register_modulator()
+class OFDMModulator(BaseModulator):
+    """OFDM modulator with pilot insertion and cyclic prefix.
+
+    Maps the input onto the data subcarriers of consecutive OFDM symbols, inserts the pilot
+    symbols, and converts every OFDM symbol to the time domain with an orthonormal IFFT followed
+    by a cyclic prefix. The input consists of bits modulated by the subcarrier `modulator`, or of
+    complex subcarrier symbols when no modulator is given.
+
+    Example:
+        >>> from kaira.modulations import QAMModulator
+        >>> # 64 subcarriers with a pilot on every 8th subcarrier and a null DC subcarrier
+        >>> pilots = list(range(4, 64, 8))
+        >>> modulator = OFDMModulator(64, cp_length=16, modulator=QAMModulator(16), pilot_indices=pilots, null_indices=[0])
+        >>> bits = torch.randint(0, 2, (32, 10 * modulator.bits_per_symbol)).float()
+        >>> x = modulator(bits)  # 10 OFDM symbols per batch element, shape (32, 10 * 80)
+    """
+
+    data_indices: torch.Tensor
+    pilot_indices: torch.Tensor
+    pilot_symbols: torch.Tensor
+
+    def __init__(
+        self,
+        num_subcarriers: int = 64,
+        cp_length: int = 16,
+        modulator: Optional[BaseModulator] = None,
+        pilot_indices: Optional[Sequence[int]] = None,
+        pilot_symbols: Optional[Union[Sequence[complex], torch.Tensor]] = None,
+        null_indices: Optional[Sequence[int]] = None,
+        *args,
+        **kwargs,
+    ) -> None:
+        """Initialize the OFDM modulator.
+
+        Args:
+            num_subcarriers: Number of subcarriers (FFT size)
+            cp_length: Length of the cyclic prefix in samples
+            modulator: Modulator of the data subcarrier symbols. If None, the input consists of
+                complex subcarrier symbols.
+            pilot_indices: Subcarriers carrying pilot symbols in every OFDM symbol
+            pilot_symbols: Pilot symbols of the pilot subcarriers. Defaults to ones.
+            null_indices: Subcarriers carrying nothing (e.g. guard bands and the DC subcarrier)
+            *args: Variable length argument list.
+            **kwargs: Arbitrary keyword arguments.
+        """
+        super().__init__(*args, **kwargs)
+        data_indices, pilot_indices_tensor, pilot_symbols_tensor = _subcarrier_layout(num_subcarriers, cp_length, pilot_indices, pilot_symbols, null_indices)
+
+        self.num_subcarriers = num_subcarriers
+        self.cp_length = cp_length
+        self.modulator = modulator
+        self.register_buffer("data_indices", data_indices, persistent=False)
+        self.register_buffer("pilot_indices", pilot_indices_tensor, persistent=False)
+        self.register_buffer("pilot_symbols", pilot_symbols_tensor, persistent=False)
+
+        # Bits (or subcarrier symbols without a modulator) per OFDM symbol
+        self._bits_per_symbol = self.num_data_subcarriers * modulator.bits_per_symbol if modulator is not None else None
+
+    @property
+    def num_data_subcarriers(self) -> int:
+        """Number of subcarriers carrying data in every OFDM symbol."""
+        return self.data_indices.numel()
+
+    @property
+    def symbol_length(self) -> int:
+        """Number of time-domain samples per OFDM symbol, including the cyclic prefix."""
+        return self.num_subcarriers + self.cp_length
+
+    def map_to_grid(self, symbols: torch.Tensor) -> torch.Tensor:
+        """Map subcarrier symbols onto the resource grid and insert the pilots.
+
+        Args:
+            symbols: Complex data symbols with shape (..., S*D), where D is the number of data
+                subcarriers
+
+        Returns:
+            Resource grid with shape (..., S, num_subcarriers)
+        """
+        if symbols.shape[-1] % self.num_data_subcarriers != 0:
+            raise ValueError(f"Number of data symbols ({symbols.shape[-1]}) must be divisible by the number of data subcarriers ({self.num_data_subcarriers})")
+        data = symbols.reshape(*symbols.shape[:-1], -1, self.num_data_subcarriers)
+        grid = torch.zeros(*data.shape[:-1], self.num_subcarriers, dtype=torch.complex64, device=symbols.device)
+        grid[..., self.data_indices] = data.to(torch.complex64)
+        grid[..., self.pilot_indices] = self.pilot_symbols
+        return grid
+
+    def forward(self, x: torch.Tensor, *args, **kwargs) -> torch.Tensor:
+        """Modulate bits or subcarrier symbols to a time-domain OFDM signal.
+
+        Args:
+            x: Input bits with shape (..., S*K), where K is bits_per_symbol, or complex data
+                symbols with shape (..., S*D) when no modulator is given
+            *args: Variable length argument list.
+            **kwargs: Arbitrary keyword arguments.
+
+        Returns:
+            Complex time-domain signal with shape (..., S*(num_subcarriers + cp_length))
+        """
+        symbols = self.modulator(x) if self.modulator is not None else x
+        time_domain = torch.fft.ifft(self.map_to_grid(symbols), norm="ortho")
+        with_prefix = torch.cat([time_domain[..., self.num_subcarriers - self.cp_length :], time_domain], dim=-1)
+        return with_prefix.reshape(*with_prefix.shape[:-2], -1)
+
+
+@ModulationRegistry.register_demodulator()
+class OFDMDemodulator(BaseDemodulator):
+    """OFDM demodulator with one-tap channel estimation and equalization.
+
+    Removes the cyclic prefix of every OFDM symbol, converts the symbols to the frequency domain
+    with an orthonormal FFT, and equalizes every subcarrier with a single complex tap. The channel
+    frequency response is either given as CSI or estimated by least squares (LS) at the pilot
+    subcarriers and interpolated linearly across the other subcarriers. The equalizer is
+
+    - 'ls': zero forcing with the channel estimate, X = Y / H
+    - 'mmse': X = conj(H) Y / (|H|^2 + σ²) / μ, which requires the noise variance
+
+    The MMSE estimate is scaled by 1/μ with μ = |H|^2 / (|H|^2 + σ²) to remove its bias towards
+    zero, which would otherwise shrink multilevel constellations relative to their decision
+    regions, and is demodulated with the noise variance (1 - μ)/μ of the unbiased estimate. On a
+    single tap, this agrees with the LS equalizer except on subcarriers whose gain vanishes,
+    which yield zeros of very large variance instead of infinities.
+
+    The equalized data symbols are passed to the subcarrier `demodulator` together with their
+    post-equalization noise variances, or returned as they are when no demodulator is given.
+
+    Example:
+        >>> from kaira.modulations import QAMDemodulator
+        >>> pilots = list(range(4, 64, 8))
+        >>> demodulator = OFDMDemodulator(64, cp_length=16, demodulator=QAMDemodulator(16), pilot_indices=pilots, null_indices=[0], equalizer='mmse')
+        >>> llrs = demodulator(y, noise_var=0.01)  # y with shape (32, 10 * 80)
+    """
+
+    EQUALIZERS = ("ls", "mmse")
+
+    data_indices: torch.Tensor
+    pilot_indices: torch.Tensor
+    pilot_symbols: torch.Tensor
+    interpolation: torch.Tensor
+
+    def __init__(
+        self,
+        num_subcarriers: int = 64,
+        cp_length: int = 16,
+        demodulator: Optional[BaseDemodulator] = None,
+        pilot_indices: Optional[Sequence[int]] = None,
+        pilot_symbols: Optional[Union[Sequence[complex], torch.Tensor]] = None,
+        null_indices: Optional[Sequence[int]] = None,
+        equalizer: Optional[str] = "ls",
+        *args,
+        **kwargs,
+    ) -> None:
+        """Initialize the OFDM demodulator.
+
+        Args:
+            num_subcarriers: Number of subcarriers (FFT size)
+            cp_length: Length of the cyclic prefix in samples
+            demodulator: Demodulator of the data subcarrier symbols. If None, the equalized
+                data symbols are returned.
+            pilot_indices: Subcarriers carrying pilot symbols in every OFDM symbol
+            pilot_symbols: Pilot symbols of the pilot subcarriers. Defaults to ones.
+            null_indices: Subcarriers carrying nothing (e.g. guard bands and the DC subcarrier)
+            equalizer: One-tap equalizer ('ls' or 'mmse'), or None to skip equalization
+            *args: Variable length argument list.
+            **kwargs: Arbitrary keyword arguments.
+        """
+        super().__init__(*args, **kwargs)
+        if equalizer is not None and equalizer not in self.EQUALIZERS:
+            raise ValueError(f"Equalizer must be one of {list(self.EQUALIZERS)} or None, got {equalizer}")
+        data_indices, pilot_indices_tensor, pilot_symbols_tensor = _subcarrier_layout(num_subcarriers, cp_length, pilot_indices, pilot_symbols, null_indices)
+        if (pilot_symbols_tensor == 0).any():
+            raise ValueError("Pilot symbols must be nonzero")
+
+        self.num_subcarriers = num_subcarriers
+        self.cp_length = cp_length
+        self.demodulator = demodulator
+        self.equalizer = equalizer
+        self.register_buffer("data_indices", data_indices, persistent=False)
+        self.register_buffer("pilot_indices", pilot_indices_tensor, persistent=False)
+        self.register_buffer("pilot_symbols", pilot_symbols_tensor, persistent=False)
+        self.register_buffer("interpolation", self._interpolation_matrix(pilot_indices_tensor, num_subcarriers), persistent=False)
+        self._bits_per_symbol = self.num_data_subcarriers * demodulator.bits_per_symbol if demodulator is not None else None
+
+    @staticmethod
+    def _interpolation_matrix(pilot_indices: torch.Tensor, num_subcarriers: int) -> torch.Tensor:
+        """Build the matrix that interpolates pilot estimates linearly across all subcarriers.
+
+        Subcarriers outside the pilot range take the estimate of the nearest pilot.
+
+        Returns:
+            Complex matrix of shape (num_pilots, num_subcarriers)
+        """
+        num_pilots = pilot_indices.numel()
+        if num_pilots == 0:
+            return torch.zeros(0, num_subcarriers, dtype=torch.complex64)
+        pilots, order = pilot_indices.double().sort()
+        subcarriers = torch.arange(num_subcarriers, dtype=torch.float64).clamp(pilots[0], pilots[-1])
+
+        # Interpolate between the pilots on either side of every subcarrier
+        right = torch.searchsorted(pilots, subcarriers, right=True).clamp(1, max(num_pilots - 1, 1))
+        left = right - 1 if num_pilots > 1 else torch.zeros_like(right)
+        right = right if num_pilots > 1 else left
+        span = (pilots[right] - pilots[left]).clamp(min=1)
+        weight_right = (subcarriers - pilots[left]) / span
+
+        matrix = torch.zeros(num_pilots, num_subcarriers, dtype=torch.float64)
+        columns = torch.arange(num_subcarriers)
+        matrix.index_put_((order[left], columns), 1 - weight_right, accumulate=True)
+        matrix.index_put_((order[right], columns), weight_right, accumulate=True)
+        return matrix.to(torch.complex64)
+
+    @property
+    def num_data_subcarriers(self) -> int:
+        """Number of subcarriers carrying data in every OFDM symbol."""
+        return self.data_indices.numel()
+
+    @property
+    def symbol_length(self) -> int:
+        """Number of time-domain samples per OFDM symbol, including the cyclic prefix."""
+        return self.num_subcarriers + self.cp_length
+
+    def to_grid(self, y: torch.Tensor) -> torch.Tensor:
+        """Remove the cyclic prefixes and transform a time-domain signal to the resource grid.
+
+        Args:
+            y: Complex time-domain signal with shape (..., S*(num_subcarriers + cp_length))
+
+        Returns:
+            Received resource grid with shape (..., S, num_subcarriers)
+        """
+        if y.shape[-1] % self.symbol_length != 0:
+            raise ValueError(f"Signal length ({y.shape[-1]}) must be divisible by the OFDM symbol length ({self.symbol_length})")
+        symbols = y.reshape(*y.shape[:-1], -1, self.symbol_length)[..., self.cp_length :]
+        return torch.fft.fft(symbols, norm="ortho")
+
+    def estimate_channel(self, grid: torch.Tensor) -> torch.Tensor:
+        """Estimate the channel frequency response from the pilots of every OFDM symbol.
+
+        Args:
+            grid: Received resource grid with shape (..., S, num_subcarriers)
+
+        Returns:
+            LS channel estimate, interpolated across all subcarriers, with shape (..., S, num_subcarriers)
+        """
+        if self.pilot_indices.numel() == 0:
+            raise ValueError("Channel estimation requires pilot subcarriers")
+        pilot_estimates = grid[..., self.pilot_indices] / self.pilot_symbols
+        return pilot_estimates @ self.interpolation
+
+    def forward(self, y: torch.Tensor, noise_var: Optional[Union[float, torch.Tensor]] = None, *args, csi: Optional[torch.Tensor] = None, **kwargs) -> torch.Tensor:
+        """Demodulate a time-domain OFDM signal.
+
+        Args:
+            y: Complex time-domain signal with shape (..., S*(num_subcarriers + cp_length))
+            noise_var: Noise variance per subcarrier, required for the MMSE equalizer and for
+                soft demodulation (optional)
+            *args: Variable length argument list.
+            csi: Channel frequency response with shape (..., num_subcarriers), constant over the
+                OFDM symbols, or (..., S, num_subcarriers). If None, the channel is estimated
+                from the pilots, or assumed ideal when there are none.
+            **kwargs: Arbitrary keyword arguments.
+
+        Returns:
+            Output of the subcarrier demodulator for the equalized data symbols with shape
+            (..., S*D), i.e. hard bits or LLRs, or the equalized data symbols themselves when no
+            demodulator is given
+        """
+        grid = self.to_grid(y)
+
+        if csi is not None:
+            channel = csi if csi.dim() == grid.dim() else csi.unsqueeze(-2)
+        elif self.pilot_indices.numel() > 0:
+            channel = self.estimate_channel(grid)
+        else:
+            channel = None
+
+        if noise_var is not None and not isinstance(noise_var, torch.Tensor):
+            noise_var = torch.tensor(noise_var, device=y.device)
+        if self.equalizer is not None and channel is not None:
+            gain = channel.abs() ** 2
+            if self.equalizer == "mmse":
+                if noise_var is None:
+                    raise ValueError("The MMSE equalizer requires the noise variance")
+                # Unbiased MMSE estimate and its noise variance (1 - μ)/μ
+                bias = (gain / (gain + noise_var)).clamp(min=torch.finfo(gain.dtype).tiny)
+                grid = grid * channel.conj() / (gain + noise_var) / bias
+                noise_var = noise_var / (gain + noise_var) / bias
+            else:
+                grid = grid / channel
+                noise_var = noise_var / gain if noise_var is not None else None
+
+        data = grid[..., self.data_indices].reshape(*grid.shape[:-2], -1)
+        if noise_var is not None and noise_var.dim() > 0:
+            noise_var = noise_var.expand(grid.shape)[..., self.data_indices].reshape(data.shape)
+        if self.demodulator is None:
+            return data
+        return self.demodulator(data, noise_var=noise_var)
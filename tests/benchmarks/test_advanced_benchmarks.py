@@ -111,6 +111,22 @@ class TestOFDMBenchmark:
             assert results.metrics["num_subcarriers"] == config["num_subcarriers"]
             assert results.metrics["cp_length"] == config["cp_length"]
 
+    @pytest.mark.parametrize("multipath", [False, True])
+    def test_ofdm_benchmark_modulations(self, multipath):
+        """Test OFDM with higher-order modulation, batching and a multipath channel."""
+        torch.manual_seed(0)
+        benchmark = create_benchmark("ofdm_performance", num_subcarriers=64, cp_length=16)
+        benchmark.snr_range = [0, 30]
+        benchmark.setup(num_symbols=250, batch_size=100, modulation="16qam", multipath=multipath)
+        results = benchmark.run()
+
+        assert results["spectral_efficiency"] == 4
+        assert results["ber_results"][0] > 0.05
+        assert results["ber_results"][1] == 0.0
+
+        with pytest.raises(NotImplementedError):
+            benchmark.setup(modulation="8psk")
+
 
 class TestChannelCodingBenchmark:
     """Test channel coding benchmark."""
@@ -8,6 +8,7 @@ import tempfile
 from pathlib import Path
 
 import pytest
+import torch
 
 from kaira.benchmarks import StandardRunner, create_benchmark
 from kaira.benchmarks.ecc_benchmark import ECCComparisonBenchmark, ECCPerformanceBenchmark
@@ -88,6 +89,23 @@ class TestECCPerformanceBenchmark:
         assert "Golay(23,12)" in config_names
         assert "Extended Golay(24,12)" in config_names
 
+    def test_chase_soft_decision_configuration(self):
+        """Test that the Chase-II configuration decodes LLRs with a gain over hard decisions."""
+        torch.manual_seed(0)
+        benchmark = ECCPerformanceBenchmark(code_family="golay")
+        benchmark.setup(snr_range=[4], num_bits=6000, num_trials=5, max_errors=3, evaluate_complexity=False, evaluate_throughput=False)
+        configs = {config["name"]: config for config in benchmark.code_configs}
+        chase = configs["Extended Golay(24,12) Chase-II"]
+
+        ec_results = benchmark._evaluate_error_correction_performance(chase)
+        assert ec_results["success"]
+        assert ec_results["correction_probability"][:4] == [1.0, 1.0, 1.0, 1.0]
+
+        chase_results = benchmark._evaluate_ber_performance(chase)
+        hard_results = benchmark._evaluate_ber_performance(configs["Extended Golay(24,12)"])
+        assert chase_results["success"]
+        assert chase_results["bler_coded"][0] < hard_results["bler_coded"][0]
+
     def test_repetition_family_benchmark(self):
         """Test repetition code family benchmark."""
         runner = StandardRunner()
@@ -10,6 +10,7 @@ from kaira.channels import (
     FlatFadingChannel,
     LaplacianChannel,
     LogNormalFadingChannel,
+    MultipathFadingChannel,
     NonlinearChannel,
     PerfectChannel,
     PhaseNoiseChannel,
@@ -497,6 +498,72 @@ class TestFlatFadingChannel:
         torch.manual_seed(42)
         assert torch.allclose(channel(complex_tensor, noise=custom_noise), expected_output)
 
+    def test_doppler_model_validation(self):
+        """Test that invalid Doppler model parameters are rejected."""
+        with pytest.raises(ValueError, match="Doppler model must be one of"):
+            FlatFadingChannel("rayleigh", coherence_time=1, snr_db=10, doppler_model="gauss", max_doppler=0.01)
+        with pytest.raises(ValueError, match="max_doppler"):
+            FlatFadingChannel("rayleigh", coherence_time=1, snr_db=10, doppler_model="jakes")
+        with pytest.raises(ValueError, match="max_doppler"):
+            FlatFadingChannel("rayleigh", coherence_time=1, snr_db=10, doppler_model="ar1", max_doppler=0.0)
+        with pytest.raises(ValueError, match="num_sinusoids"):
+            FlatFadingChannel("rayleigh", coherence_time=1, snr_db=10, doppler_model="jakes", max_doppler=0.01, num_sinusoids=0)
+
+    def test_expand_coefficients(self):
+        """Test that every block coefficient is repeated over its coherence time."""
+        channel = FlatFadingChannel("rayleigh", coherence_time=3, snr_db=10)
+        h = torch.complex(torch.randn(2, 4), torch.randn(2, 4))
+        expanded = channel._expand_coefficients(h, 10)
+        assert expanded.shape == (2, 10)
+        assert torch.equal(expanded, h[:, torch.arange(10) // 3])
+
+    @pytest.mark.parametrize("doppler_model", ["jakes", "ar1"])
+    def test_time_correlated_statistics(self, doppler_model):
+        """Test the unit power and the block-to-block correlation of time-correlated fading."""
+        torch.manual_seed(0)
+        max_doppler, coherence_time = 0.01, 2
+        channel = FlatFadingChannel("rayleigh", coherence_time=coherence_time, snr_db=10, doppler_model=doppler_model, max_doppler=max_doppler)
+        h = channel._generate_fading_coefficients(4000, 100 * coherence_time, torch.device("cpu"))
+        assert h.shape == (4000, 100)
+        assert abs(h.abs().pow(2).mean().item() - 1) < 0.05
+
+        # The correlation at a lag of d blocks approaches the Clarke autocorrelation J0(2 pi f_D d L),
+        # which the AR(1) process matches at one block and extrapolates geometrically beyond
+        rho = torch.special.bessel_j0(torch.tensor(2 * math.pi * max_doppler * coherence_time, dtype=torch.float64)).item()
+        for lag in (1, 10):
+            correlation = (h[:, lag:] * h[:, :-lag].conj()).mean().real.item()
+            expected = torch.special.bessel_j0(torch.tensor(2 * math.pi * max_doppler * lag * coherence_time, dtype=torch.float64)).item() if doppler_model == "jakes" else rho**lag
+            assert abs(correlation - expected) < 0.05
+
+    @pytest.mark.parametrize("doppler_model", ["jakes", "ar1"])
+    def test_time_correlated_state(self, doppler_model):
+        """Test that consecutive calls continue the same realization of the fading process."""
+        channel = FlatFadingChannel("rayleigh", coherence_time=1, snr_db=10, doppler_model=doppler_model, max_doppler=0.02)
+        h = [channel._generate_fading_coefficients(2000, 50, torch.device("cpu")) for _ in range(2)]
+
+        # The correlation across the call boundary matches the correlation within a call
+        within = (h[0][:, 1:] * h[0][:, :-1].conj()).mean().real.item()
+        across = (h[1][:, 0] * h[0][:, -1].conj()).mean().real.item()
+        assert abs(within - across) < 0.05
+        assert across > 0.9
+
+        # A reset or a new batch size starts an independent realization
+        channel.reset_fading_state()
+        restarted = channel._generate_fading_coefficients(2000, 1, torch.device("cpu"))
+        assert abs((restarted[:, 0] * h[1][:, -1].conj()).mean().real.item()) < 0.1
+        assert channel._generate_fading_coefficients(3, 5, torch.device("cpu")).shape == (3, 5)
+        assert channel._fading_state["batch_size"] == 3
+
+    def test_jakes_continuity(self):
+        """Test that splitting a sequence over two calls gives the same Jakes fading as one call."""
+        kwargs = dict(coherence_time=1, snr_db=10, doppler_model="jakes", max_doppler=0.05)
+        torch.manual_seed(0)
+        channel = FlatFadingChannel("rayleigh", **kwargs)
+        split = torch.cat([channel._generate_fading_coefficients(8, 37, torch.device("cpu")), channel._generate_fading_coefficients(8, 64, torch.device("cpu"))], dim=1)
+        torch.manual_seed(0)
+        whole = FlatFadingChannel("rayleigh", **kwargs)._generate_fading_coefficients(8, 101, torch.device("cpu"))
+        assert torch.allclose(split, whole, atol=1e-5)
+
 
 def test_flat_fading_channel_with_custom_noise(complex_tensor):
     """Test FlatFadingChannel when explicit noise is provided (covers branch: if noise is not
@@ -530,6 +597,99 @@ def test_flat_fading_channel_input_shape_extended():
     assert y_3d.shape == x_3d.shape
 
 
+def reference_multipath(x, taps, block_length):
+    """Filter every sample with the taps of its coherence block, one output sample at a time."""
+    y = torch.zeros_like(x)
+    for i in range(x.shape[1]):
+        for lag in range(min(i + 1, taps.shape[-1])):
+            y[:, i] += taps[:, i // block_length, lag] * x[:, i - lag]
+    return y
+
+
+class TestMultipathFadingChannel:
+    """Test suite for MultipathFadingChannel."""
+
+    def test_power_delay_profiles(self):
+        """Test the normalized tap powers of the supported power delay profiles."""
+        channel = MultipathFadingChannel("exponential", delay_spread=2.0, snr_db=10)
+        assert channel.num_taps == 11
+        assert torch.isclose(channel.tap_powers.sum(), torch.tensor(1.0))
+        assert torch.allclose(channel.tap_powers[1:] / channel.tap_powers[:-1], torch.full((10,), math.exp(-0.5)))
+
+        # Taps of the 3GPP profiles are quantized to whole samples
+        channel = MultipathFadingChannel("tdl-a", delay_spread=2.0, avg_noise_power=0.1)
+        assert channel.num_taps == 20
+        assert torch.isclose(channel.tap_powers.sum(), torch.tensor(1.0))
+
+        channel = MultipathFadingChannel([2.0, 0.0, 2.0], snr_db=10)
+        assert torch.equal(channel.tap_powers, torch.tensor([0.5, 0.0, 0.5]))
+
+    def test_invalid_arguments(self):
+        """Test that invalid parameters are rejected."""
+        with pytest.raises(ValueError, match="Power delay profile must be one of"):
+            MultipathFadingChannel("tdl-z", delay_spread=1.0, snr_db=10)
+        with pytest.raises(ValueError, match="delay_spread"):
+            MultipathFadingChannel("tdl-a", snr_db=10)
+        with pytest.raises(ValueError, match="num_taps"):
+            MultipathFadingChannel("exponential", delay_spread=1.0, num_taps=0, snr_db=10)
+        with pytest.raises(ValueError, match="Tap powers"):
+            MultipathFadingChannel([1.0, -1.0], snr_db=10)
+        with pytest.raises(ValueError, match="coherence_time"):
+            MultipathFadingChannel([1.0], coherence_time=0, snr_db=10)
+        with pytest.raises(ValueError, match="Convolution method"):
+            MultipathFadingChannel([1.0], method="overlap-add", snr_db=10)
+        with pytest.raises(ValueError, match="avg_noise_power or snr_db"):
+            MultipathFadingChannel([1.0])
+
+    @pytest.mark.parametrize("num_taps,block_length,seq_length", [(1, 5, 9), (5, 7, 50), (20, 13, 61), (40, 200, 150), (33, 1000, 999)])
+    def test_convolution_methods(self, num_taps, block_length, seq_length):
+        """Test that direct and overlap-save convolution match sample-by-sample filtering."""
+        torch.manual_seed(0)
+        channel = MultipathFadingChannel(torch.ones(num_taps), coherence_time=block_length, snr_db=10)
+        x = torch.randn(3, seq_length, dtype=torch.cfloat)
+        taps = torch.randn(3, -(-seq_length // block_length), num_taps, dtype=torch.cfloat)
+        expected = reference_multipath(x, taps, block_length)
+        assert torch.allclose(channel._direct_convolution(x, taps, block_length), expected, atol=1e-5)
+        assert torch.allclose(channel._fft_convolution(x, taps, block_length), expected, atol=1e-5)
+
+    @pytest.mark.parametrize("method", ["auto", "direct", "fft"])
+    def test_forward_with_csi_and_noise(self, method):
+        """Test the output and the frequency response for given taps and noise."""
+        torch.manual_seed(0)
+        channel = MultipathFadingChannel("exponential", delay_spread=4.0, method=method, snr_db=10)
+        x = torch.randn(4, 2, 50, dtype=torch.cfloat)
+        taps = torch.randn(4, channel.num_taps, dtype=torch.cfloat)
+        noise = torch.randn(4, 2, 50, dtype=torch.cfloat)
+
+        y, frequency_response = channel(x, csi=taps, noise=noise, return_csi=True, csi_fft_size=64)
+        assert y.shape == x.shape
+        assert torch.allclose(y, reference_multipath(x.reshape(4, 100), taps.unsqueeze(1), 100).reshape(4, 2, 50) + noise, atol=1e-5)
+        assert torch.allclose(frequency_response, torch.fft.fft(taps, n=64))
+
+    def test_time_varying_taps(self):
+        """Test the statistics and the frequency response of block-time-varying taps."""
+        torch.manual_seed(0)
+        channel = MultipathFadingChannel("tdl-c", delay_spread=2.0, coherence_time=16, avg_noise_power=1e-3)
+        y, frequency_response = channel(torch.ones(2000, 40), return_csi=True)
+        assert y.shape == (2000, 40)
+        assert frequency_response.shape == (2000, 3, 16)
+
+        # Unit average channel gain at every frequency, independent taps across blocks
+        assert abs(frequency_response.abs().pow(2).mean().item() - 1) < 0.05
+        assert abs((frequency_response[:, 1] * frequency_response[:, 0].conj()).mean().real.item()) < 0.05
+
+    def test_static_taps_per_batch_element(self):
+        """Test that the taps are constant over the sequence and differ across the batch."""
+        torch.manual_seed(0)
+        channel = MultipathFadingChannel([1.0, 0.5], avg_noise_power=1e-8)
+        impulses = torch.zeros(2, 20)
+        impulses[:, [0, 10]] = 1
+        y = channel(impulses)
+        assert torch.allclose(y[:, :2], y[:, 10:12], atol=1e-3)
+        assert not torch.allclose(y[0, :2], y[1, :2], atol=1e-3)
+        assert channel(torch.ones(30)).shape == (30,)
+
+
 class TestNonlinearChannel:
     """Test suite for NonlinearChannel."""
 
@@ -802,6 +962,18 @@ class TestRicianFadingChannel:
         with pytest.raises(ValueError):
             RicianFadingChannel(k_factor=5.0)
 
+    def test_time_correlated_fading(self):
+        """Test that the Doppler model applies to the scattered component around the LOS
+        component."""
+        torch.manual_seed(0)
+        channel = RicianFadingChannel(k_factor=3.0, coherence_time=4, snr_db=20, doppler_model="ar1", max_doppler=0.01)
+        assert channel(torch.ones(8, 40, dtype=torch.cfloat)).shape == (8, 40)
+
+        h = channel._generate_fading_coefficients(4000, 40, torch.device("cpu"))
+        assert abs(h.mean().real.item() - math.sqrt(3 / 4)) < 0.02
+        assert abs(h.abs().pow(2).mean().item() - 1) < 0.05
+        assert isinstance(RayleighFadingChannel(coherence_time=1, snr_db=10, doppler_model="jakes", max_doppler=0.01)(torch.ones(30, dtype=torch.cfloat)), torch.Tensor)
+
 
 class TestLogNormalFadingChannel:
     """Test suite for LogNormalFadingChannel."""
@@ -0,0 +1,105 @@
+"""Tests for the MIMO channel."""
+
+import pytest
+import torch
+
+from kaira.channels import ChannelRegistry, MIMOChannel
+
+
+class TestMIMOChannel:
+    """Test suite for MIMOChannel class."""
+
+    def test_invalid_arguments(self):
+        """Test that invalid configurations and inputs are rejected."""
+        with pytest.raises(ValueError, match="positive"):
+            MIMOChannel(0, 2, avg_noise_power=0.1)
+        with pytest.raises(ValueError, match="Fading type"):
+            MIMOChannel(2, 2, fading_type="nakagami", avg_noise_power=0.1)
+        with pytest.raises(ValueError, match="K-factor"):
+            MIMOChannel(2, 2, fading_type="rician", avg_noise_power=0.1)
+        with pytest.raises(ValueError, match="coherence_time"):
+            MIMOChannel(2, 2, coherence_time=0, avg_noise_power=0.1)
+        with pytest.raises(ValueError, match="between 0 and 1"):
+            MIMOChannel(2, 2, tx_correlation=1.5, avg_noise_power=0.1)
+        with pytest.raises(ValueError, match="shape"):
+            MIMOChannel(2, 2, rx_correlation=torch.eye(3), avg_noise_power=0.1)
+        with pytest.raises(ValueError, match="Hermitian"):
+            MIMOChannel(2, 2, rx_correlation=[[1.0, 0.5], [0.0, 1.0]], avg_noise_power=0.1)
+        with pytest.raises(ValueError, match="positive semidefinite"):
+            MIMOChannel(2, 2, rx_correlation=[[1.0, 2.0], [2.0, 1.0]], avg_noise_power=0.1)
+        with pytest.raises(ValueError, match="avg_noise_power or snr_db"):
+            MIMOChannel(2, 2)
+        with pytest.raises(ValueError, match="num_tx"):
+            MIMOChannel(2, 2, avg_noise_power=0.1)(torch.zeros(4, 3, dtype=torch.cfloat))
+
+    def test_registration(self):
+        """Test that the channel is available from the registry."""
+        assert ChannelRegistry.get("mimochannel") is MIMOChannel
+
+    def test_output_shapes_and_coherence(self):
+        """Test the shapes of the received vectors and channel matrices for every coherence setting."""
+        x = torch.randn(8, 10, 2, dtype=torch.cfloat)
+
+        y, h = MIMOChannel(2, 3, avg_noise_power=0.1)(x, return_csi=True)
+        assert y.shape == (8, 10, 3)
+        assert h.shape == (8, 3, 2)
+
+        y, h = MIMOChannel(2, 3, coherence_time=4, avg_noise_power=0.1)(x, return_csi=True)
+        assert y.shape == (8, 10, 3)
+        assert h.shape == (8, 10, 3, 2)
+        assert torch.equal(h[:, 0], h[:, 3]) and torch.equal(h[:, 8], h[:, 9])
+        assert not torch.equal(h[:, 3], h[:, 4])
+
+        y, h = MIMOChannel(2, 3, coherence_time=1, snr_db=10)(x[:, 0], return_csi=True)
+        assert y.shape == (8, 3)
+        assert h.shape == (8, 3, 2)
+
+    def test_noiseless_transmission(self):
+        """Test y = Hx for shared and per-vector channel matrices."""
+        x = torch.randn(4, 6, 2, dtype=torch.cfloat)
+        channel = MIMOChannel(2, 4, avg_noise_power=0.1)
+
+        y, h = channel(x, noise=torch.zeros(4, 6, 4, dtype=torch.cfloat), return_csi=True)
+        assert torch.allclose(y, torch.einsum("brt,bvt->bvr", h, x), atol=1e-6)
+
+        h = torch.randn(4, 6, 4, 2, dtype=torch.cfloat)
+        y = channel(x, csi=h, noise=torch.zeros(4, 6, 4, dtype=torch.cfloat))
+        assert torch.allclose(y, (h @ x.unsqueeze(-1)).squeeze(-1), atol=1e-6)
+
+        # Real inputs are transmitted as complex symbols
+        assert torch.is_complex(channel(torch.ones(4, 2)))
+
+    def test_noise_power(self):
+        """Test that the noise variance per receive antenna equals avg_noise_power."""
+        torch.manual_seed(0)
+        x = torch.zeros(20000, 2, dtype=torch.cfloat)
+        y = MIMOChannel(2, 3, avg_noise_power=0.2)(x)
+        assert torch.allclose(y.abs().square().mean(dim=0), torch.full((3,), 0.2), rtol=0.05)
+
+    @pytest.mark.parametrize("fading_type,k_factor", [("rayleigh", None), ("rician", 3.0)])
+    def test_channel_statistics(self, fading_type, k_factor):
+        """Test the mean, power and Kronecker correlation of the channel coefficients."""
+        torch.manual_seed(0)
+        rho = 0.7
+        channel = MIMOChannel(2, 3, fading_type=fading_type, k_factor=k_factor, rx_correlation=rho, avg_noise_power=0.1)
+        h = channel.generate_channel_matrices(50000)
+        assert h.shape == (50000, 3, 2)
+
+        mean = (k_factor / (k_factor + 1)) ** 0.5 if k_factor is not None else 0.0
+        assert torch.allclose(h.mean(dim=0).real, torch.full((3, 2), mean), atol=0.02)
+        assert torch.allclose(h.abs().square().mean(dim=0), torch.ones(3, 2), atol=0.03)
+
+        # Correlation of the scattered components between receive antennas i and j is rho^|i-j|
+        scattered = h - h.mean(dim=0)
+        scale = 1 / (k_factor + 1) if k_factor is not None else 1.0
+        correlation = torch.einsum("bit,bjt->ij", scattered, scattered.conj()).real / (2 * 50000 * scale)
+        expected = torch.tensor([[1.0, rho, rho**2], [rho, 1.0, rho], [rho**2, rho, 1.0]])
+        assert torch.allclose(correlation, expected, atol=0.03)
+
+    def test_transmit_correlation_matrix(self):
+        """Test a transmit correlation matrix given explicitly."""
+        torch.manual_seed(0)
+        correlation = torch.tensor([[1.0, 0.5j], [-0.5j, 1.0]])
+        h = MIMOChannel(2, 1, tx_correlation=correlation, avg_noise_power=0.1).generate_channel_matrices(50000)
+        empirical = torch.einsum("bri,brj->ij", h.conj(), h) / 50000
+        assert torch.allclose(empirical, correlation.to(empirical.dtype), atol=0.03)
@@ -378,3 +378,116 @@ class TestUplinkMACChannel:
         assert "num_users=2" in repr_str
         assert "interference_power=0.05" in repr_str
         assert "combine_method=weighted_sum" in repr_str
+
+    def test_stacked_input_matches_list_input(self):
+        """Test that a stacked user tensor gives the same output as a list of user signals."""
+        channel = UplinkMACChannel(
+            user_channels=AWGNChannel(avg_noise_power=0.0),
+            num_users=4,
+            user_gains=[1.0, 0.5, 2.0, 0.8],
+            interference_power=0.2,
+        )
+        user_signals = torch.randn(4, 6, 16, dtype=torch.complex64)
+
+        stacked_output = channel(user_signals)
+        list_output = channel(list(user_signals))
+
+        assert stacked_output.shape == (6, 16)
+        assert torch.allclose(stacked_output, list_output, atol=1e-6)
+
+        with pytest.raises(ValueError, match="Expected 4 user signals, got 3"):
+            channel(user_signals[:3])
+        with pytest.raises(TypeError, match="stacked torch.Tensor"):
+            channel("not a signal")
+
+    def test_interference_matches_pairwise_sum(self):
+        """Test that the interference of every user is the scaled sum of all other users."""
+        channel = UplinkMACChannel(
+            user_channels=AWGNChannel(avg_noise_power=0.0),
+            num_users=5,
+            interference_power=0.3,
+        )
+        signals = torch.randn(5, 3, 8, dtype=torch.complex64)
+
+        scale = (0.3 / 4) ** 0.5
+        expected = torch.stack([signals[i] + scale * sum(signals[j] for j in range(5) if j != i) for i in range(5)])
+        assert torch.allclose(channel._add_interference(signals), expected, atol=1e-5)
+
+        # Without other users there is no interference
+        single = UplinkMACChannel(user_channels=AWGNChannel(avg_noise_power=0.0), num_users=1, interference_power=0.3)
+        assert torch.equal(single._add_interference(signals[:1]), signals[:1])
+
+    def test_shared_channel_single_call(self):
+        """Test that users sharing a channel instance are processed in one call with independent fading."""
+        shared_channel = RayleighFadingChannel(avg_noise_power=0.0)
+        calls = []
+        shared_channel.register_forward_hook(lambda module, inputs, output: calls.append(inputs[0].shape))
+        channel = UplinkMACChannel(user_channels=[shared_channel, AWGNChannel(avg_noise_power=0.0), shared_channel])
+
+        user_signals = torch.ones(3, 4, 10, dtype=torch.complex64)
+        processed = channel._apply_user_channels(user_signals, None, None)
+
+        assert calls == [torch.Size([8, 10])]
+        assert torch.allclose(processed[1], user_signals[1])
+        # Fading coefficients are drawn independently for the users of the shared channel
+        assert not torch.allclose(processed[0], processed[2])
+
+    def test_snr_noise_follows_user_power(self):
+        """Test that SNR-configured channels scale the noise of every user to its own power."""
+        torch.manual_seed(0)
+        shared_channel = AWGNChannel(snr_db=10)
+        calls = []
+        shared_channel.register_forward_hook(lambda module, inputs, output: calls.append(inputs[0].shape))
+        channel = UplinkMACChannel(user_channels=shared_channel, num_users=2)
+        user_signals = torch.stack([torch.ones(64, 1000), torch.full((64, 1000), 10.0)])
+
+        processed = channel._apply_user_channels(user_signals, None, None)
+
+        assert calls == [torch.Size([64, 1000])] * 2
+        noise_power = (processed - user_signals).pow(2).mean(dim=(1, 2))
+        assert torch.allclose(noise_power, torch.tensor([0.1, 10.0]), rtol=0.05)
+
+        # Given noise is added as it is, in a single call for all users
+        calls.clear()
+        noise = torch.randn_like(user_signals)
+        assert torch.allclose(channel._apply_user_channels(user_signals, None, noise), user_signals + noise)
+        assert calls == [torch.Size([128, 1000])]
+
+    def test_unbatched_users_fade_independently(self):
+        """Test that coherence blocks of users without a batch dimension do not span users."""
+        torch.manual_seed(0)
+        channel = UplinkMACChannel(user_channels=RayleighFadingChannel(coherence_time=4, avg_noise_power=0.0), num_users=3)
+        user_signals = torch.ones(3, 6, dtype=torch.complex64)
+
+        processed = channel._apply_user_channels(user_signals, None, None)
+
+        assert processed.shape == (3, 6)
+        # Every user starts a new coherence block with its own fading coefficient
+        assert torch.allclose(processed[:, :4], processed[:, :1].expand(3, 4))
+        assert not torch.isclose(processed[0, 0], processed[1, 0])
+        assert not torch.isclose(processed[1, 0], processed[2, 0])
+        assert channel(list(user_signals)).shape == (6,)
+
+    def test_stacked_csi_and_noise(self):
+        """Test that stacked per-user CSI and noise are passed to the user channels."""
+        channel = UplinkMACChannel(
+            user_channels=FlatFadingChannel(fading_type="rayleigh", coherence_time=1, avg_noise_power=0.1),
+            num_users=3,
+            user_gains=[1.0, 2.0, 0.5],
+        )
+        user_signals = torch.randn(3, 2, 5, dtype=torch.complex64)
+        user_csi = torch.randn(3, 2, 5, dtype=torch.complex64)
+        user_noise = torch.randn(3, 2, 5, dtype=torch.complex64)
+
+        output = channel(user_signals, user_csi=user_csi, user_noise=user_noise)
+        expected = ((user_csi * user_signals + user_noise) * channel.user_gains.view(3, 1, 1)).sum(dim=0)
+        assert torch.allclose(output, expected, atol=1e-5)
+
+        with pytest.raises(ValueError, match="Expected 3 user_noise"):
+            channel(user_signals, user_noise=user_noise[:2])
+
+    def test_user_gains_buffer(self):
+        """Test that the user gains are a buffer that follows the module."""
+        channel = UplinkMACChannel(user_channels=AWGNChannel(avg_noise_power=0.1), num_users=3, user_gains=[1.0, 0.5, 0.2])
+        assert any(buffer is channel.user_gains for buffer in channel.buffers())
+        assert channel.to(torch.float64).user_gains.dtype == torch.float64
@@ -96,6 +96,177 @@ class TestBeliefPropagationDecoder:
         # Verify cv_map has one entry per check node
         assert len(decoder.cv_map) == decoder.n_c
 
+    def test_invalid_backend(self):
+        """Test that an unknown message-passing backend raises an error."""
+        H = torch.tensor([[1, 0, 1, 1, 0, 0], [0, 1, 1, 0, 1, 0], [0, 0, 0, 1, 1, 1]], dtype=torch.float32)
+        encoder = LDPCCodeEncoder(check_matrix=H)
+
+        with pytest.raises(ValueError, match="Unknown backend"):
+            BeliefPropagationDecoder(encoder=encoder, backend="dense")
+
+    def test_prep_edge_list(self):
+        """Test the CSR/COO edge-list representation of the Tanner graph."""
+        H = torch.tensor([[1, 0, 1, 1, 0, 0], [0, 1, 1, 0, 1, 0], [0, 0, 0, 1, 1, 1]], dtype=torch.float32)
+
+        encoder = LDPCCodeEncoder(check_matrix=H)
+        decoder = BeliefPropagationDecoder(encoder=encoder, bp_iters=10, backend="edge_list")
+
+        # COO arrays follow the edge numbering of the index-table backend
+        assert torch.equal(decoder.edge_var, decoder.lv_ind)
+        assert torch.all(H[decoder.edge_check, decoder.edge_var] == 1)
+
+        # CSR row pointers and padded check table are consistent with the check degrees
+        assert torch.equal(decoder.check_ptr, torch.tensor([0, 3, 6, 9]))
+        assert decoder.check_edges.shape == (3, 3)
+        for c_node in range(decoder.n_c):
+            assert sorted(decoder.check_edges[c_node].tolist()) == sorted(decoder.cv_map[c_node])
+
+        # Every edge maps back to its own slot in the padded table
+        assert torch.equal(decoder.check_edges.flatten()[decoder.edge_slot], torch.arange(decoder.num_edges))
+
+    @pytest.mark.parametrize("arctanh", [True, False])
+    def test_edge_list_backend_matches_combinations(self, arctanh):
+        """Test that the edge-list backend returns the same LLRs as the index-table backend."""
+        torch.manual_seed(0)
+        H = torch.zeros(12, 24, dtype=torch.int64)
+        for v_node in range(24):
+            H[torch.randperm(12)[:3], v_node] = 1
+
+        encoder = LDPCCodeEncoder(check_matrix=H)
+        reference = BeliefPropagationDecoder(encoder=encoder, bp_iters=5, arctanh=arctanh)
+        decoder = BeliefPropagationDecoder(encoder=encoder, bp_iters=5, arctanh=arctanh, backend="edge_list")
+
+        received = torch.randn(8, 24) + 1.0
+        received[0, 3] = 0.0  # Zero-valued message exercises the leave-one-out product
+
+        decoded_ref, soft_ref = reference(received, return_soft=True)
+        decoded, soft = decoder(received, return_soft=True)
+
+        assert torch.allclose(soft, soft_ref, atol=1e-4)
+        assert torch.equal(decoded, decoded_ref)
+
+    def test_edge_list_backend_linear_block_code(self):
+        """Test the edge-list backend on a dense (non-LDPC) linear block code."""
+        G = torch.tensor([[1.0, 0.0, 0.0, 1.0, 1.0, 0.0], [0.0, 1.0, 0.0, 1.0, 0.0, 1.0], [0.0, 0.0, 1.0, 0.0, 1.0, 1.0]], dtype=torch.float32)
+        encoder = LinearBlockCodeEncoder(generator_matrix=G)
+
+        reference = BeliefPropagationDecoder(encoder=encoder, bp_iters=5)
+        decoder = BeliefPropagationDecoder(encoder=encoder, bp_iters=5, backend="edge_list")
+
+        received = torch.randn(4, 6)
+        assert torch.allclose(decoder(received, return_soft=True)[1], reference(received, return_soft=True)[1], atol=1e-4)
+
+    def test_invalid_schedule(self):
+        """Test that an unknown message-passing schedule raises an error."""
+        H = torch.tensor([[1, 0, 1, 1, 0, 0], [0, 1, 1, 0, 1, 0], [0, 0, 0, 1, 1, 1]], dtype=torch.float32)
+        encoder = LDPCCodeEncoder(check_matrix=H)
+
+        with pytest.raises(ValueError, match="Unknown schedule"):
+            BeliefPropagationDecoder(encoder=encoder, schedule="serial")
+
+    def test_layers_column_disjoint(self):
+        """Test that automatically computed layers partition H into column-disjoint groups."""
+        torch.manual_seed(0)
+        H = torch.zeros(12, 24, dtype=torch.int64)
+        for v_node in range(24):
+            H[torch.randperm(12)[:3], v_node] = 1
+
+        encoder = LDPCCodeEncoder(check_matrix=H)
+        decoder = BeliefPropagationDecoder(encoder=encoder, schedule="layered")
+
+        assert sorted(c_node for layer in decoder.layers for c_node in layer) == list(range(12))
+        for layer in decoder.layers:
+            assert H[layer].sum(0).max() <= 1
+
+    def test_layers_from_lifting_size(self):
+        """Test that the block rows of a quasi-cyclic code become the layers."""
+        lifting_size = 5
+        base_matrix = torch.tensor([[0, 1, -1, 2], [3, -1, 0, 4]])
+        identity = torch.eye(lifting_size, dtype=torch.int64)
+        H = torch.zeros(2 * lifting_size, 4 * lifting_size, dtype=torch.int64)
+        for i in range(2):
+            for j in range(4):
+                if base_matrix[i, j] >= 0:
+                    H[i * lifting_size : (i + 1) * lifting_size, j * lifting_size : (j + 1) * lifting_size] = torch.roll(identity, int(base_matrix[i, j]), 1)
+
+        encoder = LDPCCodeEncoder(check_matrix=H, lifting_size=lifting_size)
+        decoder = BeliefPropagationDecoder(encoder=encoder, schedule="layered")
+
+        assert decoder.layers == [[0, 1, 2, 3, 4], [5, 6, 7, 8, 9]]
+
+    def test_invalid_layers(self):
+        """Test that layers which are not a column-disjoint partition are rejected."""
+        H = torch.tensor([[1, 0, 1, 1, 0, 0], [0, 1, 1, 0, 1, 0], [0, 0, 0, 1, 1, 1]], dtype=torch.float32)
+        encoder = LDPCCodeEncoder(check_matrix=H)
+
+        with pytest.raises(ValueError, match="partition"):
+            BeliefPropagationDecoder(encoder=encoder, schedule="layered", layers=[[0], [1]])
+        with pytest.raises(ValueError, match="share variable nodes"):
+            BeliefPropagationDecoder(encoder=encoder, schedule="layered", layers=[[0, 1], [2]])
+
+    def test_layered_decoding_with_noise(self):
+        """Test that the layered schedule decodes at least as well as flooding with the same iterations."""
+        torch.manual_seed(0)
+        H = torch.zeros(30, 60, dtype=torch.int64)
+        for v_node in range(60):
+            H[torch.randperm(30)[:3], v_node] = 1
+
+        encoder = LDPCCodeEncoder(check_matrix=H)
+        messages = torch.randint(0, 2, (200, encoder.code_dimension)).float()
+        codewords = encoder(messages)
+        received = 2.0 * (1 - 2.0 * codewords + 0.6 * torch.randn_like(codewords)) / 0.36
+
+        flooding = BeliefPropagationDecoder(encoder=encoder, bp_iters=5)
+        layered = BeliefPropagationDecoder(encoder=encoder, bp_iters=5, schedule="layered")
+
+        _, soft_flooding = flooding(received, return_soft=True)
+        _, soft_layered = layered(received, return_soft=True)
+        errors_flooding = ((soft_flooding < 0).float() != codewords).sum()
+        errors_layered = ((soft_layered < 0).float() != codewords).sum()
+
+        assert soft_layered.shape == codewords.shape
+        assert errors_layered <= errors_flooding
+
+    def test_is_codeword(self):
+        """Test the syndrome check of hard decisions."""
+        H = torch.tensor([[1, 0, 1, 1, 0, 0], [0, 1, 1, 0, 1, 0], [0, 0, 0, 1, 1, 1]], dtype=torch.float32)
+        encoder = LDPCCodeEncoder(check_matrix=H)
+        decoder = BeliefPropagationDecoder(encoder=encoder)
+
+        codeword = encoder(torch.tensor([1.0, 0.0, 1.0]))
+        llr = torch.stack([1 - 2.0 * codeword, 1 - 2.0 * codeword])
+        llr[1, 0] *= -1
+
+        assert torch.equal(decoder.is_codeword(llr), torch.tensor([True, False]))
+
+    @pytest.mark.parametrize("schedule", ["flooding", "layered"])
+    def test_early_stop(self, schedule):
+        """Test that early stopping freezes converged codewords without changing their decisions."""
+        torch.manual_seed(0)
+        H = torch.zeros(30, 60, dtype=torch.int64)
+        for v_node in range(60):
+            H[torch.randperm(30)[:3], v_node] = 1
+
+        encoder = LDPCCodeEncoder(check_matrix=H)
+        messages = torch.randint(0, 2, (100, encoder.code_dimension)).float()
+        codewords = encoder(messages)
+        received = 2.0 * (1 - 2.0 * codewords + 0.5 * torch.randn_like(codewords)) / 0.25
+
+        full = BeliefPropagationDecoder(encoder=encoder, bp_iters=20, schedule=schedule)
+        early = BeliefPropagationDecoder(encoder=encoder, bp_iters=20, schedule=schedule, early_stop=True)
+
+        _, soft_full = full(received, return_soft=True)
+        _, soft_early = early(received, return_soft=True)
+
+        assert torch.all(full.iteration_count == 20)
+        assert early.iteration_count.shape == (100, 1)
+        assert early.iteration_count.float().mean() < 20
+
+        # Codewords that stopped early satisfy all parity checks
+        stopped = early.iteration_count.view(-1) < 20
+        assert torch.all(early.is_codeword(soft_early[stopped]))
+        assert torch.equal((soft_early[stopped] < 0), (soft_full[stopped] < 0))
+
     def test_decoding_no_errors(self):
         """Test decoding a codeword with no errors."""
         # Create a simple parity check matrix for an LDPC code
@@ -134,7 +134,7 @@ class TestBeliefPropagationPolarDecoder:
 
     def test_update_right(self):
         """Test update_right method."""
-        decoder = BeliefPropagationPolarDecoder(self.encoder)
+        decoder = BeliefPropagationPolarDecoder(self.encoder, trace_messages=True)
 
         batch_size = 2
         llr = torch.randn(batch_size, self.code_length)
@@ -149,7 +149,7 @@ class TestBeliefPropagationPolarDecoder:
 
     def test_update_left(self):
         """Test update_left method."""
-        decoder = BeliefPropagationPolarDecoder(self.encoder)
+        decoder = BeliefPropagationPolarDecoder(self.encoder, trace_messages=True)
 
         batch_size = 2
         llr = torch.randn(batch_size, self.code_length)
@@ -189,6 +189,22 @@ class TestBeliefPropagationPolarDecoder:
         assert u_bits.shape == (batch_size, self.code_length)
         assert x_bits.shape == (batch_size, self.code_length)
 
+    def test_iteration_count(self):
+        """Test that the per-codeword iteration count is reported."""
+        decoder = BeliefPropagationPolarDecoder(self.encoder, bp_iters=5, early_stop=True)
+
+        # The all-zero codeword with reliable LLRs converges before the iteration limit
+        llr = torch.tensor([[10.0, 10.0, 10.0, 10.0], [1.0, -1.0, 0.5, -0.5]])
+        decoder.decode_iterative(llr)
+
+        assert decoder.iteration_count.shape == (2,)
+        assert decoder.iteration_count[0] < 5
+        assert torch.all(decoder.iteration_count <= 5)
+
+        decoder = BeliefPropagationPolarDecoder(self.encoder, bp_iters=3)
+        decoder(llr)
+        assert torch.all(decoder.iteration_count == 3)
+
     def test_forward_decoding(self):
         """Test forward decoding method."""
         decoder = BeliefPropagationPolarDecoder(self.encoder, bp_iters=2)
@@ -344,3 +360,64 @@ class TestBeliefPropagationPolarDecoder:
         decoded2 = decoder.forward(received)
 
         assert torch.allclose(decoded1, decoded2)
+
+
+class TestBatchedPermutations:
+    """Test suite for decoding all permutations of the factor graph simultaneously."""
+
+    def setup_method(self):
+        """Set up a polar code and noisy LLRs of its codewords."""
+        torch.manual_seed(0)
+        self.encoder = PolarCodeEncoder(8, 16, polar_i=False)
+        self.messages = torch.randint(0, 2, (40, 8)).float()
+        codewords = self.encoder(self.messages)
+        self.llr = 2.0 * (1 - 2 * codewords) + 1.5 * torch.randn_like(codewords)
+
+    @pytest.mark.parametrize("early_stop", [False, True])
+    def test_single_permutation_matches_serial(self, early_stop):
+        """Test that a single batched permutation decodes exactly like the serial decoder."""
+        serial = BeliefPropagationPolarDecoder(self.encoder, bp_iters=6, early_stop=early_stop)
+        batched = BeliefPropagationPolarDecoder(self.encoder, bp_iters=6, early_stop=early_stop, batch_permutations=True)
+
+        for expected, result in zip(serial.decode_iterative(self.llr), batched.decode_iterative(self.llr)):
+            assert torch.equal(result, expected)
+        assert torch.equal(batched.iteration_count, serial.iteration_count)
+
+    @pytest.mark.parametrize("early_stop", [False, True])
+    def test_best_candidate_selection(self, early_stop):
+        """Test that every codeword gets the candidate of the permutation that agrees best with its re-encoding."""
+        batched = BeliefPropagationPolarDecoder(self.encoder, bp_iters=6, early_stop=early_stop, perm="cycle", batch_permutations=True)
+        u_bits, x_bits = batched.decode_iterative(self.llr)
+        generator_matrix = self.encoder.get_generator_matrix()
+
+        # Candidates of the permutations decoded one at a time
+        candidates, iterations = [], 0
+        for permutation in batched.permutations:
+            serial = BeliefPropagationPolarDecoder(self.encoder, bp_iters=6, early_stop=early_stop)
+            serial.permutations = permutation.unsqueeze(0)
+            candidates.append(serial.decode_iterative(self.llr))
+            iterations = iterations + serial.iteration_count
+        disagreements = torch.stack([((u @ generator_matrix) % 2 != x).sum(dim=1) for u, x in candidates])
+
+        assert torch.equal(batched.iteration_count, iterations)
+        assert torch.equal(((u_bits @ generator_matrix) % 2 != x_bits).sum(dim=1), disagreements.min(dim=0).values)
+        for b in range(self.llr.shape[0]):
+            assert any(torch.equal(u_bits[b], u[b]) and torch.equal(x_bits[b], x[b]) for u, x in candidates)
+
+    def test_forward(self):
+        """Test that batched permutation decoding recovers messages from reliable LLRs."""
+        decoder = BeliefPropagationPolarDecoder(self.encoder, bp_iters=10, early_stop=True, perm="cycle", batch_permutations=True)
+        llr = 10.0 * (1 - 2 * self.encoder(self.messages))
+        assert torch.equal(decoder(llr), self.messages)
+        assert decoder.iteration_count.shape == (40,)
+
+    @pytest.mark.parametrize("batch_permutations", [False, True])
+    def test_message_history_is_opt_in(self, batch_permutations):
+        """Test that the R and L matrices are only recorded when tracing is enabled."""
+        decoder = BeliefPropagationPolarDecoder(self.encoder, bp_iters=3, batch_permutations=batch_permutations)
+        decoder.decode_iterative(self.llr)
+        assert decoder.R_all == [] and decoder.L_all == []
+
+        decoder = BeliefPropagationPolarDecoder(self.encoder, bp_iters=3, batch_permutations=batch_permutations, trace_messages=True)
+        decoder.decode_iterative(self.llr)
+        assert len(decoder.R_all) == len(decoder.L_all) == 4
@@ -5,6 +5,7 @@ import torch
 
 from kaira.models.fec.decoders.berlekamp_massey import BerlekampMasseyDecoder
 from kaira.models.fec.encoders.bch_code import BCHCodeEncoder
+from kaira.models.fec.encoders.reed_solomon_code import ReedSolomonCodeEncoder
 
 
 class TestBerlekampMasseyDecoder:
@@ -77,6 +78,39 @@ class TestBerlekampMasseyDecoder:
         # The number of error positions should match the degree of the error locator polynomial
         assert len(error_positions) <= len(error_locator_poly) - 1
 
+    def test_compute_syndromes(self):
+        """Test the batched syndromes against the field element syndrome polynomial."""
+        encoder = BCHCodeEncoder(mu=4, delta=5)
+        decoder = BerlekampMasseyDecoder(encoder=encoder)
+        field = encoder._field
+
+        torch.manual_seed(0)
+        words = torch.randint(0, 2, (8, 15))
+        syndromes = decoder.compute_syndromes(words)
+
+        assert syndromes.shape == (8, 4)
+        for word, syndrome in zip(words, syndromes):
+            expected = encoder.calculate_syndrome_polynomial([field(int(bit)) for bit in word])
+            assert syndrome.tolist() == [s.value for s in expected]
+
+    def test_batched_berlekamp_massey_and_chien_search(self):
+        """Test that the batched error locator search recovers known error positions."""
+        encoder = BCHCodeEncoder(mu=5, delta=7)  # BCH(31,16) code with t=3
+        decoder = BerlekampMasseyDecoder(encoder=encoder)
+
+        errors = torch.zeros(4, 31, dtype=torch.long)
+        errors[0, [0]] = 1
+        errors[1, [3, 30]] = 1
+        errors[2, [1, 7, 19]] = 1
+        errors[3, [2, 4, 8, 16]] = 1  # Beyond the error correction capability
+
+        error_locator = decoder.batched_berlekamp_massey(decoder.compute_syndromes(errors))
+        assert error_locator.shape == (4, 7)
+
+        error_positions = decoder.chien_search(error_locator)
+        assert torch.equal(error_positions[:3], errors[:3].bool())
+        assert not torch.equal(error_positions[3], errors[3].bool())
+
     def test_decoding_no_errors(self):
         """Test decoding a codeword with no errors."""
         # Create a BCH encoder and decoder
@@ -180,3 +214,72 @@ class TestBerlekampMasseyDecoder:
         # Decoding should raise ValueError
         with pytest.raises(ValueError, match="Last dimension .* must be divisible by code length"):
             decoder(received)
+
+    @pytest.mark.parametrize("mu, delta", [(4, 5), (5, 7), (6, 11), (8, 39)])
+    def test_decoding_random_errors(self, mu, delta):
+        """Test batched decoding of random error patterns up to the correction capability."""
+        encoder = BCHCodeEncoder(mu=mu, delta=delta)
+        decoder = BerlekampMasseyDecoder(encoder=encoder)
+        n, t = encoder.code_length, decoder.t
+
+        torch.manual_seed(42)
+        messages = torch.randint(0, 2, (3, 20, encoder.code_dimension)).float()
+        codewords = encoder(messages)
+
+        weights = torch.randint(0, t + 1, (3, 20, 1))
+        errors = (torch.rand(3, 20, n).argsort(dim=-1) < weights).float()
+        received = (codewords + errors) % 2
+
+        decoded, estimated_errors = decoder(received, return_errors=True)
+
+        assert torch.equal(decoded, messages)
+        assert torch.equal(estimated_errors, errors)
+
+    def test_decoding_multiple_blocks(self):
+        """Test decoding when the last dimension holds several codewords."""
+        encoder = BCHCodeEncoder(mu=4, delta=5)
+        decoder = BerlekampMasseyDecoder(encoder=encoder)
+
+        messages = torch.tensor([[1.0, 0.0, 1.0, 1.0, 0.0, 1.0, 0.0, 0.0, 1.0, 0.0, 1.0, 1.0, 0.0, 1.0]])
+        received = encoder(messages)
+        received[0, 3] = 1.0 - received[0, 3]
+        received[0, 16] = 1.0 - received[0, 16]
+        received[0, 29] = 1.0 - received[0, 29]
+
+        decoded, errors = decoder(received, return_errors=True)
+
+        assert torch.equal(decoded, messages)
+        assert errors.shape == received.shape
+        assert torch.nonzero(errors[0]).view(-1).tolist() == [3, 16, 29]
+
+    @pytest.mark.parametrize("mu, delta, information_set", [(3, 5, "left"), (4, 5, "left"), (4, 9, "right"), (6, 19, "left")])
+    def test_reed_solomon_round_trip(self, mu, delta, information_set):
+        """Test symbol-level Reed-Solomon decoding without errors and with up to t symbol errors."""
+        encoder = ReedSolomonCodeEncoder(mu=mu, delta=delta, information_set=information_set)
+        decoder = BerlekampMasseyDecoder(encoder=encoder)
+        n, t = encoder.code_length, decoder.t
+        assert decoder.symbol_level
+
+        torch.manual_seed(0)
+        messages = torch.randint(0, 2**mu, (2, 30, encoder.code_dimension))
+        codewords = encoder.encode_symbols(messages)
+
+        # Error-free words are passed through
+        decoded, errors = decoder(codewords.float(), return_errors=True)
+        assert torch.equal(decoded, messages.float())
+        assert not errors.any()
+
+        # Up to t symbol errors with arbitrary non-zero values are corrected
+        weights = torch.randint(0, t + 1, (2, 30, 1))
+        positions = torch.rand(2, 30, n).argsort(dim=-1) < weights
+        error_values = torch.where(positions, torch.randint(1, 2**mu, (2, 30, n)), 0)
+        decoded, estimated_errors = decoder(torch.bitwise_xor(codewords, error_values), return_errors=True)
+
+        assert torch.equal(decoded, messages)
+        assert torch.equal(estimated_errors, error_values)
+
+    def test_reed_solomon_invalid_symbols(self):
+        """Test that received values outside the field are rejected for Reed-Solomon codes."""
+        decoder = BerlekampMasseyDecoder(encoder=ReedSolomonCodeEncoder(mu=4, delta=5))
+        with pytest.raises(ValueError, match="Received symbols must be integers"):
+            decoder(torch.full((15,), 16.0))
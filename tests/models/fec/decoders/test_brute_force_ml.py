@@ -230,3 +230,51 @@ class TestBruteForceMLDecoder:
         # The codebook should still be None (generated on-demand during decoding)
         assert decoder._codebook is None
         assert decoder._message_map is None
+
+    @pytest.mark.parametrize("kwargs", [{}, {"batch_chunk_size": 7, "codebook_chunk_size": 3}, {"precompute_codebook": False, "codebook_chunk_size": 5}])
+    def test_chunked_decoding_matches_exhaustive_search(self, kwargs):
+        """Test that tiled decoding returns the closest codeword for every received word."""
+        torch.manual_seed(0)
+        encoder = HammingCodeEncoder(mu=3)
+        codebook, _ = BruteForceMLDecoder(encoder=encoder, precompute_codebook=False)._generate_codebook()
+        received = torch.randint(0, 2, (100, 7)).float()
+
+        decoder = BruteForceMLDecoder(encoder=encoder, **kwargs)
+        decoded, errors = decoder(received, return_errors=True)
+
+        distances = (received.unsqueeze(1) != codebook.unsqueeze(0)).sum(dim=-1)
+        closest = codebook[distances.argmin(dim=1)]
+        assert torch.equal(encoder(decoded), closest)
+        assert torch.equal((received + errors) % 2, closest)
+
+    def test_soft_decoding(self):
+        """Test that soft decoding returns the codeword with the largest correlation."""
+        torch.manual_seed(0)
+        encoder = HammingCodeEncoder(mu=3)
+        decoder = BruteForceMLDecoder(encoder=encoder, input_type="soft", codebook_chunk_size=4)
+        codebook = decoder._codebook
+
+        llr = 2.0 * torch.randn(100, 7)
+        decoded = decoder(llr)
+        best = ((1 - 2 * codebook) @ llr.T).argmax(dim=0)
+        assert torch.equal(encoder(decoded), codebook[best])
+
+        # Two unreliable wrong signs, beyond the hard-decision capability, are corrected
+        message = torch.tensor([[1.0, 0.0, 1.0, 1.0]])
+        llr = 3.0 * (1 - 2 * encoder(message))
+        llr[0, :2] = -0.2 * llr[0, :2].sign()
+        assert torch.equal(decoder(llr), message)
+
+        with pytest.raises(ValueError):
+            BruteForceMLDecoder(encoder=encoder, input_type="llr")
+
+    def test_codebook_cache(self, tmp_path):
+        """Test that the codebook is stored in and reloaded from the cache directory."""
+        encoder = HammingCodeEncoder(mu=3)
+        decoder = BruteForceMLDecoder(encoder=encoder, cache_dir=str(tmp_path))
+        assert len(list(tmp_path.iterdir())) == 1
+
+        cached = BruteForceMLDecoder(encoder=encoder, cache_dir=str(tmp_path))
+        assert torch.equal(cached._codebook, decoder._codebook)
+        assert torch.equal(cached._message_map, decoder._message_map)
+        assert len(list(tmp_path.iterdir())) == 1
@@ -0,0 +1,87 @@
+"""Tests for the ChaseDecoder in kaira.models.fec.decoders package."""
+
+import pytest
+import torch
+
+from kaira.models.fec.decoders import (
+    BerlekampMasseyDecoder,
+    BruteForceMLDecoder,
+    ChaseDecoder,
+    SyndromeLookupDecoder,
+)
+from kaira.models.fec.encoders import BCHCodeEncoder, GolayCodeEncoder, HammingCodeEncoder
+
+
+def noisy_llr(encoder, batch_size, noise_std, seed=0):
+    """Return random messages and the LLRs of their BPSK codewords over an AWGN channel."""
+    torch.manual_seed(seed)
+    messages = torch.randint(0, 2, (batch_size, encoder.code_dimension)).float()
+    return messages, 1 - 2 * encoder(messages) + noise_std * torch.randn(batch_size, encoder.code_length)
+
+
+class TestChaseDecoder:
+    """Test suite for ChaseDecoder class."""
+
+    def test_initialization(self):
+        """Test the inner decoder and the test patterns."""
+        encoder = HammingCodeEncoder(mu=3)
+        decoder = ChaseDecoder(encoder)
+        assert isinstance(decoder.inner_decoder, SyndromeLookupDecoder)
+        assert decoder.num_test_positions == 3
+        assert decoder.test_patterns.shape == (8, 3)
+        assert torch.equal(decoder.test_patterns.sum(dim=0), torch.tensor([4, 4, 4], dtype=torch.uint8))
+        assert not decoder.test_patterns[0].any()
+
+        inner = SyndromeLookupDecoder(encoder)
+        assert ChaseDecoder(encoder, inner, num_test_positions=0).inner_decoder is inner
+
+    def test_invalid_arguments(self):
+        """Test that invalid arguments are rejected."""
+        encoder = HammingCodeEncoder(mu=3)
+        with pytest.raises(ValueError, match="num_test_positions"):
+            ChaseDecoder(encoder, num_test_positions=8)
+        with pytest.raises(ValueError, match="batch_chunk_size"):
+            ChaseDecoder(encoder, batch_chunk_size=0)
+        with pytest.raises(ValueError, match="Inner decoder"):
+            ChaseDecoder(encoder, SyndromeLookupDecoder(HammingCodeEncoder(mu=4)))
+        with pytest.raises(ValueError, match="divisible"):
+            ChaseDecoder(encoder)(torch.zeros(2, 5))
+
+    def test_without_test_patterns(self):
+        """Test that no test positions reduce to hard-decision decoding."""
+        encoder = GolayCodeEncoder()
+        _, llr = noisy_llr(encoder, 100, 0.8)
+        inner = SyndromeLookupDecoder(encoder)
+        assert torch.equal(ChaseDecoder(encoder, inner, num_test_positions=0)(llr), inner((llr < 0).float()))
+
+    @pytest.mark.parametrize("make_encoder,inner_decoder", [(lambda: BCHCodeEncoder(mu=5, delta=7), BerlekampMasseyDecoder), (lambda: GolayCodeEncoder(extended=True), SyndromeLookupDecoder)])
+    def test_soft_decision_gain(self, make_encoder, inner_decoder):
+        """Test that more test patterns never increase the discrepancy and reduce block errors."""
+        encoder = make_encoder()
+        messages, llr = noisy_llr(encoder, 500, 0.7)
+
+        errors = []
+        for p in (0, 2, 4):
+            decoded, error_patterns = ChaseDecoder(encoder, inner_decoder, num_test_positions=p)(llr, return_errors=True)
+            errors.append((decoded != messages).any(dim=1).float().mean())
+
+            # The error patterns are relative to the hard decisions of the received word
+            assert torch.equal(error_patterns, (encoder(decoded) != (llr < 0).float()).float())
+        assert errors[2] < errors[1] < errors[0]
+
+    def test_full_search_matches_maximum_likelihood(self):
+        """Test that test patterns on all positions find the ML codeword."""
+        encoder = HammingCodeEncoder(mu=3)
+        _, llr = noisy_llr(encoder, 100, 1.0)
+        ml = BruteForceMLDecoder(encoder, input_type="soft")(llr)
+        assert torch.equal(ChaseDecoder(encoder, num_test_positions=encoder.code_length)(llr), ml)
+
+    def test_batch_shapes_and_chunking(self):
+        """Test multi-dimensional inputs and chunked decoding."""
+        encoder = GolayCodeEncoder()
+        messages, llr = noisy_llr(encoder, 24, 0.5)
+        decoder = ChaseDecoder(encoder, num_test_positions=2)
+        reference = decoder(llr)
+        chunked = ChaseDecoder(encoder, num_test_positions=2, batch_chunk_size=5)(llr.view(4, 6 * 23))
+        assert chunked.shape == (4, 6 * 12)
+        assert torch.equal(chunked.view(24, 12), reference)
@@ -0,0 +1,94 @@
+"""Tests for the Min-Sum LDPC decoder in kaira.models.fec.decoders package."""
+
+import pytest
+import torch
+
+from kaira.models.fec.decoders.min_sum_ldpc import MinSumLDPCDecoder
+from kaira.models.fec.encoders.ldpc_code import LDPCCodeEncoder
+
+
+@pytest.fixture
+def ldpc_encoder():
+    """Fixture providing a random column-weight-3 LDPC code."""
+    torch.manual_seed(0)
+    H = torch.zeros(30, 60, dtype=torch.int64)
+    for v_node in range(60):
+        H[torch.randperm(30)[:3], v_node] = 1
+    return LDPCCodeEncoder(check_matrix=H)
+
+
+class TestMinSumLDPCDecoder:
+    """Test suite for MinSumLDPCDecoder class."""
+
+    def test_initialization(self, ldpc_encoder):
+        """Test initialization of the Min-Sum variants."""
+        decoder = MinSumLDPCDecoder(ldpc_encoder, bp_iters=5)
+        assert decoder.algorithm_name == "Min-Sum"
+        assert decoder.schedule == "flooding"
+
+        decoder = MinSumLDPCDecoder(ldpc_encoder, scaling_factor=0.8)
+        assert decoder.algorithm_name == "Scaled Min-Sum"
+
+        decoder = MinSumLDPCDecoder(ldpc_encoder, normalized=True)
+        assert decoder.scaling_factor == 0.75
+        assert decoder.offset == 0.2
+        assert decoder.get_algorithm_info()["normalized"]
+
+    @pytest.mark.parametrize("kwargs", [{}, {"scaling_factor": 0.8}, {"normalized": True}])
+    def test_layered_decoding_with_noise(self, ldpc_encoder, kwargs):
+        """Test that the layered schedule corrects channel errors."""
+        torch.manual_seed(1)
+        messages = torch.randint(0, 2, (200, ldpc_encoder.code_dimension)).float()
+        codewords = ldpc_encoder(messages)
+        received = 2.0 * (1 - 2.0 * codewords + 0.5 * torch.randn_like(codewords)) / 0.25
+
+        decoder = MinSumLDPCDecoder(ldpc_encoder, bp_iters=5, schedule="layered", **kwargs)
+        _, soft_output = decoder(received, return_soft=True)
+
+        channel_errors = ((received < 0).float() != codewords).sum()
+        decoded_errors = ((soft_output < 0).float() != codewords).sum()
+        assert decoder.get_algorithm_info()["schedule"] == "layered"
+        assert decoded_errors < channel_errors
+
+    @pytest.mark.parametrize("scaling_factor,offset", [(1.0, 0.0), (0.8, 0.0), (0.75, 0.2)])
+    def test_compute_cv_matches_reference(self, ldpc_encoder, scaling_factor, offset):
+        """Test the vectorized check node update against a per-edge reference implementation."""
+        decoder = MinSumLDPCDecoder(ldpc_encoder, scaling_factor=scaling_factor, offset=offset)
+        vc = torch.randn(4, int(decoder.num_edges))
+
+        expected = torch.zeros_like(vc)
+        for c_node in range(decoder.n_c):
+            edges = decoder.cv_map[c_node]
+            for edge in edges:
+                others = vc[:, [other for other in edges if other != edge]]
+                message = torch.prod(torch.sign(others), dim=1) * others.abs().min(dim=1).values * scaling_factor
+                expected[:, edge] = message - torch.sign(message) * offset
+
+        assert torch.allclose(decoder.compute_cv(vc), expected)
+
+    def test_compute_cv_irregular_code(self):
+        """Test check nodes of different degrees, including a degree-one check node."""
+        H = torch.tensor([[1, 1, 1, 1, 0, 0], [0, 0, 1, 0, 1, 0], [0, 0, 0, 0, 0, 1]])
+        decoder = MinSumLDPCDecoder(LDPCCodeEncoder(check_matrix=H))
+        assert decoder.check_edges.shape == (3, 4)
+
+        # Edges are numbered by variable node: (c0,v0), (c0,v1), (c0,v2), (c1,v2), (c0,v3), (c1,v4), (c2,v5)
+        vc = torch.tensor([[1.0, -2.0, 3.0, -1.5, -0.5, 4.0, 2.0]])
+        cv = decoder.compute_cv(vc)
+
+        assert torch.allclose(cv, torch.tensor([[0.5, -0.5, 0.5, 4.0, -1.0, -1.5, 0.0]]))
+
+    @pytest.mark.parametrize("schedule", ["flooding", "layered"])
+    def test_decoding_with_noise(self, ldpc_encoder, schedule):
+        """Test that both schedules correct channel errors with the vectorized kernel."""
+        torch.manual_seed(1)
+        messages = torch.randint(0, 2, (200, ldpc_encoder.code_dimension)).float()
+        codewords = ldpc_encoder(messages)
+        received = 2.0 * (1 - 2.0 * codewords + 0.5 * torch.randn_like(codewords)) / 0.25
+
+        decoder = MinSumLDPCDecoder(ldpc_encoder, bp_iters=10, schedule=schedule, normalized=True)
+        _, soft_output = decoder(received, return_soft=True)
+
+        channel_errors = ((received < 0).float() != codewords).sum()
+        decoded_errors = ((soft_output < 0).float() != codewords).sum()
+        assert decoded_errors < channel_errors / 4
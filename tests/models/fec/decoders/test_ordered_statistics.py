@@ -0,0 +1,111 @@
+"""Tests for the OrderedStatisticsDecoder in kaira.models.fec.decoders package."""
+
+import pytest
+import torch
+
+from kaira.models.fec.decoders import BruteForceMLDecoder, OrderedStatisticsDecoder
+from kaira.models.fec.encoders import GolayCodeEncoder, HammingCodeEncoder, LinearBlockCodeEncoder
+
+
+def noisy_llr(encoder, batch_size, noise_std, seed=0):
+    """Return random messages and the LLRs of their BPSK codewords over an AWGN channel."""
+    torch.manual_seed(seed)
+    messages = torch.randint(0, 2, (batch_size, encoder.code_dimension)).float()
+    return messages, 1 - 2 * encoder(messages) + noise_std * torch.randn(batch_size, encoder.code_length)
+
+
+class TestOrderedStatisticsDecoder:
+    """Test suite for OrderedStatisticsDecoder class."""
+
+    def test_initialization(self):
+        """Test initialization and the generator matrix obtained from the encoder."""
+        encoder = HammingCodeEncoder(mu=3)
+        decoder = OrderedStatisticsDecoder(encoder, order=2)
+        assert decoder.order == 2
+        assert decoder.input_type == "soft"
+        assert decoder.early_stop_threshold is None
+        assert decoder.num_patterns == 1 + 4 + 6
+        assert torch.equal(decoder.generator_matrix, encoder.generator_matrix.to(torch.uint8))
+        assert not decoder.offset.any()
+        assert "generator_matrix" not in decoder.state_dict()
+
+        # The order is limited by the code dimension
+        assert OrderedStatisticsDecoder(encoder, order=10).num_patterns == 2**4
+
+    def test_invalid_arguments(self):
+        """Test that invalid arguments are rejected."""
+        encoder = HammingCodeEncoder(mu=3)
+        with pytest.raises(ValueError, match="order"):
+            OrderedStatisticsDecoder(encoder, order=-1)
+        with pytest.raises(ValueError, match="input_type"):
+            OrderedStatisticsDecoder(encoder, input_type="quantized")
+        with pytest.raises(ValueError, match="Chunk sizes"):
+            OrderedStatisticsDecoder(encoder, pattern_chunk_size=0)
+        with pytest.raises(ValueError, match="divisible"):
+            OrderedStatisticsDecoder(encoder)(torch.zeros(2, 5))
+
+    def test_noiseless_decoding(self):
+        """Test that noiseless codewords are decoded with any order."""
+        encoder = GolayCodeEncoder(extended=True)
+        messages, llr = noisy_llr(encoder, 20, 0.0)
+        for order in range(3):
+            assert torch.equal(OrderedStatisticsDecoder(encoder, order=order)(llr), messages)
+
+    @pytest.mark.parametrize("make_encoder", [lambda: HammingCodeEncoder(mu=3), lambda: HammingCodeEncoder(mu=3, extended=True), lambda: GolayCodeEncoder(extended=True)])
+    def test_matches_maximum_likelihood(self, make_encoder):
+        """Test that the full-order decoder finds the ML codeword and low orders nearly always do."""
+        encoder = make_encoder()
+        _, llr = noisy_llr(encoder, 200, 0.8)
+        ml = BruteForceMLDecoder(encoder, input_type="soft")(llr)
+
+        full = OrderedStatisticsDecoder(encoder, order=encoder.code_dimension, pattern_chunk_size=100)
+        assert torch.equal(full(llr), ml)
+
+        agreement = (OrderedStatisticsDecoder(encoder, order=2)(llr) == ml).all(dim=1).float().mean()
+        assert agreement > 0.95
+
+    def test_chunking(self):
+        """Test that the batch and pattern chunk sizes do not change the result."""
+        encoder = GolayCodeEncoder()
+        _, llr = noisy_llr(encoder, 50, 1.0)
+        reference = OrderedStatisticsDecoder(encoder, order=2)(llr)
+        assert torch.equal(OrderedStatisticsDecoder(encoder, order=2, batch_chunk_size=7, pattern_chunk_size=5)(llr), reference)
+
+    def test_early_termination(self):
+        """Test that a zero threshold keeps the result and that the threshold is applied."""
+        encoder = GolayCodeEncoder(extended=True)
+        messages, llr = noisy_llr(encoder, 100, 0.7)
+        reference = OrderedStatisticsDecoder(encoder, order=2)(llr)
+        assert torch.equal(OrderedStatisticsDecoder(encoder, order=2, early_stop_threshold=0.0)(llr), reference)
+
+        # An infinite threshold stops after the order-0 reprocessing
+        order_zero = OrderedStatisticsDecoder(encoder, order=0)(llr)
+        assert torch.equal(OrderedStatisticsDecoder(encoder, order=2, early_stop_threshold=float("inf"))(llr), order_zero)
+
+    def test_hard_input_and_errors(self):
+        """Test decoding of hard inputs and the returned error patterns."""
+        encoder = HammingCodeEncoder(mu=3)
+        decoder = OrderedStatisticsDecoder(encoder, order=1, input_type="hard")
+        messages = torch.randint(0, 2, (4, 3, 4)).float()
+        codewords = encoder(messages)
+        received = codewords.clone()
+        received[..., 2] = 1 - received[..., 2]
+
+        decoded, errors = decoder(received, return_errors=True)
+        assert decoded.shape == messages.shape
+        assert errors.shape == received.shape
+        assert torch.equal(decoded, messages)
+        assert torch.equal(errors, (received != codewords).float())
+
+    def test_affine_encoder(self):
+        """Test that a constant word added by the encoder is removed before decoding."""
+
+        class ComplementEncoder(LinearBlockCodeEncoder):
+            def forward(self, x, *args, **kwargs):
+                return 1 - super().forward(x, *args, **kwargs)
+
+        encoder = ComplementEncoder(generator_matrix=HammingCodeEncoder(mu=3).generator_matrix)
+        decoder = OrderedStatisticsDecoder(encoder, order=2)
+        assert decoder.offset.all()
+        messages, llr = noisy_llr(encoder, 20, 0.3)
+        assert torch.equal(decoder(llr), messages)
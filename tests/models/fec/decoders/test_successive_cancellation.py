@@ -327,3 +327,72 @@ class TestSuccessiveCancellationDecoder:
 
         assert decoded.shape == (1, 6)
         assert torch.all((decoded == 0) | (decoded == 1))
+
+    @pytest.mark.parametrize("polar_i", [False, True])
+    @pytest.mark.parametrize("frozen_zeros", [False, True])
+    @pytest.mark.parametrize("regime", ["sum_product", "min_sum"])
+    @pytest.mark.parametrize("fast_ssc", [False, True])
+    def test_decode_iterative_matches_recursive(self, polar_i, frozen_zeros, regime, fast_ssc):
+        """Test that the scheduled decoder reproduces the recursive decoder."""
+        encoder = PolarCodeEncoder(14, 32, polar_i=polar_i, frozen_zeros=frozen_zeros)
+        decoder = SuccessiveCancellationDecoder(encoder, regime=regime, fast_ssc=fast_ssc)
+
+        torch.manual_seed(0)
+        llr = 3 * torch.randn(6, 32)
+
+        u_rec, x_rec, y_rec = decoder.decode_recursive(llr, decoder.info_indices)
+        u_it, x_it, y_it = decoder.decode_iterative(llr)
+
+        assert torch.equal(u_it, u_rec)
+        assert torch.equal(x_it, x_rec)
+        assert torch.allclose(y_it, y_rec)
+
+    def test_schedule_fast_ssc(self):
+        """Test that fast-SSC prunes rate-0 and rate-1 subtrees from the schedule."""
+        encoder = PolarCodeEncoder(32, 64)
+        full = SuccessiveCancellationDecoder(encoder, fast_ssc=False)
+        fast = SuccessiveCancellationDecoder(encoder)
+
+        # Without pruning, every leaf is a node and every internal node has f, g and combine steps
+        assert len(full.schedule) == 64 + 3 * 63
+        assert len(fast.schedule) < len(full.schedule)
+
+        for operation, depth, offset, size in fast.schedule:
+            node_info = encoder.info_indices[offset : offset + size]
+            if operation == "rate0":
+                assert not node_info.any()
+                assert fast.frozen_patterns[(depth, offset)].shape == (size,)
+            elif operation == "rate1":
+                assert node_info.all()
+            assert size == 64 // 2**depth
+
+    def test_node_transform_is_involution(self):
+        """Test that the node transform maps node codewords back to their leaf bits."""
+        for polar_i in [False, True]:
+            decoder = SuccessiveCancellationDecoder(PolarCodeEncoder(8, 16, polar_i=polar_i))
+            bits = torch.randint(0, 2, (4, 16)).float()
+            assert torch.equal(decoder.node_transform(decoder.node_transform(bits)), bits)
+
+    def test_decode_iterative_gradients(self):
+        """Test that LLR outputs stay differentiable."""
+        encoder = PolarCodeEncoder(8, 16)
+        decoder = SuccessiveCancellationDecoder(encoder)
+
+        llr = torch.randn(3, 16, requires_grad=True)
+        decoder(llr, return_for_loss=True).sum().backward()
+
+        reference = llr.detach().clone().requires_grad_(True)
+        decoder.decode_recursive(reference, decoder.info_indices)[2].sum().backward()
+
+        assert torch.allclose(llr.grad, reference.grad)
+
+    def test_decoding_noiseless_codeword(self):
+        """Test that noiseless codewords are decoded correctly."""
+        encoder = PolarCodeEncoder(64, 128)
+        decoder = SuccessiveCancellationDecoder(encoder)
+
+        torch.manual_seed(1)
+        messages = torch.randint(0, 2, (5, 64)).float()
+        llr = 4.0 * (1 - 2 * encoder(messages))
+
+        assert torch.equal(decoder(llr), messages)
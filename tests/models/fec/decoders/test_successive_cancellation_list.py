@@ -0,0 +1,112 @@
+"""Tests for the successive_cancellation_list module in kaira.models.fec.decoders package."""
+
+import pytest
+import torch
+
+from kaira.models.fec.decoders.successive_cancellation import SuccessiveCancellationDecoder
+from kaira.models.fec.decoders.successive_cancellation_list import SuccessiveCancellationListDecoder
+from kaira.models.fec.encoders.polar_code import PolarCodeEncoder
+from kaira.models.fec.utils import append_crc
+
+
+class TestSuccessiveCancellationListDecoder:
+    """Test suite for SuccessiveCancellationListDecoder class."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        torch.manual_seed(0)
+        self.code_dimension = 32
+        self.code_length = 64
+        self.encoder = PolarCodeEncoder(self.code_dimension, self.code_length, polar_i=False, load_rank=True)
+
+    def noisy_llrs(self, codeword, sigma=0.8):
+        """BPSK over AWGN LLRs of the codewords."""
+        received = (1 - 2 * codeword) + sigma * torch.randn_like(codeword)
+        return 2 * received / sigma**2
+
+    def test_initialization(self):
+        """Test initialization and parameter validation."""
+        decoder = SuccessiveCancellationListDecoder(self.encoder)
+        assert decoder.list_size == 8  # default
+        assert decoder.crc_polynomial is None
+        assert decoder.crc_length == 0
+        assert not decoder.fast_ssc
+        assert all(operation in ("f", "g", "combine") or size == 1 for operation, _, _, size in decoder.schedule)
+
+        decoder = SuccessiveCancellationListDecoder(self.encoder, list_size=4, crc_polynomial=0b110011, regime="min_sum")
+        assert decoder.list_size == 4
+        assert decoder.crc_length == 5
+        assert decoder.regime == "min_sum"
+
+        with pytest.raises(ValueError):
+            SuccessiveCancellationListDecoder(self.encoder, list_size=0)
+        with pytest.raises(ValueError):
+            SuccessiveCancellationListDecoder(self.encoder, crc_polynomial=1 << self.code_dimension)
+
+    @pytest.mark.parametrize("polar_i", [False, True])
+    def test_list_size_one_matches_sc(self, polar_i):
+        """With a single path, SCL makes the same decisions as SC."""
+        encoder = PolarCodeEncoder(self.code_dimension, self.code_length, polar_i=polar_i, load_rank=True)
+        messages = torch.randint(0, 2, (100, self.code_dimension)).float()
+        llr = self.noisy_llrs(encoder(messages))
+
+        sc_decoded = SuccessiveCancellationDecoder(encoder, fast_ssc=False)(llr)
+        scl_decoded = SuccessiveCancellationListDecoder(encoder, list_size=1)(llr)
+        assert torch.equal(sc_decoded, scl_decoded)
+
+    @pytest.mark.parametrize("list_size", [1, 4, 8])
+    def test_noiseless_decoding(self, list_size):
+        """Test decoding of noiseless codewords."""
+        messages = torch.randint(0, 2, (10, self.code_dimension)).float()
+        llr = 10.0 * (1 - 2 * self.encoder(messages))
+
+        decoder = SuccessiveCancellationListDecoder(self.encoder, list_size=list_size)
+        assert torch.equal(decoder(llr), messages)
+        assert decoder.path_metrics.shape == (10, list_size)
+        # Path metrics are sorted from the most to the least likely path
+        assert torch.all(decoder.path_metrics[:, :-1] <= decoder.path_metrics[:, 1:])
+
+    def test_list_improves_on_sc(self):
+        """A larger list makes fewer frame errors than SC."""
+        messages = torch.randint(0, 2, (300, self.code_dimension)).float()
+        llr = self.noisy_llrs(self.encoder(messages))
+
+        sc_errors = (SuccessiveCancellationDecoder(self.encoder)(llr) != messages).any(dim=1).sum()
+        scl_errors = (SuccessiveCancellationListDecoder(self.encoder, list_size=8)(llr) != messages).any(dim=1).sum()
+        assert scl_errors < sc_errors
+
+    def test_crc_aided_selection(self):
+        """CRC-aided path selection makes fewer frame errors than selecting by path metric only."""
+        polynomial = 0b110011
+        messages = append_crc(torch.randint(0, 2, (300, self.code_dimension - 5)).float(), polynomial)
+        llr = self.noisy_llrs(self.encoder(messages))
+
+        scl_decoded = SuccessiveCancellationListDecoder(self.encoder, list_size=8)(llr)
+        decoder = SuccessiveCancellationListDecoder(self.encoder, list_size=8, crc_polynomial=polynomial)
+        ca_scl_decoded = decoder(llr)
+
+        assert ca_scl_decoded.shape == messages.shape
+        assert (ca_scl_decoded != messages).any(dim=1).sum() < (scl_decoded != messages).any(dim=1).sum()
+
+    def test_select_path_fallback(self):
+        """Without any path passing the CRC, the path with the smallest metric is selected."""
+        decoder = SuccessiveCancellationListDecoder(self.encoder, list_size=2, crc_polynomial=0b111)
+        payload = torch.zeros(1, 2, self.code_dimension - 2)
+        u = torch.cat([payload, torch.ones(1, 2, 2)], dim=-1)
+        u[0, 1, -1] = 0.0
+        path_metrics = torch.tensor([[3.0, 1.0]])
+        assert torch.equal(decoder.select_path(u, path_metrics), u[:, 1])
+
+        # The first path now passes the CRC and is preferred despite its larger metric
+        u[0, 0, -2:] = 0.0
+        assert torch.equal(decoder.select_path(u, path_metrics), u[:, 0])
+
+    def test_multiple_blocks(self):
+        """Test decoding of several codewords per row."""
+        messages = torch.randint(0, 2, (5, 3 * self.code_dimension)).float()
+        codewords = torch.cat([self.encoder(block) for block in messages.split(self.code_dimension, dim=1)], dim=1)
+        llr = 10.0 * (1 - 2 * codewords)
+
+        decoded = SuccessiveCancellationListDecoder(self.encoder, list_size=4)(llr)
+        assert decoded.shape == messages.shape
+        assert torch.equal(decoded, messages)
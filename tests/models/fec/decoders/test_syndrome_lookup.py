@@ -25,10 +25,10 @@ class TestSyndromeLookupDecoder:
 
         # Verify that syndrome table is built
         assert hasattr(decoder, "_syndrome_table")
-        assert isinstance(decoder._syndrome_table, dict)
+        assert isinstance(decoder._syndrome_table, torch.Tensor)
 
         # For a (7,4) code, there should be 2^(7-4) = 8 syndromes
-        assert len(decoder._syndrome_table) == 2**3
+        assert decoder._syndrome_table.shape == (2**3, 7)
 
     def test_syndrome_to_int(self):
         """Test conversion of syndrome tensor to integer."""
@@ -86,23 +86,41 @@ class TestSyndromeLookupDecoder:
         # Build syndrome table
         table = decoder._build_syndrome_table()
 
-        # Verify it's a dictionary
-        assert isinstance(table, dict)
+        # Verify it's a dense coset leader table
+        assert isinstance(table, torch.Tensor)
 
         # For a (7,4) code, there should be 2^(7-4) = 8 syndromes
-        assert len(table) == 2**3
+        assert table.shape == (2**3, 7)
 
         # The syndrome for all-zero error pattern should map to all-zero error pattern
         zero_syndrome = decoder._syndrome_to_int(encoder.calculate_syndrome(torch.zeros(7)))
-        assert zero_syndrome in table
+        assert zero_syndrome == 0
         assert torch.all(table[zero_syndrome] == 0)
 
-        # Check that all error patterns in the table have minimum weight for their syndrome
-        for syndrome, error_pattern in table.items():
-            # Generate the syndrome tensor from the integer
+        # Check that every coset leader has the syndrome of its row index
+        for syndrome, error_pattern in enumerate(table):
             syndrome_tensor = encoder.calculate_syndrome(error_pattern)
             assert syndrome == decoder._syndrome_to_int(syndrome_tensor)
 
+        # A perfect code has exactly one coset leader of weight <= 1 per syndrome
+        assert torch.all(table.sum(dim=1) <= 1)
+
+    def test_build_syndrome_table_minimum_weight(self):
+        """Test that the coset leaders have minimum weight in their cosets."""
+        G = torch.tensor([[1, 0, 0, 1, 1, 0], [0, 1, 0, 1, 0, 1], [0, 0, 1, 0, 1, 1]], dtype=torch.float)
+        encoder = LinearBlockCodeEncoder(generator_matrix=G)
+        decoder = SyndromeLookupDecoder(encoder=encoder)
+
+        # Exhaustively find the minimum coset weight of every syndrome
+        all_words = ((torch.arange(2**6).unsqueeze(1) >> torch.arange(6)) & 1).int()
+        syndromes = decoder._syndromes_to_int(encoder.calculate_syndrome(all_words))
+        min_weight = torch.full((2**3,), 6, dtype=torch.long)
+        min_weight.scatter_reduce_(0, syndromes, all_words.sum(dim=1).long(), reduce="amin")
+
+        table = decoder._syndrome_table
+        assert torch.equal(table.sum(dim=1).long(), min_weight)
+        assert torch.equal(decoder._syndromes_to_int(encoder.calculate_syndrome(table)), torch.arange(2**3))
+
     def test_decoding_no_errors(self):
         """Test decoding a codeword with no errors."""
         # Create a Hamming encoder and syndrome lookup decoder
@@ -168,6 +186,27 @@ class TestSyndromeLookupDecoder:
         # Verify that the decoded messages match the originals
         assert torch.all(decoded == messages)
 
+    def test_decoding_multiple_blocks_with_errors(self):
+        """Test decoding several blocks per row, returning the error patterns."""
+        encoder = HammingCodeEncoder(mu=3)  # (7,4) Hamming code
+        decoder = SyndromeLookupDecoder(encoder=encoder)
+
+        torch.manual_seed(0)
+        messages = torch.randint(0, 2, (5, 3, 4)).float()
+        codewords = encoder(messages.view(5, 12))
+
+        # Introduce a single bit error in every block
+        error_positions = torch.randint(0, 7, (5, 3))
+        true_errors = torch.nn.functional.one_hot(error_positions, 7).float().view(5, 21)
+        received = (codewords + true_errors) % 2
+
+        decoded, errors = decoder(received, return_errors=True)
+
+        assert decoded.shape == (5, 12)
+        assert errors.shape == received.shape
+        assert torch.equal(decoded, messages.view(5, 12))
+        assert torch.equal(errors, true_errors)
+
     def test_decoding_with_uncorrectable_errors(self):
         """Test decoding with uncorrectable errors."""
         # Create a Hamming encoder and syndrome lookup decoder
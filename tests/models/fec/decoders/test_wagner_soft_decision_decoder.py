@@ -158,6 +158,29 @@ class TestWagnerSoftDecisionDecoder:
         assert torch.all(errors[0] == 0)  # No errors in first codeword
         assert errors[1, 3] == 1  # Error in least reliable bit of second codeword
 
+    def test_decoding_multiple_blocks(self):
+        """Test that all blocks of a multi-dimensional input are decoded independently."""
+        G = torch.tensor([[1.0, 0.0, 0.0, 1.0], [0.0, 1.0, 0.0, 1.0], [0.0, 0.0, 1.0, 1.0]])
+        encoder = LinearBlockCodeEncoder(generator_matrix=G)
+        decoder = WagnerSoftDecisionDecoder(encoder=encoder)
+        torch.manual_seed(0)
+        soft_received = torch.randn(3, 5, 12)
+
+        decoded, errors = decoder(soft_received, return_errors=True)
+        assert decoded.shape == (3, 5, 9)
+        assert errors.shape == soft_received.shape
+
+        # Reference: flip the least reliable bit of every block with odd parity
+        blocks = soft_received.reshape(-1, 4)
+        hard = (blocks < 0).to(torch.int)
+        odd = hard.sum(dim=1) % 2 == 1
+        expected = hard.clone()
+        rows = torch.nonzero(odd).view(-1)
+        expected[rows, blocks.abs().argmin(dim=1)[rows]] ^= 1
+        assert torch.equal(decoded.reshape(-1, 3), expected[:, :3])
+        assert torch.equal(errors.reshape(-1, 4), expected ^ hard)
+        assert torch.equal(errors.reshape(-1, 4).sum(dim=1), odd.to(torch.int64))
+
     def test_invalid_input_dimensions(self):
         """Test decoding with invalid input dimensions."""
         # Create a (4,3) single parity-check code
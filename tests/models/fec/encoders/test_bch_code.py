@@ -185,6 +185,19 @@ class TestBCHCodeEncoder:
         # Invalid codeword should have non-zero syndrome
         assert not torch.all(syndrome == 0)
 
+    @pytest.mark.parametrize("information_set", ["left", "right"])
+    def test_codewords_are_cyclic_code_polynomials(self, information_set):
+        """Test that the codewords are multiples of the generator polynomial."""
+        encoder = BCHCodeEncoder(mu=4, delta=5, information_set=information_set)
+
+        # Every row of G is orthogonal to the check matrix
+        assert torch.all(torch.matmul(encoder.generator_matrix, encoder.check_matrix.T) % 2 == 0)
+
+        # Codeword bit j is the coefficient of X^j of a multiple of g(X)
+        for row in encoder.generator_matrix:
+            value = sum(1 << j for j, bit in enumerate(row.int().tolist()) if bit)
+            assert (BinaryPolynomial(value) % encoder.generator_poly).value == 0
+
     def test_decoding(self):
         """Test decoding functionality."""
         # Test with BCH(15,7) code
@@ -146,6 +146,34 @@ class TestHammingCodeEncoder:
         decoded, syndrome = encoder.inverse_encode(extended_x)
         assert torch.equal(decoded, extended_info_bits)  # 4-bit message
 
+    @pytest.mark.parametrize("mu,extended,information_set", [(3, False, "left"), (4, True, "left"), (5, False, "right")])
+    def test_decoding_all_error_positions(self, mu, extended, information_set):
+        """Test that a batch with single-bit errors in every position is corrected at once."""
+        encoder = HammingCodeEncoder(mu=mu, extended=extended, information_set=information_set)
+        n = encoder.code_length
+        torch.manual_seed(0)
+        messages = torch.randint(0, 2, (2, n, encoder.code_dimension)).float()
+        received = (encoder(messages) + torch.eye(n)) % 2
+
+        decoded, syndrome = encoder.inverse_encode(received)
+        assert decoded.shape == messages.shape
+        assert torch.equal(decoded, messages)
+        assert torch.equal(syndrome, encoder.calculate_syndrome(received))
+
+        # Every syndrome of a single-bit error maps to its position, and the zero syndrome to none
+        assert torch.equal(encoder._syndrome_to_error_position(encoder.check_matrix.T), torch.arange(n))
+        assert encoder._syndrome_to_error_position(torch.zeros(encoder.redundancy)) == n
+
+    def test_decoding_double_error_extended(self):
+        """Test that double errors in the extended code are detected but not corrected."""
+        encoder = HammingCodeEncoder(mu=3, extended=True)
+        codeword = encoder(torch.tensor([1.0, 0.0, 1.0, 1.0]))
+        received = codeword.clone()
+        received[[0, 1]] = 1 - received[[0, 1]]
+        decoded, syndrome = encoder.inverse_encode(received)
+        assert syndrome.any()
+        assert torch.equal(decoded, received[encoder.information_set])
+
     def test_syndrome_calculation(self):
         """Test syndrome calculation."""
         encoder = HammingCodeEncoder(mu=3)
@@ -3,7 +3,16 @@
 import pytest
 import torch
 
-from kaira.models.fec.encoders.ldpc_code import LDPCCodeEncoder
+from kaira.models.fec.decoders import BeliefPropagationDecoder
+from kaira.models.fec.encoders.ldpc_code import (
+    LDPCCodeEncoder,
+    expand_base_matrix,
+    find_lifting_size,
+    get_base_matrix,
+)
+
+# Base matrix of a quasi-cyclic code with a dual-diagonal parity part, as in the WiMAX codes
+BASE_MATRIX = torch.tensor([[0, 3, -1, 1, 2, 0, -1, -1], [1, -1, 2, 4, 0, 0, 0, -1], [-1, 2, 0, -1, -1, -1, 0, 0], [4, 0, 1, 3, 2, -1, -1, 0]])
 
 
 class TestLDPCCodeEncoder:
@@ -289,3 +298,116 @@ class TestLDPCCodeEncoder:
 
         expected = torch.zeros(1, 4, dtype=torch.float32)
         assert torch.allclose(zero_codeword, expected)
+
+
+class TestStructuredLDPCEncoding:
+    """Test suite for encoding quasi-cyclic LDPC codes without a generator matrix."""
+
+    def test_base_matrix_round_trip(self):
+        """Test expanding a base matrix and recovering it from the check matrix."""
+        H = expand_base_matrix(BASE_MATRIX, 5)
+        assert H.shape == (20, 40)
+        assert torch.equal(H[5:10, :5], torch.roll(torch.eye(5, dtype=torch.int64), 1, dims=1))
+        assert torch.all(H[:5, 10:15] == 0)
+        assert torch.equal(get_base_matrix(H, 5), BASE_MATRIX)
+        assert get_base_matrix(H, 3) is None
+        assert find_lifting_size(H) == 5
+
+        # A check matrix that is not made of circulant permutation blocks
+        assert find_lifting_size(torch.tensor([[1, 1, 0, 1], [0, 1, 1, 1]])) is None
+
+    @pytest.mark.parametrize("lifting_size", [2, 7, 24, 96])
+    def test_find_lifting_size(self, lifting_size):
+        """Test that the lifting size is found for random shifts and rows without wrapping diagonals."""
+        torch.manual_seed(lifting_size)
+        base_matrix = torch.where(torch.rand(4, 12) < 0.7, torch.randint(0, lifting_size, (4, 12)), -1)
+        base_matrix[0] = torch.arange(12) % 2 - 1  # Alternating zero blocks and unshifted identities
+        assert find_lifting_size(expand_base_matrix(base_matrix, lifting_size)) == lifting_size
+
+        # Neighbouring blocks with equal shifts continue each other's diagonals
+        base_matrix = torch.tensor([[3, 3, 3, -1], [0, 1, -1, 2]])
+        assert find_lifting_size(expand_base_matrix(base_matrix, 6)) == 6
+
+    @pytest.mark.parametrize("lifting_size", [1, 5, 12])
+    def test_structured_encoding(self, lifting_size):
+        """Test that structured codewords are systematic and satisfy all parity checks."""
+        torch.manual_seed(0)
+        encoder = LDPCCodeEncoder(base_matrix=BASE_MATRIX, lifting_size=lifting_size, encoding="structured")
+        k, n = 4 * lifting_size, 8 * lifting_size
+        assert encoder.generator_matrix is None
+        assert (encoder.code_dimension, encoder.code_length) == (k, n)
+        assert torch.equal(encoder.message_positions, torch.arange(k))
+
+        messages = torch.randint(0, 2, (3, 5, 2 * k)).float()
+        codewords = encoder(messages)
+        assert codewords.shape == (3, 5, 2 * n)
+        blocks = codewords.view(-1, n)
+        assert torch.equal(blocks[:, :k], messages.view(-1, k))
+        assert torch.all((blocks @ encoder.check_matrix.float().T) % 2 == 0)
+
+        # Syndromes from the circulant blocks match the dense product
+        received = torch.randint(0, 2, (3, 2 * n)).float()
+        expected = torch.cat([(received[:, :n] @ encoder.check_matrix.float().T) % 2, (received[:, n:] @ encoder.check_matrix.float().T) % 2], dim=1)
+        assert torch.equal(encoder.calculate_syndrome(received), expected)
+
+        decoded, syndrome = encoder.inverse_encode(codewords)
+        assert torch.equal(decoded, messages)
+        assert torch.all(syndrome == 0)
+
+    def test_same_code_as_generator_encoding(self):
+        """Test that structured and generator encoding produce codewords of the same code."""
+        H = expand_base_matrix(BASE_MATRIX, 6)
+        structured = LDPCCodeEncoder(check_matrix=H, encoding="structured")
+        generator = LDPCCodeEncoder(check_matrix=H)
+        assert structured.lifting_size == 6 and torch.equal(structured.base_matrix, BASE_MATRIX)
+        assert structured.code_dimension == generator.code_dimension
+
+        codewords = structured(torch.randint(0, 2, (10, structured.code_dimension)).float())
+        assert torch.all(generator.calculate_syndrome(codewords) == 0)
+
+    def test_structured_encoder_stores_no_check_matrix(self):
+        """Test that structured encoders keep the base matrix and expand the check matrix on access."""
+        encoder = LDPCCodeEncoder(base_matrix=BASE_MATRIX, lifting_size=5, encoding="structured")
+        buffers = dict(encoder.named_buffers())
+        assert "check_matrix" not in buffers and torch.equal(buffers["base_matrix"], BASE_MATRIX)
+        assert "check_matrix" not in encoder.state_dict()
+        assert torch.equal(encoder.check_matrix, expand_base_matrix(BASE_MATRIX, 5))
+        assert torch.equal(encoder.parity_check_matrix, encoder.check_matrix)
+
+        # The same holds for codes given by their check matrix
+        encoder = LDPCCodeEncoder(check_matrix=expand_base_matrix(BASE_MATRIX, 5), encoding="structured")
+        assert "check_matrix" not in dict(encoder.named_buffers())
+        assert torch.equal(encoder.base_matrix, BASE_MATRIX)
+
+    def test_belief_propagation_decoding(self):
+        """Test that belief propagation returns the messages of structured codewords."""
+        torch.manual_seed(0)
+        encoder = LDPCCodeEncoder(base_matrix=BASE_MATRIX, lifting_size=8, encoding="structured")
+        decoder = BeliefPropagationDecoder(encoder, bp_iters=10)
+        messages = torch.randint(0, 2, (4, encoder.code_dimension)).float()
+        llr = 4.0 * (1 - 2 * encoder(messages))
+        llr[:, 0] *= -1
+        assert torch.equal(decoder(llr), messages)
+
+    def test_invalid_structured_encoding(self):
+        """Test that unsupported codes and options are rejected."""
+        with pytest.raises(ValueError, match="Unknown encoding"):
+            LDPCCodeEncoder(base_matrix=BASE_MATRIX, lifting_size=4, encoding="dense")
+        with pytest.raises(ValueError, match="lifting_size"):
+            LDPCCodeEncoder(base_matrix=BASE_MATRIX)
+        with pytest.raises(ValueError, match="quasi-cyclic"):
+            LDPCCodeEncoder(check_matrix=torch.tensor([[1, 1, 0, 1], [0, 1, 1, 1]]), encoding="structured")
+        with pytest.raises(ValueError, match="Bit-packed"):
+            LDPCCodeEncoder(base_matrix=BASE_MATRIX, lifting_size=4, encoding="structured", packed=True)
+
+        # The last parity block column has weight 3, so every block row has two unknown parity blocks
+        base_matrix = BASE_MATRIX.clone()
+        base_matrix[0, 7] = 1
+        with pytest.raises(ValueError, match="back-substitution"):
+            LDPCCodeEncoder(base_matrix=base_matrix, lifting_size=4, encoding="structured")
+
+        encoder = LDPCCodeEncoder(base_matrix=BASE_MATRIX, lifting_size=4, encoding="structured")
+        with pytest.raises(ValueError, match="multiple of the code dimension"):
+            encoder(torch.zeros(5))
+        with pytest.raises(ValueError, match="multiple of the code length"):
+            encoder.inverse_encode(torch.zeros(5))
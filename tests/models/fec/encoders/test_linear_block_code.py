@@ -9,6 +9,7 @@ from kaira.models.fec.encoders.linear_block_code import (
     compute_reduced_row_echelon_form,
     compute_right_pseudo_inverse,
 )
+from kaira.models.fec.gf2 import pack_bits, unpack_bits
 
 
 class TestLinearBlockCodeEncoderHelperFunctions:
@@ -63,6 +64,25 @@ class TestLinearBlockCodeEncoderHelperFunctions:
         assert torch.allclose(result, expected)
 
 
+    def test_non_systematic_generator(self):
+        """Test the null space and right inverse of a generator matrix without unit columns."""
+        torch.manual_seed(0)
+        systematic = torch.cat([torch.eye(4), torch.randint(0, 2, (4, 11)).float()], dim=1)
+        mixing = torch.tensor([[1, 1, 0, 0], [0, 1, 1, 0], [0, 0, 1, 1], [1, 1, 1, 0]], dtype=torch.float)
+        generator = (mixing @ systematic) % 2
+
+        null_space = compute_null_space_matrix(generator)
+        assert null_space.shape == (11, 15)
+        assert torch.all((generator @ null_space.T) % 2 == 0)
+        assert torch.all(compute_reduced_row_echelon_form(null_space).sum(dim=1) > 0)
+
+        right_inv = compute_right_pseudo_inverse(generator)
+        assert torch.equal((generator @ right_inv) % 2, torch.eye(4))
+
+        with pytest.raises(ValueError, match="full row rank"):
+            compute_right_pseudo_inverse(torch.cat([generator, generator[:1]], dim=0))
+
+
 class TestLinearBlockCodeEncoder:
     """Test suite for LinearBlockCodeEncoder class."""
 
@@ -175,6 +195,35 @@ class TestLinearBlockCodeEncoder:
             invalid_codeword = torch.tensor([1, 0, 1, 0, 1, 0], dtype=torch.float)
             self.encoder.inverse_encode(invalid_codeword)
 
+    @pytest.mark.parametrize("table_limit", [LinearBlockCodeEncoder.PACKED_TABLE_LIMIT, 0])
+    def test_packed_matches_matmul(self, table_limit):
+        """Test that packed encoding, syndromes and inverse encoding match the matmul path."""
+        torch.manual_seed(0)
+        packed_encoder = LinearBlockCodeEncoder(self.generator, packed=True)
+        packed_encoder.PACKED_TABLE_LIMIT = table_limit
+        assert packed_encoder.packed and not self.encoder.packed
+
+        messages = torch.randint(0, 2, (4, 5, 3 * 3)).float()
+        received = torch.randint(0, 2, (4, 5, 2 * 7)).float()
+        assert torch.equal(packed_encoder(messages), self.encoder(messages))
+        assert torch.equal(packed_encoder.calculate_syndrome(received), self.encoder.calculate_syndrome(received))
+        for packed_result, result in zip(packed_encoder.inverse_encode(received), self.encoder.inverse_encode(received)):
+            assert torch.equal(packed_result, result)
+
+    def test_packed_interface(self):
+        """Test encoding and syndrome computation on packed bits."""
+        packed_encoder = LinearBlockCodeEncoder(self.generator, packed=True)
+        messages = torch.tensor([[1, 0, 1], [0, 1, 1]], dtype=torch.float)
+
+        codewords = packed_encoder.encode_packed(pack_bits(messages))
+        assert codewords.dtype == torch.uint8 and codewords.shape == (2, 1)
+        assert torch.equal(unpack_bits(codewords, 7), self.encoder(messages))
+
+        # Flip the first bit of each codeword
+        syndromes = packed_encoder.calculate_syndrome_packed(codewords ^ 1)
+        flipped = (self.encoder(messages) + torch.eye(7)[0]) % 2
+        assert torch.equal(unpack_bits(syndromes, 4), self.encoder.calculate_syndrome(flipped))
+
     def test_model_registry(self):
         """Test that the encoder is properly registered with the model registry."""
         from kaira.models.registry import ModelRegistry
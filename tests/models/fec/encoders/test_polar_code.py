@@ -1,12 +1,17 @@
 """Tests for the polar_code module in kaira.models.fec.encoders package."""
 
+import math
+
 import pytest
 import torch
 
 from kaira.models.fec.encoders.polar_code import (
     PolarCodeEncoder,
     _index_matrix,
+    bhattacharyya_parameters,
     calculate_gm,
+    gaussian_approximation_means,
+    polar_reliability_order,
 )
 
 
@@ -53,6 +58,44 @@ class TestPolarCodeHelperFunctions:
         assert gm.shape == (8, 8)
         assert gm.device == device
 
+    def test_bhattacharyya_parameters(self):
+        """Test the Bhattacharyya parameters of the synthesized channels."""
+        z = math.exp(-0.1)
+        log_z = bhattacharyya_parameters(4, design_snr_db=-10.0)
+        worse, better = 2 * z - z**2, z**2
+        expected = torch.tensor([2 * worse - worse**2, worse**2, 2 * better - better**2, better**2], dtype=torch.float64)
+        assert torch.allclose(log_z.exp(), expected)
+
+        # No underflow for long codes
+        assert torch.all(torch.isfinite(bhattacharyya_parameters(2**16, design_snr_db=5.0)))
+
+    def test_gaussian_approximation_means(self):
+        """Test the mean LLRs of the synthesized channels."""
+        mean = gaussian_approximation_means(8, design_snr_db=0.0)
+        assert mean.shape == (8,)
+        assert mean[-1] == 4 * 8
+        assert torch.argmin(mean) == 0
+        assert torch.all(mean > 0)
+
+    @pytest.mark.parametrize("construction", ["bhattacharyya", "gaussian_approximation"])
+    def test_reliability_order(self, construction):
+        """Test that the constructed orders agree with the 5G sequence and polarization."""
+        order = polar_reliability_order(1024, construction, design_snr_db=0.0)
+        assert torch.equal(order.sort().values, torch.arange(1024))
+        assert order[-1] == 1023
+
+        # Most information sets agree with those of the 5G sequence
+        information = set(order[512:].tolist())
+        assert len(information & set(polar_reliability_order(1024)[512:].tolist())) > 480
+
+    def test_reliability_order_invalid(self):
+        """Test that unsupported constructions are rejected."""
+        with pytest.raises(ValueError, match="Unknown construction"):
+            polar_reliability_order(8, "invalid")
+        with pytest.raises(ValueError, match="up to 1024"):
+            polar_reliability_order(2048)
+
+
 
 class TestPolarCodeEncoder:
     """Test suite for PolarCodeEncoder class."""
@@ -110,6 +153,26 @@ class TestPolarCodeEncoder:
         with pytest.raises(ValueError, match="info_indices must have exactly 2 True values"):
             PolarCodeEncoder(2, 4, load_rank=False, info_indices=torch.tensor([True, True, True, False]))
 
+    @pytest.mark.parametrize("construction", ["bhattacharyya", "gaussian_approximation"])
+    def test_constructed_frozen_set(self, construction):
+        """Test encoders whose frozen set is constructed at a design SNR."""
+        encoder = PolarCodeEncoder(100, 2048, load_rank=False, construction=construction, design_snr_db=1.0)
+        order = polar_reliability_order(2048, construction, design_snr_db=1.0)
+        assert torch.equal(encoder.rank, order)
+        assert torch.equal(torch.nonzero(encoder.info_indices).view(-1), order[-100:].sort().values)
+
+        # Frozen bits are ones, as frozen_zeros defaults to False
+        messages = torch.randint(0, 2, (3, 100)).float()
+        u = torch.ones(3, 2048)
+        u[:, encoder.info_indices] = messages
+        assert torch.equal(encoder(messages), (u @ encoder.get_generator_matrix()) % 2)
+
+    def test_polar_transform_matches_generator_matrix(self):
+        """Test that the butterfly stages compute the product with the generator matrix."""
+        encoder = PolarCodeEncoder(8, 32)
+        u = torch.randint(0, 2, (5, 32)).float()
+        assert torch.equal(encoder.polar_transform(u), (u @ encoder.get_generator_matrix()) % 2)
+
     def test_info_indices_generation(self):
         """Test generation of information bit indices."""
         encoder = PolarCodeEncoder(2, 4, load_rank=False, info_indices=torch.tensor([False, False, True, True]))
@@ -250,6 +250,17 @@ class TestReedMullerCodeEncoder:
         for partition in partitions:
             # Each partition should be a valid reshaping of the codeword indices
             assert partition.numel() == encoder.code_length
+            assert torch.equal(partition.flatten().sort().values, torch.arange(encoder.code_length))
+
+        # The check sums of a row over its partition are all one, and zero for the other rows of the same degree
+        encoder = ReedMullerCodeEncoder(order=2, length_param=4)
+        generator_matrix = encoder.generator_matrix
+        for i, partition in enumerate(encoder.get_reed_partitions()):
+            checksums = generator_matrix[:, partition].sum(dim=-1) % 2
+            assert torch.all(checksums[i] == 1)
+            degree = generator_matrix.sum(dim=1) == generator_matrix[i].sum()
+            degree[i] = False
+            assert torch.all(checksums[degree] == 0)
 
     def test_model_registry(self):
         """Test that the encoder is properly registered with the model registry."""
@@ -105,6 +105,26 @@ class TestReedSolomonCodeEncoder:
         # Invalid codeword should have non-zero syndrome
         assert not torch.all(syndrome == 0)
 
+    @pytest.mark.parametrize("information_set", ["left", "right", [0, 2, 4, 6, 8, 10, 12, 14, 1, 3, 5]])
+    def test_symbol_encoding(self, information_set):
+        """Test that symbol codewords have the roots alpha, ..., alpha^(delta-1) and keep the message."""
+        encoder = ReedSolomonCodeEncoder(mu=4, delta=5, information_set=information_set)
+        field = encoder._field
+
+        messages = torch.randint(0, 16, (6, 2 * 11))
+        codewords = encoder.encode_symbols(messages)
+        assert codewords.shape == (6, 2 * 15)
+        assert torch.equal(encoder.extract_message_symbols(codewords), messages)
+
+        powers = field.tensor_alpha_power(torch.arange(15).unsqueeze(1) * torch.arange(1, 5).unsqueeze(0))
+        evaluations = field.tensor_sum(field.tensor_mul(codewords.view(6, 2, 15, 1), powers), dim=-2)
+        assert not evaluations.any()
+
+        with pytest.raises(ValueError, match="Message symbols"):
+            encoder.encode_symbols(torch.full((11,), 16))
+        with pytest.raises(ValueError, match="divisible by code dimension"):
+            encoder.encode_symbols(torch.zeros(10))
+
     def test_decoding(self):
         """Test decoding functionality."""
         # Test with RS(15,11) code
@@ -382,6 +382,49 @@ class TestFiniteBifield:
         field = FiniteBifield(5)
         assert repr(field) == "FiniteBifield(m=5)"
 
+    @pytest.mark.parametrize("m", [2, 3, 4, 8])
+    def test_log_exp_tables(self, m):
+        """Test that the log/exp tables enumerate every non-zero element."""
+        field = FiniteBifield(m)
+        log, exp = field.log_exp_tensors()
+
+        assert sorted(exp[: field.size - 1].tolist()) == list(range(1, field.size))
+        assert torch.equal(exp[log[1:]], torch.arange(1, field.size))
+        assert torch.equal(exp[: field.size - 1], exp[field.size - 1 :])
+
+    @pytest.mark.parametrize("m", [3, 4, 5])
+    def test_tensor_arithmetic(self, m):
+        """Test batched tensor arithmetic against the element arithmetic."""
+        field = FiniteBifield(m)
+        a = torch.arange(field.size).unsqueeze(1).expand(-1, field.size)
+        b = torch.arange(field.size).unsqueeze(0).expand(field.size, -1)
+
+        expected_sum = torch.tensor([[(field(i) + field(j)).value for j in range(field.size)] for i in range(field.size)])
+        expected_product = torch.tensor([[(field(i) * field(j)).value for j in range(field.size)] for i in range(field.size)])
+        assert torch.equal(field.tensor_add(a, b), expected_sum)
+        assert torch.equal(field.tensor_mul(a, b), expected_product)
+
+        nonzero = torch.arange(1, field.size)
+        assert torch.equal(field.tensor_inv(nonzero), torch.tensor([field(i).inverse().value for i in range(1, field.size)]))
+        assert torch.equal(field.tensor_pow(torch.arange(field.size), 5), torch.tensor([(field(i) ** 5).value for i in range(field.size)]))
+        assert torch.equal(field.tensor_alpha_power(torch.tensor([-1, 0, 1, field.size])), torch.tensor([(field.primitive_element() ** (field.size - 2)).value, 1, 2, 2]))
+
+        with pytest.raises(ValueError, match="Cannot compute inverse of zero"):
+            field.tensor_inv(torch.tensor([0, 1]))
+
+    def test_tensor_sum_and_bits(self):
+        """Test the field sum reduction and the bit expansion."""
+        field = FiniteBifield(4)
+        values = torch.tensor([[3, 5, 6], [1, 2, 4]])
+
+        assert torch.equal(field.tensor_sum(values, dim=-1), torch.tensor([0, 7]))
+        assert torch.equal(field.tensor_sum(values, dim=0), torch.tensor([2, 7, 2]))
+
+        bits = field.tensor_to_bits(values)
+        assert bits.shape == (2, 3, 4)
+        assert torch.equal(bits[0, 1], torch.tensor([1, 0, 1, 0]))
+        assert torch.equal(field.tensor_from_bits(bits), values)
+
 
 class TestFiniteBifieldElement:
     """Test suite for FiniteBifieldElement class."""
@@ -0,0 +1,142 @@
+"""Tests for the cache module in kaira.models.fec package."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+import torch
+
+from kaira.models.fec.cache import (
+    CACHE_DIR_ENV,
+    artifact_key,
+    cached_artifact,
+    get_cache_dir,
+    load_artifact,
+    pack_ragged,
+    save_artifact,
+    unpack_ragged,
+)
+from kaira.models.fec.decoders import BeliefPropagationDecoder, SyndromeLookupDecoder
+from kaira.models.fec.encoders import HammingCodeEncoder, LDPCCodeEncoder
+from kaira.models.fec.rptu_database import MIRROR_DIR_ENV, OFFLINE_ENV, get_code_from_database
+
+CHECK_MATRIX = torch.tensor([[1, 1, 0, 1, 1, 0, 0], [1, 0, 1, 1, 0, 1, 0], [0, 1, 1, 1, 0, 0, 1], [1, 1, 1, 0, 0, 0, 0]])
+
+
+class TestCache:
+    """Test suite for the on-disk artifact cache."""
+
+    def test_disabled_by_default(self, monkeypatch, tmp_path):
+        """Test that nothing is stored without a cache directory."""
+        monkeypatch.delenv(CACHE_DIR_ENV, raising=False)
+        assert get_cache_dir() is None
+        assert get_cache_dir(str(tmp_path)) == str(tmp_path)
+
+        save_artifact("test", "key", {"x": torch.ones(3)})
+        assert load_artifact("test", "key") is None
+
+        calls = []
+        cached_artifact("test", "key", lambda: calls.append(1) or {"x": torch.ones(3)})
+        cached_artifact("test", "key", lambda: calls.append(1) or {"x": torch.ones(3)})
+        assert len(calls) == 2
+
+    def test_artifact_key(self):
+        """Test that keys identify the values, shapes and dtypes of the code definition."""
+        H = torch.tensor([[1, 1, 0], [0, 1, 1]])
+        assert artifact_key("code", H) == artifact_key("code", H.clone())
+        assert artifact_key("code", H) != artifact_key("other", H)
+        assert artifact_key("code", H) != artifact_key("code", H.flip(0))
+        assert artifact_key("code", H) != artifact_key("code", H.to(torch.int32))
+        assert artifact_key("code", H) != artifact_key("code", H.view(3, 2))
+        assert artifact_key(H.bool(), 3) == artifact_key(H.bool(), 3)
+
+    def test_cached_artifact(self, monkeypatch, tmp_path):
+        """Test that an artifact is built once and then loaded from the cache directory."""
+        monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+        calls = []
+
+        def build():
+            calls.append(1)
+            return {"matrix": torch.eye(4), "groups": [[0, 1], [2]], "edges": [torch.arange(3)]}
+
+        first = cached_artifact("test", "key", build)
+        second = cached_artifact("test", "key", build)
+        assert len(calls) == 1
+        assert torch.equal(first["matrix"], second["matrix"])
+        assert second["groups"] == [[0, 1], [2]]
+        assert torch.equal(second["edges"][0], torch.arange(3))
+        assert [path.name for path in tmp_path.iterdir()] == ["test_key.pt"]
+
+    def test_pack_ragged(self):
+        """Test packing of lists of tensors and index lists of different shapes."""
+        tensors = [torch.arange(3), torch.tensor([]), torch.arange(6).view(2, 3), torch.tensor([7])]
+        packed = pack_ragged(tensors)
+        assert packed["values"].dtype == torch.int64
+        unpacked = unpack_ragged(packed)
+        assert len(unpacked) == 4
+        for tensor, item in zip(tensors, unpacked):
+            assert item.shape == tensor.shape
+            assert torch.equal(item, tensor.to(torch.int64))
+
+        groups = [[0, 1, 2], [3], []]
+        assert unpack_ragged(pack_ragged(groups), as_lists=True) == groups
+        assert unpack_ragged(pack_ragged([])) == []
+
+    def test_encoder_and_decoder_artifacts(self, monkeypatch, tmp_path):
+        """Test that cached code construction gives the same encoder and decoders."""
+        monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+        encoder = LDPCCodeEncoder(check_matrix=CHECK_MATRIX)
+        decoder = BeliefPropagationDecoder(encoder)
+        lookup = SyndromeLookupDecoder(HammingCodeEncoder(mu=3))
+        names = sorted(path.name.rsplit("_", 1)[0] for path in tmp_path.iterdir())
+        assert names == ["bp_tanner_graph", "ldpc_generator", "linear_block_code", "linear_block_code", "syndrome_table"]
+
+        # Later constructions do not recompute the artifacts
+        with patch.object(LDPCCodeEncoder, "get_generator_matrix", side_effect=AssertionError), patch.object(BeliefPropagationDecoder, "prep_edge_ind", side_effect=AssertionError), patch.object(SyndromeLookupDecoder, "_build_syndrome_table", side_effect=AssertionError):
+            cached_encoder = LDPCCodeEncoder(check_matrix=CHECK_MATRIX)
+            cached_decoder = BeliefPropagationDecoder(cached_encoder)
+            cached_lookup = SyndromeLookupDecoder(HammingCodeEncoder(mu=3))
+
+        assert torch.equal(cached_encoder.generator_matrix, encoder.generator_matrix)
+        assert torch.equal(cached_encoder.generator_right_inverse, encoder.generator_right_inverse)
+        assert torch.equal(cached_lookup._syndrome_table, lookup._syndrome_table)
+        for name in BeliefPropagationDecoder.TANNER_GRAPH_TENSORS + BeliefPropagationDecoder.TANNER_GRAPH_TENSOR_LISTS + BeliefPropagationDecoder.TANNER_GRAPH_INDEX_LISTS:
+            assert str(getattr(cached_decoder, name)) == str(getattr(decoder, name))
+
+        messages = torch.randint(0, 2, (10, encoder.code_dimension)).float()
+        llr = 5.0 * (1 - 2 * encoder(messages))
+        assert torch.equal(cached_decoder(llr), decoder(llr))
+
+
+class TestAlistMirror:
+    """Test suite for reading alists from a local mirror and the cache."""
+
+    URL = "https://rptu.de/fileadmin/chaco/public/alists_wimax/wimax_576_0.5.alist"
+
+    def test_mirror_directory(self, monkeypatch, tmp_path):
+        """Test that alists are read from the mirror directory without downloading."""
+        monkeypatch.delenv(CACHE_DIR_ENV, raising=False)
+        (tmp_path / "wimax_576_0.5.alist").write_text("mirrored content")
+        with patch("requests.get", side_effect=AssertionError):
+            assert get_code_from_database(self.URL, mirror_dir=str(tmp_path)) == "mirrored content"
+            monkeypatch.setenv(MIRROR_DIR_ENV, str(tmp_path))
+            assert get_code_from_database(self.URL, offline=True) == "mirrored content"
+
+    def test_offline_missing_file(self, monkeypatch, tmp_path):
+        """Test that offline mode never downloads."""
+        monkeypatch.delenv(CACHE_DIR_ENV, raising=False)
+        monkeypatch.delenv(MIRROR_DIR_ENV, raising=False)
+        monkeypatch.setenv(OFFLINE_ENV, "1")
+        with patch("requests.get", side_effect=AssertionError), pytest.raises(FileNotFoundError):
+            get_code_from_database(self.URL, mirror_dir=str(tmp_path))
+
+    @patch("requests.get")
+    def test_downloads_are_cached(self, mock_get, monkeypatch, tmp_path):
+        """Test that a downloaded alist is stored in the cache and read from there afterwards."""
+        monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+        monkeypatch.delenv(MIRROR_DIR_ENV, raising=False)
+        mock_get.return_value = Mock(text="downloaded content", raise_for_status=Mock())
+
+        assert get_code_from_database(self.URL) == "downloaded content"
+        assert get_code_from_database(self.URL, offline=True) == "downloaded content"
+        assert mock_get.call_count == 1
+        assert (tmp_path / "alists" / "wimax_576_0.5.alist").read_text() == "downloaded content"
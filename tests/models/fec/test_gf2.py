@@ -0,0 +1,129 @@
+"""Tests for the gf2 module in kaira.models.fec package."""
+
+import pytest
+import torch
+
+from kaira.models.fec.encoders import BCHCodeEncoder, GolayCodeEncoder, HammingCodeEncoder, LDPCCodeEncoder
+from kaira.models.fec.gf2 import (
+    batched_packed_row_reduction,
+    pack_bits,
+    packed_matmul,
+    packed_parity_check,
+    packed_row_reduction,
+    packed_rows,
+    packed_xor_table,
+    unpack_bits,
+)
+
+
+class TestGF2:
+    """Test suite for the bit-packed GF(2) kernels."""
+
+    def test_pack_unpack(self):
+        """Test packing and unpacking of binary tensors."""
+        x = torch.tensor([1, 0, 1, 1, 0, 0, 0, 0, 1])
+        packed = pack_bits(x)
+        assert packed.dtype == torch.uint8
+        assert torch.equal(packed, torch.tensor([13, 1], dtype=torch.uint8))
+        assert torch.equal(unpack_bits(packed, 9, dtype=torch.long), x)
+
+        x = torch.randint(0, 2, (3, 4, 70)).float()
+        packed = pack_bits(x)
+        assert packed.shape == (3, 4, 9)
+        assert torch.equal(unpack_bits(packed, 70), x)
+
+    @pytest.mark.parametrize("rows,columns", [(1, 1), (7, 9), (64, 130), (100, 300)])
+    def test_packed_matmul(self, rows, columns):
+        """Test packed products against the matmul over GF(2)."""
+        torch.manual_seed(0)
+        matrix = torch.randint(0, 2, (rows, columns))
+        x = torch.randint(0, 2, (2, 25, rows))
+
+        table = packed_xor_table(matrix)
+        assert table.shape == ((rows + 7) // 8, 256, (columns + 63) // 64)
+        product = packed_matmul(pack_bits(x), table, columns)
+        assert product.shape == (2, 25, (columns + 7) // 8)
+        assert torch.equal(unpack_bits(product, columns, dtype=torch.long), (x @ matrix) % 2)
+
+    @pytest.mark.parametrize("rows,columns", [(1, 1), (7, 9), (64, 130), (100, 300)])
+    def test_packed_parity_check(self, rows, columns):
+        """Test packed parities against the product with the transposed matrix."""
+        torch.manual_seed(0)
+        matrix = torch.randint(0, 2, (rows, columns))
+        x = torch.randint(0, 2, (50, columns))
+
+        parities = packed_parity_check(pack_bits(x), packed_rows(matrix))
+        assert parities.dtype == torch.uint8
+        assert torch.equal(parities.long(), (x @ matrix.T) % 2)
+
+    @pytest.mark.parametrize("rows,columns", [(3, 3), (10, 70), (40, 200), (100, 64)])
+    def test_packed_row_reduction(self, rows, columns):
+        """Test packed elimination against an entrywise reduction with the same pivot rule."""
+        torch.manual_seed(0)
+        matrix = (torch.rand(rows, columns) < 0.3).long()
+
+        expected, pivots = matrix.clone(), []
+        for j in range(columns):
+            p = len(pivots)
+            candidates = p + torch.nonzero(expected[p:, j]).view(-1)
+            if p == rows or candidates.numel() == 0:
+                continue
+            pivot = int(candidates[0])
+            expected[[p, pivot]] = expected[[pivot, p]]
+            for i in torch.nonzero(expected[:, j]).view(-1).tolist():
+                if i != p:
+                    expected[i] ^= expected[p]
+            pivots.append(j)
+
+        reduced, reduced_pivots = packed_row_reduction(matrix)
+        assert reduced.dtype == matrix.dtype
+        assert torch.equal(reduced, expected)
+        assert reduced_pivots == pivots
+
+    def test_packed_row_reduction_num_cols(self):
+        """Test that pivots are only searched in the leading columns."""
+        matrix = torch.tensor([[0, 0, 1], [0, 0, 1]], dtype=torch.bool)
+        reduced, pivots = packed_row_reduction(matrix, num_cols=2)
+        assert pivots == []
+        assert torch.equal(reduced, matrix)
+
+        reduced, pivots = packed_row_reduction(matrix)
+        assert pivots == [2]
+        assert torch.equal(reduced, torch.tensor([[0, 0, 1], [0, 0, 0]], dtype=torch.bool))
+
+        reduced, pivots = packed_row_reduction(torch.zeros(0, 5))
+        assert reduced.shape == (0, 5) and pivots == []
+
+    @pytest.mark.parametrize("rows,columns,num_cols", [(3, 3, None), (12, 24, 24), (12, 36, 24), (20, 70, None)])
+    def test_batched_packed_row_reduction(self, rows, columns, num_cols):
+        """Test that every matrix of a batch is reduced as by the single-matrix elimination."""
+        torch.manual_seed(0)
+        matrices = (torch.rand(6, rows, columns) < 0.3).to(torch.uint8)
+        matrices[0] = 0
+        reduced, pivots = batched_packed_row_reduction(matrices, num_cols=num_cols)
+        assert reduced.dtype == matrices.dtype
+        assert pivots.shape == (6, rows) and pivots.dtype == torch.long
+        for matrix, matrix_reduced, matrix_pivots in zip(matrices, reduced, pivots):
+            expected, expected_pivots = packed_row_reduction(matrix, num_cols=num_cols)
+            assert torch.equal(matrix_reduced, expected)
+            assert matrix_pivots.tolist() == expected_pivots + [-1] * (rows - len(expected_pivots))
+
+    @pytest.mark.parametrize(
+        "make_encoder",
+        [
+            lambda **kwargs: HammingCodeEncoder(mu=4, **kwargs),
+            lambda **kwargs: GolayCodeEncoder(**kwargs),
+            lambda **kwargs: BCHCodeEncoder(mu=5, delta=7, **kwargs),
+            lambda **kwargs: LDPCCodeEncoder(check_matrix=torch.tensor([[1, 1, 0, 1, 1, 0, 0], [1, 0, 1, 1, 0, 1, 0], [0, 1, 1, 1, 0, 0, 1]]).float(), **kwargs),
+        ],
+    )
+    def test_encoders_opt_in(self, make_encoder):
+        """Test that linear block code encoders give the same results with packed kernels."""
+        torch.manual_seed(0)
+        encoder, packed_encoder = make_encoder(), make_encoder(packed=True)
+        assert packed_encoder.packed
+
+        messages = torch.randint(0, 2, (10, 2 * encoder.code_dimension)).float()
+        received = torch.randint(0, 2, (10, 2 * encoder.code_length)).float()
+        assert torch.equal(packed_encoder(messages), encoder(messages))
+        assert torch.equal(packed_encoder.calculate_syndrome(received), encoder.calculate_syndrome(received))
@@ -15,12 +15,15 @@ def test_import_all():
 
     # Check that the module has all expected submodules
     assert hasattr(kaira.models.fec, "algebra")
+    assert hasattr(kaira.models.fec, "cache")
     assert hasattr(kaira.models.fec, "utils")
     assert hasattr(kaira.models.fec, "encoders")
     assert hasattr(kaira.models.fec, "decoders")
+    assert hasattr(kaira.models.fec, "gf2")
+    assert hasattr(kaira.models.fec, "streaming")
 
     # Verify that __all__ is as expected
-    assert kaira.models.fec.__all__ == ["algebra", "encoders", "decoders", "utils"]
+    assert kaira.models.fec.__all__ == ["algebra", "cache", "encoders", "decoders", "gf2", "streaming", "utils"]
 
 
 def test_reimport():
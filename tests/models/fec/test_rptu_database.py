@@ -9,6 +9,7 @@ from kaira.models.fec.rptu_database import (
     CITATION,
     EXISTING_CODES,
     get_code_from_database,
+    get_lifting_size,
     parse_alist,
 )
 
@@ -87,6 +88,16 @@ class TestRPTUDatabase:
         with pytest.raises(Exception, match="HTTP Error"):
             get_code_from_database(url)
 
+    def test_get_lifting_size(self):
+        """Test lifting sizes of the quasi-cyclic standards."""
+        assert get_lifting_size(576, "wimax") == 24
+        assert get_lifting_size(2304, "wimaxB") == 96
+        assert get_lifting_size(672, "wigig") == 42
+        assert get_lifting_size(648, "wifi") == 27
+        assert get_lifting_size(384, "wran") == 16
+        assert get_lifting_size(128, "ccsds") is None
+        assert get_lifting_size(100, "wimax") is None
+
     def test_get_code_from_database_invalid_url(self):
         """Test invalid URL handling."""
         # Test empty URL
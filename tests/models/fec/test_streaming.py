@@ -0,0 +1,95 @@
+"""Tests for the streaming module in kaira.models.fec package."""
+
+import numpy as np
+import pytest
+import torch
+
+from kaira.models.fec.decoders import SyndromeLookupDecoder
+from kaira.models.fec.encoders import GolayCodeEncoder, HammingCodeEncoder
+from kaira.models.fec.streaming import StreamingBlockCodec, stream_decode, stream_encode
+
+
+@pytest.fixture
+def codec():
+    """Return a Hamming(7,4) encoder and its syndrome decoder."""
+    encoder = HammingCodeEncoder(mu=3)
+    return encoder, SyndromeLookupDecoder(encoder)
+
+
+class TestStreamingBlockCodec:
+    """Test suite for the streaming block codec."""
+
+    def test_invalid_arguments(self, codec):
+        """Test that invalid models, batch sizes and stream lengths are rejected."""
+        encoder, _ = codec
+        with pytest.raises(TypeError, match="BaseBlockCodeEncoder"):
+            StreamingBlockCodec(torch.nn.Identity())
+        with pytest.raises(ValueError, match="blocks_per_batch"):
+            StreamingBlockCodec(encoder, blocks_per_batch=0)
+        with pytest.raises(ValueError, match="divisible"):
+            list(stream_encode(encoder, torch.zeros(10)))
+        with pytest.raises(ValueError, match="divisible"):
+            list(stream_encode(encoder, [torch.zeros(6), torch.zeros(5)], blocks_per_batch=2))
+
+    @pytest.mark.parametrize("prefetch", [False, True])
+    def test_tensor_source(self, codec, prefetch):
+        """Test that streaming a tensor gives the same result as encoding it at once."""
+        encoder, _ = codec
+        torch.manual_seed(0)
+        messages = torch.randint(0, 2, (2, 50, 4)).float()
+        outputs = list(stream_encode(encoder, messages, blocks_per_batch=16, prefetch=prefetch))
+        assert [output.numel() for output in outputs] == [112, 112, 112, 112, 112, 112, 28]
+        assert torch.equal(torch.cat(outputs), encoder(messages).reshape(-1))
+
+    @pytest.mark.parametrize("prefetch", [False, True])
+    def test_iterable_source(self, codec, prefetch):
+        """Test that chunks of arbitrary lengths are gathered into whole super-batches."""
+        encoder, decoder = codec
+        torch.manual_seed(0)
+        messages = torch.randint(0, 2, (400,))
+        chunks = [messages[:3], messages[3:3].numpy(), messages[3:150].tolist(), messages[150:]]
+        codewords = list(stream_encode(encoder, iter(chunks), blocks_per_batch=32, prefetch=prefetch))
+        assert len(codewords) == 4
+        assert torch.equal(torch.cat(codewords), encoder(messages.float()).reshape(-1))
+
+        # Decoding a generator of codeword chunks, including the error patterns
+        received = torch.cat(codewords).clone()
+        received[::7] = 1 - received[::7]
+        results = list(stream_decode(decoder, received.split(100), blocks_per_batch=32, prefetch=prefetch, return_errors=True))
+        decoded = torch.cat([result[0] for result in results])
+        errors = torch.cat([result[1] for result in results])
+        assert torch.equal(decoded, messages.float())
+        assert torch.equal(errors, (received != torch.cat(codewords)).float())
+
+    def test_memory_mapped_file(self, tmp_path):
+        """Test decoding from a memory-mapped file and from its path."""
+        encoder = GolayCodeEncoder()
+        decoder = SyndromeLookupDecoder(encoder)
+        torch.manual_seed(0)
+        messages = torch.randint(0, 2, (100, 12)).float()
+        received = encoder(messages)
+        received[:, 5] = 1 - received[:, 5]
+
+        path = tmp_path / "received.bin"
+        received.to(torch.uint8).numpy().tofile(path)
+        from_path = torch.cat(list(stream_decode(decoder, path, blocks_per_batch=30)))
+        from_memmap = torch.cat(list(stream_decode(decoder, np.memmap(path, dtype=np.uint8, mode="r"), blocks_per_batch=7, prefetch=True)))
+        assert torch.equal(from_path, messages.reshape(-1))
+        assert torch.equal(from_memmap, messages.reshape(-1))
+
+    def test_reuse_buffers(self, codec):
+        """Test that results are written into the same preallocated output buffer."""
+        encoder, decoder = codec
+        messages = torch.randint(0, 2, (20, 4)).float()
+        streaming = StreamingBlockCodec(encoder, blocks_per_batch=8, reuse_buffers=True)
+
+        pointers, codewords = set(), []
+        for output in streaming(messages):
+            pointers.add(output.data_ptr())
+            codewords.append(output.clone())
+        assert len(pointers) == 1
+        assert torch.equal(torch.cat(codewords), encoder(messages).reshape(-1))
+
+        # Without buffer reuse, results never alias the staging buffers
+        outputs = list(StreamingBlockCodec(decoder, blocks_per_batch=8)(iter([torch.cat(codewords)])))
+        assert torch.equal(torch.cat(outputs), messages.reshape(-1))
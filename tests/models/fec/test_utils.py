@@ -5,7 +5,9 @@ import torch
 
 from kaira.models.fec.utils import (
     Taylor_arctanh,
+    append_crc,
     apply_blockwise,
+    crc_matrix,
     cyclic_perm,
     from_binary_tensor,
     hamming_distance,
@@ -163,6 +165,33 @@ class TestUtils:
         x = torch.tensor([])
         assert from_binary_tensor(x) == 0
 
+    def test_crc_matrix(self):
+        """Test crc_matrix against polynomial division."""
+        polynomial = 0b110011  # X^5 + X^4 + X + 1
+        matrix = crc_matrix(polynomial, 12)
+        assert matrix.shape == (12, 5)
+
+        messages = torch.randint(0, 2, (20, 12))
+        crc = (messages.float() @ matrix) % 2
+        for message, bits in zip(messages.tolist(), crc.tolist()):
+            remainder = int("".join(map(str, message)), 2) << 5
+            for shift in range(16, 4, -1):
+                if (remainder >> shift) & 1:
+                    remainder ^= polynomial << (shift - 5)
+            assert int("".join(str(int(b)) for b in bits), 2) == remainder
+
+        with pytest.raises(ValueError):
+            crc_matrix(1, 4)
+
+    def test_append_crc(self):
+        """Test append_crc function."""
+        assert torch.equal(append_crc(torch.tensor([1.0, 0.0]), 0b1011), torch.tensor([1.0, 0.0, 1.0, 1.0, 0.0]))
+
+        # Codewords with CRC are multiples of the CRC polynomial, so the CRC of the whole word is zero
+        x = append_crc(torch.randint(0, 2, (3, 4, 10)).float(), 0b1011)
+        assert x.shape == (3, 4, 13)
+        assert torch.all((x @ crc_matrix(0b1011, 13)) % 2 == 0)
+
     def test_apply_blockwise(self):
         """Test apply_blockwise function."""
         # Basic test case: apply NOT operation to each block of size 2
@@ -0,0 +1,168 @@
+"""Tests for the MIMO detectors."""
+
+import itertools
+
+import pytest
+import torch
+
+from kaira.channels import MIMOChannel
+from kaira.modulations import BPSKModulator, KBestDetector, MMSEDetector, QAMModulator, QPSKModulator, ZeroForcingDetector
+
+
+def maximum_likelihood(detector, y, h):
+    """Return the metrics and symbol indices of exhaustive maximum-likelihood detection."""
+    num_symbols, num_tx = detector.constellation.numel(), h.shape[-1]
+    candidates = torch.tensor(list(itertools.product(range(num_symbols), repeat=num_tx)))
+    received = (h.unsqueeze(-3) @ detector.constellation[candidates].unsqueeze(-1)).squeeze(-1)
+    metrics = (y.unsqueeze(-2) - received).abs().square().sum(dim=-1)
+    best = metrics.min(dim=-1)
+    return best.values, candidates[best.indices]
+
+
+@pytest.fixture
+def mimo_link():
+    """Fixture for 16-QAM bits sent over a 3x4 MIMO channel, redrawn for every vector."""
+    torch.manual_seed(0)
+    modulator = QAMModulator(16)
+    bits = torch.randint(0, 2, (64, 20, 3 * 4)).float()
+    y, h = MIMOChannel(3, 4, coherence_time=1, avg_noise_power=0.01)(modulator(bits), return_csi=True)
+    return modulator, bits, y, h
+
+
+class TestMIMODetectors:
+    """Test suite for the constellation handling and CSI layout shared by all detectors."""
+
+    def test_constellation_from_modulator(self):
+        """Test that the constellation and bit labels reproduce the modulator."""
+        detector = ZeroForcingDetector(QAMModulator(16))
+        assert detector.bits_per_symbol == 4
+        assert detector.constellation.shape == (16,)
+        assert torch.allclose(detector.constellation, QAMModulator(16)(detector.bit_labels.reshape(-1)))
+
+        # Modulators without bit pattern tables are supported as well
+        assert torch.allclose(KBestDetector(BPSKModulator()).constellation.real, torch.tensor([1.0, -1.0]))
+
+    def test_invalid_csi(self):
+        """Test that missing or mismatched channel matrices are rejected."""
+        detector = ZeroForcingDetector(QPSKModulator())
+        y = torch.randn(4, 3, dtype=torch.cfloat)
+        with pytest.raises(ValueError, match="requires the channel matrices"):
+            detector(y)
+        with pytest.raises(ValueError, match="dimensions"):
+            detector(y, csi=torch.randn(3, dtype=torch.cfloat))
+        with pytest.raises(ValueError, match="receive antennas"):
+            detector(y, csi=torch.randn(4, 2, 2, dtype=torch.cfloat))
+
+        # A single matrix is shared by all received vectors
+        assert detector(y, csi=torch.eye(3, 2, dtype=torch.cfloat)).shape == (4, 4)
+
+    @pytest.mark.parametrize("detector_class", [ZeroForcingDetector, MMSEDetector, KBestDetector])
+    def test_noiseless_detection(self, detector_class):
+        """Test that all detectors recover the bits from noiseless received vectors."""
+        modulator = QAMModulator(16)
+        bits = torch.randint(0, 2, (32, 5, 2 * 4)).float()
+        channel = MIMOChannel(2, 3, avg_noise_power=0.1)
+        y, h = channel(modulator(bits), noise=torch.zeros(32, 5, 3, dtype=torch.cfloat), return_csi=True)
+
+        llrs = detector_class(modulator)(y, noise_var=1e-4, csi=h)
+        assert llrs.shape == bits.shape
+        assert torch.equal((llrs < 0).float(), bits)
+
+    @pytest.mark.parametrize("detector_class", [ZeroForcingDetector, MMSEDetector, KBestDetector])
+    def test_noisy_detection(self, mimo_link, detector_class):
+        """Test the bit error rate of the LLR signs at a high SNR."""
+        modulator, bits, y, h = mimo_link
+        llrs = detector_class(modulator)(y, noise_var=0.01, csi=h)
+        assert llrs.shape == bits.shape
+        assert ((llrs < 0).float() != bits).float().mean() < 0.01
+
+    @pytest.mark.parametrize("detector_class", [ZeroForcingDetector, MMSEDetector, KBestDetector])
+    def test_shared_channel_matrix(self, mimo_link, detector_class):
+        """Test that a shared channel matrix gives the same result as repeating it for every vector."""
+        modulator, _, y, h = mimo_link
+        shared = h[:, 0]
+        detector = detector_class(modulator)
+        expected = detector(y, noise_var=0.01, csi=shared.unsqueeze(1).expand_as(h))
+        assert torch.allclose(detector(y, noise_var=0.01, csi=shared), expected, atol=1e-3)
+
+        # Noise variances of every vector force the matrices to be processed separately
+        noise_var = torch.full(y.shape[:-1], 0.01)
+        assert torch.allclose(detector(y, noise_var=noise_var, csi=shared), expected, atol=1e-3)
+
+
+class TestLinearDetectors:
+    """Test suite for ZeroForcingDetector and MMSEDetector."""
+
+    def test_zero_forcing_hard_decisions_and_noise(self):
+        """Test hard decisions and the post-equalization noise variance of zero forcing."""
+        torch.manual_seed(0)
+        h = torch.tensor([[[1.0, 0.0], [0.0, 0.5]]], dtype=torch.cfloat)
+        detector = ZeroForcingDetector(BPSKModulator())
+        y = torch.tensor([[0.2, -0.1]], dtype=torch.cfloat)
+        assert torch.equal(detector(y, csi=h), torch.tensor([[0.0, 1.0]]))
+
+        # Equalized symbols 0.2 and -0.2 with noise variances 0.1 and 0.1 / 0.5²
+        llrs = detector(y, noise_var=0.1, csi=h)
+        assert torch.allclose(llrs, torch.tensor([[(1.2**2 - 0.8**2) / 0.1, -(1.2**2 - 0.8**2) / 0.4]]), atol=1e-5)
+
+    def test_mmse_requires_noise_variance(self):
+        """Test that MMSE detection without a noise variance is rejected."""
+        with pytest.raises(ValueError, match="noise variance"):
+            MMSEDetector(QPSKModulator())(torch.randn(2, 2, dtype=torch.cfloat), csi=torch.eye(2, dtype=torch.cfloat).expand(2, 2, 2))
+
+    def test_mmse_outperforms_zero_forcing(self):
+        """Test that MMSE detection has fewer errors than zero forcing on correlated channels."""
+        torch.manual_seed(0)
+        modulator = QPSKModulator()
+        bits = torch.randint(0, 2, (4000, 4 * 2)).float()
+        channel = MIMOChannel(4, 4, rx_correlation=0.8, avg_noise_power=0.3)
+        y, h = channel(modulator(bits), return_csi=True)
+
+        errors = {detector.__class__: ((detector(y, noise_var=0.3, csi=h) < 0).float() != bits).float().mean() for detector in (ZeroForcingDetector(modulator), MMSEDetector(modulator))}
+        assert errors[MMSEDetector] < errors[ZeroForcingDetector]
+
+
+class TestKBestDetector:
+    """Test suite for KBestDetector."""
+
+    def test_invalid_arguments(self):
+        """Test that invalid parameters and antenna configurations are rejected."""
+        with pytest.raises(ValueError, match="num_candidates"):
+            KBestDetector(QPSKModulator(), num_candidates=0)
+        with pytest.raises(ValueError, match="llr_clip"):
+            KBestDetector(QPSKModulator(), llr_clip=0)
+        with pytest.raises(ValueError, match="at least as many receive"):
+            KBestDetector(QPSKModulator())(torch.randn(4, 2, dtype=torch.cfloat), csi=torch.randn(4, 2, 3, dtype=torch.cfloat))
+
+    def test_exhaustive_search_is_maximum_likelihood(self):
+        """Test that the search finds the ML vector and its metric when no candidate is pruned."""
+        torch.manual_seed(0)
+        modulator = QPSKModulator()
+        y, h = MIMOChannel(3, 4, avg_noise_power=1.0)(modulator(torch.randint(0, 2, (200, 3 * 2)).float()), return_csi=True)
+        detector = KBestDetector(modulator, num_candidates=16)
+
+        metrics, indices = detector.search(y, h)
+        assert metrics.shape == (200, 16)
+        assert (metrics.diff(dim=-1) >= 0).all()
+        ml_metrics, ml_indices = maximum_likelihood(detector, y, h)
+        assert torch.allclose(metrics[:, 0], ml_metrics, atol=1e-4)
+        assert torch.equal(indices[:, 0], ml_indices)
+        assert torch.equal(detector(y, csi=h), detector.bit_labels[ml_indices].reshape(200, -1))
+
+    def test_max_log_llrs(self):
+        """Test the LLRs against exhaustive max-log computation and the clipping of missing bit values."""
+        torch.manual_seed(0)
+        modulator = BPSKModulator()
+        y, h = MIMOChannel(2, 2, avg_noise_power=0.5)(modulator(torch.randint(0, 2, (100, 2)).float()), return_csi=True)
+
+        # With all four candidates kept, the LLRs are exact max-log LLRs
+        candidates = torch.tensor([[0.0, 0.0], [0.0, 1.0], [1.0, 0.0], [1.0, 1.0]])
+        received = (h.unsqueeze(1) @ (1 - 2 * candidates).to(h.dtype).unsqueeze(-1)).squeeze(-1)
+        metrics = (y.unsqueeze(1) - received).abs().square().sum(dim=-1)
+        expected = torch.stack([metrics[:, 2:].amin(-1) - metrics[:, :2].amin(-1), metrics[:, 1::2].amin(-1) - metrics[:, ::2].amin(-1)], dim=-1) / 0.5
+        llrs = KBestDetector(modulator, num_candidates=4, llr_clip=1e6)(y, noise_var=0.5, csi=h)
+        assert torch.allclose(llrs, expected, atol=1e-3)
+
+        # A single candidate leaves only one value per bit
+        llrs = KBestDetector(modulator, num_candidates=1, llr_clip=7.0)(y, noise_var=0.5, csi=h)
+        assert torch.equal(llrs.abs(), torch.full_like(llrs, 7.0))
@@ -0,0 +1,153 @@
+"""Tests for the OFDM modulator and demodulator."""
+
+import pytest
+import torch
+
+from kaira.channels import MultipathFadingChannel
+from kaira.modulations import QAMDemodulator, QAMModulator, QPSKDemodulator, QPSKModulator
+from kaira.modulations.ofdm import OFDMDemodulator, OFDMModulator
+
+PILOTS = list(range(2, 64, 4))
+
+
+@pytest.fixture
+def ofdm_pair():
+    """Fixture for a 16-QAM OFDM modem with comb pilots and a null DC subcarrier."""
+    layout = dict(num_subcarriers=64, cp_length=16, pilot_indices=PILOTS, null_indices=[0])
+    return OFDMModulator(modulator=QAMModulator(16), **layout), OFDMDemodulator(demodulator=QAMDemodulator(16), **layout)
+
+
+class TestOFDMModulator:
+    """Test suite for OFDMModulator."""
+
+    def test_resource_grid(self, ofdm_pair):
+        """Test the data, pilot and null subcarriers of the resource grid."""
+        modulator, _ = ofdm_pair
+        assert modulator.num_data_subcarriers == 47
+        assert modulator.bits_per_symbol == 47 * 4
+        assert modulator.symbol_length == 80
+
+        symbols = torch.randn(3, 2 * 47, dtype=torch.cfloat)
+        grid = modulator.map_to_grid(symbols)
+        assert grid.shape == (3, 2, 64)
+        assert torch.equal(grid[..., modulator.data_indices], symbols.view(3, 2, 47))
+        assert torch.equal(grid[..., PILOTS], torch.ones(3, 2, 16, dtype=torch.cfloat))
+        assert not grid[..., 0].any()
+
+    def test_time_domain_signal(self):
+        """Test the orthonormal IFFT and the cyclic prefix of every OFDM symbol."""
+        modulator = OFDMModulator(16, cp_length=4)
+        symbols = torch.randn(5, 3 * 16, dtype=torch.cfloat)
+        x = modulator(symbols)
+        assert x.shape == (5, 3 * 20)
+
+        blocks = x.view(5, 3, 20)
+        assert torch.allclose(blocks[..., :4], blocks[..., -4:])
+        assert torch.allclose(blocks[..., 4:], torch.fft.ifft(symbols.view(5, 3, 16), norm="ortho"))
+
+    def test_invalid_arguments(self):
+        """Test that invalid layouts and inputs are rejected."""
+        with pytest.raises(ValueError, match="cp_length"):
+            OFDMModulator(16, cp_length=17)
+        with pytest.raises(ValueError, match="between 0 and 15"):
+            OFDMModulator(16, pilot_indices=[16])
+        with pytest.raises(ValueError, match="distinct"):
+            OFDMModulator(16, pilot_indices=[1, 2], null_indices=[2])
+        with pytest.raises(ValueError, match="carry data"):
+            OFDMModulator(4, cp_length=1, pilot_indices=[0, 1], null_indices=[2, 3])
+        with pytest.raises(ValueError, match="pilot symbols"):
+            OFDMModulator(16, pilot_indices=[1, 2], pilot_symbols=[1.0])
+        with pytest.raises(ValueError, match="divisible"):
+            OFDMModulator(16)(torch.zeros(2, 20, dtype=torch.cfloat))
+
+
+class TestOFDMDemodulator:
+    """Test suite for OFDMDemodulator."""
+
+    def test_invalid_arguments(self):
+        """Test that invalid equalizers, pilots and inputs are rejected."""
+        with pytest.raises(ValueError, match="Equalizer"):
+            OFDMDemodulator(16, equalizer="zf")
+        with pytest.raises(ValueError, match="nonzero"):
+            OFDMDemodulator(16, pilot_indices=[1], pilot_symbols=[0.0])
+        with pytest.raises(ValueError, match="OFDM symbol length"):
+            OFDMDemodulator(16, cp_length=4)(torch.zeros(2, 30, dtype=torch.cfloat))
+        with pytest.raises(ValueError, match="noise variance"):
+            OFDMDemodulator(16, cp_length=4, pilot_indices=[1], equalizer="mmse")(torch.zeros(2, 20, dtype=torch.cfloat))
+        with pytest.raises(ValueError, match="pilot subcarriers"):
+            OFDMDemodulator(16).estimate_channel(torch.zeros(2, 16, dtype=torch.cfloat))
+
+    def test_interpolation_matrix(self):
+        """Test linear interpolation between unsorted pilots and constant extrapolation."""
+        matrix = OFDMDemodulator._interpolation_matrix(torch.tensor([6, 2]), 8).real
+        expected = torch.tensor([[0.0, 0.0, 0.0, 0.25, 0.5, 0.75, 1.0, 1.0], [1.0, 1.0, 1.0, 0.75, 0.5, 0.25, 0.0, 0.0]])
+        assert torch.allclose(matrix, expected)
+        assert torch.equal(OFDMDemodulator._interpolation_matrix(torch.tensor([3]), 4).real, torch.ones(1, 4))
+
+    def test_noiseless_round_trip(self, ofdm_pair):
+        """Test that bits are recovered from the noiseless signal with and without pilots."""
+        modulator, demodulator = ofdm_pair
+        bits = torch.randint(0, 2, (4, 3 * modulator.bits_per_symbol)).float()
+        assert torch.equal(demodulator(modulator(bits)), bits)
+
+        plain_modulator = OFDMModulator(32, cp_length=8, modulator=QPSKModulator())
+        plain_demodulator = OFDMDemodulator(32, cp_length=8, demodulator=QPSKDemodulator())
+        bits = torch.randint(0, 2, (2, 5, 2 * 64)).float()
+        assert torch.equal(plain_demodulator(plain_modulator(bits)), bits)
+
+    def test_multipath_channel_equalization(self, ofdm_pair):
+        """Test one-tap equalization with known CSI and with pilot-based channel estimates."""
+        torch.manual_seed(0)
+        modulator, demodulator = ofdm_pair
+        bits = torch.randint(0, 2, (200, 4 * modulator.bits_per_symbol)).float()
+        channel = MultipathFadingChannel([1.0, 0.5, 0.25], coherence_time=modulator.symbol_length, avg_noise_power=0.01)
+        x = modulator(bits)
+        y, csi = channel(x, noise=torch.zeros_like(x), return_csi=True, csi_fft_size=64)
+        assert csi.shape == (200, 4, 64)
+
+        # Without noise, a cyclic prefix longer than the channel makes one-tap equalization exact
+        grid = demodulator.to_grid(y)
+        assert torch.allclose(demodulator.estimate_channel(grid)[..., PILOTS], csi[..., PILOTS], atol=1e-4)
+        assert torch.equal(demodulator(y, csi=csi), bits)
+
+        equalized = OFDMDemodulator(64, 16, pilot_indices=PILOTS, null_indices=[0], equalizer="mmse")(y, noise_var=1e-10, csi=csi)
+        assert torch.allclose(equalized, QAMModulator(16)(bits).view(200, -1), atol=1e-3)
+
+    def test_mmse_no_worse_than_ls(self, ofdm_pair):
+        """Test that the unbiased MMSE estimates decide 16-QAM symbols at least as well as LS."""
+        torch.manual_seed(0)
+        modulator, demodulator = ofdm_pair
+        bits = torch.randint(0, 2, (400, 4 * modulator.bits_per_symbol)).float()
+        channel = MultipathFadingChannel([1.0, 0.5, 0.25], coherence_time=modulator.symbol_length, avg_noise_power=0.05)
+        y, csi = channel(modulator(bits), return_csi=True, csi_fft_size=64)
+
+        error_rates = {}
+        for equalizer in ("ls", "mmse"):
+            demodulator.equalizer = equalizer
+            llrs = demodulator(y, noise_var=0.05, csi=csi)
+            error_rates[equalizer] = ((llrs < 0).float() != bits).float().mean()
+        assert 0 < error_rates["mmse"] <= error_rates["ls"]
+
+        # Removing the bias makes the MMSE estimates agree with the LS estimates
+        estimates = {equalizer: OFDMDemodulator(64, 16, pilot_indices=PILOTS, null_indices=[0], equalizer=equalizer)(y, noise_var=0.05, csi=csi) for equalizer in ("ls", "mmse")}
+        assert torch.allclose(estimates["mmse"], estimates["ls"], atol=1e-3)
+
+    def test_soft_demodulation(self, ofdm_pair):
+        """Test that the LLRs account for the post-equalization noise of every subcarrier."""
+        torch.manual_seed(0)
+        modulator, demodulator = ofdm_pair
+        bits = torch.randint(0, 2, (100, 2 * modulator.bits_per_symbol)).float()
+        channel = MultipathFadingChannel([1.0, 0.5], coherence_time=modulator.symbol_length, avg_noise_power=0.01)
+        y, csi = channel(modulator(bits), return_csi=True, csi_fft_size=64)
+
+        for equalizer in ("ls", "mmse"):
+            demodulator.equalizer = equalizer
+            llrs = demodulator(y, noise_var=0.01, csi=csi)
+            assert llrs.shape == bits.shape
+            assert ((llrs < 0).float() != bits).float().mean() < 0.05
+
+        # The LLR magnitudes grow with the channel gain of the subcarrier
+        demodulator.equalizer = "ls"
+        llrs = demodulator(y, noise_var=0.01, csi=csi).view(100, 2, 47, 4).abs().mean(dim=(0, 1, 3))
+        gains = csi[..., demodulator.data_indices].abs().mean(dim=(0, 1))
+        assert torch.corrcoef(torch.stack([llrs, gains]))[0, 1] > 0